@@ -3,27 +3,40 @@ import json
 import datetime
 from pytz import timezone
 import time
-import yaml
-import os
+import logging
 import matplotlib.pyplot as plt
 
-config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
-with open(config_path, encoding='UTF-8') as f:
-    _cfg = yaml.load(f, Loader=yaml.FullLoader)
-APP_KEY = _cfg['APP_KEY']
-APP_SECRET = _cfg['APP_SECRET']
+from trading.kis_response import (KisApiError, OrderableCash, OrderResult, Quote, decode_response, parse_daily_bars,
+                                  parse_holdings, parse_minute_rows)
+from util.config import get_config
+from util.logger import get_logger, setup_logging
+from util.metrics import METRICS
+
+logger = get_logger('kis')
+
+_cfg = get_config()
+APP_KEY = _cfg.app_key
+APP_SECRET = _cfg.app_secret
 ACCESS_TOKEN = ""
-CANO = _cfg['CANO']
-ACNT_PRDT_CD = _cfg['ACNT_PRDT_CD']
-DISCORD_WEBHOOK_URL = _cfg['DISCORD_WEBHOOK_URL']
-URL_BASE = _cfg['URL_BASE']
+CANO = _cfg.cano
+ACNT_PRDT_CD = _cfg.acnt_prdt_cd
+DISCORD_WEBHOOK_URL = _cfg.discord_webhook_url
+URL_BASE = _cfg.url_base
 
 def send_message(msg):
     """디스코드 메세지 전송"""
     now = datetime.datetime.now()
     message = {"content": f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {str(msg)}"}
     requests.post(DISCORD_WEBHOOK_URL, data=message)
-    print(message)
+    logger.info("%s", message['content'])
+
+def kis_request(method, PATH, **kwargs):
+    """한투 API 호출 (엔드포인트별 지연시간/응답코드 계측)"""
+    URL = f"{URL_BASE}/{PATH}"
+    with METRICS.timer('kis_request_seconds', endpoint=PATH.lstrip('/')):
+        res = requests.request(method, URL, **kwargs)
+    METRICS.inc('kis_requests_total', endpoint=PATH.lstrip('/'), status=res.status_code)
+    return res
 
 def get_access_token():
     """토큰 발급"""
@@ -33,28 +46,25 @@ def get_access_token():
     "appkey":APP_KEY, 
     "appsecret":APP_SECRET}
     PATH = "oauth2/tokenP"
-    URL = f"{URL_BASE}/{PATH}"
-    res = requests.post(URL, headers=headers, data=json.dumps(body))
-    ACCESS_TOKEN = res.json()["access_token"]
+    res = kis_request("POST", PATH, headers=headers, data=json.dumps(body))
+    ACCESS_TOKEN = decode_response(res, PATH)["access_token"]
     return ACCESS_TOKEN
     
 def hashkey(datas):
     """암호화"""
     PATH = "uapi/hashkey"
-    URL = f"{URL_BASE}/{PATH}"
     headers = {
     'content-Type' : 'application/json',
     'appKey' : APP_KEY,
     'appSecret' : APP_SECRET,
     }
-    res = requests.post(URL, headers=headers, data=json.dumps(datas))
-    hashkey = res.json()["HASH"]
+    res = kis_request("POST", PATH, headers=headers, data=json.dumps(datas))
+    hashkey = decode_response(res, PATH)["HASH"]
     return hashkey
 
 def get_current_price(market="NASD", code="AAPL"):
     """현재가 조회"""
     PATH = "uapi/overseas-price/v1/quotations/price"
-    URL = f"{URL_BASE}/{PATH}"
     headers = {"Content-Type":"application/json", 
             "authorization": f"Bearer {ACCESS_TOKEN}",
             "appKey":APP_KEY,
@@ -65,13 +75,12 @@ def get_current_price(market="NASD", code="AAPL"):
         "EXCD":market,
         "SYMB":code,
     }
-    res = requests.get(URL, headers=headers, params=params)
-    return float(res.json()['output']['last'])
+    res = kis_request("GET", PATH, headers=headers, params=params)
+    return Quote.from_payload(code, decode_response(res, PATH)).last
 
 def get_target_entry_price(market="NASD", code="AAPL"):
     """황금원 진입 지점 """
     PATH = "uapi/overseas-price/v1/quotations/dailyprice"
-    URL = f"{URL_BASE}/{PATH}"
     headers = {"Content-Type":"application/json", 
         "authorization": f"Bearer {ACCESS_TOKEN}",
         "appKey":APP_KEY,
@@ -85,10 +94,11 @@ def get_target_entry_price(market="NASD", code="AAPL"):
         "BYMD":"",
         "MODP":"0"
     }
-    res = requests.get(URL, headers=headers, params=params)
-    predayclose = float(res.json()['output2'][1]['clos']) #전일 종가
-    predayhigh = float(res.json()['output2'][1]['high']) #전일 고가
-    predaylow = float(res.json()['output2'][1]['low']) #전일 저가
+    res = kis_request("GET", PATH, headers=headers, params=params)
+    previous_bar = parse_daily_bars(decode_response(res, PATH))[-2] #전일 일봉 (마지막은 오늘)
+    predayclose = previous_bar['close'] #전일 종가
+    predayhigh = previous_bar['high'] #전일 고가
+    predaylow = previous_bar['low'] #전일 저가
 
     target_entry_price = ( predayhigh + predaylow + predayclose ) / 3 + (predayhigh - predaylow)
     return target_entry_price
@@ -96,7 +106,6 @@ def get_target_entry_price(market="NASD", code="AAPL"):
 def get_stock_balance():
     """주식 잔고조회"""
     PATH = "uapi/overseas-stock/v1/trading/inquire-balance"
-    URL = f"{URL_BASE}/{PATH}"
     headers = {"Content-Type":"application/json", 
         "authorization":f"Bearer {ACCESS_TOKEN}",
         "appKey":APP_KEY,
@@ -112,16 +121,15 @@ def get_stock_balance():
         "CTX_AREA_FK200": "",
         "CTX_AREA_NK200": ""
     }
-    res = requests.get(URL, headers=headers, params=params)
-    stock_list = res.json()['output1']
-    evaluation = res.json()['output2']
+    res = kis_request("GET", PATH, headers=headers, params=params)
+    payload = decode_response(res, PATH)
+    evaluation = payload['output2']
     stock_dict = {}
     send_message(f"====주식 보유잔고====")
-    for stock in stock_list:
-        if int(stock['ovrs_cblc_qty']) > 0:
-            stock_dict[stock['ovrs_pdno']] = stock['ovrs_cblc_qty']
-            send_message(f"{stock['ovrs_item_name']}({stock['ovrs_pdno']}): {stock['ovrs_cblc_qty']}주")
-            time.sleep(0.1)
+    for holding in parse_holdings(payload):
+        stock_dict[holding.ticker] = holding.quantity
+        send_message(f"{holding.name}({holding.ticker}): {holding.quantity}주")
+        time.sleep(0.1)
     send_message(f"주식 평가 금액: ${evaluation['tot_evlu_pfls_amt']}")
     time.sleep(0.1)
     send_message(f"평가 손익 합계: ${evaluation['ovrs_tot_pfls']}")
@@ -132,7 +140,6 @@ def get_stock_balance():
 def get_balance():
     """현금 잔고조회"""
     PATH = "uapi/domestic-stock/v1/trading/inquire-psbl-order"
-    URL = f"{URL_BASE}/{PATH}"
     headers = {"Content-Type":"application/json", 
         "authorization":f"Bearer {ACCESS_TOKEN}",
         "appKey":APP_KEY,
@@ -149,15 +156,14 @@ def get_balance():
         "CMA_EVLU_AMT_ICLD_YN": "Y",
         "OVRS_ICLD_YN": "Y"
     }
-    res = requests.get(URL, headers=headers, params=params)
-    cash = res.json()['output']['ord_psbl_cash']
-    send_message(f"주문 가능 현금 잔고: {cash}원")
-    return int(cash)
+    res = kis_request("GET", PATH, headers=headers, params=params)
+    orderable_cash = OrderableCash.from_payload(decode_response(res, PATH))
+    send_message(f"주문 가능 현금 잔고: {orderable_cash.cash}원")
+    return orderable_cash.cash
 
 def buy(market="NASD", code="AAPL", qty="1", price="0"):
     """미국 주식 지정가 매수"""
     PATH = "uapi/overseas-stock/v1/trading/order"
-    URL = f"{URL_BASE}/{PATH}"
     data = {
         "CANO": CANO,
         "ACNT_PRDT_CD": ACNT_PRDT_CD,
@@ -176,18 +182,18 @@ def buy(market="NASD", code="AAPL", qty="1", price="0"):
         "custtype":"P",
         "hashkey" : hashkey(data)
     }
-    res = requests.post(URL, headers=headers, data=json.dumps(data))
-    if res.json()['rt_cd'] == '0':
-        send_message(f"[매수 성공]{str(res.json())}")
-        return True
-    else:
-        send_message(f"[매수 실패]{str(res.json())}")
+    res = kis_request("POST", PATH, headers=headers, data=json.dumps(data))
+    try:
+        order_result = OrderResult.from_payload(decode_response(res, PATH))
+    except KisApiError as order_exception:
+        send_message(f"[매수 실패]{order_exception}")
         return False
+    send_message(f"[매수 성공]{code} {qty}주 주문번호 {order_result.order_number} ({order_result.message})")
+    return True
 
 def sell(market="NASD", code="AAPL", qty="1", price="0"):
     """미국 주식 지정가 매도"""
     PATH = "uapi/overseas-stock/v1/trading/order"
-    URL = f"{URL_BASE}/{PATH}"
     data = {
         "CANO": CANO,
         "ACNT_PRDT_CD": ACNT_PRDT_CD,
@@ -206,18 +212,18 @@ def sell(market="NASD", code="AAPL", qty="1", price="0"):
         "custtype":"P",
         "hashkey" : hashkey(data)
     }
-    res = requests.post(URL, headers=headers, data=json.dumps(data))
-    if res.json()['rt_cd'] == '0':
-        send_message(f"[매도 성공]{str(res.json())}")
-        return True
-    else:
-        send_message(f"[매도 실패]{str(res.json())}")
+    res = kis_request("POST", PATH, headers=headers, data=json.dumps(data))
+    try:
+        order_result = OrderResult.from_payload(decode_response(res, PATH))
+    except KisApiError as order_exception:
+        send_message(f"[매도 실패]{order_exception}")
         return False
+    send_message(f"[매도 성공]{code} {qty}주 주문번호 {order_result.order_number} ({order_result.message})")
+    return True
 
 def get_exchange_rate():
     """환율 조회"""
     PATH = "uapi/overseas-stock/v1/trading/inquire-present-balance"
-    URL = f"{URL_BASE}/{PATH}"
     headers = {"Content-Type":"application/json", 
             "authorization": f"Bearer {ACCESS_TOKEN}",
             "appKey":APP_KEY,
@@ -232,16 +238,16 @@ def get_exchange_rate():
         "TR_MKET_CD": "01",
         "INQR_DVSN_CD": "00"
     }
-    res = requests.get(URL, headers=headers, params=params)
+    res = kis_request("GET", PATH, headers=headers, params=params)
     exchange_rate = 1270.0
-    if len(res.json()['output2']) > 0:
-        exchange_rate = float(res.json()['output2'][0]['frst_bltn_exrt'])
+    exchange_rates = decode_response(res, PATH)['output2']
+    if len(exchange_rates) > 0:
+        exchange_rate = float(exchange_rates[0]['frst_bltn_exrt'])
     return exchange_rate
 
 def get_stock_five_minute_price(market="NAS", code="AAPL"):
     """주식 분봉 가격 조회"""
-    PATH = "/uapi/overseas-price/v1/quotations/inquire-time-itemchartprice"
-    URL = f"{URL_BASE}/{PATH}"
+    PATH = "uapi/overseas-price/v1/quotations/inquire-time-itemchartprice"
     headers = {"Content-Type":"application/json", 
         "authorization": f"Bearer {ACCESS_TOKEN}",
         "appKey":APP_KEY,
@@ -259,10 +265,10 @@ def get_stock_five_minute_price(market="NAS", code="AAPL"):
         "KEYB":""
     }
     # 1) API 호출: 5분봉 120개(NREC=120) 요청
-    res = requests.get(URL, headers=headers, params=params)
+    res = kis_request("GET", PATH, headers=headers, params=params)
 
-    # 2) 응답 JSON 파싱
-    payload = res.json()
+    # 2) 응답 JSON 파싱 (rt_cd 오류는 KisApiError)
+    payload = decode_response(res, PATH)
 
     # 3) 메시지 출력(정상 처리 여부 등)
     send_message(payload.get('msg1', ''))
@@ -272,34 +278,20 @@ def get_stock_five_minute_price(market="NAS", code="AAPL"):
     # with open('stock_five_minute_price.txt', 'w', encoding='utf-8') as f:
     #     json.dump(payload, f, ensure_ascii=False)
 
-    # 5) 5분봉 데이터는 payload["output2"]에 리스트 형태로 들어옴
-    #    예: [{"kymd":"20260128","khms":"090000","open":"258.1200", ...}, ...]
-    candles = payload.get('output2', []) or []
+    # 5) 5분봉 데이터는 payload["output2"]에 리스트 형태로 들어옴 → parse_minute_rows로 숫자 변환
+    #    (거래소 시간 xymd/xhms 기준, 날짜/시각이 없는 행은 제외, 값 이상은 KisDecodeError)
     ts_open_list = []  # 반환 형태: [(timestamp, open_price), ...]
+    log_each_candle = logger.isEnabledFor(logging.DEBUG)  # 비활성 시 캔들별 로그 비용 0
 
-    # 6) 최대 120개만 추출해서 (timestamp, open) 튜플 리스트 생성
-    for c in candles[:120]:
-        # timestamp 만들기:
-        # - 우선 KST 필드(kymd/khms)가 있으면 사용
-        # - 없으면 거래소 시간 필드(xymd/xhms)로 대체
-        # - 최종 형태: "YYYYMMDDHHMMSS" (문자열)
-        ymd = (c.get('kymd') or c.get('xymd') or '').strip()
-        hms = (c.get('khms') or c.get('xhms') or '').strip()
-        ts = f"{ymd}{hms}" if (ymd and hms) else (ymd or hms or "")
-
-        # open 가격은 문자열로 오므로 float로 변환
-        # 변환 실패(필드 누락/값 이상)하면 해당 캔들은 스킵
-        try:
-            open_price = float(c.get('open'))
-        except (TypeError, ValueError):
-            continue
-
-        # (timestamp, open_price) 형태로 리스트에 저장
+    # 6) 최대 120개만 추출해서 (timestamp "YYYYMMDDHHMMSS", open) 튜플 리스트 생성
+    for minute_row in parse_minute_rows(payload)[:120]:
+        ts = minute_row['ymd'] + minute_row['hms']
+        open_price = minute_row['open']
         ts_open_list.append((ts, open_price))
 
-        # 로그 출력: 나중에 확인하기 쉽도록 timestamp와 open을 함께 출력
-        # (원하면 print 대신 send_message로 바꿔도 됨)
-        print(f"{ts} open={open_price}")
+        # 로그 출력: 나중에 확인하기 쉽도록 timestamp와 open을 함께 출력 (DEBUG 레벨에서만)
+        if log_each_candle:
+            logger.debug("%s open=%s", ts, open_price)
 
     dates = [item[0] for item in ts_open_list]
     open_prices = [item[1] for item in ts_open_list]
@@ -323,10 +315,10 @@ def get_stock_five_minute_price(market="NAS", code="AAPL"):
     return ts_open_list
 
 # 자동매매 시작
+setup_logging(_cfg.log_level, _cfg.log_format, _cfg.log_file, _cfg.log_rate_limit_per_minute)
 try:
     ACCESS_TOKEN = get_access_token()
     if ACCESS_TOKEN != "":
-        print("ACCESS_TOKEN retrieved, beginning next sequence")
         send_message("ACCESS TOKEN retrieved, beginning next sequence")
     
 
@@ -0,0 +1,260 @@
+"""
+기사 아카이브 모듈
+수집한 모든 기사와 섹터별 점수, 모델/프롬프트 버전, 주기 ID를 SQLite(WAL)에 추가 전용으로 저장
+쓰기는 백그라운드 스레드에서 배치로 처리 (파이프라인은 큐에 넣기만 함)
+시간/섹터 범위 조회와 리플레이(네트워크 없이 SignalGenerator 재실행)에 사용
+"""
+import json
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from analysis.news_analyzer import AnalysisResult
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+STATUS_FILTERED = 'filtered'  # 관련성 필터로 분석하지 않은 기사
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cycles (
+    cycle_id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    coverage REAL,
+    signal_json TEXT,
+    source_weights_json TEXT
+);
+CREATE TABLE IF NOT EXISTS articles (
+    article_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cycle_id INTEGER NOT NULL,
+    published_ts REAL,
+    archived_ts REAL NOT NULL,
+    source TEXT,
+    title TEXT,
+    link TEXT,
+    summary TEXT,
+    status TEXT NOT NULL,
+    model TEXT,
+    prompt_version TEXT,
+    latency_seconds REAL,
+    attempts INTEGER
+);
+CREATE INDEX IF NOT EXISTS articles_published ON articles (published_ts);
+CREATE INDEX IF NOT EXISTS articles_cycle ON articles (cycle_id);
+CREATE TABLE IF NOT EXISTS article_scores (
+    article_id INTEGER NOT NULL,
+    sector TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    published_ts REAL
+);
+CREATE INDEX IF NOT EXISTS article_scores_sector_time ON article_scores (sector, published_ts);
+CREATE INDEX IF NOT EXISTS article_scores_article ON article_scores (article_id);
+"""
+
+_CLOSE_SENTINEL = object()
+
+
+def _connect(archive_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(archive_path, timeout=30.0)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class ArticleArchive:
+    """추가 전용 기사/점수 아카이브 (쓰기: 백그라운드 배치, 읽기: 호출 스레드에서 별도 연결)"""
+
+    def __init__(self, archive_path: str, batch_size: int = 500):
+        """
+        Args:
+            archive_path: SQLite 파일 경로
+            batch_size: 한 트랜잭션으로 쓸 최대 레코드 수 (큐에 쌓인 만큼 모아서 기록)
+        """
+        self.archive_path = archive_path
+        self.batch_size = batch_size
+        self._last_cycle_id = 0
+
+        with closing(_connect(archive_path)) as connection:
+            connection.executescript(_SCHEMA)
+            # 출처 가중치 컬럼이 없던 이전 아카이브 (해당 주기는 리플레이 시 단순 합계)
+            cycle_columns = {row[1] for row in connection.execute("PRAGMA table_info(cycles)")}
+            if 'source_weights_json' not in cycle_columns:
+                connection.execute("ALTER TABLE cycles ADD COLUMN source_weights_json TEXT")
+
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread = threading.Thread(target=self._writer_loop, name='archive-writer', daemon=True)
+        self._writer_thread.start()
+
+    # ---- 쓰기 (파이프라인 스레드에서는 큐에 넣기만 함) ----
+
+    def record_articles(self, cycle_id: int, articles: List[Dict], results: List[Optional[AnalysisResult]],
+                        prompt_version: str = ''):
+        """
+        기사와 분석 결과 기록 (results[i]가 None이면 관련성 필터로 제외된 기사)
+
+        Args:
+            cycle_id: 주기 ID (begin_cycle() 반환값)
+            articles: 기사 리스트
+            results: articles와 같은 순서의 AnalysisResult 또는 None
+            prompt_version: 채점 프롬프트 버전
+        """
+        archived_ts = time.time()
+        for article, analysis_result in zip(articles, results):
+            self._write_queue.put(('article', cycle_id, archived_ts, article, analysis_result, prompt_version))
+
+    def begin_cycle(self) -> int:
+        """새 주기 시작 기록 → 주기 ID (시작 시각 ms 기반 단조 증가, 재시작해도 겹치지 않음)"""
+        started_at = time.time()
+        cycle_id = max(int(started_at * 1000), self._last_cycle_id + 1)
+        self._last_cycle_id = cycle_id
+        self._write_queue.put(('cycle_start', cycle_id, started_at))
+        return cycle_id
+
+    def finish_cycle(self, cycle_id: int, coverage: Optional[float] = None, signals: Optional[Dict] = None,
+                     source_weights: Optional[Dict[str, float]] = None):
+        """
+        주기 종료 + 생성된 신호 기록 (감사용)
+
+        Args:
+            source_weights: 이 주기 섹터 합계에 적용한 출처 가중치 (None이면 단순 합계 - 리플레이 시 그대로 재현)
+        """
+        self._write_queue.put(('cycle_finish', cycle_id, time.time(), coverage,
+                               json.dumps(signals, ensure_ascii=False, default=str) if signals else None,
+                               json.dumps(source_weights, ensure_ascii=False) if source_weights else None))
+
+    def _writer_loop(self):
+        connection = _connect(self.archive_path)
+        while True:
+            # 첫 레코드는 대기, 이후 이미 쌓인 레코드는 batch_size까지 모아 한 트랜잭션으로 기록
+            pending_records = [self._write_queue.get()]
+            while len(pending_records) < self.batch_size:
+                try:
+                    pending_records.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            close_requested = any(record is _CLOSE_SENTINEL for record in pending_records)
+            data_records = [record for record in pending_records if record is not _CLOSE_SENTINEL]
+            if data_records:
+                self._write_batch(connection, data_records)
+            for _ in pending_records:
+                self._write_queue.task_done()
+
+            if close_requested:
+                connection.close()
+                return
+
+    def _write_batch(self, connection: sqlite3.Connection, records: List[Tuple]):
+        try:
+            with METRICS.timer('archive_write_seconds'), connection:
+                for record in records:
+                    record_type = record[0]
+                    if record_type == 'article':
+                        self._insert_article(connection, *record[1:])
+                    elif record_type == 'cycle_start':
+                        connection.execute("INSERT OR IGNORE INTO cycles (cycle_id, started_at) VALUES (?, ?)", record[1:])
+                    elif record_type == 'cycle_finish':
+                        _, cycle_id, finished_at, coverage, signal_json, source_weights_json = record
+                        connection.execute(
+                            "UPDATE cycles SET finished_at = ?, coverage = ?, signal_json = ?, source_weights_json = ? "
+                            "WHERE cycle_id = ?", (finished_at, coverage, signal_json, source_weights_json, cycle_id))
+            METRICS.inc('archive_records_written_total', len(records))
+        except sqlite3.Error as archive_exception:
+            METRICS.inc('archive_write_errors_total')
+            logger.error("❌ 아카이브 기록 실패 (%d건): %s", len(records), archive_exception)
+
+    @staticmethod
+    def _insert_article(connection: sqlite3.Connection, cycle_id: int, archived_ts: float, article: Dict,
+                        analysis_result: Optional[AnalysisResult], prompt_version: str):
+        published_ts = article.get('published_timestamp')
+        cursor = connection.execute(
+            "INSERT INTO articles (cycle_id, published_ts, archived_ts, source, title, link, summary, status, "
+            "model, prompt_version, latency_seconds, attempts) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (cycle_id, published_ts, archived_ts, article.get('source'), article.get('title'), article.get('link'),
+             article.get('summary'),
+             analysis_result.status if analysis_result else STATUS_FILTERED,
+             analysis_result.model if analysis_result else None,
+             prompt_version if analysis_result else None,
+             analysis_result.latency_seconds if analysis_result else None,
+             analysis_result.attempts if analysis_result else None))
+        if analysis_result is not None and analysis_result.usable:
+            # 0점은 합계에 영향이 없으므로 저장하지 않음 (대부분의 기사는 1~3개 섹터만 점수가 있음)
+            connection.executemany(
+                "INSERT INTO article_scores (article_id, sector, score, published_ts) VALUES (?, ?, ?, ?)",
+                [(cursor.lastrowid, sector, int(score), published_ts)
+                 for sector, score in analysis_result.scores.items() if score])
+
+    def flush(self):
+        """큐에 쌓인 레코드가 모두 기록될 때까지 대기"""
+        self._write_queue.join()
+
+    def close(self):
+        """남은 레코드 기록 후 writer 스레드 종료"""
+        if self._writer_thread.is_alive():
+            self._write_queue.put(_CLOSE_SENTINEL)
+            self._writer_thread.join()
+
+    # ---- 읽기 (범위 조회 / 리플레이) ----
+
+    def scan_articles(self, start_ts: float = 0.0, end_ts: float = float('inf'),
+                      sector: Optional[str] = None) -> List[Dict]:
+        """
+        발행 시각 [start_ts, end_ts) 기사 조회 (sector 지정 시 해당 섹터 점수가 있는 기사만)
+
+        Returns:
+            [{'article_id', 'published_ts', 'source', 'title', 'link', 'status', 'model', 'score'(sector 지정 시)}, ...]
+        """
+        with closing(_connect(self.archive_path)) as connection:
+            connection.row_factory = sqlite3.Row
+            if sector is None:
+                rows = connection.execute(
+                    "SELECT article_id, cycle_id, published_ts, source, title, link, status, model, prompt_version "
+                    "FROM articles WHERE published_ts >= ? AND published_ts < ? ORDER BY published_ts",
+                    (start_ts, end_ts))
+            else:
+                rows = connection.execute(
+                    "SELECT a.article_id, a.cycle_id, a.published_ts, a.source, a.title, a.link, a.status, a.model, "
+                    "a.prompt_version, s.score FROM article_scores s JOIN articles a ON a.article_id = s.article_id "
+                    "WHERE s.sector = ? AND s.published_ts >= ? AND s.published_ts < ? ORDER BY s.published_ts",
+                    (sector, start_ts, end_ts))
+            return [dict(row) for row in rows]
+
+    def sector_totals(self, start_ts: float = 0.0, end_ts: float = float('inf')) -> Dict[str, int]:
+        """발행 시각 구간의 섹터별 점수 합계"""
+        with closing(_connect(self.archive_path)) as connection:
+            rows = connection.execute(
+                "SELECT sector, SUM(score) FROM article_scores WHERE published_ts >= ? AND published_ts < ? GROUP BY sector",
+                (start_ts, end_ts))
+            return {sector: int(total_score) for sector, total_score in rows}
+
+    def iter_cycles(self, start_ts: float = 0.0, end_ts: float = float('inf')
+                    ) -> Iterator[Tuple[int, float, List[AnalysisResult], Optional[Dict[str, float]]]]:
+        """
+        주기 시작 시각 [start_ts, end_ts) 주기별 분석 결과 (리플레이용, 관련성 필터로 제외된 기사는 생략)
+
+        Yields:
+            (cycle_id, started_at, [AnalysisResult, ...], 당시 출처 가중치 또는 None)
+        """
+        with closing(_connect(self.archive_path)) as connection:
+            cycle_rows = connection.execute(
+                "SELECT cycle_id, started_at, source_weights_json FROM cycles "
+                "WHERE started_at >= ? AND started_at < ? ORDER BY started_at", (start_ts, end_ts)).fetchall()
+            for cycle_id, started_at, source_weights_json in cycle_rows:
+                article_rows = connection.execute(
+                    "SELECT article_id, status, source, model, latency_seconds, attempts FROM articles "
+                    "WHERE cycle_id = ? AND status != ? ORDER BY article_id", (cycle_id, STATUS_FILTERED)).fetchall()
+                article_scores: Dict[int, Dict[str, int]] = {}
+                for article_id, sector, score in connection.execute(
+                        "SELECT s.article_id, s.sector, s.score FROM article_scores s JOIN articles a "
+                        "ON a.article_id = s.article_id WHERE a.cycle_id = ?", (cycle_id,)):
+                    article_scores.setdefault(article_id, {})[sector] = score
+                yield cycle_id, started_at, [
+                    AnalysisResult(scores=article_scores.get(article_id, {}), status=status, source=source or 'Unknown',
+                                   model=model or '', latency_seconds=latency_seconds or 0.0, attempts=attempts or 0)
+                    for article_id, status, source, model, latency_seconds, attempts in article_rows
+                ], json.loads(source_weights_json) if source_weights_json else None
@@ -0,0 +1,287 @@
+"""
+기사 본문 보강 모듈
+RSS summary가 한 줄이거나 HTML 조각인 경우가 많아, 기사 페이지를 동시에 가져와 본문을 추출
+연결 풀 공유 + 도메인별 동시 요청 제한, URL 기준 디스크 캐시(용량 상한), 토큰 예산 길이로 자르기
+"""
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from util.cassette import mount_cassette
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+CHARS_PER_TOKEN = 4
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024  # 이보다 큰 페이지는 앞부분만 파싱
+MIN_PARAGRAPH_CHARS = 40  # 메뉴/캡션 같은 짧은 문단 제외
+
+_SKIPPED_TAGS = frozenset({'script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form', 'figure', 'svg'})
+_TEXT_BLOCK_TAGS = frozenset({'p', 'h1', 'h2', 'h3', 'li', 'blockquote'})
+
+
+class _MainTextParser(HTMLParser):
+    """
+    본문 문단 추출기 (<article> 안의 문단 우선, 없으면 페이지 전체 문단)
+    스크립트/내비게이션 등은 건너뛰고, 충분한 길이가 모이면 파싱 중단
+    """
+
+    def __init__(self, max_chars: int):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.skip_depth = 0
+        self.article_depth = 0
+        self.block_depth = 0
+        self.current_block: List[str] = []
+        self.article_paragraphs: List[str] = []
+        self.page_paragraphs: List[str] = []
+        self.article_chars = 0
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self.skip_depth += 1
+        elif tag == 'article':
+            self.article_depth += 1
+        elif tag in _TEXT_BLOCK_TAGS:
+            self.block_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag == 'article':
+            self.article_depth = max(0, self.article_depth - 1)
+        elif tag in _TEXT_BLOCK_TAGS and self.block_depth:
+            self.block_depth -= 1
+            if self.block_depth == 0:
+                self._finish_block()
+
+    def handle_data(self, data):
+        if self.block_depth and not self.skip_depth:
+            self.current_block.append(data)
+
+    def _finish_block(self):
+        paragraph = " ".join(" ".join(self.current_block).split())
+        self.current_block = []
+        if len(paragraph) < MIN_PARAGRAPH_CHARS:
+            return
+        if self.article_depth:
+            self.article_paragraphs.append(paragraph)
+            self.article_chars += len(paragraph)
+            if self.article_chars >= self.max_chars:
+                self.done = True
+        else:
+            self.page_paragraphs.append(paragraph)
+
+    def main_text(self) -> str:
+        return "\n".join(self.article_paragraphs or self.page_paragraphs)
+
+
+def extract_main_text(html: str, max_chars: int = 4000) -> str:
+    """HTML에서 본문 텍스트 추출 (max_chars 이상 모이면 나머지는 파싱하지 않음)"""
+    parser = _MainTextParser(max_chars)
+    chunk_size = 16 * 1024
+    for chunk_start in range(0, len(html), chunk_size):
+        parser.feed(html[chunk_start:chunk_start + chunk_size])
+        if parser.done:
+            break
+    parser.close()
+    return parser.main_text()
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """대략적인 토큰 예산(문자 수 / 4) 길이로 단어 경계에서 자르기"""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    truncated_text = text[:max_chars]
+    last_space_index = truncated_text.rfind(' ')
+    if last_space_index > max_chars // 2:
+        truncated_text = truncated_text[:last_space_index]
+    return truncated_text + " …"
+
+
+class ExtractionCache:
+    """URL → 추출 본문 디스크 캐시 (총 용량 상한 초과 시 오래된 파일부터 삭제)"""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 50 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: 캐시 디렉터리 (없으면 생성)
+            max_bytes: 캐시 총 용량 상한
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._entry_sizes: Dict[str, int] = {}
+        self._entry_mtimes: Dict[str, float] = {}
+        for directory_entry in os.scandir(cache_dir):
+            if directory_entry.is_file() and directory_entry.name.endswith('.txt'):
+                entry_stat = directory_entry.stat()
+                self._entry_sizes[directory_entry.path] = entry_stat.st_size
+                self._entry_mtimes[directory_entry.path] = entry_stat.st_mtime
+        self.total_bytes = sum(self._entry_sizes.values())
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.txt')
+
+    def get(self, url: str) -> Optional[str]:
+        cache_path = self._path(url)
+        if cache_path not in self._entry_sizes:
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, url: str, text: str):
+        cache_path = self._path(url)
+        encoded_text = text.encode('utf-8')
+        if len(encoded_text) > self.max_bytes:
+            return
+        temporary_path = f"{cache_path}.tmp"
+        with open(temporary_path, 'wb') as f:
+            f.write(encoded_text)
+        os.replace(temporary_path, cache_path)
+
+        with self._lock:
+            self.total_bytes += len(encoded_text) - self._entry_sizes.get(cache_path, 0)
+            self._entry_sizes[cache_path] = len(encoded_text)
+            self._entry_mtimes[cache_path] = time.time()
+            if self.total_bytes > self.max_bytes:
+                self._evict_locked()
+
+    def _evict_locked(self):
+        for cache_path in sorted(self._entry_mtimes, key=self._entry_mtimes.__getitem__):
+            if self.total_bytes <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+            self.total_bytes -= self._entry_sizes.pop(cache_path)
+            del self._entry_mtimes[cache_path]
+            METRICS.inc('enrichment_cache_evictions_total')
+
+
+class ArticleEnricher:
+    """기사 페이지 동시 수집 + 본문 추출 (실패 시 RSS summary 유지)"""
+
+    def __init__(self, cache_dir: str = '.article_cache', max_cache_bytes: int = 50 * 1024 * 1024,
+                 max_workers: int = 8, per_domain_limit: int = 2, timeout: float = 10.0,
+                 max_tokens: int = 800, user_agent: str = 'Mozilla/5.0 (compatible; KISTrader/1.0)'):
+        """
+        Args:
+            cache_dir: 추출 본문 캐시 디렉터리 (빈 문자열이면 캐시 미사용)
+            max_cache_bytes: 캐시 총 용량 상한
+            max_workers: 동시 요청 수 (연결 풀 크기)
+            per_domain_limit: 같은 도메인 동시 요청 상한
+            timeout: 요청 타임아웃 (초)
+            max_tokens: 분석에 넘길 본문 토큰 예산
+        """
+        self.max_workers = max_workers
+        self.per_domain_limit = per_domain_limit
+        self.timeout = timeout
+        self.max_tokens = max_tokens
+        self.cache = ExtractionCache(cache_dir, max_cache_bytes) if cache_dir else None
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = user_agent
+        connection_adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', connection_adapter)
+        self.session.mount('https://', connection_adapter)
+        mount_cassette(self.session, pool_connections=max_workers, pool_maxsize=max_workers)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='enricher')
+        self._domain_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._domain_semaphores_lock = threading.Lock()
+
+    def _domain_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        domain = urlsplit(url).netloc.lower()
+        with self._domain_semaphores_lock:
+            domain_semaphore = self._domain_semaphores.get(domain)
+            if domain_semaphore is None:
+                domain_semaphore = self._domain_semaphores[domain] = threading.BoundedSemaphore(self.per_domain_limit)
+            return domain_semaphore
+
+    def fetch_text(self, url: str) -> Optional[str]:
+        """
+        URL 본문 텍스트 (캐시 우선, 토큰 예산으로 자르기 전 원문)
+
+        Returns:
+            추출 본문 또는 None (요청 실패 / HTML 아님 / 본문 없음)
+        """
+        if self.cache is not None:
+            cached_text = self.cache.get(url)
+            if cached_text is not None:
+                METRICS.inc('enrichment_articles_total', result='cache_hit')
+                return cached_text
+
+        try:
+            with self._domain_semaphore(url), METRICS.timer('enrichment_fetch_seconds'):
+                with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                    response.raise_for_status()
+                    if 'html' not in response.headers.get('Content-Type', 'text/html'):
+                        METRICS.inc('enrichment_articles_total', result='not_html')
+                        return None
+                    raw_body = response.raw.read(MAX_RESPONSE_BYTES, decode_content=True)
+                    # charset이 없으면 requests 기본값(ISO-8859-1) 대신 utf-8로 해석
+                    has_charset = 'charset' in response.headers.get('Content-Type', '').lower()
+                    encoding = response.encoding if has_charset else 'utf-8'
+        except requests.RequestException as request_exception:
+            METRICS.inc('enrichment_articles_total', result='error')
+            logger.debug("본문 수집 실패 [%s]: %s", url, request_exception)
+            return None
+
+        with METRICS.timer('enrichment_extract_seconds'):
+            try:
+                html = raw_body.decode(encoding, errors='replace')
+            except LookupError:
+                html = raw_body.decode('utf-8', errors='replace')
+            extracted_text = extract_main_text(html, max_chars=self.max_tokens * CHARS_PER_TOKEN * 2)
+        if not extracted_text:
+            METRICS.inc('enrichment_articles_total', result='empty')
+            return None
+
+        if self.cache is not None:
+            self.cache.put(url, extracted_text)
+        METRICS.inc('enrichment_articles_total', result='fetched')
+        return extracted_text
+
+    def enrich(self, articles: List[Dict]) -> int:
+        """
+        기사 본문을 동시에 수집하여 summary를 본문으로 교체 (원래 요약은 'rss_summary'에 보관)
+
+        Returns:
+            본문으로 보강된 기사 수
+        """
+        target_articles = [article for article in articles if article.get('link', '').startswith(('http://', 'https://'))]
+        if not target_articles:
+            return 0
+
+        enriched_count = 0
+        extracted_texts = self._executor.map(lambda article: self.fetch_text(article['link']), target_articles)
+        for article, extracted_text in zip(target_articles, extracted_texts):
+            if not extracted_text or len(extracted_text) <= len(article.get('summary', '')):
+                continue
+            article['rss_summary'] = article.get('summary', '')
+            article['summary'] = truncate_to_tokens(extracted_text, self.max_tokens)
+            enriched_count += 1
+
+        logger.info("📄 본문 보강: %d/%d개 기사", enriched_count, len(target_articles))
+        return enriched_count
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
@@ -0,0 +1,103 @@
+"""
+기사 시간 인덱스 모듈
+발행 시각을 한 번만 UTC epoch으로 정규화하고, 시간순 정렬 배열(bisect)로
+구간 조회와 오래된 기사 제거를 O(log n)에 처리 (ArticleScheduler 백로그의 오래된 기사 제거에 사용)
+"""
+import calendar
+import email.utils
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+
+def parse_published_timestamp(published: str) -> Optional[float]:
+    """RSS published 문자열(RFC 822 또는 ISO 8601) → UTC epoch 초 (해석 불가 시 None)"""
+    if not published:
+        return None
+    try:
+        published_datetime = email.utils.parsedate_to_datetime(published)
+    except (TypeError, ValueError):
+        try:
+            published_datetime = datetime.fromisoformat(published.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if published_datetime.tzinfo is None:
+        published_datetime = published_datetime.replace(tzinfo=timezone.utc)
+    return published_datetime.timestamp()
+
+
+def published_timestamp_from_entry(published: str, published_parsed: Optional[time.struct_time] = None) -> Optional[float]:
+    """
+    feedparser의 published_parsed(UTC struct_time)가 있으면 우선 사용, 없으면 문자열 해석
+
+    Returns:
+        UTC epoch 초 또는 None
+    """
+    if published_parsed:
+        return float(calendar.timegm(published_parsed))
+    return parse_published_timestamp(published)
+
+
+def format_utc(timestamp: float) -> str:
+    """프롬프트/로그용 UTC 시각 문자열"""
+    return time.strftime('%Y-%m-%d %H:%M UTC', time.gmtime(timestamp))
+
+
+class ArticleTimeIndex:
+    """
+    발행 시각 오름차순 정렬 배열 (timestamps와 articles를 같은 순서로 유지)
+    조회/경계 탐색은 이진 탐색, 오래된 구간 제거는 앞부분 슬라이스 삭제
+    """
+
+    __slots__ = ('timestamps', 'articles')
+
+    def __init__(self):
+        self.timestamps: List[float] = []
+        self.articles: List[Dict] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def add(self, article: Dict):
+        """기사 추가 (article['published_timestamp'] 필요) - 대부분 최신 기사라 끝에 붙는 경우가 많음"""
+        published_timestamp = article['published_timestamp']
+        if not self.timestamps or published_timestamp >= self.timestamps[-1]:
+            self.timestamps.append(published_timestamp)
+            self.articles.append(article)
+            return
+        insert_index = bisect_right(self.timestamps, published_timestamp)
+        self.timestamps.insert(insert_index, published_timestamp)
+        self.articles.insert(insert_index, article)
+
+    def between(self, start_timestamp: float, end_timestamp: float = float('inf')) -> List[Dict]:
+        """start_timestamp ≤ 발행 시각 < end_timestamp 기사 (시간순)"""
+        start_index = bisect_left(self.timestamps, start_timestamp)
+        end_index = bisect_left(self.timestamps, end_timestamp)
+        return self.articles[start_index:end_index]
+
+    def prune_older_than(self, cutoff_timestamp: float) -> List[Dict]:
+        """
+        cutoff보다 먼저 발행된 기사를 인덱스에서 제거
+
+        Returns:
+            제거된 기사 리스트
+        """
+        cutoff_index = bisect_left(self.timestamps, cutoff_timestamp)
+        if cutoff_index == 0:
+            return []
+        removed_articles = self.articles[:cutoff_index]
+        del self.timestamps[:cutoff_index]
+        del self.articles[:cutoff_index]
+        return removed_articles
+
+    def oldest_timestamp(self) -> Optional[float]:
+        return self.timestamps[0] if self.timestamps else None
+
+
+def is_stale(article: Dict, max_age_seconds: float, now: Optional[float] = None) -> bool:
+    """발행 후 max_age_seconds가 지난 기사인지 (max_age_seconds가 0이면 항상 False)"""
+    if not max_age_seconds:
+        return False
+    now = now if now is not None else time.time()
+    return now - article['published_timestamp'] > max_age_seconds
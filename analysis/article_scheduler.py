@@ -0,0 +1,238 @@
+"""
+기사 분석 스케줄러 모듈
+새 기사를 우선순위(출처 신뢰도, 최신성, 관련성, 같은 이슈 기사 수)로 정렬하여
+주기별 예산(기사 수 / 토큰 / 비용) 안에서만 분석 대상으로 꺼내고, 남은 기사는 다음 주기로 이월
+"""
+import heapq
+import itertools
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from analysis.article_index import ArticleTimeIndex, parse_published_timestamp
+from analysis.news_analyzer import STATUS_FAILED, STATUS_TIMEOUT
+from analysis.sector_lexicon import tokenize
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+# 기사 1건 분석 시 프롬프트 고정부 + 응답 토큰 (OpenAIBackend.build_prompt 기준 대략값)
+PROMPT_OVERHEAD_TOKENS = 450
+RESPONSE_TOKENS = 120
+CHARS_PER_TOKEN = 4
+
+# 같은 이슈(클러스터)로 묶을 제목 단어 집합 Jaccard 유사도 기준
+CLUSTER_SIMILARITY_THRESHOLD = 0.5
+
+
+@dataclass
+class CycleBudget:
+    """주기당 분석 예산 (0이면 해당 항목 무제한, 시간 예산은 ANALYSIS_DEADLINE이 담당)"""
+    max_articles: int = 0
+    max_tokens: int = 0
+    max_cost: float = 0.0
+    price_per_1k_tokens: float = 0.0
+
+
+def estimate_article_tokens(article: Dict) -> int:
+    """기사 1건을 LLM으로 분석할 때 예상 토큰 수 (문자 수 / 4 + 프롬프트 고정부 + 응답)"""
+    content_length = len(article.get('title', '')) + len(article.get('summary', ''))
+    return PROMPT_OVERHEAD_TOKENS + RESPONSE_TOKENS + content_length // CHARS_PER_TOKEN
+
+
+class ArticleScheduler:
+    """우선순위 기반 기사 백로그 (주기마다 예산만큼 꺼내고 나머지는 이월)"""
+
+    def __init__(self, source_weights: Optional[Dict[str, float]] = None, default_source_weight: float = 1.0,
+                 recency_half_life_minutes: float = 120.0, max_backlog: int = 500,
+                 max_article_age_seconds: float = 6 * 3600, max_attempts: int = 3):
+        """
+        Args:
+            source_weights: 출처(피드 제목) → 신뢰도 가중치
+            default_source_weight: source_weights에 없는 출처의 가중치
+            recency_half_life_minutes: 최신성 점수가 절반이 되는 기사 나이 (분)
+            max_backlog: 이월 백로그 최대 크기 (초과 시 우선순위 낮은 기사부터 버림)
+            max_article_age_seconds: 이보다 오래된 기사는 분석하지 않고 버림 (0이면 제한 없음)
+            max_attempts: 시간 초과/실패로 다시 백로그에 넣을 수 있는 최대 횟수
+        """
+        self.source_weights = dict(source_weights or {})
+        self.default_source_weight = default_source_weight
+        self.recency_half_life_minutes = recency_half_life_minutes
+        self.max_backlog = max_backlog
+        self.max_article_age_seconds = max_article_age_seconds
+        self.max_attempts = max_attempts
+        self.backlog: Dict[str, Dict] = {}  # 기사 키(link 또는 제목) → 기사
+        self._attempts: Dict[str, int] = {}
+        # 오래된 기사 제거용 발행 시각 인덱스 (꺼낸 기사는 지연 삭제 - 제거 시 backlog에 남아 있는지 확인)
+        self.time_index = ArticleTimeIndex()
+
+    @staticmethod
+    def _article_key(article: Dict) -> str:
+        return article.get('link') or article.get('title', '')
+
+    def enqueue(self, articles: List[Dict]):
+        """새 기사를 백로그에 추가 (이미 대기 중인 기사는 무시)"""
+        current_timestamp = time.time()
+        for article in articles:
+            article_key = self._article_key(article)
+            if article_key in self.backlog:
+                continue
+            if article.get('published_timestamp') is None:
+                article['published_timestamp'] = parse_published_timestamp(article.get('published', '')) or current_timestamp
+            article.setdefault('enqueued_timestamp', current_timestamp)
+            self.backlog[article_key] = article
+            self.time_index.add(article)
+        METRICS.inc('scheduler_articles_enqueued_total', len(articles))
+
+    def checkpoint_state(self) -> Dict:
+        """체크포인트용 상태 (이월 백로그 + 재시도 횟수)"""
+        return {'backlog': self.backlog, 'attempts': self._attempts}
+
+    def restore_state(self, state: Dict):
+        """체크포인트 복원 (발행 시각 인덱스는 복원한 기사로 다시 만듦)"""
+        self.backlog.update(state['backlog'])
+        self._attempts.update(state['attempts'])
+        self.time_index = ArticleTimeIndex()
+        for article in sorted(self.backlog.values(), key=lambda article: article['published_timestamp']):
+            self.time_index.add(article)
+
+    def requeue_unfinished(self, articles: List[Dict], results: List) -> int:
+        """
+        시간 초과 / 실패로 점수를 얻지 못한 기사를 다음 주기로 이월
+
+        Args:
+            articles: take()로 꺼내 analyze_batch()에 넘긴 기사 (results와 같은 순서)
+            results: BatchAnalysis.results
+
+        Returns:
+            이월한 기사 수
+        """
+        carried_count = 0
+        for article, analysis_result in zip(articles, results):
+            article_key = self._article_key(article)
+            if analysis_result.status not in (STATUS_TIMEOUT, STATUS_FAILED):
+                self._attempts.pop(article_key, None)
+                continue
+            attempt_count = self._attempts.get(article_key, 0) + 1
+            if attempt_count >= self.max_attempts:
+                self._attempts.pop(article_key, None)
+                METRICS.inc('scheduler_articles_abandoned_total')
+                continue
+            self._attempts[article_key] = attempt_count
+            self.backlog[article_key] = article
+            self.time_index.add(article)
+            carried_count += 1
+        if carried_count:
+            METRICS.inc('scheduler_articles_carried_total', carried_count)
+        return carried_count
+
+    def _cluster_sizes(self, articles: List[Dict]) -> List[int]:
+        """제목 단어 집합 Jaccard 유사도로 같은 이슈 기사를 묶어 기사별 클러스터 크기 반환 (greedy)"""
+        cluster_token_sets: List[frozenset] = []
+        cluster_members: List[List[int]] = []
+        for article_index, article in enumerate(articles):
+            title_tokens = frozenset(token for token in tokenize(article.get('title', '')) if len(token) > 2)
+            for cluster_index, cluster_tokens in enumerate(cluster_token_sets):
+                union_size = len(title_tokens | cluster_tokens)
+                if union_size and len(title_tokens & cluster_tokens) / union_size >= CLUSTER_SIMILARITY_THRESHOLD:
+                    cluster_members[cluster_index].append(article_index)
+                    break
+            else:
+                cluster_token_sets.append(title_tokens)
+                cluster_members.append([article_index])
+
+        cluster_sizes = [1] * len(articles)
+        for member_indexes in cluster_members:
+            for article_index in member_indexes:
+                cluster_sizes[article_index] = len(member_indexes)
+        return cluster_sizes
+
+    def priority(self, article: Dict, cluster_size: int = 1, now: Optional[float] = None) -> float:
+        """
+        우선순위 = 출처 가중치 × 최신성(반감기 감쇠) × (1 + 관련성 매칭 수) × (1 + ln(클러스터 크기))
+        """
+        now = now or time.time()
+        source_weight = self.source_weights.get(article.get('source', ''), self.default_source_weight)
+        reference_timestamp = article.get('published_timestamp') or now
+        age_minutes = max(0.0, (now - reference_timestamp) / 60.0)
+        recency = 0.5 ** (age_minutes / self.recency_half_life_minutes) if self.recency_half_life_minutes > 0 else 1.0
+        relevance = article.get('relevance', 0)
+        return source_weight * recency * (1 + relevance) * (1 + math.log(cluster_size))
+
+    def _drop_stale(self, now: float):
+        """발행 후 max_article_age_seconds가 지난 기사 제거 (인덱스 앞부분만 잘라냄, 백로그 전체를 훑지 않음)"""
+        # 이미 꺼낸 기사가 인덱스에 쌓이지 않도록 백로그보다 많이 커지면 다시 만듦
+        if len(self.time_index) > 2 * len(self.backlog) + 100:
+            self.time_index = ArticleTimeIndex()
+            for article in sorted(self.backlog.values(), key=lambda article: article['published_timestamp']):
+                self.time_index.add(article)
+
+        if not self.max_article_age_seconds:
+            return
+        stale_keys = []
+        for article in self.time_index.prune_older_than(now - self.max_article_age_seconds):
+            article_key = self._article_key(article)
+            if self.backlog.get(article_key) is article:
+                del self.backlog[article_key]
+                self._attempts.pop(article_key, None)
+                stale_keys.append(article_key)
+        if stale_keys:
+            METRICS.inc('scheduler_articles_expired_total', len(stale_keys))
+            logger.info("🗑️ 오래된 기사 %d개 백로그에서 제거", len(stale_keys))
+
+    def take(self, budget: CycleBudget) -> Tuple[List[Dict], int]:
+        """
+        우선순위 순으로 예산 안에서 분석할 기사를 꺼냄 (남은 기사는 백로그에 유지)
+
+        Returns:
+            (분석할 기사 리스트, 예상 토큰 합계)
+        """
+        now = time.time()
+        self._drop_stale(now)
+
+        pending_articles = list(self.backlog.values())
+        cluster_sizes = self._cluster_sizes(pending_articles)
+        sequence = itertools.count()
+        article_priorities = {
+            self._article_key(article): self.priority(article, cluster_size, now)
+            for article, cluster_size in zip(pending_articles, cluster_sizes)
+        }
+        priority_heap = [
+            (-article_priorities[self._article_key(article)], next(sequence), article)
+            for article in pending_articles
+        ]
+        heapq.heapify(priority_heap)
+
+        selected_articles = []
+        estimated_tokens = 0
+        token_limit = budget.max_tokens or float('inf')
+        if budget.max_cost and budget.price_per_1k_tokens:
+            token_limit = min(token_limit, budget.max_cost / budget.price_per_1k_tokens * 1000)
+
+        while priority_heap:
+            if budget.max_articles and len(selected_articles) >= budget.max_articles:
+                break
+            _, _, article = heapq.heappop(priority_heap)
+            article_tokens = estimate_article_tokens(article)
+            if estimated_tokens + article_tokens > token_limit:
+                continue  # 더 짧은 기사는 남은 예산에 들어갈 수 있음
+            estimated_tokens += article_tokens
+            selected_articles.append(article)
+            del self.backlog[self._article_key(article)]
+
+        # 백로그 상한 초과분은 우선순위 낮은 기사부터 버림
+        if len(self.backlog) > self.max_backlog:
+            overflow_keys = heapq.nsmallest(len(self.backlog) - self.max_backlog, self.backlog,
+                                            key=article_priorities.__getitem__)
+            for article_key in overflow_keys:
+                del self.backlog[article_key]
+                self._attempts.pop(article_key, None)
+            METRICS.inc('scheduler_articles_overflow_total', len(overflow_keys))
+            logger.warning("⚠️ 분석 백로그 상한 초과 - 우선순위 낮은 기사 %d개 제거", len(overflow_keys))
+
+        METRICS.inc('scheduler_articles_taken_total', len(selected_articles))
+        if self.backlog:
+            logger.info("📥 예산 내 %d개 기사 분석, %d개 다음 주기로 이월", len(selected_articles), len(self.backlog))
+        return selected_articles, estimated_tokens
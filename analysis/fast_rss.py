@@ -0,0 +1,142 @@
+"""
+빠른 RSS/Atom 파싱 모듈
+expat 기반 증분 파서(XMLPullParser)로 필요한 필드(title, link, published, summary)만 추출하고
+limit개 항목을 읽으면 즉시 중단 (네트워크 응답도 나머지는 읽지 않음)
+형식이 깨진 피드는 FastParseError → 호출 측에서 feedparser로 대체
+"""
+import xml.etree.ElementTree as ElementTree
+from typing import Dict, Iterable, List, Optional, Tuple
+
+ITEM_TAGS = frozenset({'item', 'entry'})
+FEED_CONTAINER_TAGS = frozenset({'channel', 'feed'})
+
+# 항목 필드 → 후보 태그 (앞쪽 우선)
+PUBLISHED_TAGS = ('pubDate', 'published', 'updated', 'date')
+SUMMARY_TAGS = ('description', 'summary', 'encoded', 'content')
+
+
+class FastParseError(Exception):
+    """빠른 파서로 처리할 수 없는 피드 (형식 오류 / RSS·Atom 아님)"""
+
+
+def _local_name(tag: str) -> str:
+    """'{namespace}name' → 'name'"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _entry_from_element(item_element) -> Dict[str, str]:
+    child_texts: Dict[str, str] = {}
+    link = ''
+    for child_element in item_element:
+        child_name = _local_name(child_element.tag)
+        if child_name == 'link':
+            # RSS: <link>url</link>, Atom: <link rel="alternate" href="url"/>
+            href = child_element.get('href')
+            if href is None:
+                link = link or (child_element.text or '').strip()
+            elif child_element.get('rel', 'alternate') == 'alternate' or not link:
+                link = href
+            continue
+        if child_name not in child_texts:
+            child_texts[child_name] = (child_element.text or '').strip()
+
+    published = next((child_texts[tag] for tag in PUBLISHED_TAGS if child_texts.get(tag)), '')
+    summary = next((child_texts[tag] for tag in SUMMARY_TAGS if child_texts.get(tag)), '')
+    return {
+        'title': child_texts.get('title', ''),
+        'link': link,
+        'published': published,
+        'summary': summary,
+    }
+
+
+class FastFeedParser:
+    """
+    청크 단위로 feed()하는 증분 파서 (네트워크 스트리밍과 함께 사용)
+
+    사용 예:
+        parser = FastFeedParser(limit=5)
+        for chunk in response.iter_content(16384):
+            if parser.feed(chunk):
+                break
+        feed_title, entries = parser.result()
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.feed_title: Optional[str] = None
+        self.entries: List[Dict[str, str]] = []
+        self.saw_feed_root = False
+        self._pull_parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        self._open_tags: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        return len(self.entries) >= self.limit
+
+    def feed(self, data: bytes) -> bool:
+        """
+        데이터 추가
+
+        Returns:
+            limit개 항목을 모두 읽었으면 True (더 읽을 필요 없음)
+
+        Raises:
+            FastParseError: XML 형식 오류
+        """
+        if self.done:
+            return True
+        try:
+            self._pull_parser.feed(data)
+            self._consume_events(self._pull_parser.read_events())
+        except ElementTree.ParseError as parse_exception:
+            raise FastParseError(str(parse_exception)) from parse_exception
+        return self.done
+
+    def _consume_events(self, events: Iterable[Tuple[str, object]]):
+        for event_name, element in events:
+            element_name = _local_name(element.tag)
+            if event_name == 'start':
+                if not self._open_tags and element_name in ('rss', 'feed', 'RDF'):
+                    self.saw_feed_root = True
+                self._open_tags.append(element_name)
+                continue
+
+            self._open_tags.pop()
+            if element_name in ITEM_TAGS:
+                self.entries.append(_entry_from_element(element))
+                element.clear()  # 처리한 항목은 메모리에서 해제
+                if self.done:
+                    return
+            elif (element_name == 'title' and self.feed_title is None
+                  and self._open_tags and self._open_tags[-1] in FEED_CONTAINER_TAGS):
+                self.feed_title = (element.text or '').strip()
+
+    def result(self) -> Tuple[Optional[str], List[Dict[str, str]]]:
+        """
+        Returns:
+            (피드 제목 또는 None, 항목 리스트)
+
+        Raises:
+            FastParseError: RSS/Atom 루트가 없거나 입력이 끝나기 전에 문서가 깨진 경우
+        """
+        if not self.saw_feed_root:
+            raise FastParseError("RSS/Atom 피드가 아닙니다")
+        if not self.done:
+            try:
+                self._pull_parser.close()
+            except ElementTree.ParseError as parse_exception:
+                raise FastParseError(str(parse_exception)) from parse_exception
+        return self.feed_title, self.entries
+
+
+def parse_feed_bytes(data: bytes, limit: int) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    """
+    메모리에 있는 피드 문서 파싱 (앞에서부터 limit개 항목만)
+
+    Raises:
+        FastParseError: 형식 오류
+    """
+    parser = FastFeedParser(limit)
+    parser.feed(data)
+    return parser.result()
@@ -0,0 +1,184 @@
+"""
+로컬 CPU 감정 점수 백엔드
+섹터 어휘 사전(lexicon) 기반 사전 점수 + 해시 n-gram 선형 모델(LLM 결과로 온라인 학습)
+네트워크 없이 기사당 수십 µs 수준으로 OpenAI와 같은 섹터 점수 dict 반환
+"""
+import json
+import math
+import os
+import threading
+import zlib
+from typing import Dict, List, Optional
+
+from analysis.news_analyzer import BackendScore, SentimentBackend
+from analysis.sector_lexicon import NEGATIVE_TERMS, POSITIVE_TERMS, SECTOR_ENTITIES, ngram_set, tokenize
+from util.logger import get_logger
+from util.universe import get_universe
+
+logger = get_logger(__name__)
+
+MODEL_FORMAT_VERSION = 1
+MAX_ABS_SCORE = 5
+
+
+class LocalLinearBackend(SentimentBackend):
+    """어휘 사전 + 해시 특징 선형 회귀 (섹터별 출력)"""
+
+    name = 'local'
+    model = 'local-linear-v1'
+
+    def __init__(self, model_path: str = '', hash_bits: int = 18, learning_rate: float = 0.05,
+                 lexicon_weight: float = 1.0):
+        """
+        Args:
+            model_path: 학습된 가중치 JSON 경로 (있으면 로드, save() 시 저장)
+            hash_bits: 특징 해시 공간 크기 (2^hash_bits)
+            learning_rate: 온라인 학습률
+            lexicon_weight: 어휘 사전 점수 비중 (학습 데이터가 쌓이면 선형 모델이 보정)
+        """
+        self.model_path = model_path
+        self.hash_bits = hash_bits
+        self.hash_mask = (1 << hash_bits) - 1
+        self.learning_rate = learning_rate
+        self.lexicon_weight = lexicon_weight
+        self.sector_names: List[str] = list(get_universe().names)
+        self.bias: List[float] = [0.0] * len(self.sector_names)
+        self.weights: Dict[int, List[float]] = {}  # 특징 해시 → 섹터별 가중치 (희소)
+        self.examples_seen = 0
+        self.dirty = False  # 마지막 save() 이후 learn()으로 가중치가 바뀌었는지
+        self._lock = threading.Lock()  # learn()의 가중치 갱신과 predict_raw() / save()의 읽기를 직렬화
+
+        if model_path and os.path.exists(model_path):
+            self.load(model_path)
+
+    def _features(self, tokens: List[str]) -> List[int]:
+        """unigram + bigram 해시 특징 (중복 제거)"""
+        feature_strings = set(tokens)
+        feature_strings.update(f"{tokens[i]} {tokens[i + 1]}" for i in range(len(tokens) - 1))
+        return list({zlib.crc32(feature.encode('utf-8')) & self.hash_mask for feature in feature_strings})
+
+    def _lexicon_prior(self, ngrams) -> List[float]:
+        """언급된 섹터에 기사 전체 긍정/부정 극성을 부여"""
+        polarity = len(ngrams & POSITIVE_TERMS) - len(ngrams & NEGATIVE_TERMS)
+        polarity = max(-3, min(3, polarity))
+        if polarity == 0:
+            return [0.0] * len(self.sector_names)
+        prior = []
+        for sector_name in self.sector_names:
+            mention_count = len(ngrams & SECTOR_ENTITIES.get(sector_name, frozenset()))
+            prior.append(polarity * min(mention_count, 2) * self.lexicon_weight)
+        return prior
+
+    def predict_raw(self, article_text: str) -> List[float]:
+        """섹터별 연속값 예측 (sector_names 순서)"""
+        tokens = tokenize(article_text)
+        with self._lock:
+            return self._predict_locked(tokens, self._features(tokens))
+
+    def _predict_locked(self, tokens: List[str], feature_ids: List[int]) -> List[float]:
+        """predict_raw 본체 (self._lock을 잡은 상태에서 호출 - 다른 스레드의 learn()이 가중치를 바꾸는 중에 읽지 않도록)"""
+        predictions = self._lexicon_prior(ngram_set(tokens))
+        if not feature_ids or not self.weights:
+            return predictions
+
+        feature_scale = 1.0 / math.sqrt(len(feature_ids))
+        for sector_index in range(len(self.sector_names)):
+            predictions[sector_index] += self.bias[sector_index]
+        for feature_id in feature_ids:
+            feature_weights = self.weights.get(feature_id)
+            if feature_weights is None:
+                continue
+            for sector_index, weight in enumerate(feature_weights):
+                predictions[sector_index] += weight * feature_scale
+        return predictions
+
+    def to_scores(self, raw_predictions: List[float]) -> Dict[str, int]:
+        """연속값 → -5~+5 정수 점수 dict"""
+        return {
+            sector_name: max(-MAX_ABS_SCORE, min(MAX_ABS_SCORE, int(round(raw_value))))
+            for sector_name, raw_value in zip(self.sector_names, raw_predictions)
+        }
+
+    @staticmethod
+    def is_ambiguous(raw_predictions: List[float], escalate_low: float, escalate_high: float) -> bool:
+        """
+        최대 |예측값|이 [escalate_low, escalate_high) 구간이면 애매한 기사
+        (거의 0 → 무관한 기사, escalate_high 이상 → 로컬 모델이 확신하는 기사)
+        """
+        strongest_signal = max((abs(raw_value) for raw_value in raw_predictions), default=0.0)
+        return escalate_low <= strongest_signal < escalate_high
+
+    def score(self, article_text: str, article_source: str = "Unknown",
+              article_date: str = "Unknown", deadline=None) -> BackendScore:
+        return BackendScore(scores=self.to_scores(self.predict_raw(article_text)), attempts=0, model=self.model)
+
+    def learn(self, article_text: str, target_scores: Dict[str, int]):
+        """
+        LLM 점수를 라벨로 SGD 1스텝 (제곱 오차)
+
+        Args:
+            article_text: 기사 텍스트
+            target_scores: LLM이 낸 섹터별 점수
+        """
+        tokens = tokenize(article_text)
+        feature_ids = self._features(tokens)
+        if not feature_ids:
+            return
+
+        with self._lock:
+            predictions = self._predict_locked(tokens, feature_ids)
+            feature_scale = 1.0 / math.sqrt(len(feature_ids))
+            errors = [
+                float(target_scores.get(sector_name, 0) or 0) - prediction
+                for sector_name, prediction in zip(self.sector_names, predictions)
+            ]
+            for sector_index, error in enumerate(errors):
+                self.bias[sector_index] += self.learning_rate * error * 0.1
+            for feature_id in feature_ids:
+                feature_weights = self.weights.get(feature_id)
+                if feature_weights is None:
+                    feature_weights = self.weights[feature_id] = [0.0] * len(self.sector_names)
+                for sector_index, error in enumerate(errors):
+                    feature_weights[sector_index] += self.learning_rate * error * feature_scale
+            self.examples_seen += 1
+            self.dirty = True
+
+    def save(self, model_path: Optional[str] = None):
+        """가중치를 JSON으로 저장 (임시 파일에 쓴 뒤 교체)"""
+        model_path = model_path or self.model_path
+        if not model_path:
+            return
+        with self._lock:
+            model_state = {
+                'version': MODEL_FORMAT_VERSION,
+                'model': self.model,
+                'sectors': self.sector_names,
+                'hash_bits': self.hash_bits,
+                'examples_seen': self.examples_seen,
+                'bias': self.bias,
+                'weights': {str(feature_id): [round(weight, 5) for weight in feature_weights]
+                            for feature_id, feature_weights in self.weights.items()},
+            }
+            self.dirty = False
+        temporary_path = f"{model_path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump(model_state, f, separators=(',', ':'))
+        os.replace(temporary_path, model_path)
+
+    def load(self, model_path: str):
+        """저장된 가중치 로드 (섹터 구성/해시 크기가 다르면 무시)"""
+        try:
+            with open(model_path, 'r', encoding='utf-8') as f:
+                model_state = json.load(f)
+        except (OSError, json.JSONDecodeError) as load_exception:
+            logger.warning("⚠️ 로컬 모델 로드 실패 [%s]: %s - 어휘 사전만 사용", model_path, load_exception)
+            return
+
+        if model_state.get('sectors') != self.sector_names or model_state.get('hash_bits') != self.hash_bits:
+            logger.warning("⚠️ 로컬 모델 섹터/해시 구성이 달라 무시합니다 [%s]", model_path)
+            return
+
+        self.bias = [float(bias_value) for bias_value in model_state['bias']]
+        self.weights = {int(feature_id): feature_weights for feature_id, feature_weights in model_state['weights'].items()}
+        self.examples_seen = int(model_state.get('examples_seen', 0))
+        logger.info("✅ 로컬 감정 모델 로드 (학습 예시 %d개, 특징 %d개)", self.examples_seen, len(self.weights))
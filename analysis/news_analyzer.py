@@ -2,33 +2,164 @@
 AI 뉴스 분석 모듈
 OpenAI API를 사용하여 뉴스 기사의 섹터별 감정 점수 분석
 """
+import hashlib
 import json
 import time
-import sys
-from typing import Dict, List
-from collections import Counter
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
 from openai import OpenAI
 import openai
 
+from util.cassette import active_cassette, paced_seconds
+from util.metrics import METRICS
+from util.logger import get_logger
+from util.resilience import CircuitBreaker, CircuitOpenError, Deadline, DeadlineExceeded, RetryPolicy, retry_after_seconds
+from util.universe import DEFAULT_UNIVERSE, KIND_SECTOR_ETF, Universe, get_universe
 
-# 11개 섹터 및 대응 ETF
-SECTORS = {
-    "Technology": "XLK",
-    "Semiconductors": "SMH",
-    "Financials": "XLF",
-    "Healthcare": "XLV",
-    "Energy": "XLE",
-    "Airlines": "JETS",
-    "Consumer Discretionary": "XLY",
-    "Consumer Staples": "XLP",
-    "Commodities": "DBC",
-    "Utilities": "XLU",
-    "Real Estate": "XLRE"
+logger = get_logger(__name__)
+
+
+# 분석 결과 상태
+STATUS_OK = 'ok'            # OpenAI 분석 성공
+STATUS_CACHED = 'cached'    # 같은 기사 이전 결과 재사용
+STATUS_FAILED = 'failed'    # 재시도 소진 / 서킷 open → 점수 없음 (중립 0점과 구분)
+STATUS_TIMEOUT = 'timeout'  # 마감 시간 초과로 분석하지 못함
+STATUS_FALLBACK = 'fallback'  # LLM 사용 불가로 로컬 점수 대체 (합계에는 반영, 캐시하지 않아 다음에 LLM 재시도)
+
+USABLE_STATUSES = (STATUS_OK, STATUS_CACHED, STATUS_FALLBACK)
+
+# 프롬프트(채점 기준/섹터 정의)를 바꾸면 올려서 아카이브에서 구분
+PROMPT_VERSION = 'sector11-v1'
+
+# 프롬프트에 표시할 종목 종류 (섹터 ETF는 표시하지 않음)
+_KIND_LABELS = {
+    'sub_industry': "GICS sub-industry",
+    'stock': "single stock",
+    'leveraged_etf': "leveraged ETF",
+    'inverse_etf': "inverse ETF - moves opposite to its underlying, score the impact on THIS ETF's price",
 }
 
 
-class NewsAnalyzer:
-    """OpenAI를 사용한 뉴스 감정 분석"""
+def prompt_version(universe: Optional[Universe] = None) -> str:
+    """아카이브에 기록할 프롬프트 버전 (기본 유니버스가 아니면 종목 구성 해시를 붙임)"""
+    universe = universe or get_universe()
+    if universe.instruments == DEFAULT_UNIVERSE.instruments:
+        return PROMPT_VERSION
+    universe_digest = hashlib.blake2b(json.dumps([[instrument.name, instrument.ticker] for instrument in universe]).encode('utf-8'),
+                                      digest_size=4).hexdigest()
+    return f"universe{len(universe)}-{universe_digest}"
+
+
+def weighted_sector_totals(source_scores: Dict[str, Dict[str, int]],
+                           source_weights: Optional[Dict[str, float]] = None) -> Dict[str, int]:
+    """
+    출처별 섹터 점수 합계 → 출처 가중치를 곱한 섹터 합계 (정수 반올림)
+    가중치는 출처당 한 번만 곱함 (기사마다 곱하지 않음) / 가중치가 없는 출처는 1.0
+    유니버스 id 순서 배열에 누적 (유니버스에 없는 이름은 무시)
+
+    Args:
+        source_scores: 출처 → 섹터별 점수 합계 (BatchAnalysis.source_scores)
+        source_weights: 출처 → 신뢰도 가중치 (None이면 단순 합계)
+    """
+    universe = get_universe()
+    universe_index = universe.index
+    weighted_totals = [0.0] * len(universe)
+    for source, sector_scores in source_scores.items():
+        source_weight = source_weights.get(source, 1.0) if source_weights else 1.0
+        for sector, score in sector_scores.items():
+            instrument_id = universe_index.get(sector)
+            if instrument_id is not None:
+                weighted_totals[instrument_id] += source_weight * score
+    return {sector: int(round(total_score)) for sector, total_score in zip(universe.names, weighted_totals)}
+
+
+@dataclass
+class AnalysisResult:
+    """단일 기사 분석 결과 (점수 + 상태 + 지연시간)"""
+    scores: Dict[str, int]
+    status: str
+    latency_seconds: float = 0.0
+    attempts: int = 0
+    source: str = 'Unknown'
+    model: str = ''
+
+    @property
+    def usable(self) -> bool:
+        """합계에 반영할 수 있는 결과인지 (실패/타임아웃은 제외)"""
+        return self.status in USABLE_STATUSES
+
+
+@dataclass
+class BatchAnalysis:
+    """배치 분석 결과 (사용 가능한 결과만 합산한 섹터 점수 + 커버리지)"""
+    scores: Dict[str, int]
+    results: List[AnalysisResult] = field(default_factory=list)
+
+    @property
+    def coverage(self) -> float:
+        """전체 기사 중 점수를 얻은 비율 (기사가 없으면 1.0)"""
+        if not self.results:
+            return 1.0
+        return sum(1 for result in self.results if result.usable) / len(self.results)
+
+    @property
+    def status_counts(self) -> Dict[str, int]:
+        return dict(Counter(result.status for result in self.results))
+
+    @property
+    def source_scores(self) -> Dict[str, Dict[str, int]]:
+        """출처별 섹터 점수 합계 (사용 가능한 결과만, 출처 가중치 적용 전)"""
+        accumulated_source_scores: Dict[str, Counter] = {}
+        for analysis_result in self.results:
+            if analysis_result.usable:
+                accumulated_source_scores.setdefault(analysis_result.source, Counter()).update(analysis_result.scores)
+        return {source: dict(sector_scores) for source, sector_scores in accumulated_source_scores.items()}
+
+    @classmethod
+    def from_results(cls, results: List[AnalysisResult],
+                     source_weights: Optional[Dict[str, float]] = None) -> 'BatchAnalysis':
+        """개별 결과로 배치 결과 재구성 (사용 가능한 결과만 합산 - 아카이브 리플레이용)"""
+        batch_analysis = cls(scores={}, results=list(results))
+        batch_analysis.scores = weighted_sector_totals(batch_analysis.source_scores, source_weights)
+        return batch_analysis
+
+
+@dataclass
+class BackendScore:
+    """백엔드 1회 채점 결과 (scores가 None이면 실패)"""
+    scores: Optional[Dict[str, int]]
+    attempts: int = 0
+    model: str = ''
+    from_llm: bool = False
+    fallback: bool = False  # 원래 백엔드 대신 임시로 쓴 점수 (결과 캐시에 넣지 않음)
+
+
+class SentimentBackend:
+    """
+    섹터 감정 점수 백엔드 인터페이스
+    score()는 섹터별 -5~+5 정수 점수 dict (유니버스의 모든 항목 포함)를 BackendScore로 반환
+    """
+
+    name = 'base'
+    model = ''
+
+    def score(self, article_text: str, article_source: str = "Unknown",
+              article_date: str = "Unknown", deadline: Optional[Deadline] = None) -> BackendScore:
+        """
+        Raises:
+            CircuitOpenError: 백엔드가 일시적으로 사용 불가할 때
+            DeadlineExceeded: 마감 시간 안에 채점할 수 없을 때
+        """
+        raise NotImplementedError
+
+
+class OpenAIBackend(SentimentBackend):
+    """OpenAI Responses API 기반 백엔드 (재시도 / 서킷 브레이커 포함)"""
+
+    name = 'openai'
 
     def __init__(
         self,
@@ -37,39 +168,82 @@ class NewsAnalyzer:
         temperature: float = 0.3,
         reasoning_effort: dict = {"effort": "low"},
         max_retries: int = 3,
-        retry_delay: int = 2
+        retry_delay: int = 2,
+        max_retry_delay: float = 30.0,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_cooldown: float = 120.0,
+        max_instruments_per_call: int = 20,
+        max_parallel_calls: int = 4
     ):
         """
         Args:
             api_key: OpenAI API 키
             model: 사용할 모델 (기본: gpt-4o-mini)
             temperature: 응답 랜덤성 (0.0~1.0)
-            max_retries: API 오류 시 재시도 횟수
-            retry_delay: 재시도 간격 (초)
+            max_retries: API 오류 시 최대 시도 횟수
+            retry_delay: 첫 재시도 백오프 상한 (초, 이후 2배씩 증가 + 지터)
+            max_retry_delay: 백오프 상한 (초, Retry-After 헤더가 있으면 헤더 우선)
+            circuit_breaker_threshold: 연속 실패 시 서킷을 여는 횟수
+            circuit_breaker_cooldown: 서킷 open 유지 시간 (초)
+            max_instruments_per_call: 요청 1회에 채점할 최대 종목 수 (유니버스가 크면 나눠서 병렬 요청, 0이면 분할 안 함)
+            max_parallel_calls: 분할 요청 동시 실행 수
         """
         self.client = OpenAI(api_key=api_key)
         self.model = model
         self.temperature = temperature
         self.reasoning_effort = reasoning_effort
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
-        self.SECTORS = SECTORS
-
-    def analyze_article(self, article_text: str, article_source: str = "Unknown",
-                       article_date: str = "Unknown") -> Dict[str, int]:
-        """
-        단일 기사 분석
-
-        Args:
-            article_text: 분석할 기사 텍스트 (제목 + 요약)
-            article_source: 기사 출처
-            article_date: 기사 날짜
-
-        Returns:
-            섹터별 감정 점수 dict (예: {'Technology': 3, 'Energy': -2, ...})
-            실패 시 모든 섹터 0점 반환
-        """
-        prompt = f"""You are a financial analyst specializing in US stock market sentiment analysis. Analyze this news article and rate its potential impact on 11 US market sectors.
+        self.retry_policy = RetryPolicy(max_attempts=max_retries, base_delay=retry_delay, max_delay=max_retry_delay)
+        self.circuit_breaker = CircuitBreaker(failure_threshold=circuit_breaker_threshold, cooldown_seconds=circuit_breaker_cooldown)
+        self.max_instruments_per_call = max_instruments_per_call
+        self.max_parallel_calls = max_parallel_calls
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def score(self, article_text: str, article_source: str = "Unknown",
+              article_date: str = "Unknown", deadline: Optional[Deadline] = None) -> BackendScore:
+        deadline = deadline or Deadline()
+        universe_chunks = get_universe().chunks(self.max_instruments_per_call)
+        if len(universe_chunks) == 1:
+            prompt = self.build_prompt(article_text, article_source, article_date, universe_chunks[0])
+            sector_sentiment_scores, attempts = self._request_scores(prompt, deadline, universe_chunks[0])
+            return BackendScore(scores=sector_sentiment_scores, attempts=attempts, model=self.model, from_llm=True)
+
+        # 유니버스가 크면 나눠서 병렬 요청 → 하나라도 실패하면 기사 전체를 실패로 처리 (일부 종목만 0점이 되지 않도록)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_parallel_calls, thread_name_prefix='openai')
+        chunk_futures = [
+            self._executor.submit(self._request_scores,
+                                  self.build_prompt(article_text, article_source, article_date, universe_chunk),
+                                  deadline, universe_chunk)
+            for universe_chunk in universe_chunks
+        ]
+        METRICS.inc('openai_split_requests_total', len(chunk_futures), model=self.model)
+        merged_scores: Optional[Dict[str, int]] = {}
+        total_attempts = 0
+        for chunk_future in chunk_futures:
+            chunk_scores, attempts = chunk_future.result()
+            total_attempts = max(total_attempts, attempts)
+            if chunk_scores is None:
+                merged_scores = None
+            elif merged_scores is not None:
+                merged_scores.update(chunk_scores)
+        return BackendScore(scores=merged_scores, attempts=total_attempts, model=self.model, from_llm=True)
+
+    def build_prompt(self, article_text: str, article_source: str, article_date: str,
+                     universe: Optional[Universe] = None) -> str:
+        """기사 1건 분석 프롬프트 (종목 정의와 응답 JSON 형식은 유니버스에서 생성)"""
+        universe = universe or get_universe()
+        universe_label = "sectors" if all(instrument.kind == KIND_SECTOR_ETF for instrument in universe) else "instruments"
+        definition_lines = []
+        for position, instrument in enumerate(universe, 1):
+            kind_label = _KIND_LABELS.get(instrument.kind)
+            ticker_label = f"{instrument.ticker}, {kind_label}" if kind_label else instrument.ticker
+            definition_lines.append(f"{position}. {instrument.name} ({ticker_label}): {instrument.description}".rstrip(': '))
+            if instrument.examples:
+                definition_lines.append(f"{' ' * len(f'{position}. ')}- Examples: {', '.join(instrument.examples)}")
+        instrument_definitions = "\n".join(definition_lines)
+        response_template = json.dumps(universe.zero_scores(), ensure_ascii=False)
+
+        return f"""You are a financial analyst specializing in US stock market sentiment analysis. Analyze this news article and rate its potential impact on {len(universe)} US market {universe_label}.
 
 SCORING GUIDELINES:
 +5: Extremely bullish (e.g., "Major breakthrough", "Record earnings beat 50%+", "Game-changing regulation")
@@ -80,29 +254,8 @@ SCORING GUIDELINES:
 -3: Moderately bearish (e.g., "Disappointing results", "Regulatory warnings", "Supply chain issues")
 -5: Extremely bearish (e.g., "Major crisis", "Bankruptcy concerns", "Severe regulations")
 
-SECTOR DEFINITIONS:
-1. Technology (XLK): Software companies, IT services, hardware manufacturers (EXCLUDING semiconductors)
-   - Examples: Microsoft, Apple, Oracle, IBM
-2. Semiconductors (SMH): Chip manufacturers, semiconductor equipment makers
-   - Examples: NVIDIA, Intel, AMD, TSMC, ASML
-3. Financials (XLF): Banks, insurance, investment firms, payment processors
-   - Examples: JPMorgan, Bank of America, Visa, Mastercard
-4. Healthcare (XLV): Pharmaceuticals, biotech, medical devices, healthcare services
-   - Examples: Pfizer, Johnson & Johnson, UnitedHealth
-5. Energy (XLE): Oil & gas, renewable energy, energy equipment
-   - Examples: Exxon, Chevron, ConocoPhillips
-6. Airlines (JETS): Commercial airlines, air cargo
-   - Examples: American Airlines, Delta, United, Southwest
-7. Consumer Discretionary (XLY): Retail, entertainment, automotive, luxury goods
-   - Examples: Amazon, Tesla, Nike, McDonald's
-8. Consumer Staples (XLP): Food, beverages, household products, tobacco
-   - Examples: Coca-Cola, Procter & Gamble, Walmart groceries
-9. Commodities (DBC): Agricultural products, metals, raw materials
-   - Examples: Wheat, corn, copper, gold
-10. Utilities (XLU): Electric, gas, water utilities, renewable infrastructure
-    - Examples: Duke Energy, Southern Company, NextEra Energy
-11. Real Estate (XLRE): REITs, real estate development, property management
-    - Examples: American Tower, Prologis, Simon Property
+{universe_label.upper()[:-1]} DEFINITIONS:
+{instrument_definitions}
 
 NEWS ARTICLE:
 Source: {article_source}
@@ -112,111 +265,373 @@ Date: {article_date}
 
 IMPORTANT:
 - Consider both DIRECT impact (mentioned in article) and INDIRECT impact (supply chain, competition)
-- If a sector is not mentioned or affected, use 0
-- Be conservative: most news affects 2-4 sectors significantly, others should be 0 or ±1
+- If a {universe_label[:-1]} is not mentioned or affected, use 0
+- Be conservative: most news affects 2-4 {universe_label} significantly, others should be 0 or ±1
 
-Return ONLY valid JSON with ALL 11 sectors:
-{{"Technology": 0, "Semiconductors": 0, "Financials": 0, "Healthcare": 0, "Energy": 0, "Airlines": 0, "Consumer Discretionary": 0, "Consumer Staples": 0, "Commodities": 0, "Utilities": 0, "Real Estate": 0}}
+Return ONLY valid JSON with ALL {len(universe)} {universe_label}:
+{response_template}
 """
 
-        for attempt in range(self.max_retries):
+    def _request_scores(self, prompt: str, deadline: Deadline,
+                        universe: Optional[Universe] = None) -> Tuple[Optional[Dict[str, int]], int]:
+        """
+        재시도를 포함한 OpenAI 호출
+
+        Args:
+            prompt: build_prompt() 결과
+            deadline: 주기 마감 시간
+            universe: 이 프롬프트로 채점하는 종목 (응답에서 이 종목만 사용, 없는 종목은 0)
+
+        Returns:
+            (섹터별 점수 dict 또는 재시도 소진 시 None, 시도 횟수)
+
+        Raises:
+            CircuitOpenError: 서킷 브레이커가 열려 있을 때 (호출하지 않고 즉시)
+            DeadlineExceeded: 주기 마감 시간 안에 재시도할 수 없을 때
+        """
+        for attempt in range(self.retry_policy.max_attempts):
+            # 마감 확인을 먼저 (half-open 시험 호출 자리를 잡은 뒤 호출 없이 빠져나가면 서킷이 half-open에 묶임)
+            if deadline.expired():
+                raise DeadlineExceeded("분석 마감 시간 초과")
+            if not self.circuit_breaker.allow_request():
+                METRICS.inc('openai_circuit_rejected_total', model=self.model)
+                raise CircuitOpenError(f"OpenAI 서킷 브레이커 open (연속 실패 {self.circuit_breaker.consecutive_failures}회)")
+            if attempt > 0:
+                METRICS.inc('openai_retries_total', model=self.model)
+
+            retry_after = None
             try:
                 
                 # if used model is gpt-4 or gpt-3 series it will use temperature parameter
                 # else it will use reasoning_effort parameter
 
+                request_arguments = {
+                    'model': self.model,
+                    'instructions': "you are a helpful assistant that analyzes financial news articles.",
+                    'input': prompt,
+                }
                 if self.model.startswith("gpt-4") or self.model.startswith("gpt-3"):
-                    response = self.client.responses.create(
-                        model=self.model,
-                        instructions="you are a helpful assistant that analyzes financial news articles.",
-                        input=prompt,
-                        temperature=self.temperature,
-                        )
+                    request_arguments['temperature'] = self.temperature
                 else:
-                    response = self.client.responses.create(
-                        model=self.model,
-                        instructions="you are a helpful assistant that analyzes financial news articles.",
-                        input=prompt,
-                        reasoning=self.reasoning_effort,
-                    )
+                    request_arguments['reasoning'] = self.reasoning_effort
+                with METRICS.timer('openai_request_seconds', model=self.model):
+                    response = self._create_response(request_arguments)
+                self.circuit_breaker.record_success()
+                self._record_usage(response)
 
                 api_response_content = response.output_text
-                sector_sentiment_scores = json.loads(api_response_content)
+                parsed_scores = json.loads(api_response_content)
 
-                # 모든 섹터가 포함되어 있는지 확인 및 기본값 설정
-                for sector in SECTORS.keys():
-                    if sector not in sector_sentiment_scores:
-                        sector_sentiment_scores[sector] = 0
+                # 유니버스 종목만 사용 (누락된 종목은 0)
+                sector_sentiment_scores = {sector: parsed_scores.get(sector, 0)
+                                           for sector in (universe or get_universe()).names}
 
-                return sector_sentiment_scores
+                METRICS.inc('openai_requests_total', model=self.model, outcome='ok')
+                return sector_sentiment_scores, attempt + 1
 
             except openai.RateLimitError as rate_limit_exception:
-                progressive_wait_seconds = (attempt + 1) * 10
-                print(f"⚠️ OpenAI Rate Limit (시도 {attempt + 1}/{self.max_retries})")
-                print(f"   {progressive_wait_seconds}초 대기 중...")
-                if attempt < self.max_retries - 1:
-                    time.sleep(progressive_wait_seconds)
-                else:
-                    print(f"❌ Rate Limit 초과 - 0점 반환")
+                METRICS.inc('openai_rate_limited_total', model=self.model)
+                METRICS.inc('openai_requests_total', model=self.model, outcome='rate_limited')
+                self.circuit_breaker.record_failure()
+                retry_after = retry_after_seconds(rate_limit_exception)
+                logger.warning("⚠️ OpenAI Rate Limit (시도 %d/%d, Retry-After: %s)", attempt + 1, self.retry_policy.max_attempts, retry_after)
 
             except openai.AuthenticationError as auth_exception:
-                print(f"❌ OpenAI 인증 실패: {auth_exception}")
-                print("   OPENAI_API_KEY를 확인하세요")
-                sys.exit(1)
+                # 재시도해도 해결되지 않음 → 서킷을 열어 나머지 기사는 즉시 실패 처리 (프로세스는 유지)
+                METRICS.inc('openai_requests_total', model=self.model, outcome='auth_failed')
+                self.circuit_breaker.trip()
+                logger.critical("❌ OpenAI 인증 실패: %s - OPENAI_API_KEY를 확인하세요", auth_exception)
+                raise CircuitOpenError("OpenAI 인증 실패") from auth_exception
 
-            except (openai.APIError, openai.Timeout, openai.APIConnectionError) as api_exception:
+            except (openai.APIError, openai.APITimeoutError, openai.APIConnectionError) as api_exception:
                 exception_class_name = type(api_exception).__name__
-                print(f"⚠️ OpenAI {exception_class_name} (시도 {attempt + 1}/{self.max_retries}): {api_exception}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                else:
-                    print(f"❌ API 오류 (최종) - 0점 반환")
+                METRICS.inc('openai_requests_total', model=self.model, outcome=exception_class_name)
+                self.circuit_breaker.record_failure()
+                retry_after = retry_after_seconds(api_exception)
+                logger.warning("⚠️ OpenAI %s (시도 %d/%d): %s", exception_class_name, attempt + 1, self.retry_policy.max_attempts, api_exception)
 
             except json.JSONDecodeError as json_exception:
-                print(f"⚠️ JSON 파싱 실패 (시도 {attempt + 1}/{self.max_retries})")
-                try:
-                    print(f"   응답 내용: {api_response_content[:200]}")
-                except:
-                    pass
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                else:
-                    print(f"❌ JSON 파싱 실패 (최종) - 0점 반환")
+                # 모델 출력 형식 문제 → 서비스 장애가 아니므로 서킷 브레이커에는 반영하지 않음
+                METRICS.inc('openai_requests_total', model=self.model, outcome='invalid_json')
+                logger.warning("⚠️ JSON 파싱 실패 (시도 %d/%d)", attempt + 1, self.retry_policy.max_attempts,
+                               extra={'response_head': api_response_content[:200]})
 
             except Exception as unexpected_exception:
                 exception_class_name = type(unexpected_exception).__name__
-                print(f"⚠️ 예상치 못한 오류 (시도 {attempt + 1}/{self.max_retries}): {exception_class_name}: {unexpected_exception}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
-                else:
-                    print(f"❌ AI 분석 최종 실패 - 0점 반환")
+                METRICS.inc('openai_requests_total', model=self.model, outcome='unexpected')
+                self.circuit_breaker.record_failure()
+                logger.warning("⚠️ 예상치 못한 오류 (시도 %d/%d): %s: %s", attempt + 1, self.retry_policy.max_attempts, exception_class_name, unexpected_exception)
+
+            if attempt < self.retry_policy.max_attempts - 1:
+                deadline.sleep(self.retry_policy.backoff_delay(attempt, retry_after))
+
+        logger.error("❌ AI 분석 최종 실패 - 합계에서 제외")
+        METRICS.inc('openai_failed_articles_total', model=self.model)
+        return None, self.retry_policy.max_attempts
+
+    def _create_response(self, request_arguments: Dict):
+        """responses.create 호출 (카세트가 설정돼 있으면 출력 텍스트 + 사용량만 기록/재생)"""
+        cassette = active_cassette()
+        if cassette is None:
+            return self.client.responses.create(**request_arguments)
+        return cassette.call('openai', request_arguments, lambda: self.client.responses.create(**request_arguments),
+                             encode=_encode_openai_response, decode=_decode_openai_response)
+
+    def _record_usage(self, response):
+        """응답의 토큰 사용량을 카운터에 누적"""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+        METRICS.inc('openai_tokens_total', getattr(usage, 'input_tokens', 0) or 0, model=self.model, kind='input')
+        METRICS.inc('openai_tokens_total', getattr(usage, 'output_tokens', 0) or 0, model=self.model, kind='output')
+
+
+def _encode_openai_response(response) -> Dict:
+    usage = getattr(response, 'usage', None)
+    return {'output_text': response.output_text,
+            'usage': {'input_tokens': getattr(usage, 'input_tokens', 0) or 0,
+                      'output_tokens': getattr(usage, 'output_tokens', 0) or 0} if usage is not None else None}
+
 
-        return {sector: 0 for sector in SECTORS.keys()}
+def _decode_openai_response(recorded_response: Dict) -> SimpleNamespace:
+    usage = recorded_response['usage']
+    return SimpleNamespace(output_text=recorded_response['output_text'],
+                           usage=SimpleNamespace(**usage) if usage is not None else None)
 
-    def analyze_batch(self, articles: List[Dict]) -> Dict[str, int]:
+
+class CascadeBackend(SentimentBackend):
+    """
+    로컬 모델이 모든 기사를 먼저 채점하고, 애매한 기사만 LLM으로 올려 보내는 백엔드
+    LLM이 실패하거나(서킷 open / 마감 초과) 사용 불가하면 로컬 점수로 대체
+    """
+
+    name = 'cascade'
+
+    def __init__(self, local_backend, llm_backend: SentimentBackend,
+                 escalate_low: float = 0.5, escalate_high: float = 2.5):
+        """
+        Args:
+            local_backend: predict_raw() / is_ambiguous()를 제공하는 로컬 백엔드 (LocalLinearBackend)
+            llm_backend: 애매한 기사를 넘길 LLM 백엔드 (OpenAIBackend)
+            escalate_low: 로컬 최대 |점수|가 이 값 이상이고
+            escalate_high: 이 값 미만이면 애매한 기사로 보고 LLM 호출
+        """
+        self.local_backend = local_backend
+        self.llm_backend = llm_backend
+        self.escalate_low = escalate_low
+        self.escalate_high = escalate_high
+        self.model = f"{local_backend.model}+{llm_backend.model}"
+
+    def score(self, article_text: str, article_source: str = "Unknown",
+              article_date: str = "Unknown", deadline: Optional[Deadline] = None) -> BackendScore:
+        raw_predictions = self.local_backend.predict_raw(article_text)
+        local_score = BackendScore(scores=self.local_backend.to_scores(raw_predictions), model=self.local_backend.model)
+
+        if not self.local_backend.is_ambiguous(raw_predictions, self.escalate_low, self.escalate_high):
+            METRICS.inc('cascade_decisions_total', route='local')
+            return local_score
+
+        METRICS.inc('cascade_decisions_total', route='llm')
+        try:
+            llm_score = self.llm_backend.score(article_text, article_source, article_date, deadline)
+        except (CircuitOpenError, DeadlineExceeded) as llm_exception:
+            logger.debug("LLM 사용 불가 (%s) - 로컬 점수 사용", type(llm_exception).__name__)
+            METRICS.inc('cascade_decisions_total', route='local_fallback')
+            return replace(local_score, fallback=True)
+
+        if llm_score.scores is None:
+            METRICS.inc('cascade_decisions_total', route='local_fallback')
+            return replace(local_score, attempts=llm_score.attempts, fallback=True)
+        return llm_score
+
+
+class NewsAnalyzer:
+    """백엔드(OpenAI / 로컬 모델 / 캐스케이드)를 사용한 뉴스 감정 분석"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.3,
+        reasoning_effort: dict = {"effort": "low"},
+        max_retries: int = 3,
+        retry_delay: int = 2,
+        max_retry_delay: float = 30.0,
+        circuit_breaker_threshold: int = 5,
+        circuit_breaker_cooldown: float = 120.0,
+        request_interval: float = 1.0,
+        result_cache_size: int = 2048,
+        backend: Optional[SentimentBackend] = None,
+        label_learner=None,
+        source_weights: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            api_key: OpenAI API 키 (backend를 직접 넘기면 생략 가능)
+            model ~ circuit_breaker_cooldown: backend 생략 시 만들 OpenAIBackend 설정
+            request_interval: LLM 호출 후 다음 기사까지 대기 시간 (초, rate limit 방지)
+            result_cache_size: 동일 기사 재분석 방지용 결과 캐시 크기
+            backend: 사용할 SentimentBackend (기본: OpenAIBackend)
+            label_learner: LLM 결과를 학습 라벨로 받을 객체 (learn(text, scores) 제공, 예: LocalLinearBackend)
+            source_weights: 출처 → 신뢰도 가중치 (섹터 합계 집계 시 적용, None이면 단순 합계)
+        """
+        if backend is None:
+            backend = OpenAIBackend(
+                api_key=api_key,
+                model=model,
+                temperature=temperature,
+                reasoning_effort=reasoning_effort,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                max_retry_delay=max_retry_delay,
+                circuit_breaker_threshold=circuit_breaker_threshold,
+                circuit_breaker_cooldown=circuit_breaker_cooldown,
+            )
+        self.backend = backend
+        self.label_learner = label_learner
+        self.request_interval = request_interval
+        self.result_cache_size = result_cache_size
+        self.result_cache: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self.source_weights = source_weights
+
+    @property
+    def llm_backend(self) -> Optional[OpenAIBackend]:
+        """현재 구성에서 사용하는 OpenAIBackend (없으면 None) - 설정 핫 리로드용"""
+        if isinstance(self.backend, OpenAIBackend):
+            return self.backend
+        return getattr(self.backend, 'llm_backend', None)
+
+    def checkpoint_state(self) -> Dict:
+        """체크포인트용 상태 (재시작 후 같은 기사를 다시 분석하지 않도록 결과 캐시)"""
+        return {'result_cache': self.result_cache}
+
+    def restore_state(self, state: Dict):
+        self.result_cache.update(state['result_cache'])
+        while len(self.result_cache) > self.result_cache_size:
+            self.result_cache.popitem(last=False)
+
+    def analyze_article(self, article_text: str, article_source: str = "Unknown",
+                       article_date: str = "Unknown", deadline: Optional[Deadline] = None) -> AnalysisResult:
+        """
+        단일 기사 분석
+
+        Args:
+            article_text: 분석할 기사 텍스트 (제목 + 요약)
+            article_source: 기사 출처
+            article_date: 기사 날짜
+            deadline: 재시도 대기를 제한할 마감 시간 (None이면 무제한)
+
+        Returns:
+            AnalysisResult
+            - scores: 섹터별 감정 점수 dict (예: {'Technology': 3, 'Energy': -2, ...})
+            - status: ok / cached / fallback / failed / timeout (failed, timeout이면 scores는 모두 0이며 합계에 반영하지 않음)
+
+        Raises:
+            CircuitOpenError: 백엔드 연속 실패 또는 인증 실패로 서킷이 열려 있을 때
+            DeadlineExceeded: 마감 시간 안에 분석을 끝낼 수 없을 때
+        """
+        cache_key = hashlib.sha1(f"{article_source}\x00{article_date}\x00{article_text}".encode('utf-8')).hexdigest()
+        cached_scores = self.result_cache.get(cache_key)
+        if cached_scores is not None:
+            self.result_cache.move_to_end(cache_key)
+            METRICS.inc('analysis_results_total', status=STATUS_CACHED)
+            return AnalysisResult(scores=dict(cached_scores), status=STATUS_CACHED, source=article_source)
+
+        start_time = time.perf_counter()
+        backend_score = self.backend.score(article_text, article_source, article_date, deadline or Deadline())
+        latency_seconds = time.perf_counter() - start_time
+        METRICS.observe('analyze_article_seconds', latency_seconds, backend=self.backend.name)
+
+        if backend_score.scores is None:
+            METRICS.inc('analysis_results_total', status=STATUS_FAILED)
+            return AnalysisResult(scores=self._zero_scores(), status=STATUS_FAILED, latency_seconds=latency_seconds,
+                                  attempts=backend_score.attempts, source=article_source, model=backend_score.model)
+
+        if backend_score.fallback:
+            # 캐시하면 같은 기사가 다시 들어와도 LLM을 부르지 않으므로 대체 점수는 이번 결과에만 사용
+            METRICS.inc('analysis_results_total', status=STATUS_FALLBACK)
+            return AnalysisResult(scores=backend_score.scores, status=STATUS_FALLBACK, latency_seconds=latency_seconds,
+                                  attempts=backend_score.attempts, source=article_source, model=backend_score.model)
+
+        self.result_cache[cache_key] = backend_score.scores
+        if len(self.result_cache) > self.result_cache_size:
+            self.result_cache.popitem(last=False)
+
+        if backend_score.from_llm and self.label_learner is not None:
+            self.label_learner.learn(article_text, backend_score.scores)
+
+        METRICS.inc('analysis_results_total', status=STATUS_OK)
+        return AnalysisResult(scores=backend_score.scores, status=STATUS_OK, latency_seconds=latency_seconds,
+                              attempts=backend_score.attempts, source=article_source, model=backend_score.model)
+
+    @staticmethod
+    def _zero_scores() -> Dict[str, int]:
+        return get_universe().zero_scores()
+
+    def zero_score_result(self, article: Dict, model: str = 'relevance-filter') -> AnalysisResult:
+        """LLM 호출 없이 0점 처리한 기사 결과 (관련성 필터 zero 모드 - 커버리지에는 정상 결과로 반영)"""
+        METRICS.inc('analysis_results_total', status=STATUS_OK)
+        return AnalysisResult(scores=self._zero_scores(), status=STATUS_OK,
+                              source=article.get('source', 'Unknown'), model=model)
+
+    def analyze_batch(self, articles: List[Dict], deadline_seconds: Optional[float] = None) -> BatchAnalysis:
         """
         여러 기사 배치 분석
 
+        서킷 브레이커가 열리거나 마감 시간이 지나면 남은 기사는 failed / timeout으로 표시하고
+        지금까지의 부분 결과 반환 (failed / timeout 결과는 합계에 반영하지 않음)
+
         Args:
             articles: 기사 리스트 [{'title', 'summary', 'source', 'published', ...}, ...]
+            deadline_seconds: 배치 마감 시간 (초, None이면 무제한)
 
         Returns:
-            섹터별 점수 합계 dict (예: {'Technology': 25, 'Energy': -12, ...})
+            BatchAnalysis
+            - scores: 섹터별 점수 합계 dict (출처 가중치 적용, 예: {'Technology': 25, 'Energy': -12, ...})
+            - results: 기사별 AnalysisResult 리스트 (articles와 같은 순서)
+            - coverage: 점수를 얻은 기사 비율
         """
-        accumulated_sector_scores = Counter()
+        analysis_results: List[AnalysisResult] = []
+        deadline = Deadline(deadline_seconds)
+        skip_status = None
 
         for article_index, article in enumerate(articles, 1):
-            formatted_article_content = f"Title: {article['title']}\n\nSummary: {article['summary']}"
             news_source_name = article.get('source', 'Unknown')
-            publication_date = article.get('published', 'Unknown')
 
-            print(f"🤖 분석 중... ({article_index}/{len(articles)}) [{news_source_name}]")
+            if skip_status is not None:
+                analysis_results.append(AnalysisResult(scores=self._zero_scores(), status=skip_status, source=news_source_name))
+                continue
 
-            sector_sentiment_scores = self.analyze_article(formatted_article_content, news_source_name, publication_date)
-
-            accumulated_sector_scores.update(sector_sentiment_scores)
+            formatted_article_content = f"Title: {article['title']}\n\nSummary: {article['summary']}"
+            publication_date = article.get('published', 'Unknown')
 
-            # Rate limiting 방지
-            time.sleep(1)
+            logger.debug("🤖 분석 중... (%d/%d) [%s]", article_index, len(articles), news_source_name)
 
-        return dict(accumulated_sector_scores)
+            try:
+                analysis_result = self.analyze_article(formatted_article_content, news_source_name, publication_date,
+                                                       deadline=deadline)
+            except CircuitOpenError as circuit_exception:
+                logger.error("⛔ %s - 남은 %d개 기사 분석 생략", circuit_exception, len(articles) - article_index + 1)
+                skip_status = STATUS_FAILED
+                analysis_results.append(AnalysisResult(scores=self._zero_scores(), status=skip_status, source=news_source_name))
+                continue
+            except DeadlineExceeded:
+                logger.warning("⏰ 분석 마감 시간 도달 - 남은 %d개 기사 분석 생략 (부분 결과 사용)", len(articles) - article_index + 1)
+                skip_status = STATUS_TIMEOUT
+                analysis_results.append(AnalysisResult(scores=self._zero_scores(), status=skip_status, source=news_source_name))
+                continue
+
+            analysis_results.append(analysis_result)
+
+            # Rate limiting 방지 (캐시 적중 / 로컬 모델 결과는 API를 호출하지 않았으므로 대기 불필요)
+            if analysis_result.attempts > 0 and article_index < len(articles):
+                try:
+                    deadline.sleep(paced_seconds(self.request_interval))
+                except DeadlineExceeded:
+                    logger.warning("⏰ 분석 마감 시간 도달 - 남은 %d개 기사 분석 생략 (부분 결과 사용)", len(articles) - article_index)
+                    skip_status = STATUS_TIMEOUT
+
+        batch_analysis = BatchAnalysis.from_results(analysis_results, self.source_weights)
+        METRICS.inc('analysis_batches_total')
+        logger.info("📋 분석 커버리지 %.0f%% %s", batch_analysis.coverage * 100, batch_analysis.status_counts)
+        return batch_analysis
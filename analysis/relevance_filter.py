@@ -0,0 +1,186 @@
+"""
+관련성 사전 필터 모듈
+현재 유니버스 종목의 엔티티(예: NVIDIA, OPEC, REIT) 키워드를 Aho-Corasick 오토마톤으로 한 번에 매칭하여
+시장과 무관한 기사(개인 재테크 팁, 라이프스타일 등)를 LLM 분석 전에 걸러냄
+"""
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from analysis.sector_lexicon import MARKET_WIDE_TERMS, SECTOR_ENTITIES
+from util.logger import get_logger
+from util.metrics import METRICS
+from util.universe import Universe, get_universe
+
+logger = get_logger(__name__)
+
+
+def universe_entities(universe: Universe) -> Dict[str, FrozenSet[str]]:
+    """
+    유니버스 종목 → 엔티티 키워드 (유니버스에 없는 섹터의 키워드는 매칭하지 않음)
+    - 어휘 사전에 같은 이름의 섹터가 있으면 사전 엔티티 + 종목 keywords
+    - 없으면(사용자 정의 종목) 종목 이름 + 예시 기업 + keywords
+    """
+    entities = {}
+    for instrument in universe:
+        lexicon_entities = SECTOR_ENTITIES.get(instrument.name)
+        if lexicon_entities is not None:
+            instrument_terms = instrument.keywords
+        else:
+            lexicon_entities = frozenset()
+            instrument_terms = (instrument.name, *instrument.examples, *instrument.keywords)
+        entities[instrument.name] = lexicon_entities | frozenset(term.lower().strip() for term in instrument_terms)
+    return entities
+
+
+class AhoCorasick:
+    """
+    다중 키워드 동시 매칭 오토마톤 (텍스트 길이에 선형)
+    매칭은 단어 경계에서만 인정 (예: 'ai'가 'said' 안에서 매칭되지 않도록)
+    """
+
+    def __init__(self, keyword_payloads: Dict[str, object]):
+        """
+        Args:
+            keyword_payloads: 소문자 키워드 → 매칭 시 돌려줄 값
+        """
+        self._transitions: List[Dict[str, int]] = [{}]
+        self._fail_links: List[int] = [0]
+        self._outputs: List[List[Tuple[int, object]]] = [[]]  # (키워드 길이, payload)
+
+        for keyword, payload in keyword_payloads.items():
+            self._add_keyword(keyword, payload)
+        self._build_fail_links()
+
+    def _add_keyword(self, keyword: str, payload):
+        state = 0
+        for character in keyword:
+            next_state = self._transitions[state].get(character)
+            if next_state is None:
+                next_state = len(self._transitions)
+                self._transitions[state][character] = next_state
+                self._transitions.append({})
+                self._fail_links.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append((len(keyword), payload))
+
+    def _build_fail_links(self):
+        pending_states = deque(self._transitions[0].values())
+        while pending_states:
+            state = pending_states.popleft()
+            for character, next_state in self._transitions[state].items():
+                pending_states.append(next_state)
+                fallback_state = self._fail_links[state]
+                while fallback_state and character not in self._transitions[fallback_state]:
+                    fallback_state = self._fail_links[fallback_state]
+                candidate_state = self._transitions[fallback_state].get(character, 0)
+                self._fail_links[next_state] = candidate_state if candidate_state != next_state else 0
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail_links[next_state]]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, object]]:
+        """
+        텍스트(소문자로 변환해서 전달)에서 단어 경계에 걸친 모든 키워드 매칭
+
+        Returns:
+            [(시작 인덱스, 끝 인덱스(미포함), payload), ...]
+        """
+        matches = []
+        state = 0
+        text_length = len(text)
+        transitions = self._transitions
+        fail_links = self._fail_links
+        for end_index, character in enumerate(text):
+            while state and character not in transitions[state]:
+                state = fail_links[state]
+            state = transitions[state].get(character, 0)
+            if not self._outputs[state]:
+                continue
+            next_character_is_word = end_index + 1 < text_length and text[end_index + 1].isalnum()
+            if next_character_is_word:
+                continue
+            for keyword_length, payload in self._outputs[state]:
+                start_index = end_index - keyword_length + 1
+                if start_index > 0 and text[start_index - 1].isalnum():
+                    continue
+                matches.append((start_index, end_index + 1, payload))
+        return matches
+
+
+class RelevanceFilter:
+    """섹터 엔티티 매칭 기반 기사 관련성 필터 (피드별 제거율 통계 포함)"""
+
+    def __init__(self, sector_entities: Optional[Dict[str, Iterable[str]]] = None,
+                 extra_keywords: Optional[Dict[str, Iterable[str]]] = None,
+                 min_matches: int = 1, universe: Optional[Universe] = None):
+        """
+        Args:
+            sector_entities: 섹터 → 엔티티 키워드 목록 (기본: universe_entities(universe), 시장 전체 용어는 항상 포함)
+            extra_keywords: 설정 파일에서 추가할 섹터 → 키워드 목록
+            min_matches: 관련 기사로 인정할 최소 (서로 다른) 키워드 매칭 수
+            universe: 엔티티 목록을 만들 유니버스 (기본: 현재 유니버스)
+        """
+        self.universe = universe or get_universe()
+        self.extra_keywords = {sector_name: list(keywords) for sector_name, keywords in (extra_keywords or {}).items()}
+        keyword_sectors: Dict[str, set] = {market_term: set() for market_term in MARKET_WIDE_TERMS}
+        for keyword_source in (sector_entities or universe_entities(self.universe), self.extra_keywords):
+            for sector_name, keywords in keyword_source.items():
+                for keyword in keywords:
+                    keyword_sectors.setdefault(keyword.lower().strip(), set()).add(sector_name)
+
+        self.min_matches = min_matches
+        self.automaton = AhoCorasick({keyword: (keyword, frozenset(sectors)) for keyword, sectors in keyword_sectors.items()})
+        self.feed_stats: Dict[str, Dict[str, int]] = {}
+
+    def match(self, article: Dict) -> Tuple[int, List[str]]:
+        """
+        기사 제목 + 요약에서 엔티티 매칭
+
+        Returns:
+            (서로 다른 매칭 키워드 수, 매칭된 섹터 이름 리스트)
+        """
+        searchable_text = f"{article.get('title', '')}\n{article.get('summary', '')}".lower()
+        matched_keywords = set()
+        matched_sectors = set()
+        for _, _, (keyword, sectors) in self.automaton.find_all(searchable_text):
+            matched_keywords.add(keyword)
+            matched_sectors.update(sectors)
+        return len(matched_keywords), sorted(matched_sectors)
+
+    def split(self, articles: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """
+        관련 기사 / 무관 기사 분리
+
+        각 기사에 'relevance'(매칭 키워드 수), 'matched_sectors' 필드를 추가
+
+        Returns:
+            (relevant_articles, irrelevant_articles)
+        """
+        relevant_articles = []
+        irrelevant_articles = []
+        for article in articles:
+            match_count, matched_sectors = self.match(article)
+            article['relevance'] = match_count
+            article['matched_sectors'] = matched_sectors
+
+            source = article.get('source', 'Unknown')
+            source_stats = self.feed_stats.setdefault(source, {'seen': 0, 'dropped': 0})
+            source_stats['seen'] += 1
+
+            if match_count >= self.min_matches:
+                relevant_articles.append(article)
+                METRICS.inc('relevance_filter_articles_total', feed=source, decision='kept')
+            else:
+                irrelevant_articles.append(article)
+                source_stats['dropped'] += 1
+                METRICS.inc('relevance_filter_articles_total', feed=source, decision='dropped')
+
+        if irrelevant_articles:
+            logger.info("🔎 관련성 필터: %d개 중 %d개 제외", len(articles), len(irrelevant_articles))
+        return relevant_articles, irrelevant_articles
+
+    def drop_rates(self) -> Dict[str, float]:
+        """피드(출처)별 누적 제거율 - 가치 낮은 피드 정리 판단용"""
+        return {
+            source: source_stats['dropped'] / source_stats['seen']
+            for source, source_stats in self.feed_stats.items() if source_stats['seen']
+        }
@@ -3,57 +3,141 @@ RSS 뉴스 수집 모듈
 여러 RSS 피드에서 뉴스를 수집하고 에러 처리 제공
 """
 import feedparser
+import requests
 import time
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
 
+from analysis.article_index import format_utc, is_stale, published_timestamp_from_entry
+from analysis.fast_rss import FastFeedParser, FastParseError
+from util.cassette import mount_cassette, pace
+from util.metrics import METRICS
+from util.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class RSSFetcher:
     """RSS 피드에서 뉴스 수집 (중복 제거 및 캐싱 포함)"""
 
-    def __init__(self, feed_urls: List[str], limit_per_feed: int = 5, cache_expiration_seconds: int = 3600):
+    def __init__(self, feed_urls: List[str], limit_per_feed: int = 5, cache_expiration_seconds: int = 3600,
+                 fast_parse: bool = True, request_timeout: float = 15.0, max_article_age_seconds: float = 0):
         """
         Args:
             feed_urls: RSS 피드 URL 리스트
             limit_per_feed: 각 피드당 최대 수집 기사 수
             cache_expiration_seconds: 캐시 유지 시간 (초, 기본 1시간)
+            fast_parse: 증분 XML 파서로 limit_per_feed개만 읽기 (실패 시 feedparser로 대체)
+            request_timeout: 빠른 파싱 모드의 피드 요청 타임아웃 (초)
+            max_article_age_seconds: 발행 후 이 시간이 지난 기사는 수집하지 않음 (0이면 제한 없음)
         """
         self.feed_urls = feed_urls
         self.limit_per_feed = limit_per_feed
         self.cache_expiration_seconds = cache_expiration_seconds
+        self.fast_parse = fast_parse
+        self.request_timeout = request_timeout
+        self.max_article_age_seconds = max_article_age_seconds
         self.cached_article_url_timestamps: Dict[str, float] = {}
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (compatible; KISTrader/1.0)'
+        mount_cassette(self.session)
+
+    def _download(self, feed_url: str) -> bytes:
+        """피드 전체 다운로드 (세션 연결 풀 재사용 + 카세트 기록/재생 대상)"""
+        response = self.session.get(feed_url, timeout=self.request_timeout)
+        response.raise_for_status()
+        return response.content
+
+    def _parse_with_feedparser(self, feed_url: str, feed_source) -> Tuple[str, List[Dict]]:
+        """feedparser로 파싱 (feed_source는 이미 받은 bytes)"""
+        feed = feedparser.parse(feed_source)
+
+        # 파싱 오류 체크
+        if feed.bozo:
+            METRICS.inc('rss_feed_parse_warnings_total', feed=feed_url)
+            logger.warning("⚠️ RSS 파싱 경고 [%s]: %s", feed_url, feed.bozo_exception)
+
+        entries = [
+            {
+                'title': entry.get('title', 'No title'),
+                'link': entry.get('link', ''),
+                'published': entry.get('published', 'Unknown date'),
+                'published_parsed': entry.get('published_parsed') or entry.get('updated_parsed'),
+                'summary': entry.get('summary', entry.get('description', 'No summary')),
+            }
+            for entry in feed.entries[:self.limit_per_feed]
+        ]
+        # 피드 소스 이름 추출 (피드 제목 또는 URL)
+        return feed.feed.get('title', feed_url), entries
+
+    def _parse_fast(self, feed_url: str) -> Tuple[str, List[Dict]]:
+        """
+        응답을 스트리밍으로 받으며 증분 파싱, limit_per_feed개를 읽으면 연결을 닫음
+        형식 오류 시 이미 받은 데이터 + 나머지로 feedparser 대체
+        """
+        feed_parser = FastFeedParser(self.limit_per_feed)
+        received_chunks: List[bytes] = []
+        fallback_reason: Optional[str] = None
+
+        with self.session.get(feed_url, timeout=self.request_timeout, stream=True) as response:
+            response.raise_for_status()
+            response_chunks = response.iter_content(chunk_size=16 * 1024)
+            for chunk in response_chunks:
+                received_chunks.append(chunk)
+                try:
+                    if feed_parser.feed(chunk):
+                        break
+                except FastParseError as parse_exception:
+                    fallback_reason = str(parse_exception)
+                    received_chunks.extend(response_chunks)
+                    break
+
+        if fallback_reason is None:
+            try:
+                feed_title, entries = feed_parser.result()
+            except FastParseError as parse_exception:
+                fallback_reason = str(parse_exception)
+
+        if fallback_reason is not None:
+            METRICS.inc('rss_fast_parse_fallbacks_total', feed=feed_url)
+            logger.debug("빠른 파싱 실패 [%s]: %s - feedparser로 대체", feed_url, fallback_reason)
+            return self._parse_with_feedparser(feed_url, b"".join(received_chunks))
+
+        for entry in entries:
+            entry['title'] = entry['title'] or 'No title'
+            entry['published'] = entry['published'] or 'Unknown date'
+            entry['summary'] = entry['summary'] or 'No summary'
+        return feed_title or feed_url, entries
 
     def fetch_all_news(self) -> List[Dict]:
         """
         모든 RSS 피드에서 새 뉴스만 수집 (중복 제거 및 캐싱)
 
         Returns:
-            새 뉴스 기사 리스트 [{'title', 'published', 'summary', 'link', 'source'}, ...]
+            새 뉴스 기사 리스트 [{'title', 'published', 'published_timestamp', 'summary', 'link', 'source'}, ...]
+            published는 UTC로 정규화한 문자열, published_timestamp는 UTC epoch 초
+            (발행 시각이 없거나 해석할 수 없으면 수집 시각으로 대체하고 published_estimated=True)
         """
         self._clean_cache()
+        fetch_timestamp = time.time()
 
         all_articles = []
         deduplicated_title_set: Set[str] = set()
 
         for feed_url in self.feed_urls:
             try:
-                # RSS 피드 파싱
-                feed = feedparser.parse(feed_url)
+                # RSS 피드 파싱 (제한된 수만큼만)
+                with METRICS.timer('rss_feed_fetch_seconds', feed=feed_url):
+                    if self.fast_parse:
+                        source, entries = self._parse_fast(feed_url)
+                    else:
+                        source, entries = self._parse_with_feedparser(feed_url, self._download(feed_url))
 
-                # 파싱 오류 체크
-                if feed.bozo:
-                    print(f"⚠️ RSS 파싱 경고 [{feed_url}]: {feed.bozo_exception}")
-
-                # 피드 소스 이름 추출 (피드 제목 또는 URL)
-                source = feed.feed.get('title', feed_url)
-
-                # 제한된 수만큼 기사 수집
-                entries = feed.entries[:self.limit_per_feed]
                 newly_collected_count = 0
 
                 for entry in entries:
-                    link = entry.get('link', '')
-                    title = entry.get('title', 'No title')
+                    link = entry['link']
+                    title = entry['title']
 
                     if link in self.cached_article_url_timestamps:
                         continue
@@ -64,33 +148,52 @@ class RSSFetcher:
 
                     deduplicated_title_set.add(normalized_title_key)
 
+                    published_timestamp = published_timestamp_from_entry(entry['published'], entry.get('published_parsed'))
                     article = {
                         'title': title,
-                        'published': entry.get('published', 'Unknown date'),
-                        'summary': entry.get('summary', entry.get('description', 'No summary')),
+                        'published': format_utc(published_timestamp) if published_timestamp is not None else entry['published'],
+                        'published_timestamp': published_timestamp if published_timestamp is not None else fetch_timestamp,
+                        'summary': entry['summary'],
                         'link': link,
                         'source': source
                     }
-                    all_articles.append(article)
+                    if published_timestamp is None:
+                        article['published_estimated'] = True
 
                     self.cached_article_url_timestamps[link] = time.time()
+                    if is_stale(article, self.max_article_age_seconds, fetch_timestamp):
+                        METRICS.inc('rss_articles_stale_total', feed=feed_url)
+                        continue
+
+                    all_articles.append(article)
                     newly_collected_count += 1
 
+                METRICS.inc('rss_articles_collected_total', newly_collected_count, feed=feed_url)
+
                 if newly_collected_count > 0:
-                    print(f"✅ [{source}] {newly_collected_count}개 새 기사 수집")
+                    logger.info("✅ [%s] %d개 새 기사 수집", source, newly_collected_count)
                 else:
-                    print(f"ℹ️ [{source}] 새 기사 없음 (캐시에 이미 존재)")
+                    logger.debug("ℹ️ [%s] 새 기사 없음 (캐시에 이미 존재)", source)
 
                 # Rate limiting 방지
-                time.sleep(0.5)
+                pace(0.5)
 
             except Exception as e:
-                print(f"❌ RSS 수집 실패 [{feed_url}]: {e}")
+                METRICS.inc('rss_feed_errors_total', feed=feed_url)
+                logger.error("❌ RSS 수집 실패 [%s]: %s", feed_url, e)
                 continue
 
-        print(f"\n📊 총 {len(all_articles)}개 새 기사 수집 (중복 제거 및 캐싱 완료)")
+        logger.info("📊 총 %d개 새 기사 수집 (중복 제거 및 캐싱 완료)", len(all_articles))
         return all_articles
 
+    def checkpoint_state(self) -> Dict:
+        """체크포인트용 상태 (이미 수집한 URL → 수집 시각만, 기사 본문은 저장하지 않음)"""
+        return {'seen_urls': self.cached_article_url_timestamps}
+
+    def restore_state(self, state: Dict):
+        """체크포인트 복원 (만료된 항목은 다음 수집 때 정리)"""
+        self.cached_article_url_timestamps.update(state['seen_urls'])
+
     def _clean_cache(self):
         """오래된 캐시 항목 삭제"""
         current_timestamp = time.time()
@@ -103,4 +206,4 @@ class RSSFetcher:
             del self.cached_article_url_timestamps[article_url]
 
         if expired_article_urls:
-            print(f"🧹 캐시 정리: {len(expired_article_urls)}개 항목 삭제")
+            logger.debug("🧹 캐시 정리: %d개 항목 삭제", len(expired_article_urls))
@@ -0,0 +1,100 @@
+"""
+섹터 어휘 사전
+섹터별 대표 기업/키워드와 긍정/부정 표현 목록 (로컬 감정 모델, 관련성 필터에서 공용 사용)
+모든 항목은 소문자, 여러 단어는 공백 하나로 구분
+"""
+import re
+from typing import Dict, FrozenSet, List
+
+
+SECTOR_ENTITIES: Dict[str, FrozenSet[str]] = {
+    "Technology": frozenset({
+        "microsoft", "apple", "oracle", "ibm", "alphabet", "google", "meta", "salesforce", "adobe",
+        "software", "cloud", "saas", "cybersecurity", "artificial intelligence", "ai", "openai",
+        "data center", "iphone", "tech", "technology",
+    }),
+    "Semiconductors": frozenset({
+        "nvidia", "intel", "amd", "tsmc", "asml", "qualcomm", "broadcom", "micron", "arm", "applied materials",
+        "chip", "chips", "chipmaker", "chipmakers", "semiconductor", "semiconductors", "foundry", "gpu", "gpus",
+        "export controls",
+    }),
+    "Financials": frozenset({
+        "jpmorgan", "goldman sachs", "morgan stanley", "bank of america", "citigroup", "wells fargo", "visa",
+        "mastercard", "blackrock", "bank", "banks", "lender", "lenders", "insurer", "insurers", "fed",
+        "federal reserve", "interest rate", "interest rates", "rate cut", "rate hike", "treasury", "yields",
+        "credit", "loan", "loans", "fomc",
+    }),
+    "Healthcare": frozenset({
+        "pfizer", "johnson & johnson", "unitedhealth", "eli lilly", "merck", "abbvie", "moderna", "novo nordisk",
+        "pharma", "pharmaceutical", "biotech", "drug", "drugs", "fda", "vaccine", "medicare", "medicaid",
+        "hospital", "hospitals", "health insurer", "clinical trial",
+    }),
+    "Energy": frozenset({
+        "exxon", "chevron", "conocophillips", "shell", "bp", "opec", "oil", "crude", "brent", "wti",
+        "natural gas", "lng", "refinery", "refiners", "drilling", "pipeline", "energy",
+    }),
+    "Airlines": frozenset({
+        "american airlines", "delta", "united airlines", "southwest", "jetblue", "boeing", "airbus",
+        "airline", "airlines", "air travel", "flights", "jet fuel", "faa", "tsa",
+    }),
+    "Consumer Discretionary": frozenset({
+        "amazon", "tesla", "nike", "mcdonald's", "starbucks", "home depot", "disney", "ford", "general motors",
+        "retail", "retailer", "retailers", "consumer spending", "ev", "evs", "automaker", "automakers",
+        "luxury", "holiday sales", "e-commerce",
+    }),
+    "Consumer Staples": frozenset({
+        "coca-cola", "pepsico", "procter & gamble", "walmart", "costco", "colgate", "kraft heinz",
+        "philip morris", "groceries", "grocery", "food prices", "beverage", "tobacco", "household products",
+    }),
+    "Commodities": frozenset({
+        "gold", "silver", "copper", "wheat", "corn", "soybeans", "commodity", "commodities", "metals",
+        "iron ore", "aluminum", "lithium", "futures",
+    }),
+    "Utilities": frozenset({
+        "duke energy", "southern company", "nextera", "dominion", "utility", "utilities", "power grid",
+        "electricity", "power prices", "nuclear", "renewable", "solar", "wind power",
+    }),
+    "Real Estate": frozenset({
+        "american tower", "prologis", "simon property", "reit", "reits", "real estate", "housing",
+        "home sales", "mortgage", "mortgages", "commercial property", "office vacancy", "homebuilders",
+    }),
+}
+
+# 특정 섹터는 아니지만 시장 전체에 영향을 주는 표현 (관련성 필터에서 관련 기사로 인정)
+MARKET_WIDE_TERMS: FrozenSet[str] = frozenset({
+    "stocks", "stock market", "wall street", "s&p 500", "nasdaq", "dow", "earnings", "inflation", "cpi",
+    "gdp", "jobs report", "payrolls", "unemployment", "tariff", "tariffs", "recession", "sanctions",
+    "ipo", "merger", "acquisition", "etf", "bond market", "dollar",
+})
+
+POSITIVE_TERMS: FrozenSet[str] = frozenset({
+    "surge", "surges", "soar", "soars", "jump", "jumps", "rally", "rallies", "gain", "gains", "rise", "rises",
+    "beat", "beats", "record", "upgrade", "upgrades", "growth", "profit", "profits", "strong", "boost",
+    "boosts", "approval", "approves", "breakthrough", "expands", "expansion", "rebound", "outperform",
+    "bullish", "raises guidance", "rate cut", "deal", "partnership",
+})
+
+NEGATIVE_TERMS: FrozenSet[str] = frozenset({
+    "plunge", "plunges", "slump", "slumps", "fall", "falls", "drop", "drops", "tumble", "tumbles", "sink",
+    "sinks", "miss", "misses", "downgrade", "downgrades", "loss", "losses", "weak", "cut", "cuts", "layoffs",
+    "lawsuit", "probe", "investigation", "recall", "ban", "tariff", "tariffs", "sanctions", "crisis",
+    "bankruptcy", "default", "strike", "shortage", "delay", "delays", "bearish", "warning", "warns",
+    "rate hike", "recession",
+})
+
+# 단어 안의 &는 붙여서 ("s&p"), 공백으로 떨어진 &는 단독 토큰으로 ("johnson & johnson" 3-gram 매칭)
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9&'\-]*|&")
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 단어 토큰 리스트"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def ngram_set(tokens: List[str], max_n: int = 3) -> FrozenSet[str]:
+    """1~max_n 단어 n-gram 집합 (여러 단어 엔티티를 집합 조회로 매칭하기 위함)"""
+    ngrams = set(tokens)
+    for n in range(2, max_n + 1):
+        for start_index in range(len(tokens) - n + 1):
+            ngrams.add(" ".join(tokens[start_index:start_index + n]))
+    return frozenset(ngrams)
@@ -0,0 +1,188 @@
+"""
+출처 신뢰도 가중치 모듈
+출처(피드)별 과거 섹터 점수가 이후 섹터 ETF 수익률을 얼마나 맞혔는지로 가중치를 온라인 학습
+- 주기마다 출처별 섹터 점수 벡터 + ETF 가격을 스냅샷으로 보관
+- horizon이 지난 스냅샷은 현재 가격으로 섹터 간 상대 수익률을 계산해 출처별 적중도(코사인 유사도) 지수 이동 평균 갱신
+- 가중치 = 설정 사전 가중치(SOURCE_RELIABILITY) × 학습 배수 (관측이 적을수록 1에 가깝게)
+"""
+import json
+import math
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from util.logger import get_logger
+from util.metrics import METRICS
+from util.universe import get_universe
+
+logger = get_logger(__name__)
+
+STATE_FORMAT_VERSION = 1
+
+
+def _cosine_similarity(left: List[float], right: List[float]) -> Optional[float]:
+    """두 벡터의 코사인 유사도 (한쪽이 0벡터면 None)"""
+    dot_product = sum(left_value * right_value for left_value, right_value in zip(left, right))
+    left_norm = math.sqrt(sum(value * value for value in left))
+    right_norm = math.sqrt(sum(value * value for value in right))
+    if not left_norm or not right_norm:
+        return None
+    return dot_product / (left_norm * right_norm)
+
+
+class SourceReliability:
+    """출처별 적중도(−1~1)와 관측 횟수만 저장하는 온라인 가중치 학습기"""
+
+    def __init__(self, state_path: str = '', prior_weights: Optional[Dict[str, float]] = None,
+                 learning_rate: float = 0.05, horizon_seconds: float = 4 * 3600,
+                 min_weight: float = 0.2, max_weight: float = 2.0, prior_strength: int = 20,
+                 max_pending: int = 500):
+        """
+        Args:
+            state_path: 학습 상태 JSON 경로 (있으면 로드, 갱신 시 저장 / 빈 문자열이면 메모리만)
+            prior_weights: 출처 → 사전 가중치 (config SOURCE_RELIABILITY)
+            learning_rate: 적중도 지수 이동 평균 비율
+            horizon_seconds: 점수 → 실현 수익률 평가 간격
+            min_weight: 적중도 −1일 때 학습 배수
+            max_weight: 적중도 +1일 때 학습 배수
+            prior_strength: 관측 수가 이만큼 쌓이면 학습 배수를 절반 반영 (적은 관측으로 과하게 흔들리지 않도록)
+            max_pending: 평가 대기 스냅샷 상한 (가격을 못 받는 동안 무한히 쌓이지 않도록)
+        """
+        self.state_path = state_path
+        self.prior_weights = dict(prior_weights or {})
+        self.learning_rate = learning_rate
+        self.horizon_seconds = horizon_seconds
+        self.min_weight = min_weight
+        self.max_weight = max_weight
+        self.prior_strength = prior_strength
+        self.max_pending = max_pending
+        self.universe = get_universe()
+        self.sector_names: List[str] = list(self.universe.names)
+
+        self.quality: Dict[str, float] = {}  # 출처 → 적중도 지수 이동 평균
+        self.observations: Dict[str, int] = {}  # 출처 → 평가 횟수
+        self._pending: List[list] = []  # [timestamp, {ticker: price}, {source: [섹터 점수...]}]
+        self._lock = threading.Lock()
+
+        if state_path and os.path.exists(state_path):
+            self.load(state_path)
+
+    def weight(self, source: str) -> float:
+        """출처의 현재 가중치 (사전 가중치 × 학습 배수)"""
+        prior_weight = self.prior_weights.get(source, 1.0)
+        observation_count = self.observations.get(source, 0)
+        if not observation_count:
+            return prior_weight
+        confidence = observation_count / (observation_count + self.prior_strength)
+        source_quality = self.quality[source] * confidence
+        if source_quality >= 0:
+            multiplier = 1.0 + source_quality * (self.max_weight - 1.0)
+        else:
+            multiplier = 1.0 + source_quality * (1.0 - self.min_weight)
+        return prior_weight * multiplier
+
+    def weights(self) -> Dict[str, float]:
+        """알고 있는 모든 출처의 가중치 (없는 출처는 집계 시 1.0)"""
+        with self._lock:
+            return {source: round(self.weight(source), 4)
+                    for source in set(self.prior_weights) | set(self.observations)}
+
+    def observe(self, source_scores: Dict[str, Dict[str, int]], etf_prices: Dict[str, float],
+                now: Optional[float] = None) -> int:
+        """
+        이번 주기 출처별 점수와 ETF 가격 기록 + horizon이 지난 스냅샷 평가
+
+        Args:
+            source_scores: 출처 → 섹터별 점수 합계 (BatchAnalysis.source_scores)
+            etf_prices: ETF 티커 → 현재가 (가져오지 못한 티커는 빠져도 됨)
+            now: 현재 시각 (epoch 초, 테스트용)
+
+        Returns:
+            이번에 평가한 (출처, 스냅샷) 수
+        """
+        if not etf_prices:
+            return 0
+        now = now if now is not None else time.time()
+
+        with self._lock:
+            evaluated_count = 0
+            while self._pending and now - self._pending[0][0] >= self.horizon_seconds:
+                _, past_prices, past_source_vectors = self._pending.pop(0)
+                evaluated_count += self._evaluate(past_prices, past_source_vectors, etf_prices)
+
+            source_vectors = {
+                source: [sector_scores.get(sector, 0) for sector in self.sector_names]
+                for source, sector_scores in source_scores.items() if any(sector_scores.values())
+            }
+            if source_vectors:
+                self._pending.append([now, dict(etf_prices), source_vectors])
+                del self._pending[:-self.max_pending]
+
+        METRICS.inc('source_reliability_updates_total', evaluated_count)
+        if evaluated_count or source_vectors:
+            self.save()
+        return evaluated_count
+
+    def _evaluate(self, past_prices: Dict[str, float], past_source_vectors: Dict[str, List[int]],
+                  current_prices: Dict[str, float]) -> int:
+        sector_returns: List[Optional[float]] = []
+        for sector in self.sector_names:
+            etf_ticker = self.universe.ticker_of(sector)
+            if past_prices.get(etf_ticker) and current_prices.get(etf_ticker):
+                sector_returns.append(current_prices[etf_ticker] / past_prices[etf_ticker] - 1.0)
+            else:
+                sector_returns.append(None)
+        available_returns = [sector_return for sector_return in sector_returns if sector_return is not None]
+        if len(available_returns) < 2:
+            return 0
+
+        # 섹터 간 상대 수익률로 평가 (시장 전체 상승/하락에 항상 낙관/비관적인 출처가 유리하지 않도록)
+        mean_return = sum(available_returns) / len(available_returns)
+        relative_returns = [sector_return - mean_return if sector_return is not None else 0.0
+                            for sector_return in sector_returns]
+
+        evaluated_count = 0
+        for source, score_vector in past_source_vectors.items():
+            hit_score = _cosine_similarity(score_vector, relative_returns)
+            if hit_score is None:
+                continue
+            previous_quality = self.quality.get(source, 0.0)
+            self.quality[source] = previous_quality + self.learning_rate * (hit_score - previous_quality)
+            self.observations[source] = self.observations.get(source, 0) + 1
+            evaluated_count += 1
+        return evaluated_count
+
+    def save(self, state_path: Optional[str] = None):
+        """학습 상태를 JSON으로 저장 (임시 파일에 쓴 뒤 교체)"""
+        state_path = state_path or self.state_path
+        if not state_path:
+            return
+        with self._lock:
+            reliability_state = {
+                'version': STATE_FORMAT_VERSION,
+                'sectors': self.sector_names,
+                'sources': {source: [round(self.quality[source], 5), self.observations[source]]
+                            for source in self.observations},
+                'pending': self._pending,
+            }
+        temporary_path = f"{state_path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump(reliability_state, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temporary_path, state_path)
+
+    def load(self, state_path: str):
+        """저장된 학습 상태 로드 (섹터 구성이 다르면 평가 대기 스냅샷은 버림)"""
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                reliability_state = json.load(f)
+        except (OSError, json.JSONDecodeError) as load_exception:
+            logger.warning("⚠️ 출처 신뢰도 상태 로드 실패 [%s]: %s - 사전 가중치만 사용", state_path, load_exception)
+            return
+
+        for source, (source_quality, observation_count) in reliability_state.get('sources', {}).items():
+            self.quality[source] = float(source_quality)
+            self.observations[source] = int(observation_count)
+        if reliability_state.get('sectors') == self.sector_names:
+            self._pending = reliability_state.get('pending', [])[-self.max_pending:]
+        logger.info("✅ 출처 신뢰도 로드 (출처 %d개, 평가 대기 %d개)", len(self.observations), len(self._pending))
@@ -5,78 +5,177 @@ KISTrader 뉴스 분석 파이프라인
 두 가지 모드:
 1. 한국투자증권 모드 (USE_KIS_API: true) - 토큰 획득 + 신호 생성
 2. 뉴스 분석 전용 모드 (USE_KIS_API: false) - 신호만 생성
+
+리플레이: python main.py --replay [--since 2025-03-01] [--until 2025-03-08]
+  아카이브에 저장된 분석 결과로 네트워크 없이 신호 재생성
+서비스 모드: python main.py --service
+  asyncio 이벤트 루프 하나에서 파이프라인/알림/진입 감시를 태스크로 실행 (SIGTERM 시 진행 중인 주기를 마치고 종료)
 """
-print("DEBUG: Starting main.py")
-import os
+import argparse
+import atexit
 import sys
 import time
-import yaml
 import traceback
+from dataclasses import dataclass
 from datetime import datetime
-print("DEBUG: Imports successful")
+from typing import Any, Optional
+
+from util.logger import get_logger, set_log_level, setup_logging
+from util.metrics import METRICS, start_metrics_server
+
+logger = get_logger('main')
+
+
+@dataclass
+class PipelineModules:
+    """파이프라인 구성 모듈 묶음 (initialize_modules()가 생성, 선택 모듈은 비활성화 시 None)"""
+    rss_fetcher: Any
+    news_analyzer: Any
+    signal_generator: Any
+    signal_tracker: Optional[Any] = None
+    relevance_filter: Optional[Any] = None
+    article_scheduler: Optional[Any] = None
+    article_enricher: Optional[Any] = None
+    article_archive: Optional[Any] = None
+    source_reliability: Optional[Any] = None
+    daily_bar_cache: Optional[Any] = None
+    position_sizer: Optional[Any] = None
+    entry_timing: Optional[Any] = None
+    control: Optional[Any] = None  # PipelineControl (main()이 설정, 샤드 워커에서는 None)
+    strategies: Optional[Any] = None  # StrategySet (STRATEGIES가 비어 있으면 None)
+
 
 # 설정 파일 로드 및 검증
-def load_config():
-    """config.yaml 로드 및 검증"""
-    configuration_file_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
-    if not os.path.exists(configuration_file_path):
-        print("❌ config.yaml이 없습니다. config.yaml.example을 참고하여 생성하세요.")
+def load_config(config_path=None):
+    """
+    config.yaml 로드 및 검증 (util.config에서 한 번만 파싱)
+
+    Returns:
+        ConfigWatcher 인스턴스 (watcher.config가 검증된 AppConfig)
+    """
+    from util.config import ConfigError, DEFAULT_CONFIG_PATH, get_config_watcher
+
+    try:
+        config_watcher = get_config_watcher(config_path or DEFAULT_CONFIG_PATH)
+    except ConfigError as config_exception:
+        logger.critical("❌ %s", config_exception)
         sys.exit(1)
 
-    with open(configuration_file_path, 'r', encoding='utf-8') as f:
-        configuration_settings = yaml.safe_load(f)
+    for warning_message in config_watcher.config.warnings():
+        logger.warning("⚠️ 경고: %s", warning_message)
 
-    mandatory_configuration_fields = ['OPENAI_API_KEY', 'RSS_FEEDS']
-    for configuration_field in mandatory_configuration_fields:
-        if not configuration_settings.get(configuration_field):
-            print(f"❌ 필수 설정 누락: {configuration_field}")
-            sys.exit(1)
+    logger.info("✅ 설정 검증 완료")
+    return config_watcher
 
-    openai_api_key = configuration_settings.get('OPENAI_API_KEY', '')
-    if not openai_api_key.startswith('sk-'):
-        print(f"❌ OPENAI_API_KEY 형식 오류: 'sk-'로 시작해야 합니다")
-        sys.exit(1)
 
-    rss_feed_url_list = configuration_settings.get('RSS_FEEDS')
-    if not isinstance(rss_feed_url_list, list) or len(rss_feed_url_list) == 0:
-        print("❌ RSS_FEEDS는 비어있지 않은 리스트여야 합니다")
-        sys.exit(1)
+def apply_config(config, modules):
+    """
+    핫 리로드된 설정을 실행 중인 모듈에 반영 (루프 재시작 없음)
+    OPENAI_API_KEY / SENTIMENT_BACKEND / UNIVERSE / 한투 계정 정보 변경은 재시작 후 적용
 
-    supported_openai_models = ['gpt-5-nano','gpt-4o-mini', 'gpt-4o', 'gpt-4-turbo', 'gpt-3.5-turbo', 'gpt-4']
-    selected_openai_model = configuration_settings.get('OPENAI_MODEL', 'gpt-4o-mini')
-    if selected_openai_model not in supported_openai_models:
-        print(f"⚠️ 경고: {selected_openai_model}은 유효하지 않을 수 있습니다. 권장 모델: {', '.join(supported_openai_models)}")
+    Args:
+        config: 새 AppConfig
+        modules: PipelineModules
+    """
+    rss_fetcher = modules.rss_fetcher
+    news_analyzer = modules.news_analyzer
 
-    if configuration_settings.get('NUM_LONG_POSITIONS', 2) < 1:
-        print("❌ NUM_LONG_POSITIONS는 1 이상이어야 합니다")
-        sys.exit(1)
+    rss_fetcher.feed_urls = list(config.rss_feeds)
+    rss_fetcher.limit_per_feed = config.news_limit_per_feed
+    rss_fetcher.fast_parse = config.rss_fast_parse
+    rss_fetcher.max_article_age_seconds = config.max_article_age
 
-    if configuration_settings.get('NUM_SHORT_POSITIONS', 1) < 1:
-        print("❌ NUM_SHORT_POSITIONS는 1 이상이어야 합니다")
-        sys.exit(1)
+    llm_backend = news_analyzer.llm_backend
+    if llm_backend is not None:
+        llm_backend.model = config.openai_model
+        llm_backend.temperature = config.openai_temperature
+        llm_backend.reasoning_effort = config.openai_reasoning_effort
+        llm_backend.retry_policy.max_attempts = config.max_retries
+        llm_backend.retry_policy.base_delay = config.retry_delay
+        llm_backend.retry_policy.max_delay = config.max_retry_delay
+        llm_backend.circuit_breaker.failure_threshold = config.circuit_breaker_threshold
+        llm_backend.circuit_breaker.cooldown_seconds = config.circuit_breaker_cooldown
+        llm_backend.max_instruments_per_call = config.universe_max_per_call
+
+    if hasattr(news_analyzer.backend, 'escalate_low'):
+        news_analyzer.backend.escalate_low = config.cascade_escalate_low
+        news_analyzer.backend.escalate_high = config.cascade_escalate_high
+
+    configure_signal_generator(modules.signal_generator, config)
+    if modules.signal_tracker is not None:
+        configure_signal_tracker(modules.signal_tracker, config)
+
+    # 관련성 필터: 유니버스나 키워드가 바뀌었을 때만 오토마톤을 새로 생성 (피드별 통계는 유지)
+    if config.relevance_filter_enabled:
+        from util.universe import get_universe
+        previous_filter = modules.relevance_filter
+        if (previous_filter is None or previous_filter.universe is not get_universe()
+                or previous_filter.extra_keywords != {sector_name: list(keywords) for sector_name, keywords
+                                                      in config.relevance_extra_keywords.items()}):
+            modules.relevance_filter = create_relevance_filter(config)
+            if previous_filter is not None:
+                modules.relevance_filter.feed_stats = previous_filter.feed_stats
+        else:
+            previous_filter.min_matches = config.relevance_min_matches
+    else:
+        modules.relevance_filter = None
+
+    # 본문 보강은 연결 풀/스레드 풀을 가지므로 켜고 끌 때만 다시 생성
+    if config.article_enrichment_enabled and modules.article_enricher is None:
+        modules.article_enricher = create_article_enricher(config)
+    elif not config.article_enrichment_enabled and modules.article_enricher is not None:
+        modules.article_enricher.close()
+        modules.article_enricher = None
+    elif modules.article_enricher is not None:
+        modules.article_enricher.max_tokens = config.enrichment_max_tokens
+        modules.article_enricher.timeout = config.enrichment_timeout
+
+    article_scheduler = modules.article_scheduler
+    article_scheduler.max_backlog = config.scheduler_max_backlog
+    article_scheduler.max_article_age_seconds = config.max_article_age
+
+    # 출처 가중치: 학습 상태는 유지하고 사전 가중치/범위만 갱신
+    if config.source_weighting_enabled and modules.source_reliability is None:
+        modules.source_reliability = create_source_reliability(config)
+    elif not config.source_weighting_enabled:
+        modules.source_reliability = None
+    else:
+        source_reliability = modules.source_reliability
+        source_reliability.prior_weights = dict(config.source_reliability)
+        source_reliability.horizon_seconds = config.reliability_horizon_minutes * 60
+        source_reliability.learning_rate = config.reliability_learning_rate
+        source_reliability.min_weight = config.reliability_min_weight
+        source_reliability.max_weight = config.reliability_max_weight
+    apply_source_weights(modules, config)
+
+    # 포지션 크기 / 진입 타이밍: 일봉 캐시/공분산/대기 종목은 유지하고 파라미터만 갱신
+    modules.position_sizer = update_position_sizer(modules.position_sizer, config, modules.daily_bar_cache)
+    modules.entry_timing = update_entry_timing(modules.entry_timing, config, modules.daily_bar_cache)
+    modules.strategies = update_strategies(modules.strategies, config, modules.daily_bar_cache)
+    if modules.control is not None:
+        modules.control.apply_config(config)
+
+    set_log_level(config.log_level)
 
-    if configuration_settings.get('NEWS_LIMIT_PER_FEED', 5) < 1:
-        print("❌ NEWS_LIMIT_PER_FEED는 1 이상이어야 합니다")
-        sys.exit(1)
 
-    if configuration_settings.get('LOOP_INTERVAL', 900) < 10:
-        print("⚠️ 경고: LOOP_INTERVAL이 10초 미만입니다. API 비용이 매우 높아질 수 있습니다.")
+def routine_discord_enabled(config):
+    """주기마다 반복되는 진행 메시지를 Discord로 보낼지 (SIGNAL_CHANGES_ONLY면 로그에만 남김)"""
+    return config.use_discord and not config.signal_changes_only
 
-    if configuration_settings.get('USE_KIS_API', False):
-        required_kis_fields = ['APP_KEY', 'APP_SECRET', 'CANO', 'ACNT_PRDT_CD', 'URL_BASE']
-        missing_configuration_fields = [configuration_field for configuration_field in required_kis_fields if not configuration_settings.get(configuration_field)]
-        if missing_configuration_fields:
-            print(f"❌ USE_KIS_API: true이지만 필수 설정 누락: {', '.join(missing_configuration_fields)}")
-            print("   뉴스 분석 전용 모드로 사용하려면 USE_KIS_API: false로 설정하세요")
-            sys.exit(1)
 
-    if configuration_settings.get('USE_DISCORD', False):
-        if not configuration_settings.get('DISCORD_WEBHOOK_URL'):
-            print("❌ USE_DISCORD: true이지만 DISCORD_WEBHOOK_URL이 없습니다")
-            sys.exit(1)
+# Discord 전송을 넘겨받을 함수 (서비스 모드에서 이벤트 루프 알림 큐로 연결, None이면 바로 전송)
+_discord_dispatcher = None
 
-    print("✅ 설정 검증 완료")
-    return configuration_settings
+
+def set_discord_dispatcher(dispatcher):
+    """
+    Discord 전송 경로 교체
+
+    Args:
+        dispatcher: (webhook_url, message dict)를 받는 함수 또는 None (바로 전송)
+    """
+    global _discord_dispatcher
+    _discord_dispatcher = dispatcher
 
 
 # 알림 전송 함수
@@ -86,141 +185,899 @@ def send_notification(msg, config, discord_enabled=False):
 
     Args:
         msg: 메시지
-        config: 설정 dict
+        config: AppConfig
         discord_enabled: Discord 사용 여부
     """
-    print(msg)  # 항상 콘솔에 출력
+    logger.info("%s", msg)  # 항상 로그로 출력
 
-    if discord_enabled and config.get('USE_DISCORD', False):
+    if discord_enabled and config.use_discord:
+        now = datetime.now()
+        message = {"content": f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {str(msg)}"}
+        if _discord_dispatcher is not None:
+            _discord_dispatcher(config.discord_webhook_url, message)
+            return
         try:
             import requests
-            now = datetime.now()
-            message = {"content": f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {str(msg)}"}
-            requests.post(config['DISCORD_WEBHOOK_URL'], data=message)
+            requests.post(config.discord_webhook_url, data=message)
         except Exception as e:
-            print(f"⚠️ Discord 전송 실패: {e}")
+            logger.warning("⚠️ Discord 전송 실패: %s", e)
+
+
+def close_cassette():
+    """기록 중인 카세트 파일 닫기 (설정돼 있지 않으면 아무것도 하지 않음)"""
+    from util.cassette import install_cassette
+    install_cassette(None)
+
+
+def shutdown_modules(modules):
+    """
+    종료 전 캐시/학습 상태 저장 (아카이브 배치 기록, 출처 신뢰도, 로컬 모델) + 연결 정리
+    실패해도 나머지 정리는 계속
+    """
+    cleanup_steps = [
+        ('아카이브', modules.article_archive.close if modules.article_archive is not None else None),
+        ('출처 신뢰도', modules.source_reliability.save if modules.source_reliability is not None else None),
+        ('로컬 모델', modules.news_analyzer.label_learner.save if modules.news_analyzer.label_learner is not None else None),
+        ('본문 보강', modules.article_enricher.close if modules.article_enricher is not None else None),
+        ('RSS 세션', modules.rss_fetcher.session.close),
+        ('카세트', close_cassette),
+    ]
+    for step_name, cleanup in cleanup_steps:
+        if cleanup is None:
+            continue
+        try:
+            cleanup()
+        except Exception as cleanup_exception:
+            logger.warning("⚠️ 종료 정리 실패 (%s): %s", step_name, cleanup_exception)
+
+
+def create_pipeline_control(config, modules=None):
+    """
+    루프 상태/제어 객체 생성 (CONTROL_PORT가 있으면 상태/제어 API도 시작)
+
+    Args:
+        modules: PipelineModules (있으면 캐시 크기 / 큐 길이를 /status에 추가)
+
+    Returns:
+        PipelineControl
+    """
+    from util.control import PipelineControl, start_control_server
+
+    control = PipelineControl(config.loop_interval, config.control_health_timeout)
+    control.add_status_provider('token', token_status)
+    if modules is not None:
+        control.add_status_provider('caches', lambda: module_cache_sizes(modules))
+        control.add_status_provider('queues', lambda: module_queue_depths(modules))
+        control.add_status_provider('strategies', lambda: modules.strategies.status() if modules.strategies else {})
+    if config.control_port:
+        start_control_server(control, config.control_port)
+        send_notification(f"🕹️ 상태/제어 API: http://127.0.0.1:{config.control_port}/status", config, config.use_discord)
+    return control
+
+
+def token_status():
+    """한투 토큰 재사용 만료 시각 (상태 API용)"""
+    from trading import token_fetch
+    expires_at = token_fetch.token_expires_at()
+    return {
+        'loaded': bool(token_fetch.ACCESS_TOKEN),
+        'expires_at': expires_at.strftime('%Y-%m-%d %H:%M:%S') if expires_at else None,
+        'expires_in_seconds': round((expires_at - datetime.now()).total_seconds()) if expires_at else None,
+    }
+
+
+def module_cache_sizes(modules):
+    """모듈별 캐시 항목 수 (상태 API용)"""
+    cache_sizes = {
+        'rss_seen_urls': len(modules.rss_fetcher.cached_article_url_timestamps),
+        'analysis_results': len(modules.news_analyzer.result_cache),
+    }
+    if modules.daily_bar_cache is not None:
+        cache_sizes['daily_bar_tickers'] = len(modules.daily_bar_cache.bars)
+    return cache_sizes
+
+
+def module_queue_depths(modules):
+    """대기열 길이 (상태 API용)"""
+    queue_depths = {'scheduler_backlog': len(modules.article_scheduler.backlog)}
+    if modules.entry_timing is not None:
+        queue_depths['entry_armed'] = len(modules.entry_timing.armed_tickers)
+    return queue_depths
+
+
+def create_pipeline_checkpoint(config, path_suffix=''):
+    """
+    CHECKPOINT_PATH가 있으면 PipelineCheckpoint (없으면 None)
+
+    Args:
+        path_suffix: 파일 이름 뒤에 붙일 문자열 (샤드 워커별 파일)
+    """
+    if not config.checkpoint_path:
+        return None
+    from util.checkpoint import PipelineCheckpoint
+    return PipelineCheckpoint(config.checkpoint_path + path_suffix, config.checkpoint_every_cycles)
+
+
+def checkpoint_components(modules):
+    """체크포인트에 저장/복원할 구성 요소 (None인 선택 모듈은 건너뜀)"""
+    return {
+        'rss_fetcher': modules.rss_fetcher,
+        'news_analyzer': modules.news_analyzer,
+        'article_scheduler': modules.article_scheduler,
+        'signal_tracker': modules.signal_tracker,
+        'daily_bar_cache': modules.daily_bar_cache,
+        'entry_timing': modules.entry_timing,
+        'strategies': modules.strategies,
+        'control': modules.control,
+    }
+
+
+def create_signal_generator(config):
+    """설정값으로 SignalGenerator 생성"""
+    from trading.signal_generator import SignalGenerator
+    signal_generator = SignalGenerator()
+    configure_signal_generator(signal_generator, config)
+    return signal_generator
+
+
+def configure_signal_generator(signal_generator, config):
+    signal_generator.num_long = config.num_long_positions
+    signal_generator.num_short = config.num_short_positions
+    signal_generator.long_threshold = config.signal_long_threshold
+    signal_generator.short_threshold = config.signal_short_threshold
+    signal_generator.min_score_diff = config.signal_min_score_diff
+    signal_generator.min_coverage = config.min_analysis_coverage
+    signal_generator.low_coverage_threshold = config.low_coverage_threshold
+
+
+def install_pipeline_cassette(config, path_suffix=''):
+    """
+    CASSETTE_MODE가 record / replay면 공용 카세트 설정 (토큰 발급 / 모듈 생성 전에 호출)
+
+    Args:
+        path_suffix: 파일 이름 뒤에 붙일 문자열 (샤드 워커별 파일)
+    """
+    if config.cassette_mode == 'off':
+        return
+    from util.cassette import Cassette, install_cassette
+    cassette_path = config.cassette_path + path_suffix
+    try:
+        install_cassette(Cassette(cassette_path, config.cassette_mode, config.cassette_latency_scale))
+    except OSError as cassette_exception:
+        logger.critical("❌ 카세트 파일을 열 수 없습니다 (%s): %s", cassette_path, cassette_exception)
+        sys.exit(1)
+    if config.cassette_mode == 'record':
+        logger.info("📼 카세트 기록: %s", cassette_path)
+
+
+def create_signal_tracker(signal_generator, config):
+    """설정값으로 SignalTracker 생성 (진입/청산 히스테리시스 + 최소 보유 시간)"""
+    from trading.signal_tracker import SignalTracker
+    signal_tracker = SignalTracker(signal_generator)
+    configure_signal_tracker(signal_tracker, config)
+    return signal_tracker
+
+
+def configure_signal_tracker(signal_tracker, config):
+    signal_tracker.long_exit_threshold = config.signal_long_exit_threshold
+    signal_tracker.short_exit_threshold = config.signal_short_exit_threshold
+    signal_tracker.min_holding_seconds = config.signal_min_holding_minutes * 60
+    signal_tracker.replace_margin = config.signal_replace_margin
+
+
+def configure_universe(config):
+    """설정의 UNIVERSE로 공용 유니버스 교체 (모듈 생성 전에 호출, 비어 있으면 기본 11개 섹터)"""
+    from util.universe import Universe, set_universe
+    set_universe(Universe.from_config(config.universe) if config.universe else None)
+
+
+def create_relevance_filter(config):
+    """설정값으로 RelevanceFilter 생성 (현재 유니버스 종목의 엔티티 / keywords + RELEVANCE_EXTRA_KEYWORDS)"""
+    from analysis.relevance_filter import RelevanceFilter
+    from util.universe import get_universe
+    return RelevanceFilter(extra_keywords=config.relevance_extra_keywords, min_matches=config.relevance_min_matches,
+                           universe=get_universe())
+
+
+def create_article_enricher(config):
+    """설정값으로 ArticleEnricher 생성"""
+    from analysis.article_enricher import ArticleEnricher
+    return ArticleEnricher(
+        cache_dir=config.enrichment_cache_dir,
+        max_cache_bytes=int(config.enrichment_cache_max_mb * 1024 * 1024),
+        max_workers=config.enrichment_max_workers,
+        per_domain_limit=config.enrichment_per_domain_limit,
+        timeout=config.enrichment_timeout,
+        max_tokens=config.enrichment_max_tokens
+    )
+
+
+def create_article_archive(config):
+    """설정값으로 ArticleArchive 생성 (종료 시 남은 레코드 기록)"""
+    from analysis.article_archive import ArticleArchive
+    article_archive = ArticleArchive(config.archive_path)
+    atexit.register(article_archive.close)
+    return article_archive
+
+
+def create_source_reliability(config):
+    """설정값으로 SourceReliability 생성 (저장된 학습 상태가 있으면 로드)"""
+    from analysis.source_reliability import SourceReliability
+    return SourceReliability(
+        state_path=config.reliability_state_path,
+        prior_weights=config.source_reliability,
+        learning_rate=config.reliability_learning_rate,
+        horizon_seconds=config.reliability_horizon_minutes * 60,
+        min_weight=config.reliability_min_weight,
+        max_weight=config.reliability_max_weight
+    )
+
+
+def apply_source_weights(modules, config):
+    """현재 출처 가중치를 분석기(섹터 합계)와 스케줄러(우선순위)에 반영"""
+    if modules.source_reliability is not None:
+        source_weights = modules.source_reliability.weights()
+        modules.news_analyzer.source_weights = source_weights
+    else:
+        source_weights = dict(config.source_reliability)
+        modules.news_analyzer.source_weights = None
+    modules.article_scheduler.source_weights = source_weights
+
+
+def update_source_reliability(source_reliability, source_scores, config):
+    """
+    섹터 ETF 현재가를 받아 출처 신뢰도 학습 (한투 모드에서만 호출, 실패해도 파이프라인은 계속)
+
+    Args:
+        source_reliability: SourceReliability
+        source_scores: 출처 → 섹터별 점수 합계 (BatchAnalysis.source_scores)
+    """
+    from trading import token_fetch
+    from trading.etf_quotes import fetch_etf_prices
+
+    try:
+        exchange_codes = source_reliability.universe.exchange_codes()
+        etf_prices = token_fetch.with_access_token(
+            lambda access_token: fetch_etf_prices(config, access_token, exchange_codes), config=config)
+        evaluated_count = source_reliability.observe(source_scores, etf_prices)
+    except Exception as reliability_exception:
+        logger.warning("⚠️ 출처 신뢰도 갱신 실패: %s", reliability_exception)
+        return
+    if evaluated_count:
+        ranked_weights = sorted(source_reliability.weights().items(), key=lambda item: item[1], reverse=True)
+        logger.info("⚖️ 출처 가중치 갱신: %s", ", ".join(f"{source} {weight:.2f}" for source, weight in ranked_weights))
+
+
+def create_daily_bar_cache(config):
+    """포지션 크기 계산과 진입 타이밍이 공유하는 일봉 캐시 (BAR_STORE_DIR이 있으면 로컬 봉 저장소에 영구 저장)"""
+    from trading.daily_bars import DailyBarCache
+    bar_store = None
+    if config.bar_store_dir:
+        from trading.bar_store import BarStore
+        bar_store = BarStore(config.bar_store_dir)
+    return DailyBarCache(max_bars=config.bar_store_daily_days, bar_store=bar_store)
+
+
+def update_minute_bars(daily_bar_cache, config):
+    """로컬 봉 저장소에 분봉 증분 저장 (한투 모드에서 주기마다 호출, 실패해도 파이프라인은 계속)"""
+    bar_store = daily_bar_cache.bar_store
+    if bar_store is None or not config.bar_store_minute_interval:
+        return
+    from trading import token_fetch
+    from trading.bar_store import update_minute_bars as store_minute_bars
+    from util.universe import get_universe
+
+    try:
+        exchange_codes = get_universe().exchange_codes()
+        token_fetch.with_access_token(
+            lambda access_token: store_minute_bars(bar_store, config, access_token, exchange_codes,
+                                                   config.bar_store_minute_interval, config.bar_store_backfill_pages),
+            config=config)
+    except Exception as bar_exception:
+        logger.warning("⚠️ 분봉 저장 실패: %s", bar_exception)
+
+
+def update_position_sizer(position_sizer, config, daily_bar_cache):
+    """
+    설정값을 PositionSizer에 반영 (SIZING_CAPITAL_USD가 0이면 None, 없으면 새로 생성)
+    SIZING_LOOKBACK_DAYS가 바뀌면 일봉 캐시는 두고 공분산만 다시 계산
+    """
+    if not config.sizing_capital_usd:
+        return None
+    if position_sizer is None:
+        from trading.position_sizer import PositionSizer
+        from util.universe import get_universe
+        position_sizer = PositionSizer(list(get_universe().exchange_codes()), daily_bar_cache,
+                                       lookback_days=config.sizing_lookback_days)
+    elif position_sizer.lookback_days != config.sizing_lookback_days:
+        position_sizer.lookback_days = config.sizing_lookback_days
+        position_sizer.reset()
+    position_sizer.method = config.sizing_method
+    position_sizer.target_volatility = config.sizing_target_volatility
+    position_sizer.max_gross_leverage = config.sizing_max_gross_leverage
+    return position_sizer
+
+
+def update_strategies(strategy_set, config, daily_bar_cache):
+    """
+    STRATEGIES 프로필을 StrategySet에 반영 (비어 있으면 None)
+    이름이 같은 전략은 보유 포지션 / PositionSizer를 유지하고 파라미터만 갱신, 일봉 캐시는 기본 전략과 공유
+    """
+    strategy_configs = config.strategy_configs()
+    if not strategy_configs:
+        return None
+    from trading.strategies import Strategy, StrategySet
+
+    previous_strategies = strategy_set.strategies if strategy_set is not None else {}
+    strategy_set = StrategySet()
+    for name, strategy_config in strategy_configs:
+        strategy = previous_strategies.get(name)
+        if strategy is None:
+            signal_generator = create_signal_generator(strategy_config)
+            strategy = Strategy(name, strategy_config, signal_generator,
+                                create_signal_tracker(signal_generator, strategy_config))
+        else:
+            configure_signal_generator(strategy.signal_generator, strategy_config)
+            configure_signal_tracker(strategy.signal_tracker, strategy_config)
+        # 앱키가 다르면 전략 전용 토큰 파일 (기본 토큰과 섞이지 않게)
+        token_file = f"token_info_{name}.json" if strategy_config.app_key != config.app_key else ''
+        if token_file != strategy.token_file or strategy_config.app_key != strategy.config.app_key:
+            strategy.access_token = ''
+        strategy.token_file = token_file
+        strategy.config = strategy_config
+        strategy.position_sizer = update_position_sizer(strategy.position_sizer, strategy_config, daily_bar_cache)
+        strategy_set.strategies[name] = strategy
+    return strategy_set
+
+
+def update_entry_timing(entry_timing, config, daily_bar_cache):
+    """설정값을 EntryTimingEngine에 반영 (ENTRY_TIMING_ENABLED가 false면 None, 없으면 새로 생성)"""
+    if not config.entry_timing_enabled:
+        return None
+    if entry_timing is None:
+        from trading.entry_timing import EntryTimingEngine
+        entry_timing = EntryTimingEngine(daily_bar_cache)
+    if entry_timing.trigger != config.entry_trigger:
+        entry_timing.trigger = config.entry_trigger
+        entry_timing.levels_date = ''  # 기준이 바뀌면 대기 종목 기준가 다시 계산
+    return entry_timing
+
+
+def wait_for_next_cycle(entry_timing, config, kis_mode, wait_seconds, control=None):
+    """
+    다음 주기까지 대기 (한투 모드에서 진입 대기 종목이 있으면 그동안 현재가를 폴링해 진입 타이밍 알림)
+
+    Args:
+        entry_timing: EntryTimingEngine 또는 None
+        wait_seconds: 대기 시간 (초)
+        control: PipelineControl (다음 주기 요청 시 바로 반환, 매매 일시 중지 중이면 진입 감시 생략)
+    """
+    sleep = control.wait if control is not None else time.sleep
+    trading_paused = control is not None and control.trading_paused
+    if not kis_mode or entry_timing is None or not entry_timing.armed_tickers or trading_paused:
+        sleep(wait_seconds)
+        return
+
+    from trading import token_fetch
+    from trading.etf_quotes import fetch_etf_prices
+    from util.universe import get_universe
+
+    deadline = time.time() + wait_seconds
+    try:
+        exchange_codes = get_universe().exchange_codes()
+        token_fetch.with_access_token(
+            lambda access_token: entry_timing.prepare(config, access_token, exchange_codes), config=config)
+        # 폴링마다 토큰 확인 (감시가 길어져도 만료된 토큰으로 조회하지 않음)
+        entry_timing.watch(
+            lambda tickers: token_fetch.with_access_token(
+                lambda access_token: fetch_etf_prices(config, access_token,
+                                                      {ticker: exchange_codes[ticker] for ticker in tickers},
+                                                      request_interval=0.05),
+                config=config),
+            deadline, config.entry_poll_interval,
+            on_signal=lambda entry_signal: send_notification(entry_signal.format_message(), config, config.use_discord),
+            interrupt=control.wakeup_event if control is not None else None)
+    except Exception as entry_exception:
+        logger.warning("⚠️ 진입 타이밍 감시 중단: %s", entry_exception)
+        sleep(max(0.0, deadline - time.time()))
+
+
+def size_positions(position_sizer, signals, signal_tracker, config, token_provider=None):
+    """
+    보유(또는 신호) ETF의 목표 수량 계산 (한투 모드에서만 호출, 실패하면 None)
+    일봉은 티커별로 하루 한 번만 조회하고, 공분산은 새 봉만 반영
+
+    Args:
+        position_sizer: PositionSizer
+        signals: SignalGenerator 신호
+        signal_tracker: SignalTracker (있으면 보유 포지션 기준, 없으면 이번 신호 기준)
+        token_provider: refresh 인자를 받는 한투 토큰 함수 (추가 전략은 Strategy.token, None이면 기본 토큰)
+
+    Returns:
+        PositionSizer.size() 결과 또는 None
+    """
+    from trading import token_fetch
+    from trading.etf_quotes import fetch_etf_prices
+    from util.universe import get_universe
+
+    universe = get_universe()
+    if signal_tracker is not None:
+        current_holdings = signal_tracker.holdings()
+        long_tickers = [universe.ticker_of(sector) for sector in current_holdings['long']]
+        short_tickers = [universe.ticker_of(sector) for sector in current_holdings['short']]
+    else:
+        long_tickers = list(signals['long_etfs'])
+        short_tickers = [signals['short_etf']] if signals['short_etf'] else []
+    if not long_tickers and not short_tickers:
+        return None
+
+    try:
+        exchange_codes = universe.exchange_codes()
+
+        def fetch_sizing_inputs(access_token):
+            position_sizer.daily_bar_cache.refresh(config, access_token, exchange_codes)
+            return fetch_etf_prices(config, access_token, {ticker: exchange_codes[ticker]
+                                                           for ticker in long_tickers + short_tickers})
+
+        etf_prices = token_fetch.with_access_token(fetch_sizing_inputs, token_provider, config)
+        position_sizer.update()
+        return position_sizer.size(long_tickers, short_tickers, config.sizing_capital_usd, etf_prices)
+    except Exception as sizing_exception:
+        logger.warning("⚠️ 목표 수량 계산 실패: %s", sizing_exception)
+        return None
 
 
 # 모듈 초기화
 def initialize_modules(config):
     """
-    RSS Fetcher, News Analyzer, Signal Generator 초기화
+    RSS Fetcher, Relevance Filter, News Analyzer, Signal Generator 초기화
 
     Returns:
-        (rss_fetcher, news_analyzer, signal_generator) 튜플
+        PipelineModules
     """
-    print("DEBUG: initialize_modules() called")
-    print("DEBUG: Importing RSSFetcher...")
+    logger.debug("initialize_modules() called")
+    configure_universe(config)
     from analysis.rss_fetcher import RSSFetcher
-    print("DEBUG: Importing NewsAnalyzer...")
-    from analysis.news_analyzer import NewsAnalyzer
-    print("DEBUG: Importing SignalGenerator...")
-    from trading.signal_generator import SignalGenerator
-    print("DEBUG: All imports successful")
+    from analysis.news_analyzer import CascadeBackend, NewsAnalyzer, OpenAIBackend
+    logger.debug("All imports successful")
 
     # RSS Fetcher
     rss_fetcher = RSSFetcher(
-        feed_urls=config['RSS_FEEDS'],
-        limit_per_feed=config.get('NEWS_LIMIT_PER_FEED', 5)
+        feed_urls=list(config.rss_feeds),
+        limit_per_feed=config.news_limit_per_feed,
+        fast_parse=config.rss_fast_parse,
+        max_article_age_seconds=config.max_article_age
     )
 
-    # News Analyzer
+    # 감정 분석 백엔드 (openai / local / cascade)
+    llm_backend = None
+    if config.sentiment_backend in ('openai', 'cascade'):
+        llm_backend = OpenAIBackend(
+            api_key=config.openai_api_key,
+            model=config.openai_model,
+            temperature=config.openai_temperature,
+            reasoning_effort=config.openai_reasoning_effort,
+            max_retries=config.max_retries,
+            retry_delay=config.retry_delay,
+            max_retry_delay=config.max_retry_delay,
+            circuit_breaker_threshold=config.circuit_breaker_threshold,
+            circuit_breaker_cooldown=config.circuit_breaker_cooldown,
+            max_instruments_per_call=config.universe_max_per_call,
+            max_parallel_calls=config.universe_parallel_calls
+        )
+
+    local_backend = None
+    if config.sentiment_backend in ('local', 'cascade') or config.local_model_learn:
+        from analysis.local_sentiment import LocalLinearBackend
+        local_backend = LocalLinearBackend(model_path=config.local_model_path)
+
+    if config.sentiment_backend == 'local':
+        sentiment_backend = local_backend
+    elif config.sentiment_backend == 'cascade':
+        sentiment_backend = CascadeBackend(local_backend, llm_backend,
+                                           escalate_low=config.cascade_escalate_low,
+                                           escalate_high=config.cascade_escalate_high)
+    else:
+        sentiment_backend = llm_backend
+
+    # News Analyzer (LLM 결과는 로컬 모델 학습 라벨로 재사용)
     news_analyzer = NewsAnalyzer(
-        api_key=config['OPENAI_API_KEY'],
-        model=config.get('OPENAI_MODEL', 'gpt-4o-mini'),
-        temperature=config.get('OPENAI_TEMPERATURE', 0.3),
-        reasoning_effort=config.get('OPENAI_REASONING_EFFORT', {"effort": "medium"}),
-        max_retries=config.get('MAX_RETRIES', 3),
-        retry_delay=config.get('RETRY_DELAY', 2)
+        backend=sentiment_backend,
+        label_learner=local_backend if llm_backend is not None and config.local_model_learn else None,
+        request_interval=config.openai_request_interval if llm_backend is not None else 0.0
     )
 
     # Signal Generator
-    signal_generator = SignalGenerator(
-        num_long=config.get('NUM_LONG_POSITIONS', 2),
-        num_short=config.get('NUM_SHORT_POSITIONS', 1)
+    signal_generator = create_signal_generator(config)
+
+    # 관련성 사전 필터 (무관한 기사는 LLM에 보내지 않음)
+    relevance_filter = create_relevance_filter(config) if config.relevance_filter_enabled else None
+
+    # 우선순위 스케줄러 (주기별 예산 초과분은 다음 주기로 이월)
+    from analysis.article_scheduler import ArticleScheduler
+    article_scheduler = ArticleScheduler(
+        source_weights=config.source_reliability,
+        max_backlog=config.scheduler_max_backlog,
+        max_article_age_seconds=config.max_article_age
     )
 
-    return rss_fetcher, news_analyzer, signal_generator
+    # 일봉 캐시 (포지션 크기 / 진입 타이밍 공용)
+    daily_bar_cache = create_daily_bar_cache(config)
+
+    modules = PipelineModules(
+        rss_fetcher=rss_fetcher,
+        news_analyzer=news_analyzer,
+        signal_generator=signal_generator,
+        signal_tracker=create_signal_tracker(signal_generator, config),
+        relevance_filter=relevance_filter,
+        article_scheduler=article_scheduler,
+        article_enricher=create_article_enricher(config) if config.article_enrichment_enabled else None,
+        article_archive=create_article_archive(config) if config.archive_enabled else None,
+        source_reliability=create_source_reliability(config) if config.source_weighting_enabled else None,
+        daily_bar_cache=daily_bar_cache,
+        position_sizer=update_position_sizer(None, config, daily_bar_cache),
+        entry_timing=update_entry_timing(None, config, daily_bar_cache),
+        strategies=update_strategies(None, config, daily_bar_cache)
+    )
+    apply_source_weights(modules, config)
+    return modules
 
 
 # 파이프라인 실행
-def run_pipeline(rss_fetcher, news_analyzer, signal_generator, config, kis_mode=False):
+def collect_and_analyze(modules, config, cycle_id=None):
+    """
+    수집 → 관련성 필터 → 본문 보강 → 우선순위 스케줄링 → AI 분석 → 아카이브 기록
+    (단일 프로세스 파이프라인과 샤드 워커가 공용으로 사용)
+
+    Args:
+        modules: PipelineModules
+        config: AppConfig
+        cycle_id: 아카이브 주기 ID (아카이브 미사용 시 None)
+
+    Returns:
+        BatchAnalysis 또는 None (새 기사와 이월 기사가 모두 없을 때)
+    """
+    discord_enabled = routine_discord_enabled(config)
+    rss_fetcher = modules.rss_fetcher
+    news_analyzer = modules.news_analyzer
+    article_archive = modules.article_archive
+
+    # 1. RSS 수집
+    send_notification("📰 뉴스 수집 시작...", config, discord_enabled)
+    with METRICS.timer('pipeline_stage_seconds', stage='fetch'):
+        articles = rss_fetcher.fetch_all_news()
+
+    article_scheduler = modules.article_scheduler
+    if not articles and not article_scheduler.backlog:
+        send_notification("⚠️ 수집된 뉴스가 없습니다. 다음 주기를 기다립니다.", config, discord_enabled)
+        return None
+
+    send_notification(f"✅ RSS 수집 완료 ({len(articles)}개 기사, 이월 대기 {len(article_scheduler.backlog)}개)", config, discord_enabled)
+
+    # 2. 관련성 필터 (섹터 엔티티가 없는 기사는 LLM 호출 없이 제외 또는 0점 처리)
+    irrelevant_articles = []
+    if modules.relevance_filter is not None:
+        with METRICS.timer('pipeline_stage_seconds', stage='filter'):
+            articles, irrelevant_articles = modules.relevance_filter.split(articles)
+        if irrelevant_articles:
+            drop_rates = ", ".join(f"{source} {drop_rate:.0%}" for source, drop_rate in modules.relevance_filter.drop_rates().items())
+            send_notification(f"🔎 관련성 필터: {len(irrelevant_articles)}개 제외 (피드별 누적 제외율: {drop_rates})", config, discord_enabled)
+
+    # 본문 보강 (관련 기사만, 예산 계산 전에 실제 길이 반영)
+    if modules.article_enricher is not None and articles:
+        with METRICS.timer('pipeline_stage_seconds', stage='enrich'):
+            modules.article_enricher.enrich(articles)
+
+    # 3. 우선순위 순으로 예산만큼 분석 (토큰/비용 예산은 LLM을 쓸 때만 적용)
+    from analysis.article_scheduler import CycleBudget
+    article_scheduler.enqueue(articles)
+    uses_llm = news_analyzer.llm_backend is not None
+    cycle_budget = CycleBudget(
+        max_articles=config.analysis_max_articles_per_cycle,
+        max_tokens=config.analysis_token_budget if uses_llm else 0,
+        max_cost=config.analysis_cost_budget if uses_llm else 0.0,
+        price_per_1k_tokens=config.openai_price_per_1k_tokens
+    )
+    articles, estimated_tokens = article_scheduler.take(cycle_budget)
+
+    send_notification(f"🤖 AI 분석 시작... ({len(articles)}개, 예상 {estimated_tokens} 토큰)", config, discord_enabled)
+    with METRICS.timer('pipeline_stage_seconds', stage='analyze'):
+        batch_analysis = news_analyzer.analyze_batch(articles, deadline_seconds=config.analysis_deadline or None)
+    carried_count = article_scheduler.requeue_unfinished(articles, batch_analysis.results)
+    if carried_count:
+        send_notification(f"📥 분석하지 못한 {carried_count}개 기사는 다음 주기로 이월", config, discord_enabled)
+    irrelevant_results = [None] * len(irrelevant_articles)
+    if config.relevance_filter_mode == 'zero':
+        irrelevant_results = [news_analyzer.zero_score_result(article) for article in irrelevant_articles]
+        batch_analysis.results.extend(irrelevant_results)
+
+    # 아카이브 기록 (백그라운드 스레드에서 배치로 저장)
+    if article_archive is not None and cycle_id is not None:
+        from analysis.news_analyzer import prompt_version
+        article_archive.record_articles(cycle_id, articles + irrelevant_articles,
+                                        batch_analysis.results[:len(articles)] + irrelevant_results,
+                                        prompt_version=prompt_version())
+
+    # 이번 주기에 LLM 라벨로 학습한 경우에만 저장 (가중치 전체를 JSON으로 다시 씀)
+    if news_analyzer.label_learner is not None and news_analyzer.label_learner.dirty:
+        news_analyzer.label_learner.save()
+
+    return batch_analysis
+
+
+def publish_signals(signal_generator, scorechart, coverage, status_counts, config, kis_mode=False,
+                    article_archive=None, cycle_id=None, signal_tracker=None, position_sizer=None,
+                    entry_timing=None, trading_paused=False, source_weights=None):
+    """
+    섹터 점수 요약 → 신호 생성 → 변경 감지 → 알림 → 아카이브 주기 종료 기록
+    SIGNAL_CHANGES_ONLY이고 signal_tracker가 있으면 포지션이 바뀐 주기에만 신호 알림
+
+    Args:
+        signal_generator: SignalGenerator
+        scorechart: 섹터별 점수 합계
+        coverage: 분석 커버리지
+        status_counts: 분석 상태별 기사 수
+        signal_tracker: SignalTracker (None이면 매 주기 전체 신호 알림)
+        position_sizer: PositionSizer (한투 모드에서 알림에 목표 수량 추가, None이면 생략)
+        entry_timing: EntryTimingEngine (한투 모드에서 진입/청산 변경을 진입 대기 목록에 반영)
+        trading_paused: 제어 API로 매매를 일시 중지했는지 (신호 알림은 그대로, 주문만 생략)
+        source_weights: scorechart 집계에 적용한 출처 가중치 (아카이브에 남겨 리플레이에서 같은 가중치로 재집계)
+
+    Returns:
+        SignalGenerator 신호 (changes / holdings / sizing 포함)
+    """
+    discord_enabled = config.use_discord
+    routine_discord = routine_discord_enabled(config)
+
+    # 점수 요약
+    score_summary = ", ".join([f"{sector}: {score:+d}" for sector, score in sorted(scorechart.items(), key=lambda x: x[1], reverse=True)[:11]])
+    send_notification(f"✅ 분석 완료 (커버리지 {coverage:.0%}, {status_counts})\n섹터 점수: {score_summary}", config, routine_discord)
+
+    # 4. 신호 생성 + 이전 포지션과 비교
+    send_notification("📊 거래 신호 생성 중...", config, routine_discord)
+    signals, signal_msg = evaluate_strategy(signal_generator, scorechart, coverage, config, kis_mode,
+                                            signal_tracker, position_sizer, entry_timing)
+    if article_archive is not None and cycle_id is not None:
+        article_archive.finish_cycle(cycle_id, coverage=coverage, signals=signals, source_weights=source_weights)
+    if signal_msg is None:
+        return signals
+
+    send_notification(signal_msg, config, discord_enabled)
+    send_trade_notification(config, kis_mode, trading_paused)
+    return signals
+
+
+def evaluate_strategy(signal_generator, scorechart, coverage, config, kis_mode=False, signal_tracker=None,
+                      position_sizer=None, entry_timing=None, token_provider=None):
+    """
+    신호 생성 → 이전 포지션과 비교 → (알림할 때만) 목표 수량 계산 (기본 전략과 추가 전략 공용, 알림은 보내지 않음)
+
+    Args:
+        config: 전략 설정 (SIGNAL_CHANGES_ONLY, 포지션 크기, 계좌)
+        token_provider: 목표 수량 계산에 쓸 한투 토큰 함수 (refresh 인자, None이면 기본 토큰)
+
+    Returns:
+        (신호 dict, 알림 메시지) - SIGNAL_CHANGES_ONLY이고 포지션 변경이 없으면 메시지는 None
+    """
+    with METRICS.timer('pipeline_stage_seconds', stage='signal'):
+        signals = signal_generator.generate_signals(scorechart, coverage=coverage)
+        signal_changes = []
+        if signal_tracker is not None:
+            signal_changes = signal_tracker.update(scorechart, coverage)
+            signals['changes'] = [signal_change.to_dict() for signal_change in signal_changes]
+            signals['holdings'] = signal_tracker.holdings()
+            if kis_mode and entry_timing is not None:
+                entry_timing.apply_changes(signals['changes'])
+
+    if signal_tracker is not None and config.signal_changes_only and not signal_changes:
+        logger.info("🔕 포지션 변경 없음 (%s, %s)", signals['action'], signal_tracker.format_holdings())
+        return signals, None
+
+    signal_msg = signal_generator.format_signal_message(signals)
+    if signal_changes:
+        signal_msg = f"{signal_tracker.format_changes(signal_changes)}\n\n{signal_msg}"
+    if kis_mode and position_sizer is not None:
+        sizing = size_positions(position_sizer, signals, signal_tracker, config, token_provider)
+        if sizing is not None:
+            signals['sizing'] = sizing
+            signal_msg = f"{signal_msg}\n\n{position_sizer.format_sizing(sizing)}"
+    return signals, signal_msg
+
+
+def send_trade_notification(config, kis_mode, trading_paused=False, strategy_name=''):
+    """
+    5. 실제 매매 단계 (TODO) - 주문은 전략 설정의 계좌(CANO / ACNT_PRDT_CD)로만 나가야 함
+
+    Args:
+        strategy_name: 추가 전략 이름 (기본 전략은 빈 문자열)
+    """
+    discord_enabled = config.use_discord
+    strategy_prefix = f"[{strategy_name}] " if strategy_name else ""
+    if kis_mode and trading_paused:
+        send_notification(f"⏸️ {strategy_prefix}매매 일시 중지 중 (제어 API) - 주문 생략", config, discord_enabled)
+    elif kis_mode:
+        send_notification(f"📝 {strategy_prefix}TODO: 실제 매매 실행 (미구현)", config, discord_enabled)
+    else:
+        send_notification(f"💡 {strategy_prefix}신호를 확인하고 수동으로 매매하세요", config, discord_enabled)
+
+
+def publish_strategy_signals(strategy_set, scorechart, coverage, kis_mode=False, trading_paused=False):
+    """
+    추가 전략(STRATEGIES) 평가 - 같은 섹터 점수를 전략별로 병렬 평가하고, 알림은 전략 순서대로 전략 설정의 Discord로
+
+    Args:
+        strategy_set: StrategySet 또는 None
+
+    Returns:
+        {전략 이름: 신호} (평가에 실패한 전략은 제외)
+    """
+    if strategy_set is None:
+        return {}
+
+    def evaluate(strategy):
+        position_sizer = strategy.position_sizer
+        if position_sizer is not None and kis_mode and not strategy.token():
+            # 기본 토큰으로 대신 계산하지 않음 (다른 계좌 토큰으로 조회 / 토큰 파일 덮어쓰기 방지)
+            logger.warning("⚠️ [%s] 전략 계좌 토큰 없음 - 목표 수량 계산 생략", strategy.name)
+            position_sizer = None
+        return evaluate_strategy(strategy.signal_generator, scorechart, coverage, strategy.config, kis_mode,
+                                 strategy.signal_tracker, position_sizer, token_provider=strategy.token)
+
+    strategy_signals = {}
+    for strategy, evaluation, strategy_exception in strategy_set.evaluate(evaluate):
+        strategy_config = strategy.config
+        if strategy_exception is not None:
+            METRICS.inc('strategy_errors_total', strategy=strategy.name)
+            send_notification(f"❌ [{strategy.name}] 전략 평가 오류: {strategy_exception}", strategy_config,
+                              strategy_config.use_discord)
+            continue
+        signals, signal_msg = evaluation
+        strategy.last_signals = signals
+        strategy_signals[strategy.name] = signals
+        if signal_msg is None:
+            continue
+        send_notification(f"🧭 [{strategy.name}] 계좌 {strategy.account}\n{signal_msg}", strategy_config,
+                          strategy_config.use_discord)
+        send_trade_notification(strategy_config, kis_mode, trading_paused, strategy.name)
+    return strategy_signals
+
+
+def run_pipeline(modules, config, kis_mode=False):
     """
     전체 파이프라인 실행
     1. RSS 수집
-    2. AI 분석
+    2. 관련성 필터 + 우선순위 스케줄링 + AI 분석
     3. 신호 생성
     4. (TODO) 실제 매매
 
     Args:
-        rss_fetcher: RSSFetcher 인스턴스
-        news_analyzer: NewsAnalyzer 인스턴스
-        signal_generator: SignalGenerator 인스턴스
-        config: 설정 dict
+        modules: PipelineModules
+        config: AppConfig
         kis_mode: 한투 API 모드 여부
     """
-    discord_enabled = config.get('USE_DISCORD', False)
+    discord_enabled = config.use_discord
+    article_archive = modules.article_archive
+    control = modules.control
+    cycle_id = article_archive.begin_cycle() if article_archive is not None else None
 
     try:
-        # 1. RSS 수집
-        send_notification("📰 뉴스 수집 시작...", config, discord_enabled)
-        articles = rss_fetcher.fetch_all_news()
-
-        if not articles:
-            send_notification("⚠️ 수집된 뉴스가 없습니다. 다음 주기를 기다립니다.", config, discord_enabled)
+        batch_analysis = collect_and_analyze(modules, config, cycle_id)
+        if batch_analysis is None:
             return
 
-        send_notification(f"✅ RSS 수집 완료 ({len(articles)}개 기사)", config, discord_enabled)
-
-        # 2. AI 분석
-        send_notification("🤖 AI 분석 시작...", config, discord_enabled)
-        scorechart = news_analyzer.analyze_batch(articles)
-
-        # 점수 요약
-        score_summary = ", ".join([f"{sector}: {score:+d}" for sector, score in sorted(scorechart.items(), key=lambda x: x[1], reverse=True)[:11]])
-        send_notification(f"✅ 분석 완료\n섹터 점수: {score_summary}", config, discord_enabled)
+        signals = publish_signals(modules.signal_generator, batch_analysis.scores, batch_analysis.coverage,
+                                  batch_analysis.status_counts, config, kis_mode, article_archive, cycle_id,
+                                  signal_tracker=modules.signal_tracker, position_sizer=modules.position_sizer,
+                                  entry_timing=modules.entry_timing,
+                                  trading_paused=control is not None and control.trading_paused,
+                                  source_weights=modules.news_analyzer.source_weights)
+        if control is not None:
+            control.record_signals(signals, batch_analysis.scores, batch_analysis.coverage)
+        publish_strategy_signals(modules.strategies, batch_analysis.scores, batch_analysis.coverage, kis_mode,
+                                 trading_paused=control is not None and control.trading_paused)
 
-        # 3. 신호 생성
-        send_notification("📊 거래 신호 생성 중...", config, discord_enabled)
-        signals = signal_generator.generate_signals(scorechart)
-        signal_msg = signal_generator.format_signal_message(signals)
-        send_notification(signal_msg, config, discord_enabled)
-
-        # 4. 실제 매매 (TODO)
+        # 출처 신뢰도 학습 (ETF 가격이 필요하므로 한투 모드에서만) → 다음 주기 집계부터 반영
+        if kis_mode and modules.source_reliability is not None:
+            update_source_reliability(modules.source_reliability, batch_analysis.source_scores, config)
+            apply_source_weights(modules, config)
         if kis_mode:
-            send_notification("📝 TODO: 실제 매매 실행 (미구현)", config, discord_enabled)
-        else:
-            send_notification("💡 신호를 확인하고 수동으로 매매하세요", config, discord_enabled)
+            update_minute_bars(modules.daily_bar_cache, config)
 
     except Exception as e:
+        METRICS.inc('pipeline_errors_total')
         error_msg = f"❌ 파이프라인 오류:\n{traceback.format_exc()}"
         send_notification(error_msg, config, discord_enabled)
 
 
+def _parse_date_argument(date_text):
+    """--since / --until 값 (YYYY-MM-DD 또는 ISO 8601, 시간대 없으면 UTC) → epoch 초"""
+    from analysis.article_index import parse_published_timestamp
+    timestamp = parse_published_timestamp(date_text)
+    if timestamp is None:
+        raise argparse.ArgumentTypeError(f"날짜 형식 오류: {date_text}")
+    return timestamp
+
+
+def run_replay(config, since_timestamp=0.0, until_timestamp=float('inf')):
+    """
+    아카이브된 주기별 분석 결과를 SignalGenerator에 다시 넣어 신호 재생성 (네트워크 호출 없음)
+    현재 설정의 신호 파라미터(포지션 수, 커버리지 기준)로 과거 주기를 다시 평가할 때 사용
+    섹터 합계는 주기마다 아카이브된 당시 출처 가중치로 재집계 (라이브 주기와 같은 점수, 현재 학습된 가중치는 쓰지 않음)
+    - 가중치 기록 이전 주기는 단순 합계
+
+    Args:
+        config: AppConfig
+        since_timestamp / until_timestamp: 주기 시작 시각 범위 (epoch 초)
+    """
+    from analysis.article_archive import ArticleArchive
+    from analysis.news_analyzer import BatchAnalysis
+
+    configure_universe(config)
+    article_archive = ArticleArchive(config.archive_path)
+    signal_generator = create_signal_generator(config)
+
+    signal_tracker = create_signal_tracker(signal_generator, config)
+
+    replayed_cycle_count = 0
+    signal_change_count = 0
+    action_counts = {}
+    for cycle_id, started_at, analysis_results, source_weights in article_archive.iter_cycles(since_timestamp,
+                                                                                              until_timestamp):
+        batch_analysis = BatchAnalysis.from_results(analysis_results, source_weights)
+        signals = signal_generator.generate_signals(batch_analysis.scores, coverage=batch_analysis.coverage)
+        # 최소 보유 시간은 주기 시작 시각 기준으로 재현
+        signal_changes = signal_tracker.update(batch_analysis.scores, batch_analysis.coverage, now=started_at)
+        replayed_cycle_count += 1
+        signal_change_count += len(signal_changes)
+        action_counts[signals['action']] = action_counts.get(signals['action'], 0) + 1
+        signal_msg = signal_generator.format_signal_message(signals)
+        if signal_changes:
+            signal_msg = f"{signal_tracker.format_changes(signal_changes)}\n\n{signal_msg}"
+        logger.info("⏪ 주기 %d (%s, 기사 %d개)\n%s", cycle_id,
+                    datetime.fromtimestamp(started_at).strftime('%Y-%m-%d %H:%M:%S'), len(analysis_results),
+                    signal_msg)
+
+    article_archive.close()
+    logger.info("✅ 리플레이 완료: %d개 주기 %s, 포지션 변경 %d건 (%s)", replayed_cycle_count, action_counts,
+                signal_change_count, signal_tracker.format_holdings())
+
+
 # 메인 함수
 def main():
     """메인 실행 함수"""
-    print("DEBUG: main() function called")
-    print("\n" + "="*60)
-    print("KISTrader 뉴스 분석 파이프라인")
-    print("="*60 + "\n")
+    argument_parser = argparse.ArgumentParser(description="KISTrader 뉴스 분석 파이프라인")
+    argument_parser.add_argument('--replay', action='store_true', help="아카이브로 신호 재생성 (네트워크 호출 없음)")
+    argument_parser.add_argument('--since', type=_parse_date_argument, default=0.0, help="리플레이 시작 (YYYY-MM-DD)")
+    argument_parser.add_argument('--until', type=_parse_date_argument, default=float('inf'), help="리플레이 끝 (YYYY-MM-DD)")
+    argument_parser.add_argument('--workers', type=int, default=None, help="샤드 워커 프로세스 수 (기본: SHARD_WORKERS)")
+    argument_parser.add_argument('--service', action='store_true', help="asyncio 서비스 모드 (SIGTERM 시 정상 종료)")
+    arguments = argument_parser.parse_args()
+
+    setup_logging()
+    logger.info("KISTrader 뉴스 분석 파이프라인")
 
     # 설정 로드
-    print("DEBUG: Loading config...")
-    config = load_config()
-    print("DEBUG: Config loaded successfully")
-    discord_enabled = config.get('USE_DISCORD', False)
+    config_watcher = load_config()
+    config = config_watcher.config
+    setup_logging(config.log_level, config.log_format, config.log_file, config.log_rate_limit_per_minute)
+    logger.debug("Config loaded successfully")
+    discord_enabled = config.use_discord
+
+    if arguments.replay:
+        run_replay(config, arguments.since, arguments.until)
+        return
+    install_pipeline_cassette(config)
 
     # 모드 확인 및 토큰 획득
     kis_mode = False
     ACCESS_TOKEN = None
 
-    if config.get('USE_KIS_API', False):
+    if config.use_kis_api:
         # 한국투자증권 모드
         try:
             from trading import token_fetch
             send_notification("🔐 한투 API 토큰 획득 시도 중...", config, discord_enabled)
-            ACCESS_TOKEN = token_fetch.get_access_token()
+            ACCESS_TOKEN = token_fetch.get_access_token(config)
 
             if ACCESS_TOKEN and ACCESS_TOKEN != "":
                 send_notification("✅ 토큰 획득 완료 - 한투 모드 활성화", config, discord_enabled)
@@ -238,35 +1095,81 @@ def main():
         send_notification("📊 뉴스 분석 전용 모드로 시작", config, discord_enabled)
         kis_mode = False
 
+    # 샤드 워커 모드: 피드 수집/분석은 워커 프로세스, 신호 생성은 이 프로세스(코디네이터)
+    shard_workers = arguments.workers if arguments.workers is not None else config.shard_workers
+    if shard_workers > 0:
+        from sharded_pipeline import run_sharded
+        if config.metrics_port:
+            start_metrics_server(config.metrics_port)
+        try:
+            run_sharded(config_watcher, shard_workers, kis_mode)
+        except KeyboardInterrupt:
+            send_notification("\n\n👋 프로그램을 종료합니다.", config, discord_enabled)
+        return
+
     # 모듈 초기화
     try:
-        print("DEBUG: Starting module initialization...")
         send_notification("⚙️ 모듈 초기화 중...", config, discord_enabled)
-        print("DEBUG: Calling initialize_modules...")
-        rss_fetcher, news_analyzer, signal_generator = initialize_modules(config)
-        print("DEBUG: initialize_modules returned successfully")
+        modules = initialize_modules(config)
         send_notification("✅ 모듈 초기화 완료", config, discord_enabled)
+
+        if config.metrics_port:
+            start_metrics_server(config.metrics_port)
+            send_notification(f"📈 메트릭 엔드포인트: http://127.0.0.1:{config.metrics_port}/metrics", config, discord_enabled)
+        modules.control = create_pipeline_control(config, modules)
     except Exception as e:
         send_notification(f"❌ 모듈 초기화 실패:\n{traceback.format_exc()}", config, discord_enabled)
         sys.exit(1)
 
+    if arguments.service:
+        from service import run_service
+        run_service(config_watcher, modules, kis_mode)
+        return
+
+    # 체크포인트가 있으면 캐시/포지션/반복 번호 복원
+    checkpoint = create_pipeline_checkpoint(config)
+    iteration = checkpoint.load(checkpoint_components(modules)) if checkpoint is not None else 0
+    control = modules.control
+
     # 무한 루프
-    loop_interval = config.get('LOOP_INTERVAL', 900)  # 기본값 15분
-    iteration = 0
 
     try:
         while True:
             iteration += 1
-            send_notification(f"\n{'='*60}\n🔄 반복 #{iteration} 시작\n{'='*60}", config, discord_enabled)
+
+            # 설정 파일이 바뀌었으면 재시작 없이 반영
+            if config_watcher.reload_if_changed():
+                config = config_watcher.config
+                discord_enabled = config.use_discord
+                apply_config(config, modules)
+                send_notification("🔁 설정 변경 감지 - 새 설정 적용 완료", config, discord_enabled)
+            elif config_watcher.last_reload_error:
+                send_notification(f"⚠️ 설정 리로드 실패 (기존 설정 유지): {config_watcher.last_reload_error}", config, discord_enabled)
+                config_watcher.last_reload_error = None
+
+            send_notification(f"\n{'='*60}\n🔄 반복 #{iteration} 시작\n{'='*60}", config, routine_discord_enabled(config))
 
             # 파이프라인 실행
-            run_pipeline(rss_fetcher, news_analyzer, signal_generator, config, kis_mode)
+            control.begin_cycle(iteration)
+            with METRICS.timer('pipeline_cycle_seconds'):
+                run_pipeline(modules, config, kis_mode)
+            control.end_cycle()
+            if checkpoint is not None:
+                checkpoint.save(checkpoint_components(modules), iteration)
+
+            if config.metrics_json_path:
+                METRICS.dump_cycle_json(config.metrics_json_path, iteration)
 
-            # 대기
-            send_notification(f"\n⏳ {loop_interval}초 대기 중... (Ctrl+C로 종료)", config, discord_enabled)
-            time.sleep(loop_interval)
+            # 대기 (LOOP_INTERVAL은 제어 API로 바뀌었을 수 있음)
+            loop_interval = control.loop_interval
+            send_notification(f"\n⏳ {loop_interval}초 대기 중... (Ctrl+C로 종료)", config, routine_discord_enabled(config))
+            wait_for_next_cycle(modules.entry_timing, config, kis_mode, loop_interval, control)
 
     except KeyboardInterrupt:
+        # 주기 도중에 멈췄으면 수집만 하고 분석하지 못한 기사가 있으므로 마지막 주기 끝의 체크포인트를 유지
+        if checkpoint is not None and control.state != 'running':
+            checkpoint.save(checkpoint_components(modules), iteration, force=True)
+        shutdown_modules(modules)
         send_notification("\n\n👋 프로그램을 종료합니다.", config, discord_enabled)
         sys.exit(0)
 
@@ -0,0 +1,228 @@
+"""
+asyncio 서비스 모드 (이벤트 루프 하나에서 협력 태스크로 실행)
+- 파이프라인 주기: 블로킹 단계(RSS / OpenAI / 한투)는 공용 스레드 풀에서 실행, 이벤트 루프는 다른 태스크를 계속 처리
+- 알림: Discord 전송은 큐에 넣고 전용 태스크가 공용 세션으로 순서대로 전송 (파이프라인이 Discord 응답을 기다리지 않음)
+- 진입 타이밍: 주기 사이 대기 중 진입 대기 종목 현재가를 폴링하는 태스크
+- 체크포인트 (CHECKPOINT_PATH): 시작 시 복원, 주기가 끝날 때마다 스레드 풀에서 저장, 종료 시 진행 중인 주기가 없으면 저장
+- 제어 API (CONTROL_PORT): 다음 주기 요청은 이벤트 루프로 넘겨 대기를 바로 끝냄, LOOP_INTERVAL / 매매 일시 중지 반영
+- SIGTERM / SIGINT: 새 주기를 시작하지 않고, 진행 중인 주기(한투 호출 포함)를 SERVICE_DRAIN_TIMEOUT까지 기다린 뒤
+  알림 큐를 비우고 캐시/학습 상태를 저장한 다음 종료
+
+실행: python main.py --service
+"""
+import asyncio
+import functools
+import signal
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import requests
+
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger('service')
+
+
+class PipelineService:
+    """파이프라인 / 알림 / 진입 감시 태스크를 묶은 서비스"""
+
+    def __init__(self, config_watcher, modules, kis_mode: bool):
+        """
+        Args:
+            config_watcher: ConfigWatcher (주기 사이에 리로드)
+            modules: initialize_modules()가 만든 PipelineModules
+            kis_mode: 한투 API 모드 여부
+        """
+        self.config_watcher = config_watcher
+        self.config = config_watcher.config
+        self.modules = modules
+        self.kis_mode = kis_mode
+        self.iteration = 0
+        self.executor = ThreadPoolExecutor(max_workers=self.config.service_worker_threads,
+                                           thread_name_prefix='pipeline')
+        self.discord_session = requests.Session()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._notification_queue: Optional[asyncio.Queue] = None
+        self._cycle_requested: Optional[asyncio.Event] = None
+        self._cycle_task: Optional[asyncio.Task] = None
+        self._checkpoint = None
+
+    def request_stop(self):
+        """종료 요청 (시그널 핸들러) - 진행 중인 주기는 끝까지 기다림"""
+        if not self._stop_event.is_set():
+            logger.info("🛑 종료 요청 - 진행 중인 작업을 마치고 종료합니다")
+            self._stop_event.set()
+
+    def dispatch_discord(self, webhook_url: str, message: dict):
+        """send_notification()의 Discord 전송을 알림 큐로 넘김 (스레드 풀 안에서 호출돼도 안전)"""
+        self._loop.call_soon_threadsafe(self._notification_queue.put_nowait, (webhook_url, message))
+
+    async def run(self):
+        import main as pipeline
+
+        self._loop = asyncio.get_running_loop()
+        self._loop.set_default_executor(self.executor)
+        self._stop_event = asyncio.Event()
+        self._notification_queue = asyncio.Queue()
+        self._cycle_requested = asyncio.Event()
+        control = self.modules.control
+        control.add_wakeup_callback(lambda: self._loop.call_soon_threadsafe(self._cycle_requested.set))
+        control.add_status_provider('notification_queue', lambda: {'queued': self._notification_queue.qsize()})
+        for stop_signal in (signal.SIGTERM, signal.SIGINT):
+            self._loop.add_signal_handler(stop_signal, self.request_stop)
+        pipeline.set_discord_dispatcher(self.dispatch_discord)
+        self._checkpoint = pipeline.create_pipeline_checkpoint(self.config)
+        if self._checkpoint is not None:
+            self.iteration = self._checkpoint.load(pipeline.checkpoint_components(self.modules))
+
+        notification_task = asyncio.create_task(self._deliver_notifications())
+        pipeline.send_notification("🧵 서비스 모드 시작 (SIGTERM으로 정상 종료)", self.config, self.config.use_discord)
+        try:
+            await self._run_cycles(pipeline)
+        finally:
+            await self._drain(pipeline, notification_task)
+
+    async def _run_cycles(self, pipeline):
+        control = self.modules.control
+        while not self._stop_event.is_set():
+            self.iteration += 1
+            config = self._reload_config(pipeline)
+            self._cycle_requested.clear()
+            control.begin_cycle(self.iteration)
+
+            pipeline.send_notification(f"\n{'='*60}\n🔄 반복 #{self.iteration} 시작\n{'='*60}",
+                                       config, pipeline.routine_discord_enabled(config))
+            cycle_started_at = time.perf_counter()
+            self._cycle_task = asyncio.ensure_future(
+                self._loop.run_in_executor(None, pipeline.run_pipeline, self.modules, config, self.kis_mode))
+            stop_waiter = asyncio.ensure_future(self._stop_event.wait())
+            await asyncio.wait({self._cycle_task, stop_waiter}, return_when=asyncio.FIRST_COMPLETED)
+            stop_waiter.cancel()
+            if not self._cycle_task.done():
+                break  # 종료 요청 - 진행 중인 주기는 _drain()에서 제한 시간까지 대기
+            self._cycle_task = None
+            METRICS.observe('pipeline_cycle_seconds', time.perf_counter() - cycle_started_at)
+            control.end_cycle()
+            await self._save_checkpoint(pipeline)
+            if config.metrics_json_path:
+                METRICS.dump_cycle_json(config.metrics_json_path, self.iteration)
+
+            if self._stop_event.is_set():
+                break
+            loop_interval = control.loop_interval
+            pipeline.send_notification(f"\n⏳ {loop_interval}초 대기 중... (SIGTERM으로 종료)",
+                                       config, pipeline.routine_discord_enabled(config))
+            await self._wait_for_next_cycle(pipeline, config, time.time() + loop_interval)
+
+    def _reload_config(self, pipeline):
+        """주기 사이에만 설정 반영 (스레드 풀에서 모듈을 쓰는 중에는 바꾸지 않음)"""
+        config_watcher = self.config_watcher
+        if config_watcher.reload_if_changed():
+            self.config = config_watcher.config
+            pipeline.apply_config(self.config, self.modules)
+            pipeline.send_notification("🔁 설정 변경 감지 - 새 설정 적용 완료", self.config, self.config.use_discord)
+        elif config_watcher.last_reload_error:
+            pipeline.send_notification(f"⚠️ 설정 리로드 실패 (기존 설정 유지): {config_watcher.last_reload_error}",
+                                       self.config, self.config.use_discord)
+            config_watcher.last_reload_error = None
+        return self.config
+
+    async def _wait_for_next_cycle(self, pipeline, config, deadline: float):
+        """다음 주기까지 대기 (진입 대기 종목이 있으면 폴링, 종료 / 다음 주기 요청 시 바로 반환)"""
+        entry_timing = self.modules.entry_timing
+        if (self.kis_mode and entry_timing is not None and entry_timing.armed_tickers
+                and not self.modules.control.trading_paused):
+            try:
+                await self._watch_entries(pipeline, config, entry_timing, deadline)
+            except Exception as entry_exception:
+                logger.warning("⚠️ 진입 타이밍 감시 중단: %s", entry_exception)
+        await self._sleep_until(deadline)
+
+    async def _sleep_until(self, deadline: float):
+        wake_waiters = {asyncio.ensure_future(self._stop_event.wait()), asyncio.ensure_future(self._cycle_requested.wait())}
+        await asyncio.wait(wake_waiters, timeout=max(0.0, deadline - time.time()), return_when=asyncio.FIRST_COMPLETED)
+        for wake_waiter in wake_waiters:
+            wake_waiter.cancel()
+
+    def _waiting(self, deadline: float) -> bool:
+        return not self._stop_event.is_set() and not self._cycle_requested.is_set() and time.time() < deadline
+
+    async def _watch_entries(self, pipeline, config, entry_timing, deadline: float):
+        from trading import token_fetch
+        from trading.etf_quotes import fetch_etf_prices
+        from util.universe import get_universe
+
+        exchange_codes = get_universe().exchange_codes()
+        await self._loop.run_in_executor(None, functools.partial(
+            token_fetch.with_access_token,
+            lambda access_token: entry_timing.prepare(config, access_token, exchange_codes), config=config))
+        while entry_timing.armed_tickers and self._waiting(deadline):
+            armed_codes = {ticker: exchange_codes[ticker] for ticker in entry_timing.armed_tickers}
+            # 폴링마다 토큰 확인 (만료되면 재발급, 인증 오류면 재발급 후 재시도)
+            etf_prices = await self._loop.run_in_executor(None, functools.partial(
+                token_fetch.with_access_token,
+                lambda access_token: fetch_etf_prices(config, access_token, armed_codes, 0.05), config=config))
+            for ticker, price in etf_prices.items():
+                entry_signal = entry_timing.on_price(ticker, price)
+                if entry_signal is not None:
+                    pipeline.send_notification(entry_signal.format_message(), config, config.use_discord)
+            await self._sleep_until(min(deadline, time.time() + config.entry_poll_interval))
+
+    async def _save_checkpoint(self, pipeline, force: bool = False):
+        """주기 사이에만 호출 (스레드 풀에서 모듈을 쓰는 작업이 없을 때)"""
+        if self._checkpoint is None:
+            return
+        await self._loop.run_in_executor(None, self._checkpoint.save, pipeline.checkpoint_components(self.modules),
+                                         self.iteration, force)
+
+    async def _deliver_notifications(self):
+        """알림 큐 → Discord (None을 받으면 종료)"""
+        while True:
+            queued_notification = await self._notification_queue.get()
+            if queued_notification is None:
+                return
+            webhook_url, message = queued_notification
+            try:
+                await self._loop.run_in_executor(None, lambda: self.discord_session.post(webhook_url, data=message, timeout=10))
+            except Exception as discord_exception:
+                logger.warning("⚠️ Discord 전송 실패: %s", discord_exception)
+
+    async def _drain(self, pipeline, notification_task):
+        """진행 중인 주기 대기 → 체크포인트 → 알림 큐 비우기 → 캐시/학습 상태 저장 → 스레드 풀 종료"""
+        drain_timeout = self.config.service_drain_timeout
+        if self._cycle_task is not None and not self._cycle_task.done():
+            logger.info("⏳ 진행 중인 주기 완료 대기 (최대 %.0f초)", drain_timeout)
+            done_tasks, _ = await asyncio.wait({self._cycle_task}, timeout=drain_timeout)
+            if not done_tasks:
+                logger.warning("⚠️ %.0f초 안에 주기가 끝나지 않음 - 캐시를 먼저 저장합니다", drain_timeout)
+
+        # 끝나지 않은 주기가 있으면 마지막 주기 끝의 체크포인트를 유지 (모듈 상태가 주기 중간 상태)
+        if self._cycle_task is None or self._cycle_task.done():
+            try:
+                await self._save_checkpoint(pipeline, force=True)
+            except Exception:
+                logger.error("❌ 체크포인트 저장 실패:\n%s", traceback.format_exc())
+
+        try:
+            await self._loop.run_in_executor(None, pipeline.shutdown_modules, self.modules)
+        except Exception:
+            logger.error("❌ 종료 정리 실패:\n%s", traceback.format_exc())
+        pipeline.send_notification("\n\n👋 프로그램을 종료합니다.", self.config, self.config.use_discord)
+
+        self._notification_queue.put_nowait(None)
+        try:
+            await asyncio.wait_for(notification_task, timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("⚠️ 알림 %d건을 보내지 못하고 종료합니다", self._notification_queue.qsize())
+        pipeline.set_discord_dispatcher(None)
+        self.discord_session.close()
+        self.executor.shutdown(wait=False)
+
+
+def run_service(config_watcher, modules, kis_mode: bool):
+    """서비스 모드 실행 (종료 요청을 받을 때까지 반환하지 않음)"""
+    asyncio.run(PipelineService(config_watcher, modules, kis_mode).run())
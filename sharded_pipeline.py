@@ -0,0 +1,340 @@
+"""
+샤드 워커 모드 (코디네이터 + 멀티 프로세스 워커)
+피드를 일관된 해싱으로 워커에 나눠 각 워커가 수집/중복 제거/분석을 수행하고
+섹터별 부분 합계만 코디네이터로 보내면, 코디네이터가 합쳐서 SignalGenerator 실행
+워커가 죽으면 링에서 제거 → 그 워커의 피드만 남은 워커로 재배정 (다음 주기에 새 워커 보충)
+
+실행: python main.py --workers 4   (또는 config.yaml의 SHARD_WORKERS)
+"""
+import itertools
+import math
+import multiprocessing
+import queue
+import signal
+import time
+import traceback
+from typing import Dict, List, Optional
+
+from util.hash_ring import HashRing
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger('shard')
+
+
+def _budget_share(config, share: float):
+    """워커 하나가 쓸 주기 예산 (전체 예산 × 담당 비율, 0=무제한은 유지)"""
+    return config.with_overrides(
+        analysis_max_articles_per_cycle=math.ceil(config.analysis_max_articles_per_cycle * share),
+        analysis_token_budget=math.ceil(config.analysis_token_budget * share),
+        analysis_cost_budget=config.analysis_cost_budget * share,
+    )
+
+
+def shard_worker_main(worker_id: int, config_path: str, task_queue, result_queue):
+    """
+    워커 프로세스 진입점 (spawn으로 시작되므로 모듈은 프로세스 안에서 새로 초기화)
+    task: {'task_id', 'cycle_id', 'feeds', 'budget_share', 'source_weights'} / None이면 종료
+    출처 가중치 학습/적용은 코디네이터가 담당 (워커는 출처별 원점수 합계를 보냄)
+    """
+    import main as pipeline
+    from util.config import ConfigWatcher
+    from util.logger import setup_logging
+
+    # Ctrl+C는 코디네이터가 받아서 종료 요청(None)을 보냄
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    config_watcher = ConfigWatcher(config_path)
+    config = config_watcher.config.with_overrides(use_discord=False, metrics_port=0, source_weighting_enabled=False)
+    setup_logging(config.log_level, config.log_format, config.log_file, config.log_rate_limit_per_minute)
+    worker_logger = get_logger(f'shard.worker-{worker_id}')
+    pipeline.install_pipeline_cassette(config, f".worker{worker_id}")
+    modules = pipeline.initialize_modules(config)
+    # 워커 번호는 시작할 때마다 1부터 같은 순서 → 해시 링 배정이 같으므로 워커별 체크포인트를 그대로 이어 씀
+    checkpoint = pipeline.create_pipeline_checkpoint(config, f".worker{worker_id}")
+    completed_task_count = checkpoint.load(pipeline.checkpoint_components(modules)) if checkpoint is not None else 0
+    worker_logger.info("🚀 샤드 워커 %d 시작", worker_id)
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+
+        if config_watcher.reload_if_changed():
+            config = config_watcher.config.with_overrides(use_discord=False, metrics_port=0, source_weighting_enabled=False)
+            pipeline.apply_config(config, modules)
+
+        modules.rss_fetcher.feed_urls = list(task['feeds'])
+        modules.article_scheduler.source_weights = task['source_weights']
+        started_at = time.monotonic()
+        shard_result = {
+            'task_id': task['task_id'], 'worker_id': worker_id, 'cycle_id': task['cycle_id'],
+            'scores': {}, 'source_scores': {}, 'usable': 0, 'total': 0, 'status_counts': {}, 'error': None,
+        }
+        try:
+            batch_analysis = pipeline.collect_and_analyze(modules, _budget_share(config, task['budget_share']),
+                                                          task['cycle_id'])
+            if batch_analysis is not None:
+                shard_result['scores'] = batch_analysis.scores
+                shard_result['source_scores'] = batch_analysis.source_scores
+                shard_result['usable'] = sum(1 for analysis_result in batch_analysis.results if analysis_result.usable)
+                shard_result['total'] = len(batch_analysis.results)
+                shard_result['status_counts'] = batch_analysis.status_counts
+        except Exception:
+            shard_result['error'] = traceback.format_exc()
+        shard_result['elapsed_seconds'] = time.monotonic() - started_at
+        completed_task_count += 1
+        if checkpoint is not None:
+            checkpoint.save(pipeline.checkpoint_components(modules), completed_task_count)
+        result_queue.put(shard_result)
+
+    if modules.article_archive is not None:
+        modules.article_archive.close()
+    worker_logger.info("👋 샤드 워커 %d 종료", worker_id)
+
+
+class ShardCoordinator:
+    """워커 프로세스 관리 + 주기별 피드 배정 / 부분 합계 병합"""
+
+    def __init__(self, config_path: str, num_workers: int, result_timeout: float = 900.0):
+        """
+        Args:
+            config_path: 워커가 읽을 설정 파일 경로
+            num_workers: 유지할 워커 수
+            result_timeout: 주기당 워커 응답 대기 상한 (초) - 넘기면 멈춘 워커로 보고 제거
+        """
+        self.config_path = config_path
+        self.num_workers = num_workers
+        self.result_timeout = result_timeout
+        self._context = multiprocessing.get_context('spawn')
+        self._result_queue = self._context.Queue()
+        self._worker_ids = itertools.count(1)
+        self._task_ids = itertools.count(1)
+        self.workers: Dict[int, tuple] = {}  # worker_id → (Process, task_queue)
+        self.ring = HashRing()
+        self.source_weights: Dict[str, float] = {}  # 워커 스케줄러 우선순위용 (코디네이터가 갱신)
+
+    def _spawn_worker(self) -> int:
+        worker_id = next(self._worker_ids)
+        task_queue = self._context.Queue()
+        worker_process = self._context.Process(
+            target=shard_worker_main, args=(worker_id, self.config_path, task_queue, self._result_queue),
+            name=f'shard-worker-{worker_id}', daemon=True)
+        worker_process.start()
+        self.workers[worker_id] = (worker_process, task_queue)
+        self.ring.add(worker_id)
+        return worker_id
+
+    def _remove_worker(self, worker_id: int, reason: str):
+        worker_process, _ = self.workers.pop(worker_id)
+        self.ring.remove(worker_id)
+        if worker_process.is_alive():
+            worker_process.terminate()
+        METRICS.inc('shard_worker_removed_total', reason=reason)
+        logger.warning("⚠️ 샤드 워커 %d 제거 (%s) - 담당 피드를 남은 워커로 재배정", worker_id, reason)
+
+    def ensure_workers(self):
+        """죽은 워커를 정리하고 num_workers개가 되도록 새 워커 생성"""
+        for worker_id, (worker_process, _) in list(self.workers.items()):
+            if not worker_process.is_alive():
+                self._remove_worker(worker_id, 'dead')
+        while len(self.workers) < self.num_workers:
+            self._spawn_worker()
+
+    def _dispatch(self, worker_id: int, feeds: List[str], cycle_id, total_feed_count: int, pending_tasks: Dict):
+        task_id = next(self._task_ids)
+        self.workers[worker_id][1].put({
+            'task_id': task_id, 'cycle_id': cycle_id, 'feeds': feeds,
+            'budget_share': len(feeds) / total_feed_count, 'source_weights': self.source_weights,
+        })
+        pending_tasks[task_id] = (worker_id, feeds)
+
+    def run_cycle(self, feed_urls: List[str], cycle_id=None) -> Optional[Dict]:
+        """
+        한 주기 실행: 피드 배정 → 워커 결과 수집 → 병합
+
+        Returns:
+            {'scores', 'source_scores', 'coverage', 'status_counts', 'usable', 'total'} 또는 None (분석한 기사 없음)
+        """
+        self.ensure_workers()
+        total_feed_count = max(1, len(feed_urls))
+        pending_tasks: Dict[int, tuple] = {}
+        for worker_id, assigned_feeds in self.ring.assign(feed_urls).items():
+            if assigned_feeds:
+                self._dispatch(worker_id, assigned_feeds, cycle_id, total_feed_count, pending_tasks)
+
+        merged_scores: Dict[str, int] = {}
+        merged_source_scores: Dict[str, Dict[str, int]] = {}
+        merged_status_counts: Dict[str, int] = {}
+        usable_count = total_count = 0
+        cycle_deadline = time.monotonic() + self.result_timeout
+
+        while pending_tasks:
+            try:
+                shard_result = self._result_queue.get(timeout=1.0)
+            except queue.Empty:
+                shard_result = None
+
+            if shard_result is not None and shard_result['task_id'] in pending_tasks:
+                del pending_tasks[shard_result['task_id']]
+                METRICS.observe('shard_task_seconds', shard_result['elapsed_seconds'])
+                if shard_result['error']:
+                    METRICS.inc('shard_task_errors_total')
+                    logger.error("❌ 샤드 워커 %d 오류:\n%s", shard_result['worker_id'], shard_result['error'])
+                for sector, score in shard_result['scores'].items():
+                    merged_scores[sector] = merged_scores.get(sector, 0) + score
+                for source, sector_scores in shard_result['source_scores'].items():
+                    source_totals = merged_source_scores.setdefault(source, {})
+                    for sector, score in sector_scores.items():
+                        source_totals[sector] = source_totals.get(sector, 0) + score
+                for status, status_count in shard_result['status_counts'].items():
+                    merged_status_counts[status] = merged_status_counts.get(status, 0) + status_count
+                usable_count += shard_result['usable']
+                total_count += shard_result['total']
+                continue
+
+            # 응답 없이 죽은 워커의 피드는 남은 워커로 재배정 (같은 주기 안에서)
+            for task_id, (worker_id, feeds) in list(pending_tasks.items()):
+                if worker_id in self.workers and self.workers[worker_id][0].is_alive():
+                    continue
+                del pending_tasks[task_id]
+                if worker_id in self.workers:
+                    self._remove_worker(worker_id, 'dead')
+                if not self.workers:
+                    self._spawn_worker()
+                for new_worker_id, reassigned_feeds in self.ring.assign(feeds).items():
+                    if reassigned_feeds:
+                        self._dispatch(new_worker_id, reassigned_feeds, cycle_id, total_feed_count, pending_tasks)
+
+            if time.monotonic() > cycle_deadline:
+                for task_id, (worker_id, feeds) in pending_tasks.items():
+                    if worker_id in self.workers:
+                        self._remove_worker(worker_id, 'timeout')
+                    logger.error("⏰ 샤드 워커 %d 응답 없음 - 피드 %d개는 이번 주기에서 제외", worker_id, len(feeds))
+                break
+
+        if total_count == 0:
+            return None
+        return {
+            'scores': merged_scores,
+            'source_scores': merged_source_scores,
+            'coverage': usable_count / total_count,
+            'status_counts': merged_status_counts,
+            'usable': usable_count,
+            'total': total_count,
+        }
+
+    def stop(self, timeout: float = 10.0):
+        """워커에 종료 요청 후 대기 (응답 없으면 강제 종료)"""
+        for worker_process, task_queue in self.workers.values():
+            if worker_process.is_alive():
+                task_queue.put(None)
+        for worker_process, _ in self.workers.values():
+            worker_process.join(timeout)
+            if worker_process.is_alive():
+                worker_process.terminate()
+        self.workers.clear()
+
+
+def run_sharded(config_watcher, num_workers: int, kis_mode: bool = False):
+    """
+    코디네이터 루프 (main()의 단일 프로세스 루프 대신 사용)
+
+    Args:
+        config_watcher: ConfigWatcher (코디네이터 설정 핫 리로드)
+        num_workers: 워커 프로세스 수
+        kis_mode: 한투 API 모드 여부
+    """
+    import main as pipeline
+    from analysis.news_analyzer import weighted_sector_totals
+
+    config = config_watcher.config
+    pipeline.configure_universe(config)
+    signal_generator = pipeline.create_signal_generator(config)
+    signal_tracker = pipeline.create_signal_tracker(signal_generator, config)
+    daily_bar_cache = pipeline.create_daily_bar_cache(config)
+    position_sizer = pipeline.update_position_sizer(None, config, daily_bar_cache)
+    entry_timing = pipeline.update_entry_timing(None, config, daily_bar_cache)
+    strategy_set = pipeline.update_strategies(None, config, daily_bar_cache)
+    article_archive = pipeline.create_article_archive(config) if config.archive_enabled else None
+    source_reliability = pipeline.create_source_reliability(config) if config.source_weighting_enabled else None
+    coordinator = ShardCoordinator(config_watcher.config_path, num_workers, config.shard_result_timeout)
+    control = pipeline.create_pipeline_control(config)
+    # 코디네이터 체크포인트: 보유 포지션 (전략별 포함) / 일봉 캐시 / 진입 대기 / 마지막 신호 / 반복 번호
+    # (수집/분석 캐시는 워커별 파일)
+    checkpoint_components = {'signal_tracker': signal_tracker, 'daily_bar_cache': daily_bar_cache,
+                             'entry_timing': entry_timing, 'strategies': strategy_set, 'control': control}
+    checkpoint = pipeline.create_pipeline_checkpoint(config)
+    control.add_status_provider('queues', lambda: {
+        'shard_workers': len(coordinator.workers),
+        'entry_armed': len(entry_timing.armed_tickers) if entry_timing is not None else 0,
+    })
+    control.add_status_provider('strategies', lambda: strategy_set.status() if strategy_set else {})
+    pipeline.send_notification(f"🧩 샤드 워커 모드 시작 (워커 {num_workers}개, 피드 {len(config.rss_feeds)}개)",
+                               config, config.use_discord)
+
+    iteration = checkpoint.load(checkpoint_components) if checkpoint is not None else 0
+    try:
+        while True:
+            iteration += 1
+            if config_watcher.reload_if_changed():
+                config = config_watcher.config
+                pipeline.configure_signal_generator(signal_generator, config)
+                pipeline.configure_signal_tracker(signal_tracker, config)
+                position_sizer = pipeline.update_position_sizer(position_sizer, config, daily_bar_cache)
+                entry_timing = pipeline.update_entry_timing(entry_timing, config, daily_bar_cache)
+                strategy_set = pipeline.update_strategies(strategy_set, config, daily_bar_cache)
+                coordinator.result_timeout = config.shard_result_timeout
+                control.apply_config(config)
+                if config.source_weighting_enabled and source_reliability is None:
+                    source_reliability = pipeline.create_source_reliability(config)
+                elif not config.source_weighting_enabled:
+                    source_reliability = None
+                else:
+                    source_reliability.prior_weights = dict(config.source_reliability)
+                pipeline.send_notification("🔁 설정 변경 감지 - 새 설정 적용 완료", config, config.use_discord)
+
+            pipeline.send_notification(f"\n{'='*60}\n🔄 반복 #{iteration} 시작 (샤드 워커 {len(coordinator.workers) or num_workers}개)\n{'='*60}",
+                                       config, pipeline.routine_discord_enabled(config))
+            cycle_id = article_archive.begin_cycle() if article_archive is not None else None
+            source_weights = source_reliability.weights() if source_reliability is not None else None
+            coordinator.source_weights = source_weights or dict(config.source_reliability)
+            control.begin_cycle(iteration)
+            with METRICS.timer('pipeline_cycle_seconds'):
+                try:
+                    merged_result = coordinator.run_cycle(list(config.rss_feeds), cycle_id)
+                    if merged_result is None:
+                        pipeline.send_notification("⚠️ 수집된 뉴스가 없습니다. 다음 주기를 기다립니다.", config, config.use_discord)
+                    else:
+                        # 출처 가중치는 합친 출처별 원점수에 한 번만 적용 (워커 간 반올림 차이 없음)
+                        scorechart = weighted_sector_totals(merged_result['source_scores'], source_weights)
+                        signals = pipeline.publish_signals(signal_generator, scorechart, merged_result['coverage'],
+                                                           merged_result['status_counts'], config, kis_mode,
+                                                           article_archive, cycle_id, signal_tracker=signal_tracker,
+                                                           position_sizer=position_sizer, entry_timing=entry_timing,
+                                                           trading_paused=control.trading_paused,
+                                                           source_weights=source_weights)
+                        control.record_signals(signals, scorechart, merged_result['coverage'])
+                        pipeline.publish_strategy_signals(strategy_set, scorechart, merged_result['coverage'], kis_mode,
+                                                          trading_paused=control.trading_paused)
+                        if kis_mode and source_reliability is not None:
+                            pipeline.update_source_reliability(source_reliability, merged_result['source_scores'], config)
+                        if kis_mode:
+                            pipeline.update_minute_bars(daily_bar_cache, config)
+                except Exception:
+                    METRICS.inc('pipeline_errors_total')
+                    pipeline.send_notification(f"❌ 파이프라인 오류:\n{traceback.format_exc()}", config, config.use_discord)
+            control.end_cycle()
+            if checkpoint is not None:
+                checkpoint_components['entry_timing'] = entry_timing
+                checkpoint_components['strategies'] = strategy_set
+                checkpoint.save(checkpoint_components, iteration)
+
+            if config.metrics_json_path:
+                METRICS.dump_cycle_json(config.metrics_json_path, iteration)
+
+            pipeline.send_notification(f"\n⏳ {control.loop_interval}초 대기 중... (Ctrl+C로 종료)", config,
+                                       pipeline.routine_discord_enabled(config))
+            pipeline.wait_for_next_cycle(entry_timing, config, kis_mode, control.loop_interval, control)
+    finally:
+        coordinator.stop()
@@ -0,0 +1,87 @@
+"""
+기사 본문 보강(ArticleEnricher) 확인용 스크립트
+로컬 HTTP 픽스처 서버를 띄워 네트워크 없이 동시 수집 / 본문 추출 / 디스크 캐시 동작 확인
+"""
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from analysis.article_enricher import ArticleEnricher
+
+ARTICLE_PARAGRAPH = "Nvidia shares jumped after the chipmaker reported record data center revenue and raised guidance. "
+
+FIXTURE_PAGES = {
+    '/article': (
+        "<html><head><script>var tracking = 1;</script><style>p {color: red}</style></head><body>"
+        "<nav><p>Markets Economy Technology Politics Opinion Subscribe</p></nav>"
+        f"<article><h1>Nvidia beats estimates</h1><p>{ARTICLE_PARAGRAPH * 3}</p><p>{ARTICLE_PARAGRAPH * 2}</p></article>"
+        "<footer><p>Copyright 2025 Example News. All rights reserved worldwide.</p></footer></body></html>"
+    ),
+    '/no-article-tag': f"<html><body><div><p>{ARTICLE_PARAGRAPH * 2}</p><p>short</p></div></body></html>",
+    '/slow': f"<html><body><article><p>{ARTICLE_PARAGRAPH * 2}</p></article></body></html>",
+}
+request_counts = {}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        request_counts[self.path] = request_counts.get(self.path, 0) + 1
+        page = FIXTURE_PAGES.get(self.path)
+        if page is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if self.path.startswith('/slow'):
+            time.sleep(0.5)
+        body = page.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+with tempfile.TemporaryDirectory() as cache_dir:
+    enricher = ArticleEnricher(cache_dir=cache_dir, max_workers=4, per_domain_limit=2, max_tokens=60)
+    articles = [
+        {'title': 'Nvidia beats', 'summary': 'Nvidia beats.', 'link': f"{base_url}/article"},
+        {'title': 'No article tag', 'summary': '', 'link': f"{base_url}/no-article-tag"},
+        {'title': 'Missing page', 'summary': 'keep me', 'link': f"{base_url}/missing"},
+        {'title': 'Slow 1', 'summary': '', 'link': f"{base_url}/slow"},
+        {'title': 'Slow 2', 'summary': '', 'link': f"{base_url}/slow?2"},
+        {'title': 'Slow 3', 'summary': '', 'link': f"{base_url}/slow?3"},
+    ]
+    FIXTURE_PAGES['/slow?2'] = FIXTURE_PAGES['/slow?3'] = FIXTURE_PAGES['/slow']
+
+    started_at = time.monotonic()
+    enriched_count = enricher.enrich(articles)
+    elapsed_seconds = time.monotonic() - started_at
+
+    for article in articles:
+        print(f"[{article['title']}] {article['summary'][:100]!r}")
+    print(f"보강 {enriched_count}개, {elapsed_seconds:.2f}초 (도메인당 2개 제한 → 느린 페이지 3개는 최소 1초)")
+
+    assert enriched_count == 5
+    assert 'Markets Economy' not in articles[0]['summary'] and 'Copyright' not in articles[0]['summary']
+    assert articles[0]['rss_summary'] == 'Nvidia beats.'
+    assert len(articles[0]['summary']) <= 60 * 4 + 2
+    assert articles[2]['summary'] == 'keep me'
+    assert elapsed_seconds >= 1.0
+
+    # 두 번째 호출은 디스크 캐시에서 읽음 (서버 요청 없음)
+    requests_before = dict(request_counts)
+    enricher.enrich([{'title': 'again', 'summary': '', 'link': f"{base_url}/article"}])
+    assert request_counts == requests_before
+    print("✅ 캐시 적중 확인 (추가 요청 없음)")
+
+    enricher.close()
+
+server.shutdown()
@@ -5,24 +5,13 @@ import feedparser
 import json
 from collections import Counter
 from util import halionia_discord_hook
+from util.universe import get_universe
 
 # Set your API key
 openai.api_key = os.getenv("OPENAI_API_KEY")
 
-# Define sectors and ETF mapping
-SECTORS = {
-    "Technology": "XLK",
-    "Semiconductors": "SMH",
-    "Financials": "XLF",
-    "Healthcare": "XLV",
-    "Energy": "XLE",
-    "Airlines": "JETS",
-    "Consumer Discretionary": "XLY",
-    "Consumer Staples": "XLP",
-    "Commodities": "DBC",
-    "Utilities": "XLU",
-    "Real Estate": "XLRE"
-}
+# Sectors and ETF mapping (shared universe registry)
+SECTORS = get_universe().ticker_map()
 
 def analyze_article(article_text):
     """Send article text to ChatGPT and get sector sentiment scores."""
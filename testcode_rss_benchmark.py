@@ -0,0 +1,79 @@
+"""
+RSS 파싱 벤치마크 (feedparser vs 빠른 증분 파서)
+fixtures/rss/*.xml 에 저장된 피드로 네트워크 없이 비교
+
+    python testcode_rss_benchmark.py            # 저장된 피드로 벤치마크
+    python testcode_rss_benchmark.py --record   # config.yaml의 RSS_FEEDS를 받아 fixtures/rss/에 저장
+"""
+import glob
+import os
+import sys
+import time
+
+import feedparser
+
+from analysis.fast_rss import FastParseError, parse_feed_bytes
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'rss')
+LIMIT_PER_FEED = 5
+REPEAT = 50
+
+
+def record_fixtures():
+    import re
+    import requests
+    from util.config import get_config
+
+    for feed_url in get_config().rss_feeds:
+        response = requests.get(feed_url, timeout=15)
+        response.raise_for_status()
+        file_name = re.sub(r'[^A-Za-z0-9]+', '_', feed_url.split('://', 1)[-1])[:80].strip('_') + '.xml'
+        with open(os.path.join(FIXTURE_DIR, file_name), 'wb') as f:
+            f.write(response.content)
+        print(f"💾 {file_name} ({len(response.content)} bytes)")
+
+
+def benchmark(parse_function, feed_documents):
+    started_at = time.perf_counter()
+    for _ in range(REPEAT):
+        for feed_document in feed_documents:
+            parse_function(feed_document)
+    return (time.perf_counter() - started_at) / (REPEAT * len(feed_documents))
+
+
+if __name__ == '__main__':
+    if '--record' in sys.argv:
+        record_fixtures()
+        sys.exit(0)
+
+    fixture_paths = sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.xml')))
+    feed_documents = []
+    for fixture_path in fixture_paths:
+        with open(fixture_path, 'rb') as f:
+            feed_documents.append(f.read())
+
+    # 같은 결과를 내는지 먼저 확인
+    for fixture_path, feed_document in zip(fixture_paths, feed_documents):
+        feed_title, fast_entries = parse_feed_bytes(feed_document, LIMIT_PER_FEED)
+        reference_feed = feedparser.parse(feed_document)
+        for fast_entry, reference_entry in zip(fast_entries, reference_feed.entries[:LIMIT_PER_FEED]):
+            assert fast_entry['title'] == reference_entry.get('title'), fixture_path
+            assert fast_entry['link'] == reference_entry.get('link'), fixture_path
+            assert fast_entry['published'] == reference_entry.get('published'), fixture_path
+        print(f"✅ {os.path.basename(fixture_path)}: {feed_title} ({len(feed_document)} bytes, 결과 일치)")
+
+    # 깨진 문서는 FastParseError (RSSFetcher에서 feedparser로 대체)
+    try:
+        parse_feed_bytes(feed_documents[0][:len(feed_documents[0]) // 3] + b"<<broken", 1000)
+        raise AssertionError("깨진 문서가 통과함")
+    except FastParseError:
+        print("✅ 형식 오류 감지 → feedparser 대체 경로")
+
+    feedparser_seconds = benchmark(lambda document: feedparser.parse(document).entries[:LIMIT_PER_FEED], feed_documents)
+    fast_seconds = benchmark(lambda document: parse_feed_bytes(document, LIMIT_PER_FEED), feed_documents)
+    fast_full_seconds = benchmark(lambda document: parse_feed_bytes(document, 10 ** 6), feed_documents)
+
+    print(f"\n피드당 평균 파싱 시간 (limit_per_feed={LIMIT_PER_FEED}, {REPEAT}회 반복)")
+    print(f"  feedparser          : {feedparser_seconds * 1000:8.2f} ms")
+    print(f"  빠른 파서 (limit)   : {fast_seconds * 1000:8.2f} ms  ({feedparser_seconds / fast_seconds:.0f}배)")
+    print(f"  빠른 파서 (전체)    : {fast_full_seconds * 1000:8.2f} ms  ({feedparser_seconds / fast_full_seconds:.0f}배)")
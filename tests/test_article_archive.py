@@ -0,0 +1,47 @@
+"""ArticleArchive 주기 기록 / 리플레이 조회 단위 테스트"""
+import sqlite3
+from contextlib import closing
+
+from analysis.article_archive import ArticleArchive
+from analysis.news_analyzer import STATUS_OK, AnalysisResult, BatchAnalysis
+
+
+def record_cycle(article_archive, source_weights):
+    cycle_id = article_archive.begin_cycle()
+    articles = [{'title': 'a', 'link': 'https://example.com/a', 'source': 'Trusted'},
+                {'title': 'b', 'link': 'https://example.com/b', 'source': 'Noisy'}]
+    results = [AnalysisResult(scores={'Technology': 4}, status=STATUS_OK, source='Trusted'),
+               AnalysisResult(scores={'Technology': 4, 'Energy': -2}, status=STATUS_OK, source='Noisy')]
+    article_archive.record_articles(cycle_id, articles, results)
+    article_archive.finish_cycle(cycle_id, coverage=1.0, signals={'action': 'HOLD'}, source_weights=source_weights)
+    article_archive.flush()
+    return results
+
+
+def test_replay_uses_archived_source_weights(tmp_path):
+    article_archive = ArticleArchive(str(tmp_path / 'archive.db'))
+    source_weights = {'Trusted': 1.5, 'Noisy': 0.5}
+    live_results = record_cycle(article_archive, source_weights)
+    record_cycle(article_archive, None)
+    article_archive.close()
+
+    (_, _, weighted_results, archived_weights), (_, _, _, unweighted_weights) = ArticleArchive(
+        str(tmp_path / 'archive.db')).iter_cycles()
+    assert archived_weights == source_weights
+    assert unweighted_weights is None
+    replayed_scores = BatchAnalysis.from_results(weighted_results, archived_weights).scores
+    assert replayed_scores == BatchAnalysis.from_results(live_results, source_weights).scores
+    assert replayed_scores['Technology'] == 8 and replayed_scores['Energy'] == -1
+
+
+def test_archive_without_weight_column_is_migrated(tmp_path):
+    archive_path = str(tmp_path / 'archive.db')
+    with closing(sqlite3.connect(archive_path)) as connection:
+        connection.execute("CREATE TABLE cycles (cycle_id INTEGER PRIMARY KEY, started_at REAL NOT NULL, "
+                           "finished_at REAL, coverage REAL, signal_json TEXT)")
+        connection.execute("INSERT INTO cycles (cycle_id, started_at) VALUES (1, 1.0)")
+        connection.commit()
+
+    article_archive = ArticleArchive(archive_path)
+    assert [(cycle_id, source_weights) for cycle_id, _, _, source_weights in article_archive.iter_cycles()] == [(1, None)]
+    article_archive.close()
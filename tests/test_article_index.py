@@ -0,0 +1,61 @@
+"""발행 시각 해석 / ArticleTimeIndex / is_stale 단위 테스트"""
+import calendar
+
+import pytest
+
+from analysis.article_index import ArticleTimeIndex, is_stale, parse_published_timestamp
+
+BASE_TIMESTAMP = calendar.timegm((2024, 5, 1, 12, 0, 0))
+
+
+@pytest.mark.parametrize('published', [
+    'Wed, 01 May 2024 12:00:00 GMT',  # RSS (RFC 822)
+    'Wed, 01 May 2024 21:00:00 +0900',
+    'Wed, 01 May 2024 08:00:00 EDT',
+    '2024-05-01T12:00:00Z',  # Atom (ISO 8601)
+    '2024-05-01T14:00:00+02:00',
+    '2024-05-01T12:00:00',  # 시간대 없으면 UTC
+])
+def test_parse_published_timestamp_formats(published):
+    assert parse_published_timestamp(published) == BASE_TIMESTAMP
+
+
+@pytest.mark.parametrize('published', ['', 'Unknown date', 'not a date'])
+def test_parse_published_timestamp_unparseable(published):
+    assert parse_published_timestamp(published) is None
+
+
+def _indexed(*offsets):
+    time_index = ArticleTimeIndex()
+    for offset in offsets:
+        time_index.add({'title': f"t{offset}", 'published_timestamp': BASE_TIMESTAMP + offset})
+    return time_index
+
+
+def test_index_keeps_time_order_for_out_of_order_adds():
+    time_index = _indexed(0, 300, 60, 600, 60)
+    assert time_index.timestamps == sorted(time_index.timestamps)
+    assert [article['title'] for article in time_index.articles] == ['t0', 't60', 't60', 't300', 't600']
+    assert time_index.oldest_timestamp() == BASE_TIMESTAMP
+
+
+def test_between_is_half_open():
+    time_index = _indexed(0, 60, 120, 180)
+    assert [article['title'] for article in time_index.between(BASE_TIMESTAMP + 60, BASE_TIMESTAMP + 180)] == ['t60', 't120']
+    assert [article['title'] for article in time_index.between(BASE_TIMESTAMP + 100)] == ['t120', 't180']
+    assert time_index.between(BASE_TIMESTAMP + 200) == []
+
+
+def test_prune_older_than_removes_prefix():
+    time_index = _indexed(0, 60, 120)
+    removed_articles = time_index.prune_older_than(BASE_TIMESTAMP + 60)
+    assert [article['title'] for article in removed_articles] == ['t0']
+    assert len(time_index) == 2
+    assert time_index.prune_older_than(BASE_TIMESTAMP) == []
+
+
+def test_is_stale():
+    article = {'published_timestamp': BASE_TIMESTAMP}
+    assert is_stale(article, 3600, now=BASE_TIMESTAMP + 3601)
+    assert not is_stale(article, 3600, now=BASE_TIMESTAMP + 3600)
+    assert not is_stale(article, 0, now=BASE_TIMESTAMP + 10 ** 6)
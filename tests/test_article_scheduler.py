@@ -0,0 +1,78 @@
+"""ArticleScheduler.take / requeue_unfinished 단위 테스트"""
+import time
+
+from analysis.article_scheduler import ArticleScheduler, CycleBudget, estimate_article_tokens
+from analysis.news_analyzer import STATUS_FAILED, STATUS_OK, STATUS_TIMEOUT, AnalysisResult
+
+
+def make_article(index, source='Wire', relevance=0, age_seconds=0.0, summary=''):
+    return {
+        'title': f"headline number {index} about topic{index}",
+        'link': f"https://example.com/{index}",
+        'summary': summary,
+        'source': source,
+        'relevance': relevance,
+        'published_timestamp': time.time() - age_seconds,
+    }
+
+
+def test_take_orders_by_priority_and_carries_rest():
+    scheduler = ArticleScheduler(source_weights={'Trusted': 2.0})
+    low_article = make_article(1, source='Wire')
+    high_article = make_article(2, source='Trusted')
+    relevant_article = make_article(3, source='Wire', relevance=3)
+    scheduler.enqueue([low_article, high_article, relevant_article])
+
+    selected_articles, _ = scheduler.take(CycleBudget(max_articles=2))
+    assert selected_articles == [relevant_article, high_article]
+    assert list(scheduler.backlog.values()) == [low_article]
+
+
+def test_take_respects_token_budget_and_skips_long_articles():
+    scheduler = ArticleScheduler()
+    long_article = make_article(1, relevance=5, summary='x' * 4000)
+    short_article = make_article(2)
+    scheduler.enqueue([long_article, short_article])
+    token_limit = estimate_article_tokens(short_article) + 10
+
+    selected_articles, estimated_tokens = scheduler.take(CycleBudget(max_tokens=token_limit))
+    assert selected_articles == [short_article]
+    assert estimated_tokens == estimate_article_tokens(short_article)
+    assert list(scheduler.backlog.values()) == [long_article]
+
+
+def test_take_drops_stale_articles():
+    scheduler = ArticleScheduler(max_article_age_seconds=3600)
+    fresh_article = make_article(1)
+    scheduler.enqueue([make_article(2, age_seconds=7200), fresh_article])
+    selected_articles, _ = scheduler.take(CycleBudget())
+    assert selected_articles == [fresh_article]
+    assert not scheduler.backlog
+
+
+def test_requeue_unfinished_until_max_attempts():
+    scheduler = ArticleScheduler(max_attempts=2)
+    ok_article, timeout_article, failed_article = make_article(1), make_article(2), make_article(3)
+    scheduler.enqueue([ok_article, timeout_article, failed_article])
+    articles, _ = scheduler.take(CycleBudget())
+    statuses = {ok_article['link']: STATUS_OK, timeout_article['link']: STATUS_TIMEOUT,
+                failed_article['link']: STATUS_FAILED}
+    results = [AnalysisResult(scores={}, status=statuses[article['link']]) for article in articles]
+
+    assert scheduler.requeue_unfinished(articles, results) == 2
+    assert set(scheduler.backlog) == {timeout_article['link'], failed_article['link']}
+
+    articles, _ = scheduler.take(CycleBudget())
+    results = [AnalysisResult(scores={}, status=STATUS_TIMEOUT) for _ in articles]
+    # 두 번째 실패에서 max_attempts 도달 → 버림
+    assert scheduler.requeue_unfinished(articles, results) == 0
+    assert not scheduler.backlog
+
+
+def test_checkpoint_state_round_trip():
+    scheduler = ArticleScheduler()
+    scheduler.enqueue([make_article(1), make_article(2)])
+    restored_scheduler = ArticleScheduler()
+    restored_scheduler.restore_state(scheduler.checkpoint_state())
+    assert restored_scheduler.backlog.keys() == scheduler.backlog.keys()
+    assert len(restored_scheduler.time_index) == 2
@@ -0,0 +1,53 @@
+"""PipelineCheckpoint 저장/복원 단위 테스트"""
+from util.checkpoint import CHECKPOINT_VERSION, PipelineCheckpoint, read_checkpoint, write_checkpoint
+
+
+class StatefulComponent:
+    def __init__(self, state=None):
+        self.state = state
+
+    def checkpoint_state(self):
+        return self.state
+
+    def restore_state(self, state):
+        self.state = state
+
+
+def test_round_trip(tmp_path):
+    checkpoint = PipelineCheckpoint(str(tmp_path / 'pipeline.ckpt'))
+    saved_component = StatefulComponent({'positions': {'long': {'Technology': 1.5}}, 'seen': {'a', 'b'}})
+    assert checkpoint.save({'tracker': saved_component, 'missing': None}, iteration=7)
+
+    restored_component = StatefulComponent()
+    assert checkpoint.load({'tracker': restored_component, 'missing': None}) == 7
+    assert restored_component.state == saved_component.state
+    assert not (tmp_path / 'pipeline.ckpt.tmp').exists()
+
+
+def test_save_every_cycles_and_force(tmp_path):
+    checkpoint = PipelineCheckpoint(str(tmp_path / 'pipeline.ckpt'), every_cycles=3)
+    component = StatefulComponent({'value': 1})
+    assert not checkpoint.save({'component': component}, iteration=1)
+    assert checkpoint.save({'component': component}, iteration=1, force=True)
+    assert checkpoint.save({'component': component}, iteration=3)
+
+
+def test_missing_or_corrupt_checkpoint_starts_fresh(tmp_path):
+    checkpoint_path = tmp_path / 'pipeline.ckpt'
+    component = StatefulComponent('untouched')
+    assert PipelineCheckpoint(str(checkpoint_path)).load({'component': component}) == 0
+
+    checkpoint_path.write_bytes(b'not a pickle')
+    assert read_checkpoint(str(checkpoint_path)) is None
+    assert PipelineCheckpoint(str(checkpoint_path)).load({'component': component}) == 0
+    assert component.state == 'untouched'
+
+
+def test_version_mismatch_ignored(tmp_path):
+    checkpoint = PipelineCheckpoint(str(tmp_path / 'pipeline.ckpt'))
+    checkpoint.save({'component': StatefulComponent(1)}, iteration=1)
+    payload = read_checkpoint(checkpoint.file_path)
+    assert payload['version'] == CHECKPOINT_VERSION
+
+    write_checkpoint(checkpoint.file_path, dict(payload, version=CHECKPOINT_VERSION + 1))
+    assert read_checkpoint(checkpoint.file_path) is None
@@ -0,0 +1,46 @@
+"""AppConfig 검증 / ConfigWatcher 리로드 단위 테스트"""
+import logging
+import os
+
+import pytest
+
+from util.config import AppConfig, ConfigError, ConfigWatcher
+from util.logger import ROOT_LOGGER_NAME, set_log_level
+
+BASE_SETTINGS = {'SENTIMENT_BACKEND': 'local', 'RSS_FEEDS': ['https://example.com/feed.xml']}
+
+
+def write_config(config_path, log_level):
+    config_path.write_text(f"SENTIMENT_BACKEND: local\nRSS_FEEDS: ['https://example.com/feed.xml']\n"
+                           f"LOG_LEVEL: {log_level}\n", encoding='utf-8')
+
+
+def test_log_level_is_validated():
+    assert AppConfig.from_mapping(dict(BASE_SETTINGS, LOG_LEVEL='debug')).log_level == 'debug'
+    with pytest.raises(ConfigError, match='LOG_LEVEL'):
+        AppConfig.from_mapping(dict(BASE_SETTINGS, LOG_LEVEL='verbose'))
+    with pytest.raises(ConfigError, match='LOG_FORMAT'):
+        AppConfig.from_mapping(dict(BASE_SETTINGS, LOG_FORMAT='xml'))
+
+
+def test_reload_with_bad_log_level_keeps_config(tmp_path):
+    config_path = tmp_path / 'config.yaml'
+    write_config(config_path, 'INFO')
+    config_watcher = ConfigWatcher(str(config_path))
+
+    write_config(config_path, 'verbose')
+    os.utime(config_path, (1, 1))
+    assert not config_watcher.reload_if_changed()
+    assert 'LOG_LEVEL' in config_watcher.last_reload_error
+    assert config_watcher.config.log_level == 'INFO'
+
+
+def test_set_log_level_keeps_level_on_unknown_name():
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    previous_level = root_logger.level
+    try:
+        assert set_log_level('warning')
+        assert not set_log_level('verbose')
+        assert root_logger.level == logging.WARNING
+    finally:
+        root_logger.setLevel(previous_level)
@@ -0,0 +1,44 @@
+"""HashRing 키 배정 / 노드 변경 시 재배정 단위 테스트"""
+import pytest
+
+from util.hash_ring import HashRing
+
+KEYS = [f"https://feeds.example.com/feed{index}.xml" for index in range(400)]
+
+
+def test_assignment_covers_all_nodes_and_keys():
+    hash_ring = HashRing(range(4))
+    assignment = hash_ring.assign(KEYS)
+    assert set(assignment) == {0, 1, 2, 3}
+    assert sorted(key for keys in assignment.values() for key in keys) == sorted(KEYS)
+    assert all(keys for keys in assignment.values())
+
+
+def test_assignment_is_deterministic():
+    assert HashRing(range(3)).assign(KEYS) == HashRing([2, 0, 1]).assign(KEYS)
+
+
+def test_removing_node_only_moves_its_keys():
+    hash_ring = HashRing(range(4))
+    before = {key: hash_ring.node_for(key) for key in KEYS}
+    hash_ring.remove(2)
+    after = {key: hash_ring.node_for(key) for key in KEYS}
+    for key in KEYS:
+        if before[key] != 2:
+            assert after[key] == before[key]
+        else:
+            assert after[key] != 2
+
+
+def test_adding_node_only_takes_keys_for_itself():
+    hash_ring = HashRing(range(3))
+    before = {key: hash_ring.node_for(key) for key in KEYS}
+    hash_ring.add(3)
+    moved_keys = [key for key in KEYS if hash_ring.node_for(key) != before[key]]
+    assert moved_keys
+    assert all(hash_ring.node_for(key) == 3 for key in moved_keys)
+
+
+def test_empty_ring_raises():
+    with pytest.raises(LookupError):
+        HashRing().node_for('key')
@@ -0,0 +1,44 @@
+"""한투 응답 디코딩 / 타입 매핑 단위 테스트"""
+import json
+
+import pytest
+
+from trading.kis_response import (KisAuthError, KisDecodeError, OrderableCash, decode_response,
+                                  parse_minute_rows)
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.content = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.text = self.content.decode()
+        self.status_code = status_code
+
+
+def test_decode_response_raises_auth_error_for_expired_token():
+    res = FakeResponse({'rt_cd': '1', 'msg_cd': 'EGW00123', 'msg1': '기간이 만료된 token 입니다.'}, 500)
+    with pytest.raises(KisAuthError):
+        decode_response(res, 'uapi/hashkey')
+
+
+def test_decode_response_without_rt_cd():
+    assert decode_response(FakeResponse({'HASH': 'abc'}), 'uapi/hashkey') == {'HASH': 'abc'}
+    with pytest.raises(KisDecodeError):
+        decode_response(FakeResponse(b'<html>'), 'oauth2/tokenP')
+
+
+def test_parse_minute_rows_converts_numbers_and_skips_incomplete_rows():
+    payload = {'rt_cd': '0', 'output2': [
+        {'xymd': '20240501', 'xhms': '093500', 'open': '100.5', 'high': '101', 'low': '100',
+         'last': '100.75', 'evol': '1200'},
+        {'xymd': '', 'xhms': '', 'open': '1'},
+    ]}
+    assert parse_minute_rows(payload) == [{'ymd': '20240501', 'hms': '093500', 'open': 100.5, 'high': 101.0,
+                                           'low': 100.0, 'close': 100.75, 'volume': 1200.0}]
+
+
+def test_orderable_cash_from_payload():
+    orderable_cash = OrderableCash.from_payload({'rt_cd': '0', 'output': {'ord_psbl_cash': '1250000',
+                                                                          'max_buy_amt': ''}})
+    assert orderable_cash == OrderableCash(1250000, 0)
+    with pytest.raises(KisDecodeError):
+        OrderableCash.from_payload({'rt_cd': '0'})
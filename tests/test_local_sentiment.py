@@ -0,0 +1,60 @@
+"""LocalLinearBackend 학습 / 저장 단위 테스트"""
+import threading
+
+from analysis.local_sentiment import LocalLinearBackend
+
+ARTICLE_TEXT = "Nvidia shares surge after record chip demand lifts semiconductor outlook"
+
+
+def test_dirty_only_after_learn(tmp_path):
+    model_path = tmp_path / 'local_sentiment_model.json'
+    local_backend = LocalLinearBackend(model_path=str(model_path))
+    assert not local_backend.dirty
+
+    local_backend.learn(ARTICLE_TEXT, {'Semiconductors': 4})
+    assert local_backend.dirty
+    local_backend.save()
+    assert not local_backend.dirty
+    assert model_path.exists()
+
+    reloaded_backend = LocalLinearBackend(model_path=str(model_path))
+    assert not reloaded_backend.dirty
+    assert reloaded_backend.examples_seen == 1
+
+
+def test_learn_moves_prediction_toward_label():
+    local_backend = LocalLinearBackend()
+    semiconductor_index = local_backend.sector_names.index('Semiconductors')
+    before = local_backend.predict_raw(ARTICLE_TEXT)[semiconductor_index]
+    for _ in range(20):
+        local_backend.learn(ARTICLE_TEXT, {'Semiconductors': 5})
+    assert local_backend.predict_raw(ARTICLE_TEXT)[semiconductor_index] > before
+
+
+def test_predict_while_learning_from_other_thread():
+    local_backend = LocalLinearBackend()
+    stop_event = threading.Event()
+
+    def keep_learning():
+        learn_index = 0
+        while not stop_event.is_set():
+            local_backend.learn(f"{ARTICLE_TEXT} variant{learn_index}", {'Semiconductors': 3, 'Energy': -2})
+            learn_index += 1
+
+    learner_thread = threading.Thread(target=keep_learning)
+    learner_thread.start()
+    try:
+        for _ in range(200):
+            assert len(local_backend.predict_raw(ARTICLE_TEXT)) == len(local_backend.sector_names)
+    finally:
+        stop_event.set()
+        learner_thread.join()
+
+
+def test_spaced_ampersand_entities_match():
+    from analysis.sector_lexicon import SECTOR_ENTITIES, ngram_set, tokenize
+
+    text_ngrams = ngram_set(tokenize("Johnson & Johnson and Procter & Gamble lift the S&P 500"))
+    assert "johnson & johnson" in text_ngrams & SECTOR_ENTITIES["Healthcare"]
+    assert "procter & gamble" in text_ngrams & SECTOR_ENTITIES["Consumer Staples"]
+    assert "s&p 500" in text_ngrams
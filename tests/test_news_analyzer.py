@@ -0,0 +1,40 @@
+"""NewsAnalyzer 결과 캐시 / CascadeBackend 대체 점수 단위 테스트"""
+from analysis.local_sentiment import LocalLinearBackend
+from analysis.news_analyzer import (STATUS_CACHED, STATUS_FALLBACK, STATUS_OK, BackendScore, CascadeBackend,
+                                    NewsAnalyzer, SentimentBackend)
+from util.resilience import CircuitOpenError
+
+ARTICLE_TEXT = "Nvidia shares surge after record chip demand lifts semiconductor outlook"
+
+
+class FlakyLLMBackend(SentimentBackend):
+    """첫 호출은 서킷 open, 이후에는 고정 점수"""
+
+    name = 'flaky'
+    model = 'flaky-llm'
+
+    def __init__(self):
+        self.calls = 0
+
+    def score(self, article_text, article_source="Unknown", article_date="Unknown", deadline=None):
+        self.calls += 1
+        if self.calls == 1:
+            raise CircuitOpenError("open")
+        return BackendScore(scores={'Semiconductors': 4}, attempts=1, model=self.model, from_llm=True)
+
+
+def test_cascade_fallback_is_not_cached():
+    llm_backend = FlakyLLMBackend()
+    cascade_backend = CascadeBackend(LocalLinearBackend(), llm_backend, escalate_low=0.0, escalate_high=float('inf'))
+    news_analyzer = NewsAnalyzer(backend=cascade_backend)
+
+    fallback_result = news_analyzer.analyze_article(ARTICLE_TEXT, "Feed")
+    assert fallback_result.status == STATUS_FALLBACK
+    assert fallback_result.usable
+    assert not news_analyzer.result_cache
+
+    llm_result = news_analyzer.analyze_article(ARTICLE_TEXT, "Feed")
+    assert llm_result.status == STATUS_OK
+    assert llm_result.scores == {'Semiconductors': 4}
+    assert llm_backend.calls == 2
+    assert news_analyzer.analyze_article(ARTICLE_TEXT, "Feed").status == STATUS_CACHED
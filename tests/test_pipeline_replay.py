@@ -0,0 +1,117 @@
+"""
+카세트 재생으로 run_pipeline 1주기 실행 (네트워크 없음)
+
+fixtures/cassettes/pipeline_cycle.jsonl은 fixtures/rss 피드를 로컬 HTTP 서버(127.0.0.1:8766)로 제공하고
+CASSETTE_MODE record로 이 설정(로컬 감정 모델)의 1주기를 실행해 기록한 것
+다시 기록하려면: cd fixtures/rss && python -m http.server 8766 후 PYTHONPATH=. python tests/test_pipeline_replay.py
+"""
+import os
+import socket
+import sys
+
+import pytest
+import requests
+
+import main
+from analysis.rss_fetcher import RSSFetcher
+from util.config import AppConfig
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CASSETTE_PATH = os.path.join(REPOSITORY_ROOT, 'fixtures', 'cassettes', 'pipeline_cycle.jsonl')
+FEED_BASE_URL = 'http://127.0.0.1:8766'
+FEED_FILES = ('bloomberg_markets.xml', 'google_news_finance.xml', 'example_wire_atom.xml')
+
+# 기록 당시 주기 결과 (카세트를 다시 기록하면 함께 갱신)
+EXPECTED_SCORES = {
+    'Technology': 34, 'Semiconductors': 7, 'Financials': 12, 'Healthcare': 1, 'Energy': 13, 'Airlines': 11,
+    'Consumer Discretionary': 3, 'Consumer Staples': 9, 'Commodities': 0, 'Utilities': 4, 'Real Estate': 6,
+}
+EXPECTED_ACTION = 'TRADE'
+EXPECTED_CHANGED_SECTORS = ['Technology', 'Energy']
+EXPECTED_HOLDINGS = {'long': ['Technology', 'Energy'], 'short': []}
+
+
+def pipeline_config(cassette_mode, work_dir):
+    """기록/재생 공용 설정 (로컬 백엔드, 아카이브 / 출처 학습 / 체크포인트 없음)"""
+    return AppConfig.from_mapping({
+        'USE_KIS_API': False,
+        'SENTIMENT_BACKEND': 'local',
+        'LOCAL_MODEL_LEARN': False,
+        'LOCAL_MODEL_PATH': os.path.join(work_dir, 'local_sentiment_model.json'),
+        'RSS_FEEDS': [f"{FEED_BASE_URL}/{feed_file}" for feed_file in FEED_FILES],
+        'NEWS_LIMIT_PER_FEED': 10,
+        'MAX_ARTICLE_AGE': 0,
+        'ARCHIVE_ENABLED': False,
+        'SOURCE_WEIGHTING_ENABLED': False,
+        'NUM_LONG_POSITIONS': 2,
+        'NUM_SHORT_POSITIONS': 1,
+        'CASSETTE_MODE': cassette_mode,
+        'CASSETTE_PATH': CASSETTE_PATH,
+    })
+
+
+class SignalRecorder:
+    """PipelineControl 대신 주기 결과만 받아 둠"""
+
+    trading_paused = False
+
+    def __init__(self):
+        self.cycles = []
+
+    def record_signals(self, signals, scorechart, coverage):
+        self.cycles.append((signals, scorechart, coverage))
+
+
+def run_one_cycle(config):
+    main.install_pipeline_cassette(config)
+    try:
+        modules = main.initialize_modules(config)
+        modules.control = SignalRecorder()
+        main.run_pipeline(modules, config)
+    finally:
+        main.close_cassette()
+    return modules
+
+
+@pytest.fixture
+def no_network(monkeypatch):
+    def blocked_connect(*args, **kwargs):
+        raise OSError("테스트 중 네트워크 연결 금지")
+    monkeypatch.setattr(socket.socket, 'connect', blocked_connect)
+
+
+def test_replay_one_pipeline_cycle(tmp_path, no_network):
+    modules = run_one_cycle(pipeline_config('replay', str(tmp_path)))
+
+    assert len(modules.control.cycles) == 1
+    signals, scorechart, coverage = modules.control.cycles[0]
+    assert coverage == 1.0
+    assert scorechart == EXPECTED_SCORES
+    assert signals['action'] == EXPECTED_ACTION
+    assert [change['sector'] for change in signals['changes']] == EXPECTED_CHANGED_SECTORS
+    assert signals['holdings'] == EXPECTED_HOLDINGS
+
+
+def test_replay_miss_is_reported_as_network_error(tmp_path, no_network):
+    config = pipeline_config('replay', str(tmp_path))
+    main.install_pipeline_cassette(config)
+    try:
+        rss_fetcher = RSSFetcher(feed_urls=[f"{FEED_BASE_URL}/not_recorded.xml"])
+        with pytest.raises(requests.ConnectionError):
+            rss_fetcher._download(f"{FEED_BASE_URL}/not_recorded.xml")
+    finally:
+        main.close_cassette()
+
+
+if __name__ == '__main__':
+    # 카세트 다시 기록 (기존 파일을 지우고 1주기 기록 후 결과 출력 - 위 EXPECTED_* 값 갱신용)
+    import tempfile
+    if os.path.exists(CASSETTE_PATH):
+        os.remove(CASSETTE_PATH)
+    with tempfile.TemporaryDirectory() as work_dir:
+        recorded_modules = run_one_cycle(pipeline_config('record', work_dir))
+    recorded_signals, recorded_scores, _ = recorded_modules.control.cycles[0]
+    print(recorded_scores)
+    print(recorded_signals['action'], [change['sector'] for change in recorded_signals['changes']],
+          recorded_signals['holdings'])
+    sys.exit(0)
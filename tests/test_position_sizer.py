@@ -0,0 +1,70 @@
+"""RollingCovariance / risk_parity_weights 단위 테스트"""
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from trading.position_sizer import RollingCovariance, risk_parity_weights  # noqa: E402
+
+
+def test_rolling_covariance_matches_window_sample_covariance():
+    random_generator = np.random.default_rng(7)
+    return_vectors = random_generator.normal(0, 0.01, size=(25, 3))
+    rolling_covariance = RollingCovariance(dimension=3, window=10)
+    for return_vector in return_vectors:
+        rolling_covariance.push(return_vector)
+    assert rolling_covariance.count == 10
+    expected_covariance = np.cov(return_vectors[-10:], rowvar=False)
+    assert np.allclose(rolling_covariance.covariance(), expected_covariance)
+
+
+def test_rolling_covariance_needs_two_samples():
+    rolling_covariance = RollingCovariance(dimension=2, window=5)
+    rolling_covariance.push(np.array([0.01, -0.02]))
+    assert not rolling_covariance.covariance().any()
+
+
+def test_risk_parity_equal_risk_contributions():
+    covariance = np.array([[0.04, 0.006, 0.0],
+                           [0.006, 0.01, 0.002],
+                           [0.0, 0.002, 0.0225]])
+    weights = risk_parity_weights(covariance)
+    assert weights.sum() == pytest.approx(1.0)
+    risk_contributions = weights * (covariance @ weights)
+    assert np.allclose(risk_contributions, risk_contributions.mean(), rtol=1e-6)
+
+
+def test_risk_parity_uncorrelated_is_inverse_volatility():
+    volatilities = np.array([0.1, 0.2, 0.4])
+    weights = risk_parity_weights(np.diag(volatilities ** 2))
+    expected_weights = (1 / volatilities) / (1 / volatilities).sum()
+    assert np.allclose(weights, expected_weights)
+
+
+def _daily_bars(closes, first_day=1):
+    return [{'date': f"202401{first_day + offset:02d}", 'open': close, 'high': close + 1, 'low': close - 1,
+             'close': close, 'volume': 1000.0} for offset, close in enumerate(closes)]
+
+
+def test_update_reads_bar_store_views_like_memory_cache(tmp_path):
+    from trading.bar_store import BarStore
+    from trading.daily_bars import DailyBarCache
+    from trading.position_sizer import PositionSizer
+
+    closes = {'XLK': [100, 101, 99, 102, 104, 103], 'XLE': [50, 49, 51, 52, 50, 53]}
+    memory_cache = DailyBarCache()
+    stored_cache = DailyBarCache(bar_store=BarStore(str(tmp_path)))
+    for ticker, ticker_closes in closes.items():
+        memory_cache.bars[ticker] = _daily_bars(ticker_closes[:4])
+        stored_cache.bar_store.series(ticker, 'D').append_daily(_daily_bars(ticker_closes[:4]))
+
+    memory_sizer = PositionSizer(list(closes), memory_cache, lookback_days=10)
+    stored_sizer = PositionSizer(list(closes), stored_cache, lookback_days=10)
+    assert memory_sizer.update() == stored_sizer.update() == 3
+
+    for ticker, ticker_closes in closes.items():
+        memory_cache.bars[ticker].extend(_daily_bars(ticker_closes[4:], first_day=5))
+        stored_cache.bar_store.series(ticker, 'D').append_daily(_daily_bars(ticker_closes[4:], first_day=5))
+    assert memory_sizer.update() == stored_sizer.update() == 2
+    assert stored_sizer.update() == 0
+    assert np.allclose(memory_sizer.rolling_covariance.covariance(), stored_sizer.rolling_covariance.covariance())
+    assert stored_cache.last_bar('XLK') == {'date': '20240106', 'high': 104.0, 'low': 102.0, 'close': 103.0}
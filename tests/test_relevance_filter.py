@@ -0,0 +1,35 @@
+"""RelevanceFilter 유니버스 기반 엔티티 매칭 단위 테스트"""
+from analysis.relevance_filter import RelevanceFilter, universe_entities
+from analysis.sector_lexicon import SECTOR_ENTITIES
+from util.universe import DEFAULT_UNIVERSE, Instrument, Universe
+
+OIL_ARTICLE = {'title': "OPEC agrees to cut crude output", 'summary': ''}
+CHIP_ARTICLE = {'title': "Nvidia unveils new GPU lineup", 'summary': ''}
+
+
+def test_default_universe_uses_lexicon_entities():
+    assert universe_entities(DEFAULT_UNIVERSE) == SECTOR_ENTITIES
+    relevance_filter = RelevanceFilter(universe=DEFAULT_UNIVERSE)
+    assert relevance_filter.match(OIL_ARTICLE)[1] == ['Energy']
+
+
+def test_sectors_outside_universe_are_not_matched():
+    semiconductor_universe = Universe([Instrument("Semiconductors", "SMH", keywords=("soxx",))])
+    relevance_filter = RelevanceFilter(universe=semiconductor_universe)
+    relevant_articles, irrelevant_articles = relevance_filter.split([OIL_ARTICLE, CHIP_ARTICLE])
+    assert relevant_articles == [CHIP_ARTICLE]
+    assert irrelevant_articles == [OIL_ARTICLE]
+    assert relevance_filter.match({'title': "SOXX inflows hit record"})[1] == ['Semiconductors']
+
+
+def test_custom_instrument_matches_name_and_examples():
+    stock_universe = Universe([Instrument("Palantir", "PLTR", examples=("Foundry platform",), kind='stock')])
+    relevance_filter = RelevanceFilter(universe=stock_universe)
+    assert relevance_filter.match({'title': "Palantir wins army contract"})[1] == ['Palantir']
+    assert relevance_filter.match({'title': "New Foundry platform release"})[1] == ['Palantir']
+    assert relevance_filter.match(CHIP_ARTICLE) == (0, [])
+
+
+def test_extra_keywords_are_added():
+    relevance_filter = RelevanceFilter(extra_keywords={'Technology': ['snowflake']}, universe=DEFAULT_UNIVERSE)
+    assert relevance_filter.match({'title': "Snowflake beats estimates"})[1] == ['Technology']
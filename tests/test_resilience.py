@@ -0,0 +1,75 @@
+"""CircuitBreaker / Deadline 단위 테스트"""
+import time
+
+import pytest
+
+from util.resilience import CircuitBreaker, Deadline, DeadlineExceeded
+
+
+class ExpiredDeadline(Deadline):
+    """이미 지난 마감 시간"""
+
+    def __init__(self):
+        super().__init__()
+        self.expires_at = time.monotonic() - 1
+
+
+def test_circuit_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=60)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_half_open_allows_single_trial():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # 시험 호출 진행 중에는 1건만
+
+
+def test_half_open_trial_success_closes():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=0)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+def test_half_open_trial_failure_reopens():
+    breaker = CircuitBreaker(failure_threshold=3, cooldown_seconds=0)
+    breaker.trip()
+    assert breaker.allow_request()
+    breaker.cooldown_seconds = 60
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_deadline_sleep_raises_when_too_long():
+    with pytest.raises(DeadlineExceeded):
+        Deadline(0.5).sleep(10)
+    assert not Deadline().expired()
+    assert ExpiredDeadline().expired()
+
+
+def test_expired_deadline_does_not_leak_half_open_trial():
+    """마감이 지난 상태로 half-open 서킷에 요청해도 시험 호출 자리를 잡지 않음 (이후 요청이 영원히 거부되지 않도록)"""
+    pytest.importorskip('openai')
+    from analysis.news_analyzer import OpenAIBackend
+
+    backend = OpenAIBackend(api_key='test-key', circuit_breaker_threshold=1, circuit_breaker_cooldown=0)
+    backend.circuit_breaker.record_failure()
+    assert backend.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+
+    def unexpected_call(request_arguments):
+        raise AssertionError("마감이 지났는데 API를 호출함")
+
+    backend._create_response = unexpected_call
+    with pytest.raises(DeadlineExceeded):
+        backend._request_scores("prompt", ExpiredDeadline())
+
+    assert backend.circuit_breaker.allow_request()
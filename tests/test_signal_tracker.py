@@ -0,0 +1,71 @@
+"""SignalTracker 히스테리시스 / 최소 보유 시간 / 교체 단위 테스트"""
+from trading.signal_generator import SignalGenerator
+from trading.signal_tracker import CHANGE_ENTER, CHANGE_EXIT, SIDE_LONG, SIDE_SHORT, SignalTracker
+
+START = 1_700_000_000.0
+
+
+def make_tracker(num_long=1, num_short=1, min_holding_seconds=0, replace_margin=5):
+    signal_generator = SignalGenerator(num_long=num_long, num_short=num_short, long_threshold=5, short_threshold=-5)
+    return SignalTracker(signal_generator, long_exit_threshold=2, short_exit_threshold=-2,
+                         min_holding_seconds=min_holding_seconds, replace_margin=replace_margin)
+
+
+def changes_of(signal_changes):
+    return [(signal_change.change, signal_change.side, signal_change.sector) for signal_change in signal_changes]
+
+
+def test_enter_long_and_short_above_thresholds():
+    tracker = make_tracker()
+    signal_changes = tracker.update({'Technology': 8, 'Energy': -7, 'Utilities': 1}, now=START)
+    assert changes_of(signal_changes) == [(CHANGE_ENTER, SIDE_LONG, 'Technology'),
+                                          (CHANGE_ENTER, SIDE_SHORT, 'Energy')]
+    assert signal_changes[0].ticker == 'XLK'
+    assert tracker.holdings() == {SIDE_LONG: ['Technology'], SIDE_SHORT: ['Energy']}
+
+
+def test_hysteresis_keeps_position_between_exit_and_enter_levels():
+    tracker = make_tracker()
+    tracker.update({'Technology': 8}, now=START)
+    # 진입 임계값(5) 아래지만 청산 기준(2) 이상 → 유지
+    assert tracker.update({'Technology': 3}, now=START + 60) == []
+    assert changes_of(tracker.update({'Technology': 1}, now=START + 120)) == [(CHANGE_EXIT, SIDE_LONG, 'Technology')]
+
+
+def test_min_holding_blocks_exit_until_elapsed():
+    tracker = make_tracker(min_holding_seconds=3600)
+    tracker.update({'Technology': 8}, now=START)
+    assert tracker.update({'Technology': -1}, now=START + 600) == []
+    assert changes_of(tracker.update({'Technology': -1}, now=START + 3600)) == [(CHANGE_EXIT, SIDE_LONG, 'Technology')]
+
+
+def test_replace_requires_margin():
+    tracker = make_tracker(replace_margin=5)
+    tracker.update({'Technology': 6}, now=START)
+    # 9 - 6 = 3 < 5 → 교체하지 않음
+    assert tracker.update({'Technology': 6, 'Healthcare': 9}, now=START + 60) == []
+    signal_changes = tracker.update({'Technology': 6, 'Healthcare': 12}, now=START + 120)
+    assert changes_of(signal_changes) == [(CHANGE_EXIT, SIDE_LONG, 'Technology'),
+                                          (CHANGE_ENTER, SIDE_LONG, 'Healthcare')]
+    assert tracker.holdings()[SIDE_LONG] == ['Healthcare']
+
+
+def test_replace_blocked_by_min_holding():
+    tracker = make_tracker(min_holding_seconds=3600)
+    tracker.update({'Technology': 6}, now=START)
+    assert tracker.update({'Technology': 6, 'Healthcare': 20}, now=START + 60) == []
+
+
+def test_low_coverage_holds_positions():
+    tracker = make_tracker()
+    tracker.update({'Technology': 8}, now=START)
+    assert tracker.update({'Technology': -8}, coverage=0.1, now=START + 60) == []
+    assert tracker.holdings()[SIDE_LONG] == ['Technology']
+
+
+def test_checkpoint_state_round_trip():
+    tracker = make_tracker()
+    tracker.update({'Technology': 8, 'Energy': -7}, now=START)
+    restored_tracker = make_tracker()
+    restored_tracker.restore_state(tracker.checkpoint_state())
+    assert restored_tracker.positions == tracker.positions
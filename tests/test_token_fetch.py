@@ -0,0 +1,70 @@
+"""기본 한투 토큰 접근 (만료 / 인증 오류 시 재발급) 단위 테스트"""
+import datetime
+import json
+
+import pytest
+
+from trading import token_fetch
+from trading.kis_response import KisApiError, KisAuthError
+
+
+@pytest.fixture
+def token_file(tmp_path, monkeypatch):
+    path = tmp_path / "token_info.json"
+    issued = []
+
+    def fake_get_access_token(config=None):
+        token = f"token-{len(issued) + 1}"
+        issued.append(token)
+        path.write_text(json.dumps({
+            'access_token': token,
+            'issued_at': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }))
+        token_fetch.ACCESS_TOKEN = token
+        return token
+
+    monkeypatch.setattr(token_fetch, 'TOKEN_FILE', str(path))
+    monkeypatch.setattr(token_fetch, 'ACCESS_TOKEN', "")
+    monkeypatch.setattr(token_fetch, 'get_access_token', fake_get_access_token)
+    return path, issued
+
+
+def test_current_token_reused_until_expiry(token_file):
+    path, issued = token_file
+    assert token_fetch.current_access_token() == "token-1"
+    assert token_fetch.current_access_token() == "token-1"
+    stale = datetime.datetime.now() - token_fetch.TOKEN_REUSE_WINDOW - datetime.timedelta(minutes=1)
+    path.write_text(json.dumps({'access_token': "token-1", 'issued_at': stale.strftime("%Y-%m-%d %H:%M:%S")}))
+    assert token_fetch.current_access_token() == "token-2"
+    assert issued == ["token-1", "token-2"]
+
+
+def test_refresh_drops_cached_file(token_file):
+    path, issued = token_file
+    token_fetch.current_access_token()
+    assert token_fetch.current_access_token(refresh=True) == "token-2"
+    assert issued == ["token-1", "token-2"]
+
+
+def test_with_access_token_retries_once_on_auth_error(token_file):
+    seen = []
+
+    def request(access_token):
+        seen.append(access_token)
+        if len(seen) == 1:
+            raise KisAuthError('/oauth2/tokenP', '1', 'EGW00123', '기간이 만료된 token 입니다.')
+        return access_token
+
+    assert token_fetch.with_access_token(request) == "token-2"
+    assert seen == ["token-1", "token-2"]
+
+
+def test_with_access_token_does_not_retry_other_errors(token_file):
+    _, issued = token_file
+
+    def request(access_token):
+        raise KisApiError('/quotations/price', '1', 'EGW00201', '잘못된 요청')
+
+    with pytest.raises(KisApiError):
+        token_fetch.with_access_token(request)
+    assert issued == ["token-1"]
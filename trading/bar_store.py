@@ -0,0 +1,246 @@
+"""
+로컬 시세 봉 저장소 (종목/주기별 memory-mapped 컬럼 배열)
+- 디렉터리 구조: {root}/{timeframe}/{종목}.{컬럼} (원시 little-endian 배열) + {종목}.json (행 수/용량)
+- 컬럼: timestamp (epoch 초, int64) / open / high / low / close / volume (float64)
+- 추가는 마지막 timestamp보다 새로운 봉만 (append-only), 용량이 차면 파일을 두 배로 늘림
+- 구간 조회는 timestamp 이진 탐색 후 memmap 슬라이스를 그대로 반환 (복사 없음)
+- 한투 분봉 API는 NEXT/KEYB로 과거 페이지를 넘기며 채우고, 이후에는 주기마다 최신 페이지만 추가
+"""
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pytz
+import requests
+
+from trading.kis_response import KisAuthError, KisError, decode_response, kis_session, parse_minute_rows
+from util.cassette import pace
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+MINUTE_PRICE_PATH = "uapi/overseas-price/v1/quotations/inquire-time-itemchartprice"
+EASTERN_TIMEZONE = pytz.timezone('America/New_York')
+BAR_COLUMNS = (('timestamp', '<i8'), ('open', '<f8'), ('high', '<f8'), ('low', '<f8'), ('close', '<f8'), ('volume', '<f8'))
+
+
+def eastern_epoch(ymd: str, hms: str = '000000') -> int:
+    """미국 동부 날짜/시각 (YYYYMMDD, HHMMSS) → epoch 초"""
+    return int(EASTERN_TIMEZONE.localize(datetime.strptime(ymd + hms, '%Y%m%d%H%M%S')).timestamp())
+
+
+class BarSeries:
+    """종목 1개 / 주기 1개의 컬럼 배열"""
+
+    def __init__(self, directory: str, symbol: str, initial_capacity: int = 1024):
+        self.directory = directory
+        self.symbol = symbol
+        self._meta_path = os.path.join(directory, f"{symbol}.json")
+        self.count = 0
+        self.capacity = 0
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, 'r', encoding='utf-8') as f:
+                series_meta = json.load(f)
+            self.count, self.capacity = series_meta['count'], series_meta['capacity']
+            self._map_columns('r+')
+        else:
+            self.capacity = initial_capacity
+            self._map_columns('w+')
+            self._save_meta()
+
+    def _column_path(self, column: str) -> str:
+        return os.path.join(self.directory, f"{self.symbol}.{column}")
+
+    def _map_columns(self, mode: str):
+        self.columns: Dict[str, np.memmap] = {
+            column: np.memmap(self._column_path(column), dtype=dtype, mode=mode, shape=(self.capacity,))
+            for column, dtype in BAR_COLUMNS
+        }
+
+    def _save_meta(self):
+        temporary_path = f"{self._meta_path}.tmp"
+        with open(temporary_path, 'w', encoding='utf-8') as f:
+            json.dump({'count': self.count, 'capacity': self.capacity}, f)
+        os.replace(temporary_path, self._meta_path)
+
+    def _grow(self, required_capacity: int):
+        new_capacity = self.capacity
+        while new_capacity < required_capacity:
+            new_capacity *= 2
+        for column_array in self.columns.values():
+            column_array.flush()
+        for column, dtype in BAR_COLUMNS:
+            with open(self._column_path(column), 'r+b') as f:
+                f.truncate(new_capacity * np.dtype(dtype).itemsize)
+        self.capacity = new_capacity
+        self._map_columns('r+')
+
+    @property
+    def last_timestamp(self) -> int:
+        return int(self.columns['timestamp'][self.count - 1]) if self.count else 0
+
+    def append(self, rows: Dict[str, np.ndarray]) -> int:
+        """
+        마지막 timestamp보다 새로운 행만 추가 (행 수 → 메타 순서로 기록해 중간에 죽어도 기존 행은 유지)
+
+        Args:
+            rows: 컬럼 → 배열 (timestamp 오름차순)
+
+        Returns:
+            추가한 행 수
+        """
+        new_row_mask = np.asarray(rows['timestamp']) > self.last_timestamp
+        new_row_count = int(new_row_mask.sum())
+        if not new_row_count:
+            return 0
+        if self.count + new_row_count > self.capacity:
+            self._grow(self.count + new_row_count)
+        for column, _ in BAR_COLUMNS:
+            column_array = self.columns[column]
+            column_array[self.count:self.count + new_row_count] = np.asarray(rows[column])[new_row_mask]
+            column_array.flush()
+        self.count += new_row_count
+        self._save_meta()
+        METRICS.inc('bar_store_rows_total', new_row_count)
+        return new_row_count
+
+    def append_daily(self, daily_bars: List[Dict]) -> int:
+        """DailyBarCache 형식 일봉 ({'date', 'open', ...}) 추가"""
+        return self.append(daily_bars_to_columns(daily_bars))
+
+    def range(self, start: Optional[float] = None, end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        start ≤ timestamp ≤ end 구간 (memmap 뷰, 복사 없음 - 수정하지 말 것)
+        """
+        timestamps = self.columns['timestamp'][:self.count]
+        start_index = int(np.searchsorted(timestamps, start, 'left')) if start is not None else 0
+        end_index = int(np.searchsorted(timestamps, end, 'right')) if end is not None else self.count
+        return {column: column_array[start_index:end_index] for column, column_array in self.columns.items()}
+
+    def tail(self, row_count: int) -> Dict[str, np.ndarray]:
+        """최근 row_count개 행 (memmap 뷰)"""
+        start_index = max(0, self.count - row_count)
+        return {column: column_array[start_index:self.count] for column, column_array in self.columns.items()}
+
+    def daily_bars(self, row_count: int) -> List[Dict]:
+        """최근 row_count개 일봉을 DailyBarCache 형식으로"""
+        recent_rows = self.tail(row_count)
+        return [{'date': datetime.fromtimestamp(int(timestamp), EASTERN_TIMEZONE).strftime('%Y%m%d'),
+                 'open': float(open_price), 'high': float(high), 'low': float(low),
+                 'close': float(close), 'volume': float(volume)}
+                for timestamp, open_price, high, low, close, volume in zip(
+                    recent_rows['timestamp'], recent_rows['open'], recent_rows['high'],
+                    recent_rows['low'], recent_rows['close'], recent_rows['volume'])]
+
+
+def _bars_to_columns(bars: List[Dict], timestamps: List[int]) -> Dict[str, np.ndarray]:
+    return {
+        'timestamp': np.array(timestamps, dtype='<i8'),
+        **{column: np.array([bar[column] for bar in bars], dtype='<f8')
+           for column, _ in BAR_COLUMNS if column != 'timestamp'},
+    }
+
+
+def daily_bars_to_columns(daily_bars: List[Dict]) -> Dict[str, np.ndarray]:
+    """DailyBarCache 형식 일봉 → BarSeries.range()와 같은 컬럼 배열 (timestamp = 미국 동부 자정)"""
+    return _bars_to_columns(daily_bars, [eastern_epoch(bar['date']) for bar in daily_bars])
+
+
+class BarStore:
+    """종목/주기별 BarSeries 모음"""
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self._series: Dict[tuple, BarSeries] = {}
+
+    def series(self, symbol: str, timeframe: str) -> BarSeries:
+        """
+        Args:
+            symbol: 종목 코드
+            timeframe: 'D' (일봉) / '5m' 등 (분봉)
+        """
+        series_key = (symbol, timeframe)
+        if series_key not in self._series:
+            directory = os.path.join(self.root_dir, timeframe)
+            os.makedirs(directory, exist_ok=True)
+            self._series[series_key] = BarSeries(directory, symbol)
+        return self._series[series_key]
+
+    def range(self, symbol: str, timeframe: str, start: Optional[float] = None,
+              end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        return self.series(symbol, timeframe).range(start, end)
+
+
+def fetch_minute_page(config, access_token: str, ticker: str, exchange_code: str, interval_minutes: int,
+                      next_key: str = '') -> tuple:
+    """
+    분봉 1페이지 (최대 120개) 조회
+
+    Args:
+        interval_minutes: 분봉 간격 (NMIN)
+        next_key: 이전 페이지 마지막 봉의 YYYYMMDDHHMMSS (빈 문자열이면 최신 페이지)
+
+    Returns:
+        (봉 리스트 {'timestamp', 'open', 'high', 'low', 'close', 'volume'} 오래된 순, 다음 페이지 키 또는 '')
+    """
+    headers = {"Content-Type": "application/json",
+               "authorization": f"Bearer {access_token}",
+               "appKey": config.app_key,
+               "appSecret": config.app_secret,
+               "tr_id": "HHDFS76950200"}
+    params = {"AUTH": "", "EXCD": exchange_code, "SYMB": ticker, "NMIN": str(interval_minutes), "PIN": "1",
+              "NEXT": "1" if next_key else "", "NREC": "120", "FIL": "", "KEYB": next_key}
+    with METRICS.timer('kis_request_seconds', endpoint=MINUTE_PRICE_PATH):
+        res = kis_session().get(f"{config.url_base}/{MINUTE_PRICE_PATH}", headers=headers, params=params, timeout=10)
+    METRICS.inc('kis_requests_total', endpoint=MINUTE_PRICE_PATH, status=res.status_code)
+    payload = decode_response(res, MINUTE_PRICE_PATH)
+
+    minute_bars = [dict(minute_row, timestamp=eastern_epoch(minute_row['ymd'], minute_row['hms']),
+                        key=minute_row['ymd'] + minute_row['hms'])
+                   for minute_row in parse_minute_rows(payload)]
+    minute_bars.sort(key=lambda bar: bar['timestamp'])
+    has_more = (payload.get('output1') or {}).get('more', '1') == '1'
+    return minute_bars, (minute_bars[0]['key'] if minute_bars and has_more else '')
+
+
+def update_minute_bars(bar_store: BarStore, config, access_token: str, exchange_codes: Dict[str, str],
+                       interval_minutes: int, backfill_pages: int = 10, request_interval: float = 0.1) -> int:
+    """
+    종목별 분봉 증분 저장 (저장된 마지막 봉에 닿을 때까지 NEXT/KEYB로 페이지를 넘김, 최대 backfill_pages)
+    아직 끝나지 않은 최신 봉은 저장하지 않음
+
+    Returns:
+        새로 저장한 봉 수 (전체 종목 합)
+    """
+    timeframe = f"{interval_minutes}m"
+    completed_before = time.time() - interval_minutes * 60
+    new_bar_count = 0
+    for ticker, exchange_code in exchange_codes.items():
+        bar_series = bar_store.series(ticker, timeframe)
+        last_timestamp = bar_series.last_timestamp
+        collected_bars: List[Dict] = []
+        next_key = ''
+        try:
+            for _ in range(backfill_pages):
+                page_bars, next_key = fetch_minute_page(config, access_token, ticker, exchange_code,
+                                                        interval_minutes, next_key)
+                collected_bars[:0] = page_bars
+                pace(request_interval)
+                if not next_key or (page_bars and page_bars[0]['timestamp'] <= last_timestamp):
+                    break
+        except KisAuthError:
+            raise  # 토큰 문제는 모든 티커가 실패 → 호출한 쪽에서 재발급 후 재시도
+        except (requests.RequestException, KisError, ValueError) as bar_exception:
+            logger.warning("⚠️ %s 분봉 조회 실패: %s", ticker, bar_exception)
+            continue
+        unique_bars = {bar['timestamp']: bar for bar in collected_bars}  # 페이지 경계 중복 제거
+        completed_bars = [unique_bars[timestamp] for timestamp in sorted(unique_bars) if timestamp <= completed_before]
+        if completed_bars:
+            new_bar_count += bar_series.append(_bars_to_columns(completed_bars, [bar['timestamp'] for bar in completed_bars]))
+    if new_bar_count:
+        logger.info("🗄️ 분봉 저장: 새 봉 %d개 (%s, 종목 %d개)", new_bar_count, timeframe, len(exchange_codes))
+    return new_bar_count
@@ -0,0 +1,192 @@
+"""
+해외주식 일봉 조회 + 메모리 캐시 (한투 해외주식 기간별시세 API)
+일봉은 하루에 한 번만 바뀌므로 티커별로 미국 동부 날짜가 바뀌었을 때만 다시 조회하고 새 봉만 덧붙임
+BarStore가 있으면 시작 시 저장된 일봉을 읽고, 비어 있는 종목은 BYMD로 페이지를 넘기며 과거 일봉을 채움
+계산 쪽(PositionSizer / EntryTimingEngine)은 columns() / last_bar()로 BarStore memmap 뷰를 바로 읽음 (dict 리스트 복사 없음)
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+import pytz
+import requests
+
+from trading.bar_store import daily_bars_to_columns, eastern_epoch
+from trading.kis_response import KisAuthError, KisError, decode_response, kis_session, parse_daily_bars
+from util.cassette import pace
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+DAILY_PRICE_PATH = "uapi/overseas-price/v1/quotations/dailyprice"
+EASTERN_TIMEZONE = pytz.timezone('America/New_York')
+
+
+def eastern_date() -> str:
+    """미국 동부 기준 오늘 날짜 (YYYYMMDD, 한투 일봉 xymd 형식)"""
+    return datetime.now(EASTERN_TIMEZONE).strftime('%Y%m%d')
+
+
+def fetch_daily_bars(config, access_token: str, ticker: str, exchange_code: str, base_date: str = '') -> List[Dict]:
+    """
+    일봉 조회 (base_date 이전 최대 100개, 오래된 순)
+
+    Args:
+        config: AppConfig (url_base, app_key, app_secret)
+        access_token: 한투 접근 토큰
+        ticker: 종목 코드
+        exchange_code: 한투 거래소 코드 (NAS / NYS / AMS)
+        base_date: 조회 기준일 (YYYYMMDD, 빈 문자열이면 오늘)
+
+    Returns:
+        [{'date': 'YYYYMMDD', 'open', 'high', 'low', 'close', 'volume'}, ...]
+    """
+    headers = {"Content-Type": "application/json",
+               "authorization": f"Bearer {access_token}",
+               "appKey": config.app_key,
+               "appSecret": config.app_secret,
+               "tr_id": "HHDFS76240000"}
+    params = {"AUTH": "", "EXCD": exchange_code, "SYMB": ticker, "GUBN": "0", "BYMD": base_date, "MODP": "0"}
+    with METRICS.timer('kis_request_seconds', endpoint=DAILY_PRICE_PATH):
+        res = kis_session().get(f"{config.url_base}/{DAILY_PRICE_PATH}", headers=headers, params=params, timeout=10)
+    METRICS.inc('kis_requests_total', endpoint=DAILY_PRICE_PATH, status=res.status_code)
+    return parse_daily_bars(decode_response(res, DAILY_PRICE_PATH))
+
+
+def fetch_daily_history(config, access_token: str, ticker: str, exchange_code: str, max_bars: int,
+                        request_interval: float = 0.1) -> List[Dict]:
+    """
+    기준일을 과거로 옮기며(BYMD) 최대 max_bars개 일봉 조회 (오래된 순)
+    """
+    daily_bars: List[Dict] = []
+    base_date = ''
+    while len(daily_bars) < max_bars:
+        page_bars = fetch_daily_bars(config, access_token, ticker, exchange_code, base_date)
+        if daily_bars:
+            page_bars = [bar for bar in page_bars if bar['date'] < daily_bars[0]['date']]
+        if not page_bars:
+            break
+        daily_bars[:0] = page_bars
+        base_date = (datetime.strptime(page_bars[0]['date'], '%Y%m%d') - timedelta(days=1)).strftime('%Y%m%d')
+        pace(request_interval)
+    return daily_bars[-max_bars:]
+
+
+class DailyBarCache:
+    """티커별 완성된 일봉 (오늘 진행 중인 봉은 제외) 메모리 캐시"""
+
+    def __init__(self, max_bars: int = 250, bar_store=None):
+        """
+        Args:
+            max_bars: 티커별 보관할 최대 일봉 수 (BarStore가 비어 있으면 이만큼 과거 일봉을 채움)
+            bar_store: 일봉을 영구 저장할 BarStore (None이면 메모리만)
+        """
+        self.max_bars = max_bars
+        self.bar_store = bar_store
+        self.bars: Dict[str, List[Dict]] = {}  # 티커 → 일봉 (오래된 순)
+        self.fetched_on: Dict[str, str] = {}  # 티커 → 마지막으로 조회한 미국 동부 날짜
+        self._refresh_lock = threading.Lock()  # 전략별 평가가 동시에 갱신해도 티커당 한 번만 조회
+
+    def merge(self, ticker: str, daily_bars: List[Dict], today: str) -> int:
+        """
+        조회한 일봉 중 캐시보다 새로운 완성 봉만 추가
+
+        Returns:
+            새로 추가한 봉 수
+        """
+        cached_bars = self.bars.setdefault(ticker, [])
+        last_date = cached_bars[-1]['date'] if cached_bars else ''
+        new_bars = [bar for bar in daily_bars if last_date < bar['date'] < today]
+        cached_bars.extend(new_bars)
+        del cached_bars[:-self.max_bars]
+        return len(new_bars)
+
+    def refresh(self, config, access_token: str, exchange_codes: Dict[str, str],
+                request_interval: float = 0.1) -> int:
+        """
+        오늘 아직 조회하지 않은 티커만 일봉 조회 (실패한 티커는 다음 호출에서 다시 시도)
+
+        Args:
+            exchange_codes: 티커 → 한투 거래소 코드 (Universe.exchange_codes())
+
+        Returns:
+            새로 추가한 봉 수 (전체 티커 합)
+        """
+        today = eastern_date()
+        new_bar_count = 0
+        with self._refresh_lock:
+            for ticker, exchange_code in exchange_codes.items():
+                if self.fetched_on.get(ticker) == today:
+                    continue
+                bar_series = self._load_stored(ticker)
+                try:
+                    if bar_series is not None and not bar_series.count:
+                        daily_bars = fetch_daily_history(config, access_token, ticker, exchange_code,
+                                                         self.max_bars + 1, request_interval)
+                    else:
+                        daily_bars = fetch_daily_bars(config, access_token, ticker, exchange_code)
+                except KisAuthError:
+                    raise  # 토큰 문제는 모든 티커가 실패 → 호출한 쪽에서 재발급 후 재시도
+                except (requests.RequestException, KisError, ValueError) as bar_exception:
+                    logger.warning("⚠️ %s 일봉 조회 실패: %s", ticker, bar_exception)
+                    continue
+                ticker_new_bar_count = self.merge(ticker, daily_bars, today)
+                if bar_series is not None and ticker_new_bar_count:
+                    # 저장소가 비어 있으면 체크포인트에서 복원한 봉까지 함께 저장 (columns()가 저장소만 읽으므로)
+                    bar_series.append_daily(self.bars[ticker] if not bar_series.count
+                                            else self.bars[ticker][-ticker_new_bar_count:])
+                new_bar_count += ticker_new_bar_count
+                self.fetched_on[ticker] = today
+                pace(request_interval)
+        if new_bar_count:
+            logger.info("🕯️ 일봉 캐시 갱신: 새 봉 %d개 (티커 %d개)", new_bar_count, len(self.bars))
+        return new_bar_count
+
+    def _load_stored(self, ticker: str) -> Optional[object]:
+        """BarStore의 일봉 시계열 (처음 접근할 때 최근 max_bars개를 메모리 캐시로 읽음)"""
+        if self.bar_store is None:
+            return None
+        bar_series = self.bar_store.series(ticker, 'D')
+        if ticker not in self.bars and bar_series.count:
+            self.bars[ticker] = bar_series.daily_bars(self.max_bars)
+        return bar_series
+
+    def checkpoint_state(self) -> Dict:
+        """체크포인트용 상태 (같은 날 재시작하면 일봉을 다시 조회하지 않음)"""
+        return {'bars': self.bars, 'fetched_on': self.fetched_on}
+
+    def restore_state(self, state: Dict):
+        for ticker, daily_bars in state['bars'].items():
+            self.bars.setdefault(ticker, daily_bars[-self.max_bars:])
+        self.fetched_on.update(state['fetched_on'])
+
+    def columns(self, ticker: str, start: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        start ≤ timestamp인 일봉 컬럼 (timestamp / open / high / low / close / volume)
+        BarStore에 저장된 봉이 있으면 memmap 뷰 그대로 (복사 없음 - 수정하지 말 것), 없으면 메모리 캐시를 배열로 변환
+
+        Args:
+            start: epoch 초 (None이면 전체)
+        """
+        if self.bar_store is not None:
+            bar_series = self.bar_store.series(ticker, 'D')
+            if bar_series.count:
+                return bar_series.range(start)
+        cached_bars = self.bars.get(ticker, [])
+        if start is not None:
+            cached_bars = [bar for bar in cached_bars if eastern_epoch(bar['date']) >= start]
+        return daily_bars_to_columns(cached_bars)
+
+    def last_bar(self, ticker: str) -> Optional[Dict]:
+        """마지막 완성 일봉 {'date', 'high', 'low', 'close'} (없으면 None)"""
+        if self.bar_store is not None:
+            bar_series = self.bar_store.series(ticker, 'D')
+            if bar_series.count:
+                last_row = bar_series.tail(1)
+                return {'date': datetime.fromtimestamp(int(last_row['timestamp'][0]), EASTERN_TIMEZONE).strftime('%Y%m%d'),
+                        'high': float(last_row['high'][0]), 'low': float(last_row['low'][0]),
+                        'close': float(last_row['close'][0])}
+        cached_bars = self.bars.get(ticker)
+        return cached_bars[-1] if cached_bars else None
@@ -0,0 +1,173 @@
+"""
+장중 진입 타이밍 모듈
+전일 일봉으로 유니버스 전체의 진입 기준가를 하루 한 번 미리 계산하고, 진입 대기 종목의 현재가가 기준을 넘으면 진입 이벤트 발생
+- 기준가: 목표가 (피벗 + 전일 변동폭, 기존 get_target_entry_price와 같은 공식) / 돌파 (전일 고가·저가) / 피벗
+- Short는 같은 기준을 아래 방향으로 대칭 적용 (피벗 − 변동폭, 전일 저가, 피벗)
+- 가격 1건 처리는 dict 조회 + 비교 1번 (스트리밍/폴링 어느 쪽에서 들어와도 O(1))
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from trading.daily_bars import eastern_date
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+ENTRY_TRIGGERS = ('target', 'breakout', 'pivot')
+
+
+@dataclass(frozen=True)
+class EntryLevels:
+    """전일 일봉으로 계산한 종목별 기준가"""
+    ticker: str
+    date: str  # 기준 일봉 날짜 (YYYYMMDD)
+    pivot: float
+    previous_high: float
+    previous_low: float
+    target_long: float  # 피벗 + 변동폭
+    target_short: float  # 피벗 − 변동폭
+
+    @classmethod
+    def from_bar(cls, ticker: str, daily_bar: Dict) -> 'EntryLevels':
+        high, low, close = daily_bar['high'], daily_bar['low'], daily_bar['close']
+        pivot = (high + low + close) / 3
+        return cls(ticker, daily_bar['date'], pivot, high, low, pivot + (high - low), pivot - (high - low))
+
+    def trigger_price(self, side: str, trigger: str) -> float:
+        if trigger == 'target':
+            return self.target_long if side == 'long' else self.target_short
+        if trigger == 'breakout':
+            return self.previous_high if side == 'long' else self.previous_low
+        return self.pivot
+
+
+@dataclass
+class EntrySignal:
+    """진입 기준 도달 이벤트"""
+    ticker: str
+    side: str
+    price: float
+    trigger_price: float
+    levels: EntryLevels
+
+    def format_message(self) -> str:
+        comparison = '≥' if self.side == 'long' else '≤'
+        return (f"🎯 진입 타이밍: {self.side.upper()} {self.ticker} 현재가 {self.price:.2f} {comparison} "
+                f"기준 {self.trigger_price:.2f} (피벗 {self.levels.pivot:.2f}, "
+                f"전일 고가/저가 {self.levels.previous_high:.2f}/{self.levels.previous_low:.2f})")
+
+
+class EntryTimingEngine:
+    """진입 대기 종목(armed)의 현재가를 미리 계산한 기준가와 비교"""
+
+    def __init__(self, daily_bar_cache, trigger: str = 'target'):
+        """
+        Args:
+            daily_bar_cache: 전일 일봉을 읽을 DailyBarCache (PositionSizer와 공유)
+            trigger: 진입 기준 (target / breakout / pivot)
+        """
+        self.daily_bar_cache = daily_bar_cache
+        self.trigger = trigger
+        self.levels: Dict[str, EntryLevels] = {}
+        self.levels_date = ''  # 기준가를 계산한 미국 동부 날짜
+        self._armed: Dict[str, tuple] = {}  # 티커 → (side, 기준가) - 틱마다 조회하는 유일한 상태
+
+    def prepare(self, config, access_token: str, exchange_codes: Dict[str, str]) -> bool:
+        """
+        날짜가 바뀌었으면 일봉을 갱신하고 유니버스 전체 기준가 재계산 (하루 한 번)
+
+        Returns:
+            재계산 여부
+        """
+        today = eastern_date()
+        if self.levels_date == today:
+            return False
+        self.daily_bar_cache.refresh(config, access_token, exchange_codes)
+        last_bars = {ticker: self.daily_bar_cache.last_bar(ticker) for ticker in exchange_codes}
+        self.levels = {ticker: EntryLevels.from_bar(ticker, last_bar)
+                       for ticker, last_bar in last_bars.items() if last_bar is not None}
+        if len(self.levels) == len(exchange_codes):
+            self.levels_date = today
+        for ticker, (side, _) in list(self._armed.items()):
+            self.arm(ticker, side)
+        logger.info("🎯 진입 기준가 계산 완료 (%d개 종목, 기준: %s)", len(self.levels), self.trigger)
+        return True
+
+    def arm(self, ticker: str, side: str):
+        """진입 대기 등록 (기준가가 아직 없으면 prepare() 후 적용)"""
+        entry_levels = self.levels.get(ticker)
+        self._armed[ticker] = (side, entry_levels.trigger_price(side, self.trigger) if entry_levels else None)
+
+    def disarm(self, ticker: str):
+        self._armed.pop(ticker, None)
+
+    def apply_changes(self, signal_changes: List[Dict]):
+        """SignalTracker 변경 이벤트 반영 (진입 → 대기 등록, 청산 → 대기 해제)"""
+        for signal_change in signal_changes:
+            if signal_change['change'] == 'enter':
+                self.arm(signal_change['ticker'], signal_change['side'])
+            else:
+                self.disarm(signal_change['ticker'])
+
+    def checkpoint_state(self) -> Dict:
+        """체크포인트용 상태 (진입 대기 종목 → 방향, 기준가는 재시작 후 prepare()에서 다시 계산)"""
+        return {'armed': {ticker: side for ticker, (side, _) in self._armed.items()}}
+
+    def restore_state(self, state: Dict):
+        for ticker, side in state['armed'].items():
+            self.arm(ticker, side)
+
+    @property
+    def armed_tickers(self) -> List[str]:
+        return list(self._armed)
+
+    def on_price(self, ticker: str, price: float) -> Optional[EntrySignal]:
+        """
+        현재가 1건 처리 (기준 도달 시 대기 해제 후 EntrySignal 반환)
+        """
+        armed_entry = self._armed.get(ticker)
+        if armed_entry is None or armed_entry[1] is None:
+            return None
+        side, trigger_price = armed_entry
+        if (price >= trigger_price) if side == 'long' else (price <= trigger_price):
+            del self._armed[ticker]
+            METRICS.inc('entry_signals_total', side=side)
+            return EntrySignal(ticker, side, price, trigger_price, self.levels[ticker])
+        return None
+
+    def watch(self, price_source: Callable[[List[str]], Dict[str, float]], deadline: float,
+              poll_interval: float = 5.0, on_signal: Optional[Callable[[EntrySignal], None]] = None,
+              interrupt: Optional[threading.Event] = None) -> List[EntrySignal]:
+        """
+        deadline까지 poll_interval마다 대기 종목 현재가를 받아 기준 도달 확인 (대기 종목이 없으면 남은 시간 대기)
+
+        Args:
+            price_source: 티커 목록 → {티커: 현재가}
+            deadline: 종료 시각 (time.time() 기준)
+            poll_interval: 현재가 조회 간격 (초)
+            on_signal: 진입 이벤트 콜백 (알림 등)
+            interrupt: set되면 deadline 전이라도 종료 (제어 API의 다음 주기 요청)
+
+        Returns:
+            발생한 진입 이벤트
+        """
+        sleep = interrupt.wait if interrupt is not None else time.sleep
+        entry_signals: List[EntrySignal] = []
+        while True:
+            remaining_seconds = deadline - time.time()
+            if remaining_seconds <= 0 or (interrupt is not None and interrupt.is_set()):
+                return entry_signals
+            if not self._armed:
+                sleep(remaining_seconds)
+                return entry_signals
+            for ticker, price in price_source(self.armed_tickers).items():
+                entry_signal = self.on_price(ticker, price)
+                if entry_signal is None:
+                    continue
+                entry_signals.append(entry_signal)
+                if on_signal is not None:
+                    on_signal(entry_signal)
+            sleep(max(0.0, min(poll_interval, deadline - time.time())))
@@ -0,0 +1,54 @@
+"""
+섹터 ETF 현재가 조회 (한투 해외주식 현재체결가 API)
+출처 신뢰도 학습에서 점수 → 실현 수익률 평가에 사용
+"""
+from typing import Dict
+
+import requests
+
+from trading.kis_response import KisAuthError, KisError, Quote, decode_response, kis_session
+from util.cassette import pace
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+PRICE_PATH = "uapi/overseas-price/v1/quotations/price"
+
+
+def fetch_etf_prices(config, access_token: str, exchange_codes: Dict[str, str],
+                     request_interval: float = 0.1) -> Dict[str, float]:
+    """
+    ETF 현재가 일괄 조회 (실패한 티커는 결과에서 제외)
+
+    Args:
+        config: AppConfig (url_base, app_key, app_secret)
+        access_token: 한투 접근 토큰
+        exchange_codes: 티커 → 한투 거래소 코드 (Universe.exchange_codes())
+        request_interval: 요청 간 대기 (초, 초당 요청 제한 방지)
+
+    Returns:
+        {티커: 현재가}
+    """
+    headers = {"Content-Type": "application/json",
+               "authorization": f"Bearer {access_token}",
+               "appKey": config.app_key,
+               "appSecret": config.app_secret,
+               "tr_id": "HHDFS00000300"}
+    etf_prices: Dict[str, float] = {}
+    for ticker, exchange_code in exchange_codes.items():
+        params = {"AUTH": "", "EXCD": exchange_code, "SYMB": ticker}
+        try:
+            with METRICS.timer('kis_request_seconds', endpoint=PRICE_PATH):
+                res = kis_session().get(f"{config.url_base}/{PRICE_PATH}", headers=headers, params=params, timeout=10)
+            METRICS.inc('kis_requests_total', endpoint=PRICE_PATH, status=res.status_code)
+            last_price = Quote.from_payload(ticker, decode_response(res, PRICE_PATH)).last
+        except KisAuthError:
+            raise  # 토큰 문제는 모든 티커가 실패 → 호출한 쪽에서 재발급 후 재시도
+        except (requests.RequestException, KisError) as price_exception:
+            logger.warning("⚠️ %s 현재가 조회 실패: %s", ticker, price_exception)
+            continue
+        if last_price > 0:
+            etf_prices[ticker] = last_price
+        pace(request_interval)
+    return etf_prices
@@ -0,0 +1,212 @@
+"""
+한투 API 응답 디코딩 모듈
+응답 본문은 한 번만 파싱하고 (orjson이 있으면 orjson), rt_cd가 '0'이 아니면 오류 코드별 예외 발생
+자주 쓰는 응답(현재가 / 일봉 / 분봉 / 잔고 / 주문)은 문자열 숫자를 변환해 __slots__ 데이터클래스로 매핑
+시세 조회 / 토큰 발급은 공용 세션(kis_session)의 연결 풀을 재사용 (카세트가 설정돼 있으면 기록/재생)
+"""
+import json
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson은 선택 의존성 - 없으면 표준 json
+    _json_loads = json.loads
+
+from util.cassette import mount_cassette
+from util.metrics import METRICS
+
+# msg_cd → 예외 클래스 (그 외 오류 코드는 KisApiError)
+RATE_LIMIT_CODES = ('EGW00201',)  # 초당 거래건수 초과
+AUTH_ERROR_CODES = ('EGW00121', 'EGW00123', 'EGW00103')  # 유효하지 않은 / 만료된 토큰, 앱키
+
+
+_kis_session: Optional[requests.Session] = None
+_kis_session_lock = threading.Lock()
+
+
+def kis_session() -> requests.Session:
+    """한투 API 공용 세션 (keep-alive 연결 풀, 여러 스레드에서 공유)"""
+    global _kis_session
+    with _kis_session_lock:
+        if _kis_session is None:
+            _kis_session = requests.Session()
+            _kis_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+            mount_cassette(_kis_session, pool_connections=4, pool_maxsize=16)
+        return _kis_session
+
+
+class KisError(Exception):
+    """한투 API 응답 처리 실패"""
+
+
+class KisDecodeError(KisError, ValueError):
+    """응답 본문이 JSON이 아니거나 필드 값이 형식과 다름"""
+
+
+class KisHttpError(KisError):
+    """HTTP 오류 응답 (본문에 rt_cd가 없는 경우)"""
+
+    def __init__(self, endpoint: str, status_code: int, body: str):
+        super().__init__(f"[{endpoint}] HTTP {status_code}: {body[:200]}")
+        self.endpoint = endpoint
+        self.status_code = status_code
+
+
+class KisApiError(KisError):
+    """rt_cd != '0' (브로커 오류 코드)"""
+
+    def __init__(self, endpoint: str, rt_cd: str, msg_cd: str, msg1: str):
+        super().__init__(f"[{endpoint}] {msg_cd or rt_cd}: {msg1}")
+        self.endpoint = endpoint
+        self.rt_cd = rt_cd
+        self.msg_cd = msg_cd
+        self.msg1 = msg1
+
+
+class KisRateLimitError(KisApiError):
+    """초당 요청 제한 초과 (잠시 후 재시도 가능)"""
+
+
+class KisAuthError(KisApiError):
+    """접근 토큰 / 앱키 오류 (토큰 재발급 필요)"""
+
+
+def decode_response(res, endpoint: str = '') -> Dict:
+    """
+    응답 본문을 한 번만 파싱해 반환 (rt_cd가 있으면 '0'인지 확인)
+
+    Args:
+        res: requests.Response
+        endpoint: 오류 메시지 / 메트릭용 경로
+
+    Raises:
+        KisDecodeError: JSON이 아닌 본문
+        KisHttpError: HTTP 오류이면서 브로커 오류 코드도 없는 응답
+        KisApiError / KisRateLimitError / KisAuthError: rt_cd != '0'
+    """
+    try:
+        payload = _json_loads(res.content)
+    except ValueError as decode_exception:
+        if res.status_code >= 400:
+            raise KisHttpError(endpoint, res.status_code, res.text) from decode_exception
+        raise KisDecodeError(f"[{endpoint}] JSON 디코딩 실패: {decode_exception}") from decode_exception
+    if not isinstance(payload, dict):
+        raise KisDecodeError(f"[{endpoint}] 예상하지 못한 응답 형식: {type(payload).__name__}")
+
+    rt_cd = payload.get('rt_cd')
+    if rt_cd is not None and rt_cd != '0':
+        msg_cd = payload.get('msg_cd', '')
+        METRICS.inc('kis_errors_total', endpoint=endpoint, code=msg_cd or rt_cd)
+        error_class = (KisRateLimitError if msg_cd in RATE_LIMIT_CODES
+                       else KisAuthError if msg_cd in AUTH_ERROR_CODES else KisApiError)
+        raise error_class(endpoint, rt_cd, msg_cd, payload.get('msg1', '').strip())
+    if rt_cd is None and res.status_code >= 400:
+        raise KisHttpError(endpoint, res.status_code, res.text)
+    return payload
+
+
+def _number(row: Dict, field_name: str, number_type=float):
+    """문자열 숫자 필드 변환 (빈 문자열은 0)"""
+    raw_value = row.get(field_name)
+    if raw_value in ('', None):
+        return number_type(0)
+    try:
+        return number_type(float(raw_value)) if number_type is int else number_type(raw_value)
+    except (TypeError, ValueError) as conversion_exception:
+        raise KisDecodeError(f"{field_name} 값 변환 실패: {raw_value!r}") from conversion_exception
+
+
+def _output(payload: Dict, key: str):
+    try:
+        return payload[key]
+    except KeyError as missing_exception:
+        raise KisDecodeError(f"응답에 {key} 없음") from missing_exception
+
+
+@dataclass(frozen=True)
+class Quote:
+    """해외주식 현재체결가 (HHDFS00000300)"""
+    __slots__ = ('ticker', 'last', 'base', 'rate', 'volume')
+    ticker: str
+    last: float
+    base: float  # 전일 종가
+    rate: float  # 등락률 (%)
+    volume: float
+
+    @classmethod
+    def from_payload(cls, ticker: str, payload: Dict) -> 'Quote':
+        output = _output(payload, 'output')
+        return cls(ticker, _number(output, 'last'), _number(output, 'base'),
+                   _number(output, 'rate'), _number(output, 'tvol'))
+
+
+@dataclass(frozen=True)
+class Holding:
+    """해외주식 잔고 1종목 (inquire-balance output1)"""
+    __slots__ = ('ticker', 'name', 'quantity', 'average_price', 'current_price', 'profit')
+    ticker: str
+    name: str
+    quantity: int
+    average_price: float
+    current_price: float
+    profit: float  # 외화 평가 손익
+
+    @classmethod
+    def from_row(cls, row: Dict) -> 'Holding':
+        return cls(row.get('ovrs_pdno', ''), row.get('ovrs_item_name', ''), _number(row, 'ovrs_cblc_qty', int),
+                   _number(row, 'pchs_avg_pric'), _number(row, 'now_pric2'), _number(row, 'frcr_evlu_pfls_amt'))
+
+
+@dataclass(frozen=True)
+class OrderResult:
+    """주문 접수 결과"""
+    __slots__ = ('order_number', 'order_time', 'message')
+    order_number: str
+    order_time: str
+    message: str
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> 'OrderResult':
+        output = payload.get('output') or {}
+        return cls(output.get('ODNO', ''), output.get('ORD_TMD', ''), payload.get('msg1', '').strip())
+
+
+@dataclass(frozen=True)
+class OrderableCash:
+    """매수가능조회 (inquire-psbl-order output, 원화)"""
+    __slots__ = ('cash', 'max_buy_amount')
+    cash: int  # 주문 가능 현금
+    max_buy_amount: int  # 최대 매수 금액 (미수 포함)
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> 'OrderableCash':
+        output = _output(payload, 'output')
+        return cls(_number(output, 'ord_psbl_cash', int), _number(output, 'max_buy_amt', int))
+
+
+def parse_holdings(payload: Dict) -> List[Holding]:
+    """잔고 조회 응답 → 보유 수량이 있는 종목만"""
+    holdings = [Holding.from_row(row) for row in _output(payload, 'output1')]
+    return [holding for holding in holdings if holding.quantity > 0]
+
+
+def parse_daily_bars(payload: Dict) -> List[Dict]:
+    """기간별시세(HHDFS76240000) 응답 → 일봉 (오래된 순, DailyBarCache 형식)"""
+    daily_bars = [{'date': row['xymd'], 'open': _number(row, 'open'), 'high': _number(row, 'high'),
+                   'low': _number(row, 'low'), 'close': _number(row, 'clos'), 'volume': _number(row, 'tvol')}
+                  for row in _output(payload, 'output2') if row.get('xymd')]
+    daily_bars.sort(key=lambda bar: bar['date'])
+    return daily_bars
+
+
+def parse_minute_rows(payload: Dict) -> List[Dict]:
+    """분봉(HHDFS76950200) 응답 → {'ymd', 'hms', 'open', 'high', 'low', 'close', 'volume'} (응답 순서 그대로)"""
+    return [{'ymd': row['xymd'], 'hms': row['xhms'], 'open': _number(row, 'open'), 'high': _number(row, 'high'),
+             'low': _number(row, 'low'), 'close': _number(row, 'last'), 'volume': _number(row, 'evol')}
+            for row in payload.get('output2') or [] if row.get('xymd') and row.get('xhms')]
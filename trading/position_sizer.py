@@ -0,0 +1,202 @@
+"""
+포지션 크기 계산 모듈
+일봉 종가로 섹터 ETF 수익률의 이동 공분산을 유지하고, 선정된 Long/Short ETF의 목표 수량 계산
+- 공분산은 최근 lookback일 수익률의 누적 합(1차/2차)으로 관리 → 새 봉이 들어오면 O(종목²)로 갱신
+- 종가는 DailyBarCache.columns()의 BarStore memmap 뷰에서 마지막으로 반영한 봉 이후만 읽음
+- risk_parity: 상관관계까지 반영해 포지션별 위험 기여도가 같도록 비중 결정
+- vol_target: 종목별 변동성 역수로 비중 결정 (상관관계 무시)
+- 두 방식 모두 포트폴리오 연 변동성이 목표치가 되도록 전체 노출을 조정 (총 레버리지 상한 적용)
+"""
+import functools
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+SIZING_METHODS = ('risk_parity', 'vol_target')
+
+
+class RollingCovariance:
+    """최근 window개 수익률 벡터의 평균/공분산 (링 버퍼 + 누적 합)"""
+
+    def __init__(self, dimension: int, window: int):
+        self.window = window
+        self._returns = np.zeros((window, dimension))
+        self._sum = np.zeros(dimension)
+        self._outer_sum = np.zeros((dimension, dimension))
+        self._next_index = 0
+        self.count = 0
+
+    def push(self, return_vector: np.ndarray):
+        """수익률 벡터 1개 추가 (window를 넘으면 가장 오래된 것 제거)"""
+        if self.count == self.window:
+            dropped_vector = self._returns[self._next_index]
+            self._sum -= dropped_vector
+            self._outer_sum -= np.outer(dropped_vector, dropped_vector)
+        else:
+            self.count += 1
+        self._returns[self._next_index] = return_vector
+        self._sum += return_vector
+        self._outer_sum += np.outer(return_vector, return_vector)
+        self._next_index = (self._next_index + 1) % self.window
+        if self._next_index == 0:
+            # 한 바퀴마다 누적 합을 다시 계산해 뺄셈 누적 오차 제거
+            self._sum = self._returns.sum(axis=0)
+            self._outer_sum = self._returns.T @ self._returns
+
+    def covariance(self) -> np.ndarray:
+        """표본 공분산 (일간)"""
+        if self.count < 2:
+            return np.zeros_like(self._outer_sum)
+        return (self._outer_sum - np.outer(self._sum, self._sum) / self.count) / (self.count - 1)
+
+
+def risk_parity_weights(covariance: np.ndarray, iterations: int = 200, tolerance: float = 1e-10) -> np.ndarray:
+    """
+    위험 기여도 균등 비중 (순환 좌표 하강법, 합계 1)
+
+    Args:
+        covariance: 방향(Long +1 / Short −1)을 반영한 공분산 (D Σ D)
+    """
+    variances = np.diag(covariance)
+    weights = 1.0 / np.sqrt(variances)
+    weights /= weights.sum()
+    risk_budget = 1.0 / len(weights)
+    for _ in range(iterations):
+        previous_weights = weights.copy()
+        for index in range(len(weights)):
+            cross_term = covariance[index] @ weights - variances[index] * weights[index]
+            weights[index] = (-cross_term + math.sqrt(cross_term ** 2 + 4 * variances[index] * risk_budget)) / (2 * variances[index])
+        if np.abs(weights - previous_weights).max() < tolerance:
+            break
+    return weights / weights.sum()
+
+
+class PositionSizer:
+    """섹터 ETF 이동 공분산 기반 목표 수량 계산기"""
+
+    def __init__(self, tickers: List[str], daily_bar_cache, lookback_days: int = 60, method: str = 'risk_parity',
+                 target_volatility: float = 0.10, max_gross_leverage: float = 1.0):
+        """
+        Args:
+            tickers: 공분산을 유지할 ETF 티커 (유니버스 전체)
+            daily_bar_cache: 종가를 읽을 DailyBarCache (columns())
+            lookback_days: 변동성/공분산 계산에 쓰는 최근 일간 수익률 개수
+            method: risk_parity / vol_target
+            target_volatility: 목표 포트폴리오 연 변동성 (0.10 = 10%)
+            max_gross_leverage: 총 노출(Long + Short) / 자본 상한
+        """
+        self.tickers = list(tickers)
+        self.daily_bar_cache = daily_bar_cache
+        self.ticker_index = {ticker: index for index, ticker in enumerate(self.tickers)}
+        self.lookback_days = lookback_days
+        self.method = method
+        self.target_volatility = target_volatility
+        self.max_gross_leverage = max_gross_leverage
+        self.reset()
+
+    def reset(self):
+        self.rolling_covariance = RollingCovariance(len(self.tickers), self.lookback_days)
+        self.last_timestamp = 0  # 마지막으로 반영한 일봉 timestamp (epoch 초)
+        self.last_closes: Optional[np.ndarray] = None
+
+    def update(self) -> int:
+        """
+        모든 티커에 종가가 있는 새 날짜만 로그 수익률로 변환해 공분산에 반영
+
+        Returns:
+            새로 반영한 수익률 개수
+        """
+        if not self.tickers:
+            return 0
+        start = self.last_timestamp + 1 if self.last_timestamp else None
+        columns_by_ticker = [self.daily_bar_cache.columns(ticker, start) for ticker in self.tickers]
+        new_timestamps = functools.reduce(np.intersect1d, (columns['timestamp'] for columns in columns_by_ticker))
+        if not len(new_timestamps):
+            return 0
+        if len(new_timestamps) > self.lookback_days:
+            # 공백이 길면 이전 종가와 이어 붙이지 않고 최근 lookback일로 새로 채움
+            self.last_closes = None
+            new_timestamps = new_timestamps[-(self.lookback_days + 1):]
+
+        close_matrix = np.column_stack([
+            columns['close'][np.searchsorted(columns['timestamp'], new_timestamps)] for columns in columns_by_ticker
+        ])
+        if self.last_closes is not None:
+            close_matrix = np.vstack([self.last_closes, close_matrix])
+        for return_vector in np.diff(np.log(close_matrix), axis=0):
+            self.rolling_covariance.push(return_vector)
+        self.last_closes = close_matrix[-1]
+        self.last_timestamp = int(new_timestamps[-1])
+        return len(close_matrix) - 1
+
+    def size(self, long_tickers: List[str], short_tickers: List[str], capital: float,
+             prices: Dict[str, float]) -> Optional[Dict]:
+        """
+        목표 비중 / 수량 계산
+
+        Args:
+            long_tickers: Long ETF 티커
+            short_tickers: Short ETF 티커
+            capital: 운용 자본 (USD)
+            prices: 티커 → 현재가 (없으면 마지막 종가 사용)
+
+        Returns:
+            {'positions': {티커: {'side', 'weight', 'shares', 'notional', 'volatility'}},
+             'portfolio_volatility', 'gross_leverage', 'method'}
+            수익률이 부족하거나 대상 종목이 없으면 None
+        """
+        selected_tickers = [ticker for ticker in list(long_tickers) + list(short_tickers) if ticker in self.ticker_index]
+        if not selected_tickers or self.rolling_covariance.count < 2:
+            return None
+
+        with METRICS.timer('pipeline_stage_seconds', stage='sizing'):
+            selected_indices = [self.ticker_index[ticker] for ticker in selected_tickers]
+            directions = np.array([1.0 if ticker in long_tickers else -1.0 for ticker in selected_tickers])
+            annual_covariance = self.rolling_covariance.covariance()[np.ix_(selected_indices, selected_indices)] * TRADING_DAYS_PER_YEAR
+            volatilities = np.sqrt(np.diag(annual_covariance))
+            if not np.all(volatilities > 0):
+                return None
+
+            if self.method == 'risk_parity':
+                gross_weights = risk_parity_weights(annual_covariance * np.outer(directions, directions))
+            else:
+                gross_weights = (1.0 / volatilities) / (1.0 / volatilities).sum()
+            signed_weights = gross_weights * directions
+
+            # 목표 변동성에 맞춰 전체 노출 조정 (총 레버리지 상한)
+            unit_volatility = math.sqrt(float(signed_weights @ annual_covariance @ signed_weights))
+            exposure_scale = min(self.target_volatility / unit_volatility if unit_volatility > 0 else 0.0,
+                                 self.max_gross_leverage)
+            signed_weights = signed_weights * exposure_scale
+
+            last_closes = dict(zip(self.tickers, self.last_closes.tolist()))
+            positions = {}
+            for ticker, weight, volatility in zip(selected_tickers, signed_weights.tolist(), volatilities.tolist()):
+                price = prices.get(ticker) or last_closes[ticker]
+                shares = int(abs(weight) * capital // price)
+                positions[ticker] = {'side': 'long' if weight > 0 else 'short', 'weight': round(weight, 4),
+                                     'shares': shares, 'notional': round(shares * price, 2),
+                                     'volatility': round(volatility, 4)}
+
+        return {'positions': positions,
+                'portfolio_volatility': round(unit_volatility * exposure_scale, 4),
+                'gross_leverage': round(float(np.abs(signed_weights).sum()), 4),
+                'method': self.method}
+
+    @staticmethod
+    def format_sizing(sizing: Dict) -> str:
+        """Discord 알림용 목표 수량 메시지"""
+        formatted_message = (f"⚖️ 목표 수량 ({sizing['method']}, 예상 연 변동성 {sizing['portfolio_volatility']:.1%}, "
+                             f"총 노출 {sizing['gross_leverage']:.0%})\n")
+        for ticker, position in sizing['positions'].items():
+            formatted_message += (f"  • {position['side'].upper()} {ticker}: {position['shares']}주 "
+                                  f"(${position['notional']:,.0f}, 비중 {position['weight']:+.1%}, "
+                                  f"변동성 {position['volatility']:.1%})\n")
+        return formatted_message.rstrip()
@@ -2,25 +2,11 @@
 거래 신호 생성 모듈
 섹터별 감정 점수를 바탕으로 Long/Short ETF 선정
 """
-from typing import Dict
+from typing import Dict, Optional
 from datetime import datetime
 import pytz
 
-
-# 섹터와 ETF 매핑
-SECTOR_TO_ETF = {
-    "Technology": "XLK",
-    "Semiconductors": "SMH",
-    "Financials": "XLF",
-    "Healthcare": "XLV",
-    "Energy": "XLE",
-    "Airlines": "JETS",
-    "Consumer Discretionary": "XLY",
-    "Consumer Staples": "XLP",
-    "Commodities": "DBC",
-    "Utilities": "XLU",
-    "Real Estate": "XLRE"
-}
+from util.universe import Universe, get_universe
 
 
 class SignalGenerator:
@@ -28,7 +14,8 @@ class SignalGenerator:
 
     def __init__(self, num_long: int = 2, num_short: int = 1,
                  long_threshold: int = 5, short_threshold: int = -5,
-                 min_score_diff: int = 3):
+                 min_score_diff: int = 3, min_coverage: float = 0.5,
+                 low_coverage_threshold: float = 0.8, universe: Optional[Universe] = None):
         """
         Args:
             num_long: Long 포지션 개수
@@ -36,19 +23,27 @@ class SignalGenerator:
             long_threshold: Long 신호 최소 점수 (기본 +5)
             short_threshold: Short 신호 최대 점수 (기본 -5)
             min_score_diff: 같은 방향 포지션 간 최소 점수 차이 (기본 3)
+            min_coverage: 분석 커버리지가 이보다 낮으면 HOLD (기본 0.5)
+            low_coverage_threshold: 분석 커버리지가 이보다 낮으면 경고 추가 → 신뢰도 LOW (기본 0.8)
+            universe: 섹터 이름 → ETF 티커 조회용 유니버스 (기본: 현재 유니버스)
         """
         self.num_long = num_long
         self.num_short = num_short
         self.long_threshold = long_threshold
         self.short_threshold = short_threshold
         self.min_score_diff = min_score_diff
+        self.min_coverage = min_coverage
+        self.low_coverage_threshold = low_coverage_threshold
+        self.universe = universe or get_universe()
 
-    def generate_signals(self, scorechart: Dict[str, int]) -> Dict:
+    def generate_signals(self, scorechart: Dict[str, int], coverage: Optional[float] = None) -> Dict:
         """
         섹터 점수를 바탕으로 거래 신호 생성 (절대적 임계값 및 신뢰도 검증)
 
         Args:
             scorechart: 섹터별 점수 dict (예: {'Technology': 25, 'Energy': -12, ...})
+            coverage: 점수를 얻은 기사 비율 (0.0~1.0, None이면 검증 생략)
+                      분석 실패/타임아웃이 많아 커버리지가 낮으면 HOLD 또는 신뢰도 하향
 
         Returns:
             거래 신호 dict:
@@ -63,7 +58,8 @@ class SignalGenerator:
                 'short_score': 점수 또는 None,
                 'timestamp': 생성 시각,
                 'warnings': [경고 메시지 리스트],
-                'all_scores': 전체 점수 (디버깅용)
+                'all_scores': 전체 점수 (디버깅용),
+                'coverage': 분석 커버리지 또는 None
             }
         """
         sectors_sorted_by_score = sorted(scorechart.items(), key=lambda x: x[1], reverse=True)
@@ -73,6 +69,15 @@ class SignalGenerator:
 
         signal_warnings = []
 
+        if coverage is not None and coverage < self.min_coverage:
+            return self._hold_signal(
+                f'분석 커버리지 부족 ({coverage:.0%} < {self.min_coverage:.0%}) - 부분 결과로는 신호를 내지 않음',
+                signal_generation_timestamp, sectors_sorted_by_score, coverage
+            )
+
+        if coverage is not None and coverage < self.low_coverage_threshold:
+            signal_warnings.append(f"분석 커버리지 낮음 ({coverage:.0%} < {self.low_coverage_threshold:.0%})")
+
         long_eligible_sectors = [(sector, score) for sector, score in sectors_sorted_by_score
                           if score >= self.long_threshold]
 
@@ -80,20 +85,10 @@ class SignalGenerator:
                            if score <= self.short_threshold]
 
         if not long_eligible_sectors and not short_eligible_sectors:
-            return {
-                'action': 'HOLD',
-                'confidence': 'N/A',
-                'reason': f'유의미한 신호 없음 (Long 임계값: {self.long_threshold:+d}, Short 임계값: {self.short_threshold:+d})',
-                'long_etfs': [],
-                'long_sectors': [],
-                'long_scores': [],
-                'short_etf': None,
-                'short_sector': None,
-                'short_score': None,
-                'timestamp': signal_generation_timestamp,
-                'warnings': [],
-                'all_scores': sectors_sorted_by_score
-            }
+            return self._hold_signal(
+                f'유의미한 신호 없음 (Long 임계값: {self.long_threshold:+d}, Short 임계값: {self.short_threshold:+d})',
+                signal_generation_timestamp, sectors_sorted_by_score, coverage
+            )
 
         selected_long_positions = []
         if len(long_eligible_sectors) >= self.num_long:
@@ -117,11 +112,11 @@ class SignalGenerator:
 
         signal_confidence = self._calculate_confidence(selected_long_positions, selected_short_position, signal_warnings)
 
-        long_etf_tickers = [SECTOR_TO_ETF[sector] for sector, _ in selected_long_positions]
+        long_etf_tickers = [self.universe.ticker_of(sector) for sector, _ in selected_long_positions]
         long_sector_names = [sector for sector, _ in selected_long_positions]
         long_sector_scores = [score for _, score in selected_long_positions]
 
-        short_etf_ticker = SECTOR_TO_ETF[selected_short_position[0]] if selected_short_position else None
+        short_etf_ticker = self.universe.ticker_of(selected_short_position[0]) if selected_short_position else None
         short_sector_name = selected_short_position[0] if selected_short_position else None
         short_sector_score = selected_short_position[1] if selected_short_position else None
 
@@ -138,7 +133,26 @@ class SignalGenerator:
             'short_score': short_sector_score,
             'timestamp': signal_generation_timestamp,
             'warnings': signal_warnings,
-            'all_scores': sectors_sorted_by_score
+            'all_scores': sectors_sorted_by_score,
+            'coverage': coverage
+        }
+
+    def _hold_signal(self, reason, signal_generation_timestamp, sectors_sorted_by_score, coverage):
+        """HOLD 신호 dict 생성"""
+        return {
+            'action': 'HOLD',
+            'confidence': 'N/A',
+            'reason': reason,
+            'long_etfs': [],
+            'long_sectors': [],
+            'long_scores': [],
+            'short_etf': None,
+            'short_sector': None,
+            'short_score': None,
+            'timestamp': signal_generation_timestamp,
+            'warnings': [],
+            'all_scores': sectors_sorted_by_score,
+            'coverage': coverage
         }
 
     def _calculate_confidence(self, selected_long_positions, selected_short_position, signal_warnings):
@@ -168,7 +182,10 @@ class SignalGenerator:
         """
         formatted_message = "=== 거래 신호 생성 완료 ===\n"
         formatted_message += f"⏰ {signals['timestamp']}\n"
-        formatted_message += f"📊 액션: {signals['action']} | 신뢰도: {signals.get('confidence', 'N/A')}\n\n"
+        formatted_message += f"📊 액션: {signals['action']} | 신뢰도: {signals.get('confidence', 'N/A')}"
+        if signals.get('coverage') is not None:
+            formatted_message += f" | 분석 커버리지: {signals['coverage']:.0%}"
+        formatted_message += "\n\n"
 
         if signals['action'] == 'HOLD':
             formatted_message += f"💤 {signals.get('reason', '거래 신호 없음')}\n"
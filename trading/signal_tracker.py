@@ -0,0 +1,174 @@
+"""
+신호 변경 감지 모듈
+주기마다 새로 만드는 SignalGenerator 신호를 이전 보유 포지션과 비교해 바뀐 것만 이벤트로 전달
+- 히스테리시스: 진입은 SignalGenerator 임계값(±5), 청산은 더 느슨한 청산 기준(기본 ±2)
+- 최소 보유 시간: 진입 후 일정 시간 안에는 청산/교체하지 않음
+- 교체: 자리가 찼을 때 새 후보가 가장 약한 보유 종목보다 replace_margin 이상 강해야 교체
+- 커버리지가 부족한 주기(부분 결과)에는 포지션을 바꾸지 않음
+"""
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+SIDE_LONG = 'long'
+SIDE_SHORT = 'short'
+CHANGE_ENTER = 'enter'
+CHANGE_EXIT = 'exit'
+
+
+@dataclass
+class SignalChange:
+    """포지션 변경 이벤트 1건"""
+    change: str  # enter / exit
+    side: str  # long / short
+    sector: str
+    ticker: str
+    score: int
+    reason: str
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class SignalTracker:
+    """보유 포지션 상태를 유지하며 신호 변경 이벤트만 생성"""
+
+    def __init__(self, signal_generator, long_exit_threshold: int = 2, short_exit_threshold: int = -2,
+                 min_holding_seconds: float = 3600, replace_margin: int = 5):
+        """
+        Args:
+            signal_generator: 진입 임계값 / 포지션 수 / 최소 커버리지 / 유니버스를 가진 SignalGenerator
+            long_exit_threshold: Long 보유 종목 점수가 이보다 낮아지면 청산 (진입 임계값보다 높으면 진입 임계값 사용)
+            short_exit_threshold: Short 보유 종목 점수가 이보다 높아지면 청산
+            min_holding_seconds: 진입 후 청산/교체하지 않는 최소 시간 (초)
+            replace_margin: 자리가 찼을 때 교체에 필요한 점수 차이
+        """
+        self.signal_generator = signal_generator
+        self.long_exit_threshold = long_exit_threshold
+        self.short_exit_threshold = short_exit_threshold
+        self.min_holding_seconds = min_holding_seconds
+        self.replace_margin = replace_margin
+        self.positions: Dict[str, Dict[str, float]] = {SIDE_LONG: {}, SIDE_SHORT: {}}  # side → {섹터: 진입 시각}
+
+    def update(self, scorechart: Dict[str, int], coverage: Optional[float] = None,
+               now: Optional[float] = None) -> List[SignalChange]:
+        """
+        이번 주기 섹터 점수로 보유 포지션 갱신
+
+        Args:
+            scorechart: 섹터별 점수 합계
+            coverage: 분석 커버리지 (min_coverage 미만이면 변경 없음)
+            now: 현재 시각 (epoch 초, 리플레이 시 주기 시작 시각)
+
+        Returns:
+            변경 이벤트 리스트 (변화가 없으면 빈 리스트)
+        """
+        signal_generator = self.signal_generator
+        if coverage is not None and coverage < signal_generator.min_coverage:
+            logger.info("⏸️ 분석 커버리지 부족 (%.0f%%) - 포지션 변경 보류", coverage * 100)
+            return []
+        now = now if now is not None else time.time()
+
+        signal_changes = self._update_side(
+            SIDE_LONG, 1, scorechart, now, signal_generator.num_long,
+            enter_level=signal_generator.long_threshold,
+            exit_level=min(self.long_exit_threshold, signal_generator.long_threshold))
+        signal_changes += self._update_side(
+            SIDE_SHORT, -1, scorechart, now, signal_generator.num_short,
+            enter_level=-signal_generator.short_threshold,
+            exit_level=min(-self.short_exit_threshold, -signal_generator.short_threshold))
+
+        for signal_change in signal_changes:
+            METRICS.inc('signal_changes_total', change=signal_change.change, side=signal_change.side)
+        return signal_changes
+
+    def _update_side(self, side: str, direction: int, scorechart: Dict[str, int], now: float, slot_count: int,
+                     enter_level: int, exit_level: int) -> List[SignalChange]:
+        """
+        한 방향(Long/Short) 포지션 갱신 (direction을 곱한 점수 = 강도, 클수록 해당 방향으로 강한 신호)
+        """
+        held_positions = self.positions[side]
+        other_side_positions = self.positions[SIDE_SHORT if side == SIDE_LONG else SIDE_LONG]
+        signal_changes: List[SignalChange] = []
+
+        def strength(sector: str) -> int:
+            return direction * scorechart.get(sector, 0)
+
+        def can_leave(sector: str) -> bool:
+            return now - held_positions[sector] >= self.min_holding_seconds
+
+        def record(change: str, sector: str, reason: str):
+            if change == CHANGE_ENTER:
+                held_positions[sector] = now
+            else:
+                del held_positions[sector]
+            signal_changes.append(SignalChange(change, side, sector, self.signal_generator.universe.ticker_of(sector),
+                                               scorechart.get(sector, 0), reason))
+
+        # 1. 청산 기준 아래로 내려간 보유 종목 (최소 보유 시간이 지난 것만)
+        for sector in list(held_positions):
+            if strength(sector) < exit_level and can_leave(sector):
+                record(CHANGE_EXIT, sector, f"청산 기준 이탈 ({direction * exit_level:+d})")
+
+        # 포지션 수 설정이 줄었으면 약한 종목부터 정리
+        while len(held_positions) > slot_count:
+            leavable_sectors = [sector for sector in held_positions if can_leave(sector)]
+            if not leavable_sectors:
+                break
+            record(CHANGE_EXIT, min(leavable_sectors, key=strength), "포지션 수 축소")
+
+        # 2. 진입 임계값을 넘은 새 후보 (강한 순) → 빈 자리 채우기, 자리가 없으면 충분히 강할 때만 교체
+        candidate_sectors = sorted(
+            (sector for sector in scorechart
+             if strength(sector) >= enter_level and sector not in held_positions and sector not in other_side_positions),
+            key=strength, reverse=True)
+        for sector in candidate_sectors:
+            if len(held_positions) < slot_count:
+                record(CHANGE_ENTER, sector, f"진입 임계값 돌파 ({direction * enter_level:+d})")
+                continue
+            leavable_sectors = [held_sector for held_sector in held_positions if can_leave(held_sector)]
+            if not leavable_sectors:
+                break
+            weakest_sector = min(leavable_sectors, key=strength)
+            if strength(sector) - strength(weakest_sector) < self.replace_margin:
+                break
+            record(CHANGE_EXIT, weakest_sector, f"{sector}로 교체")
+            record(CHANGE_ENTER, sector, f"{weakest_sector} 대비 {strength(sector) - strength(weakest_sector)}점 우위")
+
+        return signal_changes
+
+    def checkpoint_state(self) -> Dict:
+        """체크포인트용 상태 (방향별 보유 섹터와 진입 시각)"""
+        return {'positions': self.positions}
+
+    def restore_state(self, state: Dict):
+        for side in (SIDE_LONG, SIDE_SHORT):
+            self.positions[side] = dict(state['positions'].get(side, {}))
+
+    def holdings(self) -> Dict[str, List[str]]:
+        """방향별 보유 섹터 (진입 순)"""
+        return {side: sorted(held_positions, key=held_positions.get) for side, held_positions in self.positions.items()}
+
+    def format_changes(self, signal_changes: List[SignalChange]) -> str:
+        """Discord 알림용 변경 이벤트 메시지"""
+        change_labels = {CHANGE_ENTER: '진입', CHANGE_EXIT: '청산'}
+        change_icons = {CHANGE_ENTER: '🟢', CHANGE_EXIT: '⚪'}
+        formatted_message = f"🔔 신호 변경 {len(signal_changes)}건\n"
+        for signal_change in signal_changes:
+            formatted_message += (f"  • {change_icons[signal_change.change]} {signal_change.side.upper()} "
+                                  f"{change_labels[signal_change.change]} {signal_change.ticker} ({signal_change.sector}) "
+                                  f"{signal_change.score:+d}점 - {signal_change.reason}\n")
+        formatted_message += self.format_holdings()
+        return formatted_message
+
+    def format_holdings(self) -> str:
+        universe = self.signal_generator.universe
+        current_holdings = self.holdings()
+        long_tickers = ", ".join(universe.ticker_of(sector) for sector in current_holdings[SIDE_LONG]) or "없음"
+        short_tickers = ", ".join(universe.ticker_of(sector) for sector in current_holdings[SIDE_SHORT]) or "없음"
+        return f"📌 보유: LONG {long_tickers} / SHORT {short_tickers}"
@@ -0,0 +1,99 @@
+"""
+추가 전략 프로필 (STRATEGIES) - 수집/분석 한 번의 섹터 점수를 여러 전략으로 팬아웃
+- 전략마다 SignalGenerator 파라미터 / SignalTracker 보유 포지션 / PositionSizer / 계좌(CANO, ACNT_PRDT_CD) / 토큰을 따로 가짐
+- 전략별 평가(신호 → 변경 감지 → 목표 수량)는 스레드 풀에서 병렬 실행, 한 전략의 오류는 다른 전략에 영향 없음
+- 일봉 캐시는 기본 전략과 공유 (티커별 하루 한 번 조회)
+"""
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from trading import token_fetch
+
+
+@dataclass
+class Strategy:
+    """전략 프로필 1개의 실행 상태"""
+    name: str
+    config: Any  # 기본 설정에 프로필 값을 덮어쓴 AppConfig
+    signal_generator: Any
+    signal_tracker: Any
+    position_sizer: Optional[Any] = None
+    token_file: str = ''  # 빈 문자열이면 기본 토큰(token_fetch.ACCESS_TOKEN) 공유
+    access_token: str = ''
+    last_signals: Optional[Dict] = None
+
+    @property
+    def account(self) -> str:
+        if not self.config.cano:
+            return '-'
+        return f"{self.config.cano}-{self.config.acnt_prdt_cd}" if self.config.acnt_prdt_cd else self.config.cano
+
+    def token(self, refresh: bool = False) -> Optional[str]:
+        """
+        전략 앱키로 발급한 한투 토큰 (앱키가 기본 설정과 같으면 기본 토큰 공유, 재사용 기간이 지나면 다시 발급)
+
+        Args:
+            refresh: 캐시를 버리고 새로 발급 (KisAuthError 후 - token_fetch.with_access_token)
+        """
+        if not self.token_file:
+            # 기본 설정으로 발급 (전략 설정으로 발급하면 기본 토큰 파일 / ACCESS_TOKEN을 덮어씀)
+            return token_fetch.current_access_token(refresh=refresh)
+        if refresh:
+            token_fetch.invalidate_token_file(self.token_file)
+            self.access_token = ''
+        expires_at = token_fetch.token_expires_at(self.token_file)
+        if not self.access_token or expires_at is None or expires_at <= datetime.datetime.now():
+            self.access_token = token_fetch.issue_access_token(self.config, self.token_file) or ''
+        return self.access_token or None
+
+
+class StrategySet:
+    """이름 → Strategy (설정 순서 유지)"""
+
+    def __init__(self):
+        self.strategies: Dict[str, Strategy] = {}
+
+    def __len__(self) -> int:
+        return len(self.strategies)
+
+    def evaluate(self, evaluate_strategy: Callable[[Strategy], Any]) -> List[Tuple[Strategy, Any, Optional[Exception]]]:
+        """
+        전략마다 evaluate_strategy(strategy)를 병렬 실행
+
+        Returns:
+            [(전략, 결과, 예외 또는 None), ...] (설정 순서)
+        """
+        if not self.strategies:
+            return []
+        with ThreadPoolExecutor(max_workers=len(self.strategies), thread_name_prefix='strategy') as executor:
+            strategy_futures = [(strategy, executor.submit(evaluate_strategy, strategy))
+                                for strategy in self.strategies.values()]
+        evaluations = []
+        for strategy, strategy_future in strategy_futures:
+            try:
+                evaluations.append((strategy, strategy_future.result(), None))
+            except Exception as strategy_exception:
+                evaluations.append((strategy, None, strategy_exception))
+        return evaluations
+
+    def checkpoint_state(self) -> Dict:
+        """체크포인트용 상태 (전략별 보유 포지션 + 마지막 신호)"""
+        return {name: {'tracker': strategy.signal_tracker.checkpoint_state(), 'last_signals': strategy.last_signals}
+                for name, strategy in self.strategies.items()}
+
+    def restore_state(self, state: Dict):
+        """이름이 같은 전략만 복원 (설정에서 빠진 전략은 버림)"""
+        for name, strategy_state in state.items():
+            strategy = self.strategies.get(name)
+            if strategy is not None:
+                strategy.signal_tracker.restore_state(strategy_state['tracker'])
+                strategy.last_signals = strategy_state['last_signals']
+
+    def status(self) -> Dict:
+        """상태 API용 전략별 계좌 / 보유 포지션 / 마지막 신호"""
+        return {name: {'account': strategy.account,
+                       'holdings': strategy.signal_tracker.holdings(),
+                       'action': strategy.last_signals['action'] if strategy.last_signals else None}
+                for name, strategy in self.strategies.items()}
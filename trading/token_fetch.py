@@ -1,76 +1,162 @@
-import yaml
 import os
-import requests
 import json
 import datetime
+from typing import Callable, Optional, TypeVar
+
+from trading.kis_response import KisAuthError, kis_session
+from util.config import get_config
+from util.metrics import METRICS
+from util.logger import get_logger
+
+logger = get_logger(__name__)
 
-config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
-with open(config_path, encoding='UTF-8') as f:
-    _cfg = yaml.load(f, Loader=yaml.FullLoader)
-APP_KEY = _cfg['APP_KEY']
-APP_SECRET = _cfg['APP_SECRET']
 ACCESS_TOKEN = ""
-CANO = _cfg['CANO']
-ACNT_PRDT_CD = _cfg['ACNT_PRDT_CD']
-URL_BASE = _cfg['URL_BASE']
 TOKEN_FILE = "token_info.json"
+TOKEN_REUSE_WINDOW = datetime.timedelta(hours=1)  # 발급 후 이 시간 안에는 캐시된 토큰 재사용
+
+RequestResult = TypeVar('RequestResult')
+
+
+def token_expires_at(token_file=TOKEN_FILE):
+    """
+    캐시된 토큰의 재사용 만료 시각 (상태 API / 전략별 토큰 갱신용)
+
+    Returns:
+        datetime 또는 None (캐시 파일이 없거나 손상됨)
+    """
+    try:
+        with open(token_file, 'r') as f:
+            token_data = json.load(f)
+        return datetime.datetime.strptime(token_data['issued_at'], "%Y-%m-%d %H:%M:%S") + TOKEN_REUSE_WINDOW
+    except (OSError, json.JSONDecodeError, KeyError, ValueError):
+        return None
+
+def get_access_token(config=None):
+    """
+    토큰 발급 및 로컬 캐싱 관리 (발급/재사용한 토큰은 ACCESS_TOKEN에 보관)
 
-def get_access_token():
-    """토큰 발급 및 로컬 캐싱 관리"""
+    Args:
+        config: AppConfig (생략 시 공용 설정 사용)
+    """
     global ACCESS_TOKEN
-    
+    access_token = issue_access_token(config or get_config(), TOKEN_FILE)
+    if access_token:
+        ACCESS_TOKEN = access_token
+    return access_token
+
+
+def current_access_token(config=None, refresh: bool = False) -> Optional[str]:
+    """
+    기본 계좌 토큰 (기본 토큰을 쓰는 모든 곳의 단일 진입점)
+    ACCESS_TOKEN이 재사용 기간 안이면 그대로, 지났으면 다시 발급 (장시간 실행 중 만료된 토큰을 계속 보내지 않도록)
+
+    Args:
+        config: AppConfig (생략 시 공용 설정 사용)
+        refresh: 캐시 파일을 버리고 새로 발급 (KisAuthError 후)
+    """
+    global ACCESS_TOKEN
+    if refresh:
+        invalidate_token_file(TOKEN_FILE)
+        ACCESS_TOKEN = ""
+    expires_at = token_expires_at(TOKEN_FILE)
+    if ACCESS_TOKEN and expires_at is not None and expires_at > datetime.datetime.now():
+        return ACCESS_TOKEN
+    return get_access_token(config)
+
+
+def invalidate_token_file(token_file=TOKEN_FILE):
+    """캐시된 토큰 파일 삭제 (서버가 토큰을 거부했을 때 - 다음 발급은 재사용하지 않고 새로 요청)"""
+    try:
+        os.remove(token_file)
+    except FileNotFoundError:
+        pass
+    except OSError as remove_exception:
+        logger.warning("⚠️ 토큰 캐시 파일 삭제 실패 [%s]: %s", token_file, remove_exception)
+
+
+def with_access_token(request: Callable[[Optional[str]], RequestResult],
+                      token_provider: Optional[Callable[..., Optional[str]]] = None, config=None) -> RequestResult:
+    """
+    request(토큰) 실행 - KisAuthError(만료/무효 토큰)면 토큰을 다시 발급해 한 번만 재시도
+
+    Args:
+        request: 토큰을 받아 한투 API를 호출하는 함수
+        token_provider: refresh 인자를 받는 토큰 함수 (기본: current_access_token, 추가 전략은 Strategy.token)
+        config: token_provider가 없을 때 기본 토큰 발급에 쓸 AppConfig
+    """
+    if token_provider is None:
+        def token_provider(refresh=False):
+            return current_access_token(config, refresh=refresh)
+    try:
+        return request(token_provider())
+    except KisAuthError as auth_exception:
+        METRICS.inc('kis_token_refreshes_total')
+        logger.warning("⚠️ 한투 인증 오류 - 토큰 재발급 후 재시도: %s", auth_exception)
+        return request(token_provider(refresh=True))
+
+
+def issue_access_token(config, token_file=TOKEN_FILE):
+    """
+    token_file에 1시간 이내 발급한 토큰이 있으면 재사용, 없으면 config의 앱키로 새로 발급해 저장
+    (ACCESS_TOKEN은 바꾸지 않음 - 앱키가 다른 추가 전략은 전략별 파일로 호출)
+
+    Args:
+        config: AppConfig (app_key, app_secret, url_base)
+        token_file: 토큰 캐시 파일
+    """
     # 1. 기존 저장된 파일이 있는지 확인
-    if os.path.exists(TOKEN_FILE):
+    if os.path.exists(token_file):
         try:
-            with open(TOKEN_FILE, 'r') as f:
+            with open(token_file, 'r') as f:
                 token_data = json.load(f)
             
             # 저장된 발급 시간 문자열을 datetime 객체로 변환
             last_issued = datetime.datetime.strptime(token_data['issued_at'], "%Y-%m-%d %H:%M:%S")
             
             # 2. 시간 차이 계산 (현재 시간 - 마지막 발급 시간)
-            if datetime.datetime.now() - last_issued < datetime.timedelta(hours=1):
-                ACCESS_TOKEN = token_data['access_token']
-                print(f"캐시 사용: 1시간 이내에 발급된 토큰을 재사용합니다. (발급시각: {token_data['issued_at']})")
-                return ACCESS_TOKEN
+            if datetime.datetime.now() - last_issued < TOKEN_REUSE_WINDOW:
+                logger.info("캐시 사용: 1시간 이내에 발급된 토큰을 재사용합니다. (발급시각: %s)", token_data['issued_at'])
+                return token_data['access_token']
             
         except (json.JSONDecodeError, KeyError, ValueError):
             # 파일이 손상되었거나 형식이 다를 경우 새로 발급받도록 진행
             pass
 
     # 3. 1분이 지났거나 저장된 정보가 없으면 새로 발급 요청
-    print("신규 요청: 1시간이 지났거나 정보가 없어 서버에서 새 토큰을 가져옵니다.")
+    logger.info("신규 요청: 1시간이 지났거나 정보가 없어 서버에서 새 토큰을 가져옵니다.")
     headers = {"content-type": "application/json"}
     body = {
         "grant_type": "client_credentials",
-        "appkey": APP_KEY, 
-        "appsecret": APP_SECRET
+        "appkey": config.app_key,
+        "appsecret": config.app_secret
     }
     PATH = "oauth2/tokenP"
-    URL = f"{URL_BASE}/{PATH}"
+    URL = f"{config.url_base}/{PATH}"
     
     try:
-        res = requests.post(URL, headers=headers, data=json.dumps(body))
+        with METRICS.timer('kis_request_seconds', endpoint=PATH):
+            res = kis_session().post(URL, headers=headers, data=json.dumps(body))
+        METRICS.inc('kis_requests_total', endpoint=PATH, status=res.status_code)
         res_data = res.json()
         
         if "access_token" in res_data:
             # print(res_data["access_token"])
-            ACCESS_TOKEN = res_data["access_token"]
+            access_token = res_data["access_token"]
             
             # 4. 새로운 토큰 정보와 현재 시간을 파일에 기록
             save_data = {
-                "access_token": ACCESS_TOKEN,
+                "access_token": access_token,
                 "issued_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
-            with open(TOKEN_FILE, 'w') as f:
+            with open(token_file, 'w') as f:
                 json.dump(save_data, f, indent=4)
         
-            return ACCESS_TOKEN
+            return access_token
 
         else:
-            print("토큰 발급 실패:", res_data.get("msg1", "알 수 없는 에러"))
+            logger.error("토큰 발급 실패: %s", res_data.get("msg1", "알 수 없는 에러"))
             return None
             
     except Exception as e:
-        print(f"네트워크 또는 기타 오류 발생: {e}")
+        logger.error("네트워크 또는 기타 오류 발생: %s", e)
         return None
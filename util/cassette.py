@@ -0,0 +1,254 @@
+"""
+외부 I/O 기록/재생 카세트 (OpenAI / RSS / 한투)
+- record: 실제로 요청하면서 요청 키 → 응답(상태 코드 / 헤더 / 본문) + 걸린 시간을 JSON Lines 파일에 한 줄씩 추가
+- replay: 네트워크 없이 같은 요청 키의 응답을 기록 순서대로 돌려줌 (기록보다 많이 요청하면 마지막 응답 반복)
+  걸린 시간 × CASSETTE_LATENCY_SCALE만큼 대기 (0이면 최대 속도, 1이면 기록 당시 속도) - 요청 간격 대기도 같은 배율
+- 요청 키: 메서드 + URL + 본문 + tr_id 헤더 (인증 헤더는 저장하지 않고, 본문의 appkey / appsecret은 키에서 제외)
+- 연결 실패처럼 응답이 없었던 요청은 기록하지 않음 (재생 시 기록에 없는 요청은 CassetteMissError)
+
+requests 세션은 CassetteAdapter를 마운트하고 (mount_cassette), OpenAI는 SDK 호출 단위로 감쌈 (Cassette.call)
+"""
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+KEY_HEADERS = ('tr_id',)  # 같은 URL이라도 거래 ID가 다르면 다른 요청
+SECRET_BODY_FIELDS = ('appkey', 'appsecret')
+SKIPPED_RESPONSE_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'set-cookie')  # 본문은 디코딩된 상태로 저장
+
+
+class CassetteMissError(requests.ConnectionError):
+    """재생 중 기록에 없는 요청 (호출하는 쪽에서 네트워크 오류와 같이 처리)"""
+
+
+def request_key(kind: str, key_fields: Dict) -> str:
+    """요청 키 (kind + 필드를 정렬한 JSON의 SHA-256)"""
+    canonical_request = json.dumps(key_fields, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{kind}\n{canonical_request}".encode('utf-8')).hexdigest()
+
+
+class Cassette:
+    """카세트 파일 1개 (여러 스레드에서 공유)"""
+
+    def __init__(self, file_path: str, mode: str, latency_scale: float = 0.0):
+        """
+        Args:
+            file_path: JSON Lines 파일 경로 (record면 기존 파일에 이어서 기록)
+            mode: 'record' / 'replay'
+            latency_scale: 재생 시 기록된 시간 / 요청 간격 대기에 곱할 배율
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"카세트 모드 오류: {mode}")
+        self.file_path = file_path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        self._recorded: Dict[str, List[Dict]] = defaultdict(list)
+        self._replay_positions: Dict[str, int] = defaultdict(int)
+        self._file = None
+        if mode == 'record':
+            os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+            self._file = open(file_path, 'a', encoding='utf-8')
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self._recorded[interaction['key']].append(interaction)
+            logger.info("📼 카세트 재생: %s (요청 %d종, 응답 %d개, 지연 배율 %.2f)", file_path, len(self._recorded),
+                        sum(len(interactions) for interactions in self._recorded.values()), latency_scale)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def record(self, kind: str, key_fields: Dict, request_summary: str, response: Dict, elapsed_seconds: float):
+        """응답 1개를 파일 끝에 추가 (한 줄씩 flush - 도중에 죽어도 앞부분은 재생 가능)"""
+        interaction_line = json.dumps({
+            'kind': kind,
+            'key': request_key(kind, key_fields),
+            'request': request_summary,
+            'response': response,
+            'elapsed': round(elapsed_seconds, 4),
+        }, ensure_ascii=False)
+        with self._lock:
+            self._file.write(interaction_line + '\n')
+            self._file.flush()
+        METRICS.inc('cassette_interactions_total', kind=kind, outcome='recorded')
+
+    def replay(self, kind: str, key_fields: Dict, request_summary: str) -> Dict:
+        """
+        기록된 응답 (같은 키는 기록 순서대로, 다 쓰면 마지막 응답 반복) - 기록된 시간 × latency_scale만큼 대기
+
+        Raises:
+            CassetteMissError: 기록에 없는 요청
+        """
+        key = request_key(kind, key_fields)
+        with self._lock:
+            interactions = self._recorded.get(key)
+            if not interactions:
+                METRICS.inc('cassette_interactions_total', kind=kind, outcome='missed')
+                raise CassetteMissError(f"카세트에 없는 요청: {request_summary}")
+            position = self._replay_positions[key]
+            self._replay_positions[key] = position + 1
+        if position >= len(interactions):
+            METRICS.inc('cassette_interactions_total', kind=kind, outcome='repeated')
+        else:
+            METRICS.inc('cassette_interactions_total', kind=kind, outcome='replayed')
+        interaction = interactions[min(position, len(interactions) - 1)]
+        if self.latency_scale > 0:
+            time.sleep(interaction['elapsed'] * self.latency_scale)
+        return interaction['response']
+
+    def call(self, kind: str, key_fields: Dict, send: Callable[[], Any], encode: Callable[[Any], Dict],
+             decode: Callable[[Dict], Any]):
+        """
+        HTTP가 아닌 SDK 호출 기록/재생
+
+        Args:
+            key_fields: 요청 키 필드 (비밀 값은 넣지 말 것)
+            send: 실제 호출 (record 모드)
+            encode: 호출 결과 → 저장할 dict
+            decode: 저장된 dict → 호출 결과 대신 쓸 객체
+        """
+        request_summary = f"{kind} {key_fields.get('model', '')}".strip()
+        if self.replaying:
+            return decode(self.replay(kind, key_fields, request_summary))
+        started_at = time.perf_counter()
+        result = send()
+        self.record(kind, key_fields, request_summary, encode(result), time.perf_counter() - started_at)
+        return result
+
+    def close(self):
+        if self._file is not None:
+            with self._lock:
+                self._file.close()
+                self._file = None
+
+
+def _http_key_fields(request: requests.PreparedRequest) -> Dict:
+    body = request.body or b''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    try:
+        json_body = json.loads(body) if body else None
+    except ValueError:
+        json_body = None
+    if isinstance(json_body, dict):
+        body_key = {field: value for field, value in json_body.items() if field not in SECRET_BODY_FIELDS}
+    else:
+        body_key = hashlib.sha256(body).hexdigest() if body else ''
+    return {
+        'method': request.method,
+        'url': request.url,
+        'body': body_key,
+        'headers': {header: request.headers[header] for header in KEY_HEADERS if header in request.headers},
+    }
+
+
+def _encode_http_response(response: requests.Response) -> Dict:
+    encoded_response = {
+        'status': response.status_code,
+        'reason': response.reason,
+        'headers': {header: value for header, value in response.headers.items()
+                    if header.lower() not in SKIPPED_RESPONSE_HEADERS},
+    }
+    try:
+        encoded_response['body'] = response.content.decode('utf-8')
+    except UnicodeDecodeError:
+        encoded_response['body_base64'] = base64.b64encode(response.content).decode('ascii')
+    return encoded_response
+
+
+def _decode_http_response(request: requests.PreparedRequest, recorded_response: Dict) -> requests.Response:
+    if 'body_base64' in recorded_response:
+        body = base64.b64decode(recorded_response['body_base64'])
+    else:
+        body = recorded_response['body'].encode('utf-8')
+    response = requests.Response()
+    response.status_code = recorded_response['status']
+    response.reason = recorded_response.get('reason', '')
+    response.headers = CaseInsensitiveDict(recorded_response['headers'])
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = io.BytesIO(body)
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class CassetteAdapter(HTTPAdapter):
+    """requests 세션용 기록/재생 어댑터 (record 모드는 실제 요청 후 기록 - 스트리밍 응답도 본문 전체를 읽음)"""
+
+    def __init__(self, cassette: Cassette, **adapter_arguments):
+        super().__init__(**adapter_arguments)
+        self.cassette = cassette
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key_fields = _http_key_fields(request)
+        request_summary = f"{request.method} {request.url}"
+        if self.cassette.replaying:
+            return _decode_http_response(request, self.cassette.replay('http', key_fields, request_summary))
+        started_at = time.perf_counter()
+        response = super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        encoded_response = _encode_http_response(response)  # response.content를 읽음 (이후 iter_content는 읽은 본문 사용)
+        self.cassette.record('http', key_fields, request_summary, encoded_response, time.perf_counter() - started_at)
+        return response
+
+
+_active_cassette: Optional[Cassette] = None
+
+
+def install_cassette(cassette: Optional[Cassette]):
+    """공용 카세트 설정 (세션 / 클라이언트를 만들기 전에 호출, None이면 해제)"""
+    global _active_cassette
+    if _active_cassette is not None and _active_cassette is not cassette:
+        _active_cassette.close()
+    _active_cassette = cassette
+
+
+def active_cassette() -> Optional[Cassette]:
+    return _active_cassette
+
+
+def mount_cassette(session: requests.Session, **adapter_arguments) -> requests.Session:
+    """
+    카세트가 설정돼 있으면 세션의 http:// / https://에 CassetteAdapter 마운트
+
+    Args:
+        adapter_arguments: HTTPAdapter 인자 (연결 풀 크기 등 - 세션에 원래 마운트하던 값)
+    """
+    if _active_cassette is not None:
+        cassette_adapter = CassetteAdapter(_active_cassette, **adapter_arguments)
+        session.mount('http://', cassette_adapter)
+        session.mount('https://', cassette_adapter)
+    return session
+
+
+def paced_seconds(seconds: float) -> float:
+    """요청 간격 대기 시간 (재생 중이면 latency_scale 배율 - 기본 0이라 대기 없음)"""
+    if _active_cassette is not None and _active_cassette.replaying:
+        return seconds * _active_cassette.latency_scale
+    return seconds
+
+
+def pace(seconds: float):
+    """rate limit 방지용 요청 간격 대기 (재생 중에는 paced_seconds()만큼)"""
+    paced = paced_seconds(seconds)
+    if paced > 0:
+        time.sleep(paced)
@@ -0,0 +1,122 @@
+"""
+파이프라인 상태 체크포인트 (재시작 시 캐시/포지션/반복 번호 복원)
+- 구성 요소마다 checkpoint_state() / restore_state(state)를 제공하고, 여기서는 이름별로 모아 pickle(프로토콜 5)로 저장
+- 저장은 임시 파일에 쓰고 fsync 후 os.replace (저장 중에 죽어도 이전 체크포인트가 그대로 남음)
+- 직접 쓴 파일만 읽을 것 (pickle은 신뢰할 수 없는 입력을 읽으면 안 됨)
+"""
+import os
+import pickle
+import time
+from typing import Dict, Optional
+
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+CHECKPOINT_VERSION = 1
+PICKLE_PROTOCOL = 5
+
+
+def write_checkpoint(file_path: str, payload: Dict) -> int:
+    """
+    payload를 원자적으로 저장
+
+    Returns:
+        저장한 바이트 수
+    """
+    checkpoint_bytes = pickle.dumps(payload, protocol=PICKLE_PROTOCOL)
+    temporary_path = f"{file_path}.tmp"
+    with open(temporary_path, 'wb') as f:
+        f.write(checkpoint_bytes)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary_path, file_path)
+    return len(checkpoint_bytes)
+
+
+def read_checkpoint(file_path: str) -> Optional[Dict]:
+    """저장된 payload (없거나 손상됐거나 버전이 다르면 None)"""
+    if not os.path.exists(file_path):
+        return None
+    try:
+        with open(file_path, 'rb') as f:
+            payload = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError) as load_exception:
+        logger.warning("⚠️ 체크포인트 읽기 실패 (처음부터 시작): %s", load_exception)
+        return None
+    if not isinstance(payload, dict) or payload.get('version') != CHECKPOINT_VERSION:
+        logger.warning("⚠️ 체크포인트 형식이 달라 무시합니다: %s", file_path)
+        return None
+    return payload
+
+
+class PipelineCheckpoint:
+    """구성 요소 상태를 한 파일로 저장/복원"""
+
+    def __init__(self, file_path: str, every_cycles: int = 1):
+        """
+        Args:
+            file_path: 체크포인트 파일 경로
+            every_cycles: 몇 주기마다 저장할지
+        """
+        self.file_path = file_path
+        self.every_cycles = every_cycles
+
+    def load(self, components: Dict[str, object]) -> int:
+        """
+        저장된 상태를 구성 요소에 복원 (None인 구성 요소와 저장되지 않은 항목은 건너뜀)
+
+        Args:
+            components: 이름 → checkpoint_state() / restore_state()를 가진 객체
+
+        Returns:
+            저장 당시 반복 번호 (체크포인트가 없으면 0)
+        """
+        started_at = time.perf_counter()
+        payload = read_checkpoint(self.file_path)
+        if payload is None:
+            return 0
+        restored_names = []
+        for name, component in components.items():
+            component_state = payload['state'].get(name)
+            if component is None or component_state is None:
+                continue
+            try:
+                component.restore_state(component_state)
+                restored_names.append(name)
+            except Exception as restore_exception:
+                logger.warning("⚠️ 체크포인트 복원 실패 (%s): %s", name, restore_exception)
+        elapsed_seconds = time.perf_counter() - started_at
+        METRICS.observe('checkpoint_seconds', elapsed_seconds, operation='load')
+        logger.info("♻️ 체크포인트 복원: 반복 #%d, %.0f초 전 저장, %.0fms (%s)", payload['iteration'],
+                    time.time() - payload['saved_at'], elapsed_seconds * 1000, ", ".join(restored_names))
+        return payload['iteration']
+
+    def save(self, components: Dict[str, object], iteration: int, force: bool = False) -> bool:
+        """
+        every_cycles 주기마다 (force면 항상) 구성 요소 상태 저장 - 구성 요소를 쓰는 작업이 없을 때 호출
+
+        Returns:
+            저장 여부
+        """
+        if not force and iteration % self.every_cycles:
+            return False
+        started_at = time.perf_counter()
+        payload = {
+            'version': CHECKPOINT_VERSION,
+            'saved_at': time.time(),
+            'iteration': iteration,
+            'state': {name: component.checkpoint_state() for name, component in components.items()
+                      if component is not None},
+        }
+        try:
+            checkpoint_size = write_checkpoint(self.file_path, payload)
+        except (OSError, pickle.PicklingError) as save_exception:
+            logger.warning("⚠️ 체크포인트 저장 실패: %s", save_exception)
+            return False
+        elapsed_seconds = time.perf_counter() - started_at
+        METRICS.observe('checkpoint_seconds', elapsed_seconds, operation='save')
+        logger.debug("💾 체크포인트 저장: 반복 #%d, %.1fKB, %.0fms", iteration, checkpoint_size / 1024,
+                     elapsed_seconds * 1000)
+        return True
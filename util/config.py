@@ -0,0 +1,571 @@
+"""
+통합 설정 모듈
+config.yaml을 한 번만 파싱하여 불변 AppConfig 객체로 검증 후 모든 모듈에 주입
+파일 변경(mtime) 감지 시 루프 재시작 없이 핫 리로드 지원
+"""
+import logging
+import os
+import threading
+from dataclasses import dataclass, field, fields, replace
+from typing import Dict, List, Optional, Tuple, get_origin
+
+import yaml
+
+from util.universe import Universe
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'config.yaml')
+
+SUPPORTED_OPENAI_MODELS = ('gpt-5-nano', 'gpt-4o-mini', 'gpt-4o', 'gpt-4-turbo', 'gpt-3.5-turbo', 'gpt-4')
+REQUIRED_KIS_FIELDS = ('APP_KEY', 'APP_SECRET', 'CANO', 'ACNT_PRDT_CD', 'URL_BASE')
+TYPE_NAMES = {bool: 'true/false', int: '정수', float: '숫자', str: '문자열', dict: 'key: value 목록', list: '리스트'}
+# STRATEGIES 프로필에서 바꿀 수 있는 설정 (신호 / 포지션 / 계좌 / 알림)
+STRATEGY_FIELDS = (
+    'NUM_LONG_POSITIONS', 'NUM_SHORT_POSITIONS', 'MIN_ANALYSIS_COVERAGE', 'LOW_COVERAGE_THRESHOLD',
+    'SIGNAL_LONG_THRESHOLD', 'SIGNAL_SHORT_THRESHOLD', 'SIGNAL_MIN_SCORE_DIFF',
+    'SIGNAL_LONG_EXIT_THRESHOLD', 'SIGNAL_SHORT_EXIT_THRESHOLD', 'SIGNAL_MIN_HOLDING_MINUTES', 'SIGNAL_REPLACE_MARGIN',
+    'SIZING_CAPITAL_USD', 'SIZING_METHOD', 'SIZING_TARGET_VOLATILITY', 'SIZING_LOOKBACK_DAYS', 'SIZING_MAX_GROSS_LEVERAGE',
+    'APP_KEY', 'APP_SECRET', 'CANO', 'ACNT_PRDT_CD', 'DISCORD_WEBHOOK_URL',
+)
+
+
+class ConfigError(ValueError):
+    """설정 파일 누락 또는 검증 실패"""
+
+
+def coerce_field_value(config_field, value):
+    """
+    YAML 값을 AppConfig 필드 타입으로 변환
+    - 계좌번호처럼 숫자로 읽힌 문자열 필드는 str로, "3" 같은 숫자 문자열은 int / float로
+    - bool은 true/false (문자열 "true"/"false" 포함)만 허용
+
+    Raises:
+        ConfigError: 변환할 수 없는 값
+    """
+    field_type = get_origin(config_field.type) or config_field.type
+    yaml_key = config_field.name.upper()
+    try:
+        if field_type is bool:
+            if isinstance(value, str) and value.strip().lower() in ('true', 'false'):
+                return value.strip().lower() == 'true'
+            if isinstance(value, bool):
+                return value
+        elif field_type in (int, float) and not isinstance(value, bool):
+            if isinstance(value, (int, float, str)):
+                number = float(value)
+                if field_type is float:
+                    return number
+                if number.is_integer():
+                    return int(number)
+        elif field_type is str and not isinstance(value, bool):
+            if isinstance(value, (str, int, float)):
+                return str(value)
+        elif field_type in (dict, list, tuple):
+            if isinstance(value, list if field_type is tuple else field_type):
+                return value
+        else:
+            return value
+    except ValueError:
+        pass
+    raise ConfigError(f"{yaml_key} 형식 오류: {TYPE_NAMES.get(field_type, field_type.__name__)} 값이어야 합니다 "
+                      f"(현재: {value!r})")
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """
+    검증이 끝난 불변 설정 객체
+    필드 이름을 대문자로 바꾼 값이 config.yaml의 키 (예: num_long_positions → NUM_LONG_POSITIONS)
+    """
+    rss_feeds: Tuple[str, ...]
+    openai_api_key: str = ''
+
+    # 모드 설정
+    use_kis_api: bool = False
+    use_discord: bool = False
+
+    # OpenAI 설정
+    openai_model: str = 'gpt-4o-mini'
+    openai_temperature: float = 0.3
+    openai_reasoning_effort: Dict[str, str] = field(default_factory=lambda: {"effort": "medium"})
+    openai_request_interval: float = 1.0  # 기사 간 대기 (초)
+    max_retries: int = 3
+    retry_delay: float = 2
+    max_retry_delay: float = 30.0
+    circuit_breaker_threshold: int = 5
+    circuit_breaker_cooldown: float = 120.0
+    analysis_deadline: float = 0  # 초, 0이면 무제한
+
+    # 감정 분석 백엔드: openai / local (네트워크 불필요) / cascade (로컬 우선, 애매한 기사만 LLM)
+    sentiment_backend: str = 'openai'
+    local_model_path: str = 'local_sentiment_model.json'
+    local_model_learn: bool = True  # LLM 결과로 로컬 모델 온라인 학습
+    cascade_escalate_low: float = 0.5
+    cascade_escalate_high: float = 2.5
+
+    # 관련성 사전 필터 (LLM 분석 전 섹터 엔티티 매칭): drop (분석 제외) / zero (0점으로 처리)
+    relevance_filter_enabled: bool = True
+    relevance_filter_mode: str = 'drop'
+    relevance_min_matches: int = 1
+    relevance_extra_keywords: Dict[str, list] = field(default_factory=dict)  # 섹터 → 추가 키워드
+
+    # 기사 본문 보강 (RSS summary 대신 기사 페이지 본문을 추출해 분석)
+    article_enrichment_enabled: bool = False
+    enrichment_max_workers: int = 8
+    enrichment_per_domain_limit: int = 2
+    enrichment_timeout: float = 10.0
+    enrichment_max_tokens: int = 800  # 분석에 넘길 본문 길이 (토큰 ≈ 문자 수 / 4)
+    enrichment_cache_dir: str = '.article_cache'  # 빈 문자열이면 캐시 미사용
+    enrichment_cache_max_mb: float = 50
+
+    # 주기별 분석 예산 / 우선순위 스케줄러 (0이면 무제한, 예산을 넘는 기사는 다음 주기로 이월)
+    analysis_max_articles_per_cycle: int = 0
+    analysis_token_budget: int = 0
+    analysis_cost_budget: float = 0.0  # USD
+    openai_price_per_1k_tokens: float = 0.0  # USD, 비용 예산 계산용
+    source_reliability: Dict[str, float] = field(default_factory=dict)  # 피드 제목 → 사전 가중치 (우선순위 + 집계)
+    scheduler_max_backlog: int = 500
+    max_article_age: float = 21600  # 초, 이보다 오래된 기사는 수집/분석하지 않음 (0이면 제한 없음)
+
+    # 거래 유니버스 (비어 있으면 기본 11개 섹터 ETF, util/universe.py) - 변경은 재시작 후 적용
+    universe: List[Dict] = field(default_factory=list)
+    universe_max_per_call: int = 20  # LLM 요청 1회에 채점할 최대 종목 수 (넘으면 나눠서 병렬 요청)
+    universe_parallel_calls: int = 4
+
+    # 출처 신뢰도 가중치 (섹터 합계 집계에 적용, 한투 모드에서는 이후 ETF 수익률로 온라인 학습)
+    source_weighting_enabled: bool = True
+    reliability_state_path: str = 'source_reliability.json'
+    reliability_horizon_minutes: float = 240
+    reliability_learning_rate: float = 0.05
+    reliability_min_weight: float = 0.2
+    reliability_max_weight: float = 2.0
+
+    # 뉴스 수집 / 신호 / 주기 설정
+    news_limit_per_feed: int = 5
+    rss_fast_parse: bool = True  # 증분 XML 파서로 필요한 항목만 읽기 (형식 오류 시 feedparser)
+    num_long_positions: int = 2
+    num_short_positions: int = 1
+    min_analysis_coverage: float = 0.5  # 이보다 낮으면 HOLD
+    low_coverage_threshold: float = 0.8  # 이보다 낮으면 신뢰도 LOW
+    signal_long_threshold: int = 5  # Long 진입 최소 점수
+    signal_short_threshold: int = -5  # Short 진입 최대 점수
+    signal_min_score_diff: int = 3  # 같은 방향 포지션 간 최소 점수 차이
+    loop_interval: int = 900
+
+    # 신호 변경 감지 (진입은 ±5, 청산은 아래 기준 / 변경이 있을 때만 알림)
+    signal_long_exit_threshold: int = 2
+    signal_short_exit_threshold: int = -2
+    signal_min_holding_minutes: float = 60
+    signal_replace_margin: int = 5
+    signal_changes_only: bool = True  # false면 매 주기 전체 신호 알림 (이전 동작)
+
+    # 추가 전략 프로필 (분석은 한 번, 프로필마다 신호 / 보유 포지션 / 목표 수량 / 계좌 / 토큰 분리)
+    # 기본 설정이 첫 번째 전략, 프로필은 기본 설정에 STRATEGY_FIELDS 값만 덮어씀
+    strategies: List[Dict] = field(default_factory=list)
+
+    # 포지션 크기 (한투 모드, 일봉 이동 공분산 기반 목표 수량 / 운용 자본이 0이면 사용 안 함)
+    sizing_capital_usd: float = 0.0
+    sizing_method: str = 'risk_parity'  # risk_parity / vol_target
+    sizing_target_volatility: float = 0.10  # 목표 포트폴리오 연 변동성
+    sizing_lookback_days: int = 60
+    sizing_max_gross_leverage: float = 1.0
+
+    # 진입 타이밍 (한투 모드, 새로 진입한 종목의 현재가가 전일 일봉 기준가에 도달하면 알림)
+    entry_timing_enabled: bool = False
+    entry_trigger: str = 'target'  # target: 피벗 ± 전일 변동폭 / breakout: 전일 고가·저가 / pivot: 피벗
+    entry_poll_interval: float = 5.0  # 대기 중 현재가 조회 간격 (초)
+
+    # 서비스 모드 (python main.py --service) - 변경은 재시작 후 적용
+    service_worker_threads: int = 4  # 블로킹 작업(RSS / OpenAI / 한투 / Discord)용 스레드 풀 크기
+    service_drain_timeout: float = 120.0  # 종료 요청 시 진행 중인 주기를 기다리는 최대 시간 (초)
+
+    # 로컬 시세 봉 저장소 (memmap 컬럼 배열, 빈 문자열이면 일봉은 메모리 캐시만)
+    bar_store_dir: str = ''
+    bar_store_daily_days: int = 250  # 보관할 일봉 수 (저장소가 비어 있으면 이만큼 과거 일봉을 채움)
+    bar_store_minute_interval: int = 0  # 주기마다 저장할 분봉 간격 (분, 0이면 분봉 저장 안 함)
+    bar_store_backfill_pages: int = 10  # 분봉 1회 갱신 시 최대 페이지 수 (페이지당 120개)
+
+    # 한국투자증권 API (USE_KIS_API: true 시 필수)
+    app_key: str = ''
+    app_secret: str = ''
+    cano: str = ''
+    acnt_prdt_cd: str = ''
+    url_base: str = ''
+
+    # Discord (USE_DISCORD: true 시 필수)
+    discord_webhook_url: str = ''
+    halionia_discord_webhook_url: str = ''  # util/halionia_discord_hook.py 채널 (빈 문자열이면 DISCORD_WEBHOOK_URL)
+
+    # 기사/점수 아카이브 (SQLite WAL, main.py --replay 로 재생)
+    archive_enabled: bool = True
+    archive_path: str = 'news_archive.db'
+
+    # 샤드 워커 모드 (0이면 단일 프로세스, sharded_pipeline.py)
+    shard_workers: int = 0
+    shard_result_timeout: float = 900.0
+
+    # 로깅
+    log_level: str = 'INFO'
+    log_format: str = 'json'
+    log_file: str = ''
+    log_rate_limit_per_minute: int = 10
+
+    # 계측 (0 / 빈 문자열이면 비활성화)
+    metrics_port: int = 0
+    metrics_json_path: str = ''
+
+    # 체크포인트 (빈 문자열이면 비활성화) - 변경은 재시작 후 적용
+    checkpoint_path: str = ''
+    checkpoint_every_cycles: int = 1
+
+    # 상태/제어 API (0이면 비활성화, 로컬 전용)
+    control_port: int = 0
+    control_health_timeout: float = 1800.0  # 주기가 예정보다 이만큼 늦어지면 /health 503 (초)
+
+    # 외부 I/O 기록/재생 (off / record / replay) - 변경은 재시작 후 적용
+    cassette_mode: str = 'off'
+    cassette_path: str = 'cassettes/pipeline.jsonl'
+    cassette_latency_scale: float = 0.0  # 재생 시 기록된 응답 시간 배율 (0: 최대 속도, 1: 기록 당시 속도)
+
+    @classmethod
+    def from_mapping(cls, configuration_settings: Dict) -> 'AppConfig':
+        """
+        YAML에서 읽은 dict를 검증하여 AppConfig 생성
+
+        Raises:
+            ConfigError: 필수 설정 누락 또는 값 범위 오류
+        """
+        if not isinstance(configuration_settings, dict):
+            raise ConfigError("설정 파일의 최상위 구조는 key: value 형식이어야 합니다")
+
+        # 로컬 백엔드만 쓰는 경우 OpenAI 키 불필요
+        uses_openai = configuration_settings.get('SENTIMENT_BACKEND', 'openai') != 'local'
+        mandatory_configuration_fields = ('OPENAI_API_KEY', 'RSS_FEEDS') if uses_openai else ('RSS_FEEDS',)
+        for configuration_field in mandatory_configuration_fields:
+            if not configuration_settings.get(configuration_field):
+                raise ConfigError(f"필수 설정 누락: {configuration_field}")
+
+        if uses_openai and not str(configuration_settings['OPENAI_API_KEY']).startswith('sk-'):
+            raise ConfigError("OPENAI_API_KEY 형식 오류: 'sk-'로 시작해야 합니다")
+
+        rss_feed_url_list = configuration_settings['RSS_FEEDS']
+        if not isinstance(rss_feed_url_list, list) or len(rss_feed_url_list) == 0:
+            raise ConfigError("RSS_FEEDS는 비어있지 않은 리스트여야 합니다")
+
+        field_values = {}
+        for config_field in fields(cls):
+            yaml_key = config_field.name.upper()
+            if yaml_key in configuration_settings and configuration_settings[yaml_key] is not None:
+                field_value = configuration_settings[yaml_key]
+                # 예제 파일은 "low" 같은 문자열, 코드 기본값은 {"effort": ...} dict → dict로 통일
+                if config_field.name == 'openai_reasoning_effort' and isinstance(field_value, str):
+                    field_value = {"effort": field_value}
+                field_values[config_field.name] = coerce_field_value(config_field, field_value)
+
+        field_values['rss_feeds'] = tuple(rss_feed_url_list)
+
+        app_config = cls(**field_values)
+        app_config.validate()
+        return app_config
+
+    def validate(self):
+        """값 범위 및 모드별 필수 항목 검증 (실패 시 ConfigError)"""
+        if self.num_long_positions < 1:
+            raise ConfigError("NUM_LONG_POSITIONS는 1 이상이어야 합니다")
+
+        if self.num_short_positions < 1:
+            raise ConfigError("NUM_SHORT_POSITIONS는 1 이상이어야 합니다")
+
+        if not 0.0 <= self.min_analysis_coverage <= self.low_coverage_threshold <= 1.0:
+            raise ConfigError("0 ≤ MIN_ANALYSIS_COVERAGE ≤ LOW_COVERAGE_THRESHOLD ≤ 1 이어야 합니다")
+
+        if self.news_limit_per_feed < 1:
+            raise ConfigError("NEWS_LIMIT_PER_FEED는 1 이상이어야 합니다")
+
+        if self.signal_min_holding_minutes < 0 or self.signal_replace_margin < 0:
+            raise ConfigError("SIGNAL_MIN_HOLDING_MINUTES / SIGNAL_REPLACE_MARGIN은 0 이상이어야 합니다")
+
+        if not self.signal_short_threshold < 0 < self.signal_long_threshold or self.signal_min_score_diff < 0:
+            raise ConfigError("SIGNAL_SHORT_THRESHOLD는 0보다 작고 SIGNAL_LONG_THRESHOLD는 0보다 커야 하며, "
+                              "SIGNAL_MIN_SCORE_DIFF는 0 이상이어야 합니다")
+
+        if self.signal_short_exit_threshold > self.signal_long_exit_threshold:
+            raise ConfigError("SIGNAL_SHORT_EXIT_THRESHOLD는 SIGNAL_LONG_EXIT_THRESHOLD 이하여야 합니다")
+
+        if self.sizing_method not in ('risk_parity', 'vol_target'):
+            raise ConfigError("SIZING_METHOD는 risk_parity 또는 vol_target이어야 합니다")
+
+        if self.entry_trigger not in ('target', 'breakout', 'pivot'):
+            raise ConfigError("ENTRY_TRIGGER는 target, breakout, pivot 중 하나여야 합니다")
+
+        if self.service_worker_threads < 2 or self.service_drain_timeout <= 0:
+            raise ConfigError("SERVICE_WORKER_THREADS는 2 이상, SERVICE_DRAIN_TIMEOUT은 0보다 커야 합니다")
+
+        if self.checkpoint_every_cycles < 1:
+            raise ConfigError("CHECKPOINT_EVERY_CYCLES는 1 이상이어야 합니다")
+
+        if not 0 <= self.control_port <= 65535 or self.control_health_timeout <= 0:
+            raise ConfigError("CONTROL_PORT는 0~65535, CONTROL_HEALTH_TIMEOUT은 0보다 커야 합니다")
+
+        if self.control_port and self.control_port == self.metrics_port:
+            raise ConfigError("CONTROL_PORT와 METRICS_PORT는 서로 달라야 합니다")
+
+        if self.cassette_mode not in ('off', 'record', 'replay'):
+            raise ConfigError("CASSETTE_MODE는 off, record, replay 중 하나여야 합니다")
+
+        if self.cassette_mode != 'off' and not self.cassette_path:
+            raise ConfigError("CASSETTE_MODE를 쓰려면 CASSETTE_PATH가 필요합니다")
+
+        if self.cassette_latency_scale < 0:
+            raise ConfigError("CASSETTE_LATENCY_SCALE은 0 이상이어야 합니다")
+
+        if self.entry_poll_interval <= 0:
+            raise ConfigError("ENTRY_POLL_INTERVAL은 0보다 커야 합니다")
+
+        if self.bar_store_daily_days < 100 or self.bar_store_minute_interval < 0 or self.bar_store_backfill_pages < 1:
+            raise ConfigError("BAR_STORE_DAILY_DAYS는 100 이상, BAR_STORE_MINUTE_INTERVAL은 0 이상, BAR_STORE_BACKFILL_PAGES는 1 이상이어야 합니다")
+
+        if self.bar_store_minute_interval and not self.bar_store_dir:
+            raise ConfigError("BAR_STORE_MINUTE_INTERVAL을 쓰려면 BAR_STORE_DIR이 필요합니다")
+
+        max_lookback_days = self.bar_store_daily_days - 1 if self.bar_store_dir else 99
+        if not 2 <= self.sizing_lookback_days <= max_lookback_days:
+            raise ConfigError(f"SIZING_LOOKBACK_DAYS는 2~{max_lookback_days} 사이여야 합니다 "
+                              "(BAR_STORE_DIR 없이는 한투 일봉 조회 1회 최대 100개)")
+
+        if self.sizing_capital_usd < 0 or self.sizing_target_volatility <= 0 or self.sizing_max_gross_leverage <= 0:
+            raise ConfigError("SIZING_CAPITAL_USD는 0 이상, SIZING_TARGET_VOLATILITY / SIZING_MAX_GROSS_LEVERAGE는 0보다 커야 합니다")
+
+        if self.use_kis_api:
+            missing_configuration_fields = [
+                configuration_field for configuration_field in REQUIRED_KIS_FIELDS
+                if not getattr(self, configuration_field.lower())
+            ]
+            if missing_configuration_fields:
+                raise ConfigError(
+                    f"USE_KIS_API: true이지만 필수 설정 누락: {', '.join(missing_configuration_fields)}\n"
+                    "   뉴스 분석 전용 모드로 사용하려면 USE_KIS_API: false로 설정하세요"
+                )
+
+        if self.sentiment_backend not in ('openai', 'local', 'cascade'):
+            raise ConfigError("SENTIMENT_BACKEND는 openai, local, cascade 중 하나여야 합니다")
+
+        if self.cascade_escalate_low > self.cascade_escalate_high:
+            raise ConfigError("CASCADE_ESCALATE_LOW는 CASCADE_ESCALATE_HIGH 이하여야 합니다")
+
+        if self.relevance_filter_mode not in ('drop', 'zero'):
+            raise ConfigError("RELEVANCE_FILTER_MODE는 drop 또는 zero여야 합니다")
+
+        if self.relevance_min_matches < 1:
+            raise ConfigError("RELEVANCE_MIN_MATCHES는 1 이상이어야 합니다")
+
+        if not isinstance(self.relevance_extra_keywords, dict):
+            raise ConfigError("RELEVANCE_EXTRA_KEYWORDS는 섹터: [키워드, ...] 형식이어야 합니다")
+
+        if min(self.analysis_max_articles_per_cycle, self.analysis_token_budget, self.analysis_cost_budget,
+               self.openai_price_per_1k_tokens, self.max_article_age) < 0:
+            raise ConfigError("분석 예산 / 기사 나이 설정은 0 이상이어야 합니다 (0은 무제한)")
+
+        if self.analysis_cost_budget and not self.openai_price_per_1k_tokens:
+            raise ConfigError("ANALYSIS_COST_BUDGET을 쓰려면 OPENAI_PRICE_PER_1K_TOKENS가 필요합니다")
+
+        if not isinstance(self.source_reliability, dict):
+            raise ConfigError("SOURCE_RELIABILITY는 피드 제목: 가중치 형식이어야 합니다")
+
+        if not isinstance(self.universe, list):
+            raise ConfigError("UNIVERSE는 [{name, ticker, ...}, ...] 리스트여야 합니다")
+        if self.universe:
+            try:
+                Universe.from_config(self.universe)
+            except ValueError as universe_exception:
+                raise ConfigError(str(universe_exception)) from universe_exception
+
+        if self.universe_max_per_call < 0 or self.universe_parallel_calls < 1:
+            raise ConfigError("UNIVERSE_MAX_PER_CALL은 0 이상, UNIVERSE_PARALLEL_CALLS는 1 이상이어야 합니다")
+
+        if self.reliability_horizon_minutes <= 0 or not 0 < self.reliability_learning_rate <= 1:
+            raise ConfigError("RELIABILITY_HORIZON_MINUTES는 0보다 크고, RELIABILITY_LEARNING_RATE는 0~1 사이여야 합니다")
+
+        if not 0 < self.reliability_min_weight <= 1 <= self.reliability_max_weight:
+            raise ConfigError("RELIABILITY_MIN_WEIGHT는 0~1, RELIABILITY_MAX_WEIGHT는 1 이상이어야 합니다")
+
+        if min(self.enrichment_max_workers, self.enrichment_per_domain_limit, self.enrichment_max_tokens) < 1:
+            raise ConfigError("ENRICHMENT_MAX_WORKERS / ENRICHMENT_PER_DOMAIN_LIMIT / ENRICHMENT_MAX_TOKENS는 1 이상이어야 합니다")
+
+        if self.enrichment_timeout <= 0 or self.enrichment_cache_max_mb <= 0:
+            raise ConfigError("ENRICHMENT_TIMEOUT / ENRICHMENT_CACHE_MAX_MB는 0보다 커야 합니다")
+
+        if self.shard_workers < 0 or self.shard_result_timeout <= 0:
+            raise ConfigError("SHARD_WORKERS는 0 이상, SHARD_RESULT_TIMEOUT은 0보다 커야 합니다")
+
+        if self.scheduler_max_backlog < 1:
+            raise ConfigError("SCHEDULER_MAX_BACKLOG는 1 이상이어야 합니다")
+
+        if self.max_retries < 1:
+            raise ConfigError("MAX_RETRIES는 1 이상이어야 합니다")
+
+        if self.circuit_breaker_threshold < 1:
+            raise ConfigError("CIRCUIT_BREAKER_THRESHOLD는 1 이상이어야 합니다")
+
+        if self.log_level.upper() not in logging._nameToLevel:
+            raise ConfigError(f"LOG_LEVEL 오류: {self.log_level} (DEBUG / INFO / WARNING / ERROR / CRITICAL)")
+
+        if self.log_format not in ('json', 'text'):
+            raise ConfigError("LOG_FORMAT은 json 또는 text여야 합니다")
+
+        if self.use_discord and not self.discord_webhook_url:
+            raise ConfigError("USE_DISCORD: true이지만 DISCORD_WEBHOOK_URL이 없습니다")
+
+        self.strategy_configs()
+
+    def warnings(self):
+        """종료할 정도는 아니지만 사용자에게 알릴 경고 메시지 리스트"""
+        warning_messages = []
+        if self.openai_model not in SUPPORTED_OPENAI_MODELS:
+            warning_messages.append(
+                f"{self.openai_model}은 유효하지 않을 수 있습니다. 권장 모델: {', '.join(SUPPORTED_OPENAI_MODELS)}"
+            )
+        if self.loop_interval < 10:
+            warning_messages.append("LOOP_INTERVAL이 10초 미만입니다. API 비용이 매우 높아질 수 있습니다.")
+        if self.cassette_mode == 'replay' and self.use_discord:
+            warning_messages.append("카세트 재생 중에도 Discord 알림은 실제로 전송됩니다 (USE_DISCORD: false 권장).")
+        if self.cassette_mode == 'record':
+            warning_messages.append(f"카세트 기록 중: {self.cassette_path}에 RSS / OpenAI / 한투 응답(접근 토큰 포함)이 저장됩니다.")
+        return warning_messages
+
+    def with_overrides(self, **overrides) -> 'AppConfig':
+        """일부 값만 바꾼 새 AppConfig 반환 (원본은 불변)"""
+        return replace(self, **overrides)
+
+    def strategy_configs(self) -> List[Tuple[str, 'AppConfig']]:
+        """
+        STRATEGIES 프로필별 설정 (기본 설정에 프로필 값을 덮어쓴 AppConfig)
+
+        Returns:
+            [(전략 이름, AppConfig), ...] (프로필 순서)
+
+        Raises:
+            ConfigError: 이름 누락/중복/형식 오류, 바꿀 수 없는 키, 덮어쓴 값의 범위 오류
+        """
+        if not isinstance(self.strategies, list):
+            raise ConfigError("STRATEGIES는 [{NAME, ...}, ...] 리스트여야 합니다")
+        strategy_configs = []
+        for strategy_profile in self.strategies:
+            if not isinstance(strategy_profile, dict) or not strategy_profile.get('NAME'):
+                raise ConfigError("STRATEGIES 항목마다 NAME이 필요합니다")
+            strategy_name = str(strategy_profile['NAME'])
+            # 이름은 토큰 캐시 파일 이름에도 쓰임
+            if not strategy_name.replace('-', '').replace('_', '').isalnum():
+                raise ConfigError(f"STRATEGIES 이름은 영문/숫자/-/_만 사용할 수 있습니다: {strategy_name}")
+            if any(strategy_name == existing_name for existing_name, _ in strategy_configs):
+                raise ConfigError(f"STRATEGIES 이름 중복: {strategy_name}")
+            unknown_keys = set(strategy_profile) - {'NAME'} - set(STRATEGY_FIELDS)
+            if unknown_keys:
+                raise ConfigError(f"STRATEGIES[{strategy_name}]에서 바꿀 수 없는 설정: {', '.join(sorted(unknown_keys))}")
+
+            config_fields = {config_field.name: config_field for config_field in fields(self)}
+            try:
+                overrides = {yaml_key.lower(): coerce_field_value(config_fields[yaml_key.lower()], override_value)
+                             for yaml_key, override_value in strategy_profile.items()
+                             if yaml_key != 'NAME' and override_value is not None}
+                strategy_config = self.with_overrides(strategies=[], **overrides)
+                strategy_config.validate()
+            except ConfigError as strategy_exception:
+                raise ConfigError(f"STRATEGIES[{strategy_name}]: {strategy_exception}") from strategy_exception
+            strategy_configs.append((strategy_name, strategy_config))
+        return strategy_configs
+
+
+_yaml_cache: Dict[str, Tuple[float, Dict]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def read_yaml_file(file_path: str) -> Dict:
+    """
+    YAML 파일을 safe_load로 파싱 (mtime 기준 캐시 → 같은 파일은 한 번만 파싱)
+
+    Raises:
+        ConfigError: 파일이 없을 때
+    """
+    if not os.path.exists(file_path):
+        raise ConfigError(f"{os.path.basename(file_path)}이 없습니다. config.yaml.example을 참고하여 생성하세요.")
+
+    file_mtime = os.stat(file_path).st_mtime
+    with _yaml_cache_lock:
+        cached_entry = _yaml_cache.get(file_path)
+        if cached_entry and cached_entry[0] == file_mtime:
+            return cached_entry[1]
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        parsed_settings = yaml.safe_load(f) or {}
+
+    with _yaml_cache_lock:
+        _yaml_cache[file_path] = (file_mtime, parsed_settings)
+    return parsed_settings
+
+
+class ConfigWatcher:
+    """config.yaml의 mtime을 감시하여 변경 시 다시 검증/로드 (실패 시 기존 설정 유지)"""
+
+    def __init__(self, config_path: str = DEFAULT_CONFIG_PATH):
+        """
+        Args:
+            config_path: 감시할 설정 파일 경로
+
+        Raises:
+            ConfigError: 최초 로드 실패 시
+        """
+        self.config_path = config_path
+        self._lock = threading.Lock()
+        self._loaded_mtime = os.stat(config_path).st_mtime if os.path.exists(config_path) else None
+        self.config: AppConfig = AppConfig.from_mapping(read_yaml_file(config_path))
+        self.last_reload_error: Optional[str] = None
+
+    def reload_if_changed(self) -> bool:
+        """
+        설정 파일이 바뀌었으면 다시 로드
+
+        Returns:
+            새 설정이 적용되었으면 True (검증 실패 시 기존 설정을 유지하고 False)
+        """
+        try:
+            current_mtime = os.stat(self.config_path).st_mtime
+        except OSError:
+            return False
+
+        with self._lock:
+            if current_mtime == self._loaded_mtime:
+                return False
+            self._loaded_mtime = current_mtime
+
+            try:
+                reloaded_config = AppConfig.from_mapping(read_yaml_file(self.config_path))
+            except (ConfigError, yaml.YAMLError, TypeError, ValueError, OSError) as reload_exception:
+                # 형식 변환 후에도 남은 타입 오류 / stat과 open 사이에 파일이 바뀐 경우도 기존 설정 유지
+                self.last_reload_error = str(reload_exception)
+                return False
+
+            self.last_reload_error = None
+            if reloaded_config == self.config:
+                return False
+            self.config = reloaded_config
+            return True
+
+
+_default_watcher: Optional[ConfigWatcher] = None
+_default_watcher_lock = threading.Lock()
+
+
+def get_config_watcher(config_path: str = DEFAULT_CONFIG_PATH) -> ConfigWatcher:
+    """프로세스 전역 ConfigWatcher (최초 호출 시 한 번만 파싱)"""
+    global _default_watcher
+    with _default_watcher_lock:
+        if _default_watcher is None or _default_watcher.config_path != config_path:
+            _default_watcher = ConfigWatcher(config_path)
+        return _default_watcher
+
+
+def get_config(config_path: str = DEFAULT_CONFIG_PATH) -> AppConfig:
+    """현재 적용 중인 AppConfig 반환"""
+    return get_config_watcher(config_path).config
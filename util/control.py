@@ -0,0 +1,265 @@
+"""
+실행 중인 루프 상태 조회 + 제어 API
+- GET  /health            : 주기가 제때 진행 중이면 200, 멈춘 것으로 보이면 503 (감시 프로세스 liveness 확인용)
+- GET  /status            : 반복 번호 / 마지막 주기 시간(단계별) / 마지막 신호 / 섹터 점수 / 캐시 크기 / 큐 길이 / 토큰 만료
+- POST /control/cycle     : 대기 중이면 다음 주기를 바로 시작
+- POST /control/pause     : 매매 일시 중지 (수집/분석/신호 알림은 계속)
+- POST /control/resume    : 매매 재개
+- POST /control/interval?seconds=N : LOOP_INTERVAL 변경 (0이면 설정 파일 값으로 복귀)
+
+HTTP 요청은 별도 데몬 스레드에서 처리하고, 파이프라인 상태는 주기 경계에서 기록한 값만 읽음 (파이프라인 부하 없음)
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from util.logger import get_logger
+from util.metrics import METRICS
+
+logger = get_logger(__name__)
+
+
+def _stage_seconds() -> Dict[str, float]:
+    """pipeline_stage_seconds 히스토그램의 단계별 누적 시간"""
+    stage_histograms = METRICS.snapshot()['histograms'].get('pipeline_stage_seconds', [])
+    return {histogram['labels'].get('stage', ''): histogram['sum'] for histogram in stage_histograms}
+
+
+class PipelineControl:
+    """루프 스레드(기록)와 HTTP 스레드(조회 / 명령)가 공유하는 상태"""
+
+    def __init__(self, loop_interval: int, health_timeout: float = 1800.0):
+        """
+        Args:
+            loop_interval: 설정 파일의 LOOP_INTERVAL (초)
+            health_timeout: 주기가 예정보다 이만큼 늦어지면 /health 503 (초)
+        """
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._wakeup_callbacks: List[Callable[[], None]] = []
+        self._status_providers: Dict[str, Callable[[], Dict]] = {}
+        self._stage_seconds_at_start: Dict[str, float] = {}
+        self.config_loop_interval = loop_interval
+        self.health_timeout = health_timeout
+        self.started_at = time.time()
+        self.iteration = 0
+        self.state = 'starting'  # starting / running / waiting
+        self.trading_paused = False
+        self.loop_interval_override: Optional[int] = None
+        self.cycle_started_at: Optional[float] = None
+        self.last_cycle: Dict = {}
+        self.last_signals: Optional[Dict] = None
+        self.last_scores: Dict[str, int] = {}
+        self.last_coverage: Optional[float] = None
+
+    @property
+    def wakeup_event(self) -> threading.Event:
+        """다음 주기 요청 시 set (대기 루프가 기다리는 이벤트)"""
+        return self._wakeup
+
+    def apply_config(self, config):
+        self.config_loop_interval = config.loop_interval
+        self.health_timeout = config.control_health_timeout
+
+    @property
+    def loop_interval(self) -> int:
+        """이번 대기에 쓸 주기 (API로 바꾼 값이 있으면 그 값)"""
+        return self.loop_interval_override or self.config_loop_interval
+
+    def add_status_provider(self, name: str, provider: Callable[[], Dict]):
+        """/status에 항목 추가 (provider는 HTTP 스레드에서 호출되므로 가벼운 조회만)"""
+        self._status_providers[name] = provider
+
+    def add_wakeup_callback(self, callback: Callable[[], None]):
+        """다음 주기 요청 시 추가로 호출할 함수 (서비스 모드 이벤트 루프 깨우기)"""
+        self._wakeup_callbacks.append(callback)
+
+    # ----- 루프 스레드에서 기록 -----
+
+    def begin_cycle(self, iteration: int):
+        self._wakeup.clear()
+        stage_seconds = _stage_seconds()
+        with self._lock:
+            self.iteration = iteration
+            self.state = 'running'
+            self.cycle_started_at = time.time()
+            self._stage_seconds_at_start = stage_seconds
+
+    def end_cycle(self):
+        stage_seconds = _stage_seconds()
+        finished_at = time.time()
+        with self._lock:
+            self.last_cycle = {
+                'iteration': self.iteration,
+                'started_at': self.cycle_started_at,
+                'finished_at': finished_at,
+                'duration': round(finished_at - self.cycle_started_at, 3),
+                'stages': {stage: round(total_seconds - self._stage_seconds_at_start.get(stage, 0.0), 3)
+                           for stage, total_seconds in stage_seconds.items()
+                           if total_seconds != self._stage_seconds_at_start.get(stage, 0.0)},
+            }
+            self.state = 'waiting'
+            self.cycle_started_at = None
+
+    def record_signals(self, signals: Dict, scorechart: Dict[str, int], coverage: float):
+        with self._lock:
+            self.last_signals = signals
+            self.last_scores = dict(scorechart)
+            self.last_coverage = coverage
+
+    def wait(self, seconds: float) -> bool:
+        """
+        다음 주기까지 대기 (/control/cycle 요청 시 바로 반환)
+
+        Returns:
+            요청으로 일찍 끝났는지
+        """
+        woken = self._wakeup.wait(max(0.0, seconds))
+        self._wakeup.clear()
+        return woken
+
+    def checkpoint_state(self) -> Dict:
+        """체크포인트용 상태 (마지막 신호 / 점수 + 매매 일시 중지 여부 - 재시작해도 중지 상태 유지)"""
+        with self._lock:
+            return {'last_cycle': self.last_cycle, 'last_signals': self.last_signals, 'last_scores': self.last_scores,
+                    'last_coverage': self.last_coverage, 'trading_paused': self.trading_paused}
+
+    def restore_state(self, state: Dict):
+        with self._lock:
+            self.last_cycle = state['last_cycle']
+            self.last_signals = state['last_signals']
+            self.last_scores = state['last_scores']
+            self.last_coverage = state['last_coverage']
+            self.trading_paused = state['trading_paused']
+        if self.trading_paused:
+            logger.info("⏸️ 체크포인트 복원: 매매 일시 중지 상태 유지 (POST /control/resume으로 재개)")
+
+    # ----- HTTP 스레드에서 호출 -----
+
+    def request_cycle(self):
+        logger.info("⏩ 제어 API: 다음 주기 즉시 시작 요청")
+        self._wakeup.set()
+        for callback in self._wakeup_callbacks:
+            callback()
+
+    def set_trading_paused(self, paused: bool):
+        self.trading_paused = paused
+        logger.info("%s 제어 API: 매매 %s", '⏸️' if paused else '▶️', '일시 중지' if paused else '재개')
+
+    def set_loop_interval(self, seconds: int):
+        self.loop_interval_override = seconds or None
+        logger.info("⏱️ 제어 API: LOOP_INTERVAL %d초 (%s)", self.loop_interval,
+                    'API 지정' if seconds else '설정 파일 값')
+
+    def health(self) -> Dict:
+        """
+        Returns:
+            {'healthy', 'state', 'iteration', 'overdue_seconds'} - 진행 중인 주기가 health_timeout보다 오래 걸리거나
+            대기 후 다음 주기가 health_timeout 넘게 시작하지 않으면 healthy False
+        """
+        now = time.time()
+        with self._lock:
+            if self.state == 'running':
+                expected_at = self.cycle_started_at
+            elif self.state == 'waiting':
+                expected_at = self.last_cycle['finished_at'] + self.loop_interval
+            else:
+                expected_at = self.started_at
+            overdue_seconds = max(0.0, now - expected_at - self.health_timeout)
+            return {'healthy': overdue_seconds == 0.0, 'state': self.state, 'iteration': self.iteration,
+                    'overdue_seconds': round(overdue_seconds, 1)}
+
+    def status(self) -> Dict:
+        with self._lock:
+            pipeline_status = {
+                'state': self.state,
+                'iteration': self.iteration,
+                'uptime_seconds': round(time.time() - self.started_at, 1),
+                'trading_paused': self.trading_paused,
+                'loop_interval': self.loop_interval,
+                'loop_interval_override': self.loop_interval_override,
+                'current_cycle_started_at': self.cycle_started_at,
+                'last_cycle': dict(self.last_cycle),
+                'last_signal': self.last_signals,
+                'sector_scores': dict(self.last_scores),
+                'coverage': self.last_coverage,
+            }
+        for name, provider in list(self._status_providers.items()):
+            try:
+                pipeline_status[name] = provider()
+            except Exception as provider_exception:
+                pipeline_status[name] = {'error': str(provider_exception)}
+        return pipeline_status
+
+
+class _ControlRequestHandler(BaseHTTPRequestHandler):
+    control: PipelineControl = None
+
+    def _send_json(self, status_code: int, body: Dict):
+        response_body = json.dumps(body, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+
+    def do_GET(self):
+        request_path = urlsplit(self.path).path
+        if request_path == '/health':
+            health = self.control.health()
+            self._send_json(200 if health['healthy'] else 503, health)
+        elif request_path == '/status':
+            self._send_json(200, self.control.status())
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        request_url = urlsplit(self.path)
+        if request_url.path == '/control/cycle':
+            self.control.request_cycle()
+        elif request_url.path == '/control/pause':
+            self.control.set_trading_paused(True)
+        elif request_url.path == '/control/resume':
+            self.control.set_trading_paused(False)
+        elif request_url.path == '/control/interval':
+            seconds_values = parse_qs(request_url.query).get('seconds', [''])
+            try:
+                seconds = int(seconds_values[0])
+            except ValueError:
+                seconds = -1
+            if seconds < 0:
+                self._send_json(400, {'error': "seconds는 0 이상의 정수여야 합니다 (0: 설정 파일 값)"})
+                return
+            self.control.set_loop_interval(seconds)
+        else:
+            self.send_error(404)
+            return
+        METRICS.inc('control_commands_total', command=request_url.path.rsplit('/', 1)[-1])
+        self._send_json(202, {'accepted': request_url.path, 'trading_paused': self.control.trading_paused,
+                              'loop_interval': self.control.loop_interval})
+
+    def log_message(self, format, *args):
+        # 감시 프로세스 요청마다 stderr에 접근 로그를 남기지 않음
+        pass
+
+
+def start_control_server(control: PipelineControl, port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """
+    백그라운드 데몬 스레드에서 상태/제어 엔드포인트 실행
+
+    Args:
+        control: 노출할 PipelineControl
+        port: 리슨 포트
+        host: 바인드 주소 (기본: 로컬 전용 - 제어 명령에 인증이 없으므로 외부에 열지 말 것)
+
+    Returns:
+        실행 중인 서버 (server.shutdown()으로 종료)
+    """
+    handler_class = type('ControlRequestHandler', (_ControlRequestHandler,), {'control': control})
+    control_server = ThreadingHTTPServer((host, port), handler_class)
+    server_thread = threading.Thread(target=control_server.serve_forever, name='control-server', daemon=True)
+    server_thread.start()
+    return control_server
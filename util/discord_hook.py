@@ -1,19 +1,24 @@
 import datetime
 import requests
-import yaml
-import os
 
-config_path = os.path.join(os.path.dirname(__file__), 'discord_config.yaml')
-with open(config_path, encoding='UTF-8') as f:
-    discord_cfg = yaml.load(f, Loader=yaml.FullLoader)
+from util.config import get_config
+from util.logger import get_logger
 
-DISCORD_WEBHOOK_URL = discord_cfg['DISCORD_WEBHOOK_URL']
+logger = get_logger('discord')
 
-def send_message(msg):
-    """디스코드 메세지 전송"""
+
+def send_message(msg, config=None):
+    """
+    디스코드 메세지 전송
+
+    Args:
+        config: AppConfig (생략 시 공용 설정의 DISCORD_WEBHOOK_URL)
+    """
     now = datetime.datetime.now()
     message = {"content": f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {str(msg)}"}
-    requests.post(DISCORD_WEBHOOK_URL, data=message)
-    print(message)
+    requests.post((config or get_config()).discord_webhook_url, data=message)
+    logger.info("%s", message['content'])
+
 
-send_message("Discord Hook is set up and ready.")
\ No newline at end of file
+if __name__ == '__main__':
+    send_message("Discord Hook is set up and ready.")
@@ -0,0 +1,70 @@
+"""
+일관된 해싱(consistent hashing) 링
+노드(워커)가 추가/제거되어도 해당 노드의 키만 다른 노드로 옮겨가도록 키 → 노드 배정
+"""
+import hashlib
+from bisect import bisect_right
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+
+def _ring_position(value: str) -> int:
+    """문자열 → 링 위의 64비트 위치 (프로세스/실행마다 같은 값 - 내장 hash()는 실행마다 달라짐)"""
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class HashRing:
+    """가상 노드를 둔 일관된 해싱 링 (노드 수가 적어도 키가 고르게 분산되도록)"""
+
+    def __init__(self, nodes: Iterable[Hashable] = (), virtual_nodes: int = 64):
+        """
+        Args:
+            nodes: 초기 노드 목록
+            virtual_nodes: 노드당 링 위 가상 위치 개수
+        """
+        self.virtual_nodes = virtual_nodes
+        self._positions: List[int] = []  # 정렬된 링 위치
+        self._owners: List[Hashable] = []  # 같은 순서의 담당 노드
+        self.nodes = set()
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: Hashable):
+        if node in self.nodes:
+            return
+        self.nodes.add(node)
+        self._rebuild()
+
+    def remove(self, node: Hashable):
+        if node not in self.nodes:
+            return
+        self.nodes.discard(node)
+        self._rebuild()
+
+    def _rebuild(self):
+        ring: List[Tuple[int, str, Hashable]] = sorted(
+            (_ring_position(f"{node}#{replica_index}"), str(node), node)
+            for node in self.nodes for replica_index in range(self.virtual_nodes)
+        )
+        self._positions = [position for position, _, _ in ring]
+        self._owners = [node for _, _, node in ring]
+
+    def node_for(self, key: str) -> Hashable:
+        """
+        키를 담당하는 노드 (링에서 키 위치의 시계 방향 첫 노드)
+
+        Raises:
+            LookupError: 노드가 없을 때
+        """
+        if not self._positions:
+            raise LookupError("해시 링에 노드가 없습니다")
+        ring_index = bisect_right(self._positions, _ring_position(key))
+        if ring_index == len(self._positions):
+            ring_index = 0
+        return self._owners[ring_index]
+
+    def assign(self, keys: Iterable[str]) -> Dict[Hashable, List[str]]:
+        """키 목록을 노드별로 나눔 (키가 없는 노드도 빈 리스트로 포함)"""
+        assignment: Dict[Hashable, List[str]] = {node: [] for node in self.nodes}
+        for key in keys:
+            assignment[self.node_for(key)].append(key)
+        return assignment
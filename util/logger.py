@@ -0,0 +1,163 @@
+"""
+구조화 로깅 모듈
+JSON Lines 출력, 큐 기반 비동기 핸들러(백그라운드 스레드에서 포맷/출력), 반복 경고 rate limit 제공
+비활성화된 레벨의 로그는 logger.debug("... %s", x) 형태로 호출 시 문자열 포맷 비용이 들지 않음
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+ROOT_LOGGER_NAME = 'kistrader'
+
+_STANDARD_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 객체 (extra=로 넘긴 필드도 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for attribute_name, attribute_value in record.__dict__.items():
+            if attribute_name not in _STANDARD_RECORD_ATTRIBUTES and not attribute_name.startswith('_'):
+                log_entry[attribute_name] = attribute_value
+        if record.exc_info:
+            log_entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(log_entry, ensure_ascii=False, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    같은 모듈/같은 메시지 템플릿의 WARNING 이상 로그를 주기당 N개로 제한
+    억제된 개수는 다음으로 통과하는 로그의 'suppressed' 필드에 기록
+    """
+
+    def __init__(self, max_per_interval: int = 10, interval_seconds: float = 60.0):
+        super().__init__()
+        self.max_per_interval = max_per_interval
+        self.interval_seconds = interval_seconds
+        self._windows: Dict[Tuple[str, str], list] = {}  # key → [window_start, emitted_count, suppressed_count]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING or self.max_per_interval <= 0:
+            return True
+
+        # 포맷 전 템플릿(record.msg)을 키로 사용 → 인자만 다른 반복 경고를 하나로 묶음
+        rate_limit_key = (record.name, str(record.msg))
+        current_time = time.monotonic()
+        with self._lock:
+            window = self._windows.get(rate_limit_key)
+            if window is None or current_time - window[0] >= self.interval_seconds:
+                suppressed_count = window[2] if window else 0
+                self._windows[rate_limit_key] = [current_time, 1, 0]
+                if suppressed_count:
+                    record.suppressed = suppressed_count
+                return True
+            if window[1] < self.max_per_interval:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+
+class _DeferredFormatQueueHandler(logging.handlers.QueueHandler):
+    """호출 스레드에서는 포맷하지 않고 레코드를 그대로 큐에 넣음 (포맷은 리스너 스레드에서)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+
+
+def setup_logging(level: str = 'INFO', log_format: str = 'json', log_file: str = '',
+                  rate_limit_per_minute: int = 10):
+    """
+    로깅 초기화 (재호출 시 기존 리스너를 정리하고 새 설정 적용)
+
+    Args:
+        level: 로그 레벨 (DEBUG / INFO / WARNING / ERROR)
+        log_format: 'json' (JSON Lines) 또는 'text' (사람이 읽는 형식)
+        log_file: 지정 시 콘솔 대신 파일로 출력
+        rate_limit_per_minute: 동일 경고 분당 최대 출력 수 (0이면 제한 없음)
+    """
+    global _queue_listener
+
+    with _setup_lock:
+        if _queue_listener is not None:
+            _queue_listener.stop()
+            _queue_listener = None
+
+        if log_file:
+            output_handler = logging.FileHandler(log_file, encoding='utf-8')
+        else:
+            output_handler = logging.StreamHandler(sys.stdout)
+
+        if log_format == 'json':
+            output_handler.setFormatter(JsonFormatter())
+        else:
+            output_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s', '%H:%M:%S'))
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = _DeferredFormatQueueHandler(log_queue)
+        queue_handler.addFilter(RateLimitFilter(max_per_interval=rate_limit_per_minute, interval_seconds=60.0))
+
+        root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+        for existing_handler in list(root_logger.handlers):
+            root_logger.removeHandler(existing_handler)
+        root_logger.addHandler(queue_handler)
+        root_logger.setLevel(level.upper())
+        root_logger.propagate = False
+
+        _queue_listener = logging.handlers.QueueListener(log_queue, output_handler)
+        _queue_listener.start()
+
+
+def set_log_level(level: str) -> bool:
+    """
+    실행 중 로그 레벨 변경 (설정 핫 리로드용)
+
+    Returns:
+        적용 여부 (알 수 없는 레벨이면 기존 레벨을 유지하고 False - 리로드 때문에 루프가 죽지 않도록)
+    """
+    root_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    try:
+        root_logger.setLevel(level.upper())
+    except (AttributeError, TypeError, ValueError):
+        root_logger.warning("⚠️ 알 수 없는 로그 레벨 %r - 기존 레벨 유지", level)
+        return False
+    return True
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 출력한 뒤 리스너 종료"""
+    global _queue_listener
+    with _setup_lock:
+        if _queue_listener is not None:
+            _queue_listener.stop()
+            _queue_listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    모듈별 로거 (kistrader.<name>)
+
+    setup_logging() 전에 호출해도 되며, 그 전까지는 WARNING 이상만 stderr로 출력됨
+    """
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+atexit.register(shutdown_logging)
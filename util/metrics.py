@@ -0,0 +1,229 @@
+"""
+계측(메트릭) 모듈
+파이프라인 단계 / RSS 피드 / OpenAI 호출 / 한투 API 별 지연시간 히스토그램과 카운터 수집
+로컬 /metrics HTTP 엔드포인트(Prometheus 텍스트 형식)와 주기별 JSON 덤프 제공
+"""
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+
+# 지연시간 히스토그램 버킷 (초) - RSS/OpenAI/한투 호출 범위(수 ms ~ 수 분)를 커버
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (observe는 이진 탐색 + 정수 증가만 수행)"""
+
+    __slots__ = ('bucket_bounds', 'bucket_counts', 'count', 'total')
+
+    def __init__(self, bucket_bounds=DEFAULT_LATENCY_BUCKETS):
+        self.bucket_bounds = tuple(bucket_bounds)
+        self.bucket_counts = [0] * (len(self.bucket_bounds) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect_left(self.bucket_bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float:
+        """버킷 상한 기준 근사 분위수 (JSON 요약용)"""
+        if self.count == 0:
+            return 0.0
+        target_rank = q * self.count
+        cumulative_count = 0
+        for bucket_index, bucket_count in enumerate(self.bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= target_rank:
+                if bucket_index < len(self.bucket_bounds):
+                    return self.bucket_bounds[bucket_index]
+                return float('inf')
+        return float('inf')
+
+
+class MetricsRegistry:
+    """라벨별 카운터/히스토그램 저장소 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._last_dumped_counters: Dict[str, Dict[LabelKey, float]] = {}
+
+    @staticmethod
+    def _label_key(labels: Dict[str, object]) -> LabelKey:
+        return tuple(sorted((label_name, str(label_value)) for label_name, label_value in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels):
+        """카운터 증가"""
+        label_key = self._label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[label_key] = series.get(label_key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        """히스토그램에 값 기록"""
+        label_key = self._label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(label_key)
+            if histogram is None:
+                histogram = series[label_key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """with 블록 실행 시간을 히스토그램(초)에 기록"""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start_time, **labels)
+
+    def counter_value(self, name: str, **labels) -> float:
+        """카운터 현재 값 (없으면 0)"""
+        with self._lock:
+            return self._counters.get(name, {}).get(self._label_key(labels), 0)
+
+    def snapshot(self) -> Dict:
+        """
+        전체 메트릭 JSON 직렬화용 dict
+
+        Returns:
+            {'counters': {name: [{'labels', 'value'}]}, 'histograms': {name: [{'labels', 'count', 'sum', 'p50', 'p95', 'p99'}]}}
+        """
+        with self._lock:
+            counters = {
+                name: [{'labels': dict(label_key), 'value': value} for label_key, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: [
+                    {
+                        'labels': dict(label_key),
+                        'count': histogram.count,
+                        'sum': round(histogram.total, 6),
+                        'p50': histogram.quantile(0.50),
+                        'p95': histogram.quantile(0.95),
+                        'p99': histogram.quantile(0.99),
+                    }
+                    for label_key, histogram in series.items()
+                ]
+                for name, series in self._histograms.items()
+            }
+        return {'counters': counters, 'histograms': histograms}
+
+    def counter_deltas(self) -> Dict:
+        """마지막 호출 이후 증가한 카운터 값 (주기별 토큰/재시도 수 확인용)"""
+        with self._lock:
+            deltas = {}
+            for name, series in self._counters.items():
+                previous_series = self._last_dumped_counters.get(name, {})
+                changed = [
+                    {'labels': dict(label_key), 'value': value - previous_series.get(label_key, 0)}
+                    for label_key, value in series.items()
+                    if value != previous_series.get(label_key, 0)
+                ]
+                if changed:
+                    deltas[name] = changed
+            self._last_dumped_counters = {name: dict(series) for name, series in self._counters.items()}
+        return deltas
+
+    def dump_cycle_json(self, file_path: str, cycle: int):
+        """주기별 메트릭을 JSON Lines 파일에 한 줄 추가"""
+        cycle_record = {
+            'cycle': cycle,
+            'timestamp': time.time(),
+            'cycle_delta': self.counter_deltas(),
+            'metrics': self.snapshot(),
+        }
+        with open(file_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(cycle_record, ensure_ascii=False) + '\n')
+
+    def to_prometheus_text(self) -> str:
+        """Prometheus exposition 텍스트 형식으로 변환"""
+        output_lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                output_lines.append(f"# TYPE {name} counter")
+                for label_key, value in series.items():
+                    output_lines.append(f"{name}{_format_labels(label_key)} {value}")
+
+            for name, series in sorted(self._histograms.items()):
+                output_lines.append(f"# TYPE {name} histogram")
+                for label_key, histogram in series.items():
+                    cumulative_count = 0
+                    for bucket_bound, bucket_count in zip(histogram.bucket_bounds, histogram.bucket_counts):
+                        cumulative_count += bucket_count
+                        bucket_labels = label_key + (('le', repr(bucket_bound)),)
+                        output_lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative_count}")
+                    output_lines.append(f"{name}_bucket{_format_labels(label_key + (('le', '+Inf'),))} {histogram.count}")
+                    output_lines.append(f"{name}_sum{_format_labels(label_key)} {histogram.total}")
+                    output_lines.append(f"{name}_count{_format_labels(label_key)} {histogram.count}")
+        return "\n".join(output_lines) + "\n"
+
+
+def _format_labels(label_key: LabelKey) -> str:
+    if not label_key:
+        return ""
+    escaped_pairs = []
+    for label_name, label_value in label_key:
+        escaped_value = label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        escaped_pairs.append(f'{label_name}="{escaped_value}"')
+    return "{" + ",".join(escaped_pairs) + "}"
+
+
+# 프로세스 전역 레지스트리
+METRICS = MetricsRegistry()
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = METRICS
+
+    def do_GET(self):
+        if self.path == '/metrics':
+            response_body = self.registry.to_prometheus_text().encode('utf-8')
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        elif self.path == '/metrics.json':
+            response_body = json.dumps(self.registry.snapshot(), ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(response_body)))
+        self.end_headers()
+        self.wfile.write(response_body)
+
+    def log_message(self, format, *args):
+        # 스크레이프마다 stderr에 접근 로그를 남기지 않음
+        pass
+
+
+def start_metrics_server(port: int, host: str = '127.0.0.1',
+                         registry: Optional[MetricsRegistry] = None) -> ThreadingHTTPServer:
+    """
+    백그라운드 데몬 스레드에서 /metrics, /metrics.json 엔드포인트 실행
+
+    Args:
+        port: 리슨 포트
+        host: 바인드 주소 (기본: 로컬 전용)
+        registry: 노출할 레지스트리 (기본: 전역 METRICS)
+
+    Returns:
+        실행 중인 서버 (server.shutdown()으로 종료)
+    """
+    handler_class = type('MetricsRequestHandler', (_MetricsRequestHandler,), {'registry': registry or METRICS})
+    metrics_server = ThreadingHTTPServer((host, port), handler_class)
+    server_thread = threading.Thread(target=metrics_server.serve_forever, name='metrics-server', daemon=True)
+    server_thread.start()
+    return metrics_server
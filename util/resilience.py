@@ -0,0 +1,176 @@
+"""
+외부 API 복원력 모듈
+지수 백오프 + 지터(Retry-After 헤더 우선), 연속 실패 시 빠르게 실패하는 서킷 브레이커,
+주기 마감 시간(Deadline) 제공 - OpenAI / 한투 API 호출에서 공용으로 사용
+"""
+import email.utils
+import random
+import threading
+import time
+from typing import Optional
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 호출을 시도하지 않음"""
+
+
+class DeadlineExceeded(Exception):
+    """주기 마감 시간 초과로 더 이상 호출/대기하지 않음"""
+
+
+class Deadline:
+    """monotonic 시계 기준 마감 시간 (seconds=None이면 무제한)"""
+
+    __slots__ = ('expires_at',)
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.expires_at = time.monotonic() + seconds if seconds else None
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 무제한이면 inf)"""
+        if self.expires_at is None:
+            return float('inf')
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def sleep(self, seconds: float):
+        """
+        마감 시간 안에서만 대기
+
+        Raises:
+            DeadlineExceeded: 대기 시간이 남은 시간보다 길 때 (대기하지 않고 즉시)
+        """
+        if seconds > self.remaining():
+            raise DeadlineExceeded(f"대기 {seconds:.1f}초가 남은 시간 {self.remaining():.1f}초를 초과")
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 30.0):
+        """
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 시도 포함)
+            base_delay: 첫 재시도 대기 상한 (초)
+            max_delay: 대기 상한 (초)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        attempt번째 실패(0부터) 후 대기 시간
+
+        서버가 Retry-After를 주면 그 값을 그대로 따르고,
+        없으면 [0, min(max_delay, base_delay * 2^attempt)] 구간에서 균등 랜덤 (여러 워커가 동시에 몰리지 않도록)
+        """
+        if retry_after is not None:
+            return max(0.0, retry_after)
+        exponential_cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, exponential_cap)
+
+
+def retry_after_seconds(exception: BaseException) -> Optional[float]:
+    """
+    예외에 포함된 HTTP 응답의 Retry-After / retry-after-ms 헤더 해석
+
+    Returns:
+        대기 시간(초) 또는 None (헤더 없음)
+    """
+    response = getattr(exception, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get('retry-after-ms')
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+
+    retry_after = headers.get('retry-after')
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    try:
+        # HTTP-date 형식
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    연속 실패 N회 시 open → cooldown 동안 즉시 실패 → half-open에서 1회 시험 호출
+    시험 호출 성공 시 closed, 실패 시 다시 open
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 120.0):
+        """
+        Args:
+            failure_threshold: open 전환 연속 실패 횟수
+            cooldown_seconds: open 유지 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state_locked()
+
+    def _state_locked(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.cooldown_seconds:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow_request(self) -> bool:
+        """호출 가능 여부 (half-open에서는 동시에 1건만 허용)"""
+        with self._lock:
+            current_state = self._state_locked()
+            if current_state == self.CLOSED:
+                return True
+            if current_state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self._trial_in_flight or self.consecutive_failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+    def trip(self):
+        """재시도로 해결되지 않는 오류(인증 실패 등) 발생 시 즉시 open"""
+        with self._lock:
+            self.consecutive_failures = max(self.consecutive_failures, self.failure_threshold)
+            self.opened_at = time.monotonic()
+            self._trial_in_flight = False
@@ -0,0 +1,162 @@
+"""
+거래 유니버스 레지스트리
+분석/신호/학습이 공용으로 쓰는 종목 목록 (이름 → 티커/설명/예시/거래소)
+- 이름마다 0부터 시작하는 조밀한 정수 id (리스트 인덱스로 점수 배열 접근)
+- 설정 파일 UNIVERSE로 교체 가능 (GICS 하위 산업, 개별 종목, 레버리지/인버스 ETF 등)
+- LLM 프롬프트의 종목 정의와 응답 JSON 형식은 이 레지스트리에서 생성
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+KIND_SECTOR_ETF = 'sector_etf'
+KIND_SUB_INDUSTRY = 'sub_industry'
+KIND_STOCK = 'stock'
+KIND_LEVERAGED_ETF = 'leveraged_etf'
+KIND_INVERSE_ETF = 'inverse_etf'
+INSTRUMENT_KINDS = (KIND_SECTOR_ETF, KIND_SUB_INDUSTRY, KIND_STOCK, KIND_LEVERAGED_ETF, KIND_INVERSE_ETF)
+
+DEFAULT_EXCHANGE_CODE = 'AMS'  # 한투 해외주식 거래소 코드 (섹터 ETF 대부분은 NYSE Arca)
+
+
+@dataclass(frozen=True)
+class Instrument:
+    """유니버스 항목 하나 (name이 점수 dict의 키)"""
+    name: str
+    ticker: str
+    description: str = ''
+    examples: Tuple[str, ...] = ()
+    kind: str = KIND_SECTOR_ETF
+    exchange: str = DEFAULT_EXCHANGE_CODE
+    keywords: Tuple[str, ...] = ()  # 관련성 필터에 추가할 키워드 (소문자)
+
+
+DEFAULT_INSTRUMENTS: Tuple[Instrument, ...] = (
+    Instrument("Technology", "XLK", "Software companies, IT services, hardware manufacturers (EXCLUDING semiconductors)",
+               ("Microsoft", "Apple", "Oracle", "IBM")),
+    Instrument("Semiconductors", "SMH", "Chip manufacturers, semiconductor equipment makers",
+               ("NVIDIA", "Intel", "AMD", "TSMC", "ASML"), exchange='NAS'),
+    Instrument("Financials", "XLF", "Banks, insurance, investment firms, payment processors",
+               ("JPMorgan", "Bank of America", "Visa", "Mastercard")),
+    Instrument("Healthcare", "XLV", "Pharmaceuticals, biotech, medical devices, healthcare services",
+               ("Pfizer", "Johnson & Johnson", "UnitedHealth")),
+    Instrument("Energy", "XLE", "Oil & gas, renewable energy, energy equipment",
+               ("Exxon", "Chevron", "ConocoPhillips")),
+    Instrument("Airlines", "JETS", "Commercial airlines, air cargo",
+               ("American Airlines", "Delta", "United", "Southwest")),
+    Instrument("Consumer Discretionary", "XLY", "Retail, entertainment, automotive, luxury goods",
+               ("Amazon", "Tesla", "Nike", "McDonald's")),
+    Instrument("Consumer Staples", "XLP", "Food, beverages, household products, tobacco",
+               ("Coca-Cola", "Procter & Gamble", "Walmart groceries")),
+    Instrument("Commodities", "DBC", "Agricultural products, metals, raw materials",
+               ("Wheat", "corn", "copper", "gold")),
+    Instrument("Utilities", "XLU", "Electric, gas, water utilities, renewable infrastructure",
+               ("Duke Energy", "Southern Company", "NextEra Energy")),
+    Instrument("Real Estate", "XLRE", "REITs, real estate development, property management",
+               ("American Tower", "Prologis", "Simon Property")),
+)
+
+
+class Universe:
+    """순서가 고정된 종목 목록 + 이름/티커 → id 조회 (모두 O(1))"""
+
+    def __init__(self, instruments: Iterable[Instrument]):
+        """
+        Raises:
+            ValueError: 비어 있거나 이름/티커가 중복될 때
+        """
+        self.instruments: Tuple[Instrument, ...] = tuple(instruments)
+        if not self.instruments:
+            raise ValueError("유니버스가 비어 있습니다")
+        self.names: List[str] = [instrument.name for instrument in self.instruments]
+        self.index: Dict[str, int] = {name: instrument_id for instrument_id, name in enumerate(self.names)}
+        self.ticker_index: Dict[str, int] = {instrument.ticker: instrument_id
+                                             for instrument_id, instrument in enumerate(self.instruments)}
+        if len(self.index) != len(self.names):
+            raise ValueError("유니버스 이름이 중복되었습니다")
+        if len(self.ticker_index) != len(self.names):
+            raise ValueError("유니버스 티커가 중복되었습니다")
+
+    def __len__(self) -> int:
+        return len(self.instruments)
+
+    def __iter__(self) -> Iterator[Instrument]:
+        return iter(self.instruments)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __getitem__(self, name: str) -> Instrument:
+        return self.instruments[self.index[name]]
+
+    def ticker_of(self, name: str) -> str:
+        return self.instruments[self.index[name]].ticker
+
+    def ticker_map(self) -> Dict[str, str]:
+        """이름 → 티커"""
+        return {instrument.name: instrument.ticker for instrument in self.instruments}
+
+    def exchange_codes(self) -> Dict[str, str]:
+        """티커 → 한투 거래소 코드"""
+        return {instrument.ticker: instrument.exchange for instrument in self.instruments}
+
+    def zero_scores(self) -> Dict[str, int]:
+        return dict.fromkeys(self.names, 0)
+
+    def to_vector(self, scores: Dict[str, float]) -> List[float]:
+        """점수 dict → id 순서 리스트 (없는 항목은 0)"""
+        return [scores.get(name, 0) for name in self.names]
+
+    def from_vector(self, score_vector: List[float]) -> Dict[str, float]:
+        return dict(zip(self.names, score_vector))
+
+    def chunks(self, max_per_chunk: int) -> List['Universe']:
+        """LLM 1회 호출에 넣을 크기로 분할 (max_per_chunk가 0이면 분할하지 않음)"""
+        if not max_per_chunk or len(self) <= max_per_chunk:
+            return [self]
+        return [Universe(self.instruments[chunk_start:chunk_start + max_per_chunk])
+                for chunk_start in range(0, len(self), max_per_chunk)]
+
+    @classmethod
+    def from_config(cls, entries: List[Dict]) -> 'Universe':
+        """
+        설정 파일 UNIVERSE 항목 → Universe
+
+        Args:
+            entries: [{'name', 'ticker', 'description'?, 'examples'?, 'kind'?, 'exchange'?, 'keywords'?}, ...]
+
+        Raises:
+            ValueError: 필수 항목 누락 / 알 수 없는 kind / 중복
+        """
+        instruments = []
+        for entry in entries:
+            if not isinstance(entry, dict) or not entry.get('name') or not entry.get('ticker'):
+                raise ValueError(f"UNIVERSE 항목에는 name과 ticker가 필요합니다: {entry}")
+            kind = entry.get('kind', KIND_SECTOR_ETF)
+            if kind not in INSTRUMENT_KINDS:
+                raise ValueError(f"알 수 없는 UNIVERSE kind: {kind} ({', '.join(INSTRUMENT_KINDS)})")
+            instruments.append(Instrument(
+                name=str(entry['name']),
+                ticker=str(entry['ticker']),
+                description=str(entry.get('description', '')),
+                examples=tuple(str(example) for example in entry.get('examples', ())),
+                kind=kind,
+                exchange=str(entry.get('exchange', DEFAULT_EXCHANGE_CODE)),
+                keywords=tuple(str(keyword).lower() for keyword in entry.get('keywords', ())),
+            ))
+        return cls(instruments)
+
+
+DEFAULT_UNIVERSE = Universe(DEFAULT_INSTRUMENTS)
+
+_active_universe = DEFAULT_UNIVERSE
+
+
+def get_universe() -> Universe:
+    """현재 사용 중인 유니버스 (설정에 UNIVERSE가 없으면 기본 11개 섹터 ETF)"""
+    return _active_universe
+
+
+def set_universe(universe: Optional[Universe]):
+    """시작 시 설정의 유니버스로 교체 (None이면 기본값) - 실행 중 교체는 재시작 필요"""
+    global _active_universe
+    _active_universe = universe or DEFAULT_UNIVERSE